@@ -4,3 +4,16 @@ from django.apps import AppConfig
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+
+    def ready(self):
+        # 관리자 화면/API로 제품을 바꿔도 카탈로그 버전이 올라 파생 캐시(검색 인덱스 등)가 갱신되도록
+        from api.utils.catalog_version import connect_catalog_signals
+        connect_catalog_signals()
+
+        # 전체 카탈로그 SPEC 스키마 아티팩트를 워커 기동 시 미리 로드 (첫 요청에서 스펙 분석하지 않도록)
+        from api.utils.spec_column_scorer import spec_column_scorer
+        spec_column_scorer.load_schema_artifact()
+
+        # 제품별 리뷰 키워드 인덱스 (추천 문구 생성 시 리뷰를 다시 조회/분석하지 않도록)
+        from api.services.recommendation_reason_generator import reason_generator
+        reason_generator.load_review_index()
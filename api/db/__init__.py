@@ -7,6 +7,10 @@ from .oracle_client import (
     fetch_all,
     fetch_one,
     fetch_all_dict,
+    fetch_columns,
+    iter_rows,
+    stream_cursor,
+    tune_cursor,
 )
 
 __all__ = [
@@ -14,5 +18,9 @@ __all__ = [
     'fetch_all',
     'fetch_one',
     'fetch_all_dict',
+    'fetch_columns',
+    'iter_rows',
+    'stream_cursor',
+    'tune_cursor',
 ]
 
@@ -0,0 +1,190 @@
+"""
+Oracle 배열 DML 적재기 (정규화 마이그레이션 등 대량 INSERT용)
+
+자식 행마다 cur.execute + 커밋하는 대신 문장별 배열로 모았다가 executemany(batcherrors=True)로
+한 번에 보내고, 청크 단위로 커밋합니다.
+
+- 청크: 부모 레코드(세션/제품/사용자) chunk_size개의 자식 행 전체. 청크의 모든 문장을 보낸 뒤 한 번 커밋
+- 행 오류(중복 키 등): batcherrors로 해당 행만 건너뛰고 나머지는 적재, 문장별 오류 건수 기록
+- 재개: 커밋한 청크의 마지막 부모 키를 체크포인트 파일에 기록 → 다음 실행에서 그 키 이후부터 진행
+  (부모는 키 오름차순으로 넘겨야 함. 커밋 직후 중단되어 청크가 다시 적재되면 중복 행은 batcherrors로 건너뜀)
+- 지표: 문장별 적재/오류 행 수, 초당 적재 행 수
+
+사용법:
+    loader = BulkLoader(conn, {'spaces': "INSERT INTO T (A, B) VALUES (:1, :2)"},
+                        chunk_size=500, checkpoint=ChunkCheckpoint('onboarding'))
+    stats = loader.load(parents, key=lambda parent: parent[0], build_rows=make_rows)
+    # make_rows(parent) → [('spaces', (a, b)), ...]
+"""
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+
+# 문장별로 보관하는 오류 메시지 예시 수
+ERROR_SAMPLES = 5
+
+
+def get_checkpoint_path() -> Path:
+    return Path(getattr(
+        settings, 'BULK_LOAD_CHECKPOINT_PATH', Path(settings.BASE_DIR) / 'logs' / 'bulk_load_checkpoints.json'
+    ))
+
+
+class ChunkCheckpoint:
+    """적재 작업별 마지막 커밋 청크 기록 (JSON 파일, 작업 이름별 항목)"""
+
+    def __init__(self, name: str, path: Path = None):
+        self.name = name
+        self.path = Path(path) if path else get_checkpoint_path()
+
+    def _read_all(self) -> Dict:
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_all(self, data: Dict):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def get(self) -> Optional[Dict]:
+        """{'last_key', 'chunks', 'parents', 'rows', 'completed'} 또는 None"""
+        return self._read_all().get(self.name)
+
+    def save(self, **state):
+        data = self._read_all()
+        data[self.name] = {**data.get(self.name, {}), **state}
+        self._write_all(data)
+
+    def clear(self):
+        data = self._read_all()
+        if data.pop(self.name, None) is not None:
+            self._write_all(data)
+
+
+class BulkLoader:
+    """부모 레코드 단위 청크로 자식 행을 배열 INSERT (executemany + batcherrors)"""
+
+    def __init__(self, conn, statements: Dict[str, str], chunk_size: int = None,
+                 checkpoint: ChunkCheckpoint = None, dry_run: bool = False, log: Callable[[str], None] = print):
+        """
+        Args:
+            conn: oracledb 연결 (dry_run이면 None 가능)
+            statements: {문장 이름: INSERT SQL (위치 바인드 :1, :2 ...)}
+            chunk_size: 청크당 부모 레코드 수 (생략 시 BULK_LOAD_CHUNK_SIZE)
+            checkpoint: 재개용 체크포인트 (생략 시 기록 안 함)
+            dry_run: True면 행만 만들어 세고 DB에 쓰지 않음
+        """
+        self.conn = conn
+        self.statements = statements
+        self.chunk_size = max(1, chunk_size or getattr(settings, 'BULK_LOAD_CHUNK_SIZE', 500))
+        self.checkpoint = checkpoint
+        self.dry_run = dry_run
+        self.log = log
+        self.stats = {
+            name: {'rows': 0, 'errors': 0, 'error_samples': []}
+            for name in statements
+        }
+
+    def _flush(self, cur, buffers: Dict[str, List[Tuple]]):
+        """청크의 문장별 배열 전송 (커밋은 호출자)"""
+        for name, rows in buffers.items():
+            if not rows:
+                continue
+            stat = self.stats[name]
+            if self.dry_run:
+                stat['rows'] += len(rows)
+                continue
+            cur.executemany(self.statements[name], rows, batcherrors=True)
+            errors = cur.getbatcherrors()
+            stat['rows'] += len(rows) - len(errors)
+            stat['errors'] += len(errors)
+            for error in errors[:max(0, ERROR_SAMPLES - len(stat['error_samples']))]:
+                stat['error_samples'].append(f"{rows[error.offset]}: {error.message}")
+
+    def load(self, parents: Iterable, key: Callable, build_rows: Callable[[object], Iterable[Tuple[str, Tuple]]],
+             total: int = None) -> Dict:
+        """
+        부모 레코드를 청크로 나눠 자식 행 적재
+
+        Args:
+            parents: 키 오름차순 부모 레코드 (재개 시 체크포인트 키 이후만 넘김)
+            key: 부모 레코드 → 재개 키 (JSON 저장 가능한 값)
+            build_rows: 부모 레코드 → [(문장 이름, 바인드 튜플), ...]
+            total: 진행 표시용 전체 부모 수
+
+        Returns:
+            {'parents', 'chunks', 'rows', 'errors', 'elapsed', 'rows_per_sec', 'statements': {이름: {...}}}
+        """
+        started = time.time()
+        state = (self.checkpoint.get() if self.checkpoint else None) or {}
+        parents_done = state.get('parents', 0)
+        chunks_done = state.get('chunks', 0)
+        rows_before = sum(stat['rows'] for stat in self.stats.values())
+
+        buffers: Dict[str, List[Tuple]] = {name: [] for name in self.statements}
+        in_chunk = 0
+        last_key = state.get('last_key')
+        cur = None if self.dry_run else self.conn.cursor()
+        try:
+            for parent in parents:
+                for name, row in build_rows(parent):
+                    buffers[name].append(row)
+                last_key = key(parent)
+                in_chunk += 1
+                if in_chunk >= self.chunk_size:
+                    parents_done += in_chunk
+                    chunks_done += 1
+                    self._commit_chunk(cur, buffers, last_key, chunks_done, parents_done, total, started, rows_before)
+                    buffers = {name: [] for name in self.statements}
+                    in_chunk = 0
+            if in_chunk:
+                parents_done += in_chunk
+                chunks_done += 1
+                self._commit_chunk(cur, buffers, last_key, chunks_done, parents_done, total, started, rows_before)
+        except Exception:
+            # 커밋하지 않은 청크는 되돌림 (다음 실행은 체크포인트의 마지막 커밋 청크 이후부터)
+            if not self.dry_run:
+                self.conn.rollback()
+            raise
+        finally:
+            if cur is not None:
+                cur.close()
+
+        if self.checkpoint and not self.dry_run:
+            self.checkpoint.save(completed=True)
+
+        elapsed = time.time() - started
+        rows = sum(stat['rows'] for stat in self.stats.values()) - rows_before
+        return {
+            'parents': parents_done,
+            'chunks': chunks_done,
+            'rows': rows,
+            'errors': sum(stat['errors'] for stat in self.stats.values()),
+            'elapsed': round(elapsed, 2),
+            'rows_per_sec': round(rows / elapsed, 1) if elapsed > 0 else 0.0,
+            'statements': self.stats,
+        }
+
+    def _commit_chunk(self, cur, buffers, last_key, chunks_done, parents_done, total, started, rows_before):
+        self._flush(cur, buffers)
+        if not self.dry_run:
+            self.conn.commit()
+            if self.checkpoint:
+                self.checkpoint.save(
+                    last_key=last_key, chunks=chunks_done, parents=parents_done,
+                    rows=sum(stat['rows'] for stat in self.stats.values()), completed=False,
+                )
+        elapsed = time.time() - started
+        rows = sum(stat['rows'] for stat in self.stats.values()) - rows_before
+        rate = rows / elapsed if elapsed > 0 else 0.0
+        progress = f"{parents_done}/{total}" if total is not None else str(parents_done)
+        self.log(f"  청크 {chunks_done} 커밋: 부모 {progress}, 적재 {rows}행 ({rate:.0f}행/초)")
@@ -0,0 +1,266 @@
+"""
+Oracle → Django 카탈로그 증분 동기화
+
+PRODUCT / PRODUCT_SPEC / PRODUCT_IMAGE를 제품 단위 행 해시(ORA_HASH)로 비교해
+바뀐 제품만 가져오고, bulk_create / bulk_update로 한 번에 반영합니다.
+변경이 있으면 카탈로그 버전을 올려 다운스트림 캐시가 갱신되도록 합니다.
+
+사용법:
+    from api.db.catalog_sync import sync_catalog
+    sync_catalog()            # 증분 동기화
+    sync_catalog(full=True)   # 해시 무시하고 전체 재적재
+"""
+import time
+
+from django.db import transaction
+from django.utils import timezone
+
+from api.db.oracle_client import get_connection, stream_cursor
+from api.utils.catalog_version import bump_catalog_version
+
+# 대용량 조회 시 네트워크 왕복 횟수를 줄이기 위한 fetch 크기
+FETCH_ARRAYSIZE = 2000
+# Oracle IN 목록 최대 개수 (ORA-01795)
+IN_LIST_CHUNK = 1000
+# Django bulk 작업 배치 크기
+BULK_BATCH_SIZE = 500
+
+# 테이블별 제품 단위 행 해시 (Oracle 11g: ORA_HASH 사용)
+HASH_QUERIES = {
+    'PRODUCT': """
+        SELECT PRODUCT_ID,
+               ORA_HASH(
+                   PRODUCT_NAME || '|' || MAIN_CATEGORY || '|' || SUB_CATEGORY || '|' ||
+                   MODEL_CODE || '|' || STATUS || '|' || TO_CHAR(PRICE) || '|' ||
+                   TO_CHAR(DISCOUNT_PRICE) || '|' || TO_CHAR(RATING) || '|' || URL || '|' || IMAGE_URL
+               ) AS ROW_HASH
+        FROM PRODUCT
+        WHERE PRODUCT_NAME IS NOT NULL
+    """,
+    'PRODUCT_SPEC': """
+        SELECT PRODUCT_ID,
+               COUNT(*) || ':' || SUM(
+                   ORA_HASH(SPEC_KEY) + ORA_HASH(NVL(SPEC_VALUE, ' ')) * 3 +
+                   ORA_HASH(NVL(SPEC_TYPE, ' ')) * 7 + SPEC_ID * 11
+               ) AS ROW_HASH
+        FROM PRODUCT_SPEC
+        GROUP BY PRODUCT_ID
+    """,
+    'PRODUCT_IMAGE': """
+        SELECT PRODUCT_ID,
+               COUNT(*) || ':' || SUM(ORA_HASH(NVL(IMAGE_URL, ' ')) + PRODUCT_IMAGE_ID * 11) AS ROW_HASH
+        FROM PRODUCT_IMAGE
+        GROUP BY PRODUCT_ID
+    """,
+}
+
+ROW_QUERIES = {
+    'PRODUCT': """
+        SELECT PRODUCT_ID, PRODUCT_NAME, MAIN_CATEGORY, SUB_CATEGORY, MODEL_CODE, STATUS,
+               PRICE, DISCOUNT_PRICE, RATING, URL, IMAGE_URL
+        FROM PRODUCT
+        WHERE PRODUCT_ID IN ({ids})
+    """,
+    'PRODUCT_SPEC': """
+        SELECT SPEC_ID, PRODUCT_ID, SPEC_KEY, SPEC_VALUE, SPEC_TYPE
+        FROM PRODUCT_SPEC
+        WHERE PRODUCT_ID IN ({ids})
+    """,
+    'PRODUCT_IMAGE': """
+        SELECT PRODUCT_IMAGE_ID, PRODUCT_ID, IMAGE_URL
+        FROM PRODUCT_IMAGE
+        WHERE PRODUCT_ID IN ({ids})
+    """,
+}
+
+PRODUCT_UPDATE_FIELDS = [
+    'product_name', 'main_category', 'sub_category', 'model_code', 'status',
+    'price', 'discount_price', 'rating', 'url', 'image_url',
+    'name', 'model_number', 'category', 'product_type', 'is_active', 'updated_at',
+]
+
+
+def _fetch_dicts(cur, sql, params=None):
+    """arraysize/prefetchrows를 키운 커서로 dict 리스트 조회"""
+    return list(stream_cursor(cur, sql, params, FETCH_ARRAYSIZE, row_type='dict'))
+
+
+def _fetch_rows_for_products(cur, table, product_ids):
+    """바뀐 제품 ID만 IN 목록 청크로 나눠 조회"""
+    rows = []
+    product_ids = sorted(product_ids)
+    for start in range(0, len(product_ids), IN_LIST_CHUNK):
+        chunk = product_ids[start:start + IN_LIST_CHUNK]
+        binds = {f"id{i}": pid for i, pid in enumerate(chunk)}
+        placeholders = ', '.join(f":{name}" for name in binds)
+        rows.extend(_fetch_dicts(cur, ROW_QUERIES[table].format(ids=placeholders), binds))
+    return rows
+
+
+def _diff(old_hashes, new_hashes, full):
+    """(변경/추가된 제품 ID 집합, 삭제된 제품 ID 집합)"""
+    if full:
+        changed = set(new_hashes)
+    else:
+        changed = {pid for pid, h in new_hashes.items() if old_hashes.get(pid) != h}
+    removed = set(old_hashes) - set(new_hashes)
+    return changed, removed
+
+
+def _apply_products(rows, removed_ids):
+    from api.models import Product
+    from api.utils.product_type_classifier import product_type_column_value
+
+    now = timezone.now()
+    ids = [int(r['PRODUCT_ID']) for r in rows]
+    existing = {
+        p.product_id: p
+        for p in Product.objects.filter(product_id__in=ids)
+    }
+
+    to_create, to_update = [], []
+    for r in rows:
+        product_id = int(r['PRODUCT_ID'])
+        fields = {
+            'product_name': r.get('PRODUCT_NAME') or '',
+            'main_category': r.get('MAIN_CATEGORY') or '',
+            'sub_category': r.get('SUB_CATEGORY'),
+            'model_code': r.get('MODEL_CODE'),
+            'status': r.get('STATUS'),
+            'price': r.get('PRICE'),
+            'discount_price': r.get('DISCOUNT_PRICE'),
+            'rating': r.get('RATING'),
+            'url': r.get('URL'),
+            'image_url': r.get('IMAGE_URL') or '',
+            'name': r.get('PRODUCT_NAME') or '',  # 하위 호환성
+            'model_number': r.get('MODEL_CODE'),
+            'category': r.get('MAIN_CATEGORY') or '',
+            'product_type': product_type_column_value(r.get('PRODUCT_NAME'), r.get('MAIN_CATEGORY')),
+            'is_active': True,
+            'updated_at': now,
+        }
+        product = existing.get(product_id)
+        if product is None:
+            to_create.append(Product(product_id=product_id, **fields))
+        else:
+            for key, value in fields.items():
+                setattr(product, key, value)
+            to_update.append(product)
+
+    Product.objects.bulk_create(to_create, batch_size=BULK_BATCH_SIZE)
+    Product.objects.bulk_update(to_update, PRODUCT_UPDATE_FIELDS, batch_size=BULK_BATCH_SIZE)
+
+    # Oracle에서 사라진 제품은 삭제하지 않고 비활성화 (주문/포트폴리오 참조 보존)
+    deactivated = 0
+    if removed_ids:
+        deactivated = Product.objects.filter(product_id__in=removed_ids).update(is_active=False, updated_at=now)
+
+    return {'created': len(to_create), 'updated': len(to_update), 'deactivated': deactivated}
+
+
+def _replace_children(model, pk_name, rows, product_ids, build):
+    """제품 단위로 하위 행(스펙/이미지)을 통째로 교체"""
+    from api.models import Product
+
+    local_ids = set(
+        Product.objects.filter(product_id__in=product_ids).values_list('product_id', flat=True)
+    )
+    deleted, _ = model.objects.filter(product_id__in=product_ids).delete()
+    objs = [
+        build(r) for r in rows
+        if r.get(pk_name) is not None and int(r['PRODUCT_ID']) in local_ids
+    ]
+    model.objects.bulk_create(objs, batch_size=BULK_BATCH_SIZE)
+    return {'replaced': len(objs), 'deleted': deleted}
+
+
+def _apply_specs(rows, product_ids):
+    from api.models import ProductSpecNew
+
+    return _replace_children(ProductSpecNew, 'SPEC_ID', rows, product_ids, lambda r: ProductSpecNew(
+        spec_id=int(r['SPEC_ID']),
+        product_id=int(r['PRODUCT_ID']),
+        spec_key=r.get('SPEC_KEY') or '',
+        spec_value=r.get('SPEC_VALUE'),
+        spec_type=r.get('SPEC_TYPE'),
+    ))
+
+
+def _apply_images(rows, product_ids):
+    from api.models import ProductImage
+
+    return _replace_children(ProductImage, 'PRODUCT_IMAGE_ID', rows, product_ids, lambda r: ProductImage(
+        product_image_id=int(r['PRODUCT_IMAGE_ID']),
+        product_id=int(r['PRODUCT_ID']),
+        image_url=r.get('IMAGE_URL'),
+    ))
+
+
+def sync_catalog(full=False):
+    """
+    카탈로그 증분 동기화
+
+    Args:
+        full: True면 저장된 해시를 무시하고 모든 제품을 다시 반영
+
+    Returns:
+        {
+            'catalog_version': int,   # 동기화 후 카탈로그 버전
+            'changed': bool,
+            'elapsed': float,
+            'PRODUCT': {...}, 'PRODUCT_SPEC': {...}, 'PRODUCT_IMAGE': {...}
+        }
+    """
+    from api.models import CatalogSyncState
+    from api.utils.catalog_version import get_catalog_version
+
+    started = time.time()
+    print(f"[카탈로그 동기화] 시작 ({'전체' if full else '증분'})", flush=True)
+
+    states = {
+        table: CatalogSyncState.objects.get_or_create(table_name=table)[0]
+        for table in HASH_QUERIES
+    }
+
+    new_hashes, changed, removed, rows = {}, {}, {}, {}
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            for table, sql in HASH_QUERIES.items():
+                new_hashes[table] = {
+                    str(int(r['PRODUCT_ID'])): str(r['ROW_HASH'])
+                    for r in _fetch_dicts(cur, sql)
+                    if r.get('PRODUCT_ID') is not None
+                }
+                changed_keys, removed_keys = _diff(states[table].get_row_hashes(), new_hashes[table], full)
+                changed[table] = {int(pid) for pid in changed_keys}
+                removed[table] = {int(pid) for pid in removed_keys}
+                rows[table] = _fetch_rows_for_products(cur, table, changed[table]) if changed[table] else []
+                print(
+                    f"[카탈로그 동기화] {table}: 전체 {len(new_hashes[table])}개 중 "
+                    f"변경 {len(changed[table])}개, 삭제 {len(removed[table])}개",
+                    flush=True
+                )
+
+    result = {}
+    with transaction.atomic():
+        result['PRODUCT'] = _apply_products(rows['PRODUCT'], removed['PRODUCT'])
+        result['PRODUCT_SPEC'] = _apply_specs(
+            rows['PRODUCT_SPEC'], changed['PRODUCT_SPEC'] | removed['PRODUCT_SPEC']
+        )
+        result['PRODUCT_IMAGE'] = _apply_images(
+            rows['PRODUCT_IMAGE'], changed['PRODUCT_IMAGE'] | removed['PRODUCT_IMAGE']
+        )
+        for table, state in states.items():
+            state.set_row_hashes(new_hashes[table])
+            state.save()
+
+    has_changes = any(changed[t] or removed[t] for t in HASH_QUERIES)
+    version = bump_catalog_version() if has_changes else get_catalog_version(refresh=True)
+
+    result.update({
+        'catalog_version': version,
+        'changed': has_changes,
+        'elapsed': round(time.time() - started, 2),
+    })
+    print(f"[카탈로그 동기화] 완료: {result}", flush=True)
+    return result
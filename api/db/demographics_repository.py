@@ -0,0 +1,155 @@
+"""
+제품 인구통계 조회 (정규화 테이블 일괄 조회)
+
+PROD_DEMO_FAMILY_TYPES / PROD_DEMO_HOUSE_SIZES / PROD_DEMO_HOUSE_TYPES 세 테이블을
+UNION ALL 한 번으로 조회합니다. 여러 제품은 IN 목록(최대 1000개씩)으로 묶어 같은 연결에서 처리하고,
+결과는 카탈로그 버전별로 프로세스 내에 캐시합니다.
+
+사용법:
+    from api.db.demographics_repository import demographics_repository
+    demographics_repository.get(product_id)
+    demographics_repository.get_many([1, 2, 3])
+    demographics_repository.resolve_many(ProductDemographics 목록)  # 정규화 테이블 우선, JSONField 폴백
+"""
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from api.db.reference_replica import get_reference_connection
+from api.utils.catalog_version import get_catalog_version
+
+# Oracle IN 목록 최대 개수 (ORA-01795)
+IN_LIST_CHUNK = 1000
+
+# 캐시 최대 제품 수 (초과 시 전체 비움)
+MAX_CACHED_PRODUCTS = 20000
+
+FIELDS = ('family_types', 'house_sizes', 'house_types')
+
+DEMOGRAPHICS_TABLES = ('PROD_DEMO_FAMILY_TYPES', 'PROD_DEMO_HOUSE_SIZES', 'PROD_DEMO_HOUSE_TYPES')
+
+DEMOGRAPHICS_QUERY = """
+    SELECT 'family_types' AS FIELD, PRODUCT_ID, FAMILY_TYPE AS VALUE
+    FROM PROD_DEMO_FAMILY_TYPES WHERE PRODUCT_ID IN ({ids})
+    UNION ALL
+    SELECT 'house_sizes', PRODUCT_ID, HOUSE_SIZE
+    FROM PROD_DEMO_HOUSE_SIZES WHERE PRODUCT_ID IN ({ids})
+    UNION ALL
+    SELECT 'house_types', PRODUCT_ID, HOUSE_TYPE
+    FROM PROD_DEMO_HOUSE_TYPES WHERE PRODUCT_ID IN ({ids})
+    ORDER BY 1, 2, 3
+"""
+
+
+def _empty() -> Dict[str, List[str]]:
+    return {field: [] for field in FIELDS}
+
+
+def _json_list(value) -> List:
+    return value if isinstance(value, list) else []
+
+
+class DemographicsRepository:
+    """정규화 인구통계 테이블 조회 + 카탈로그 버전별 캐시"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cache: Dict[int, Dict[str, List[str]]] = {}
+        self._version = None
+
+    def get(self, product_id: int) -> Optional[Dict[str, List[str]]]:
+        """
+        단일 제품 인구통계
+
+        Returns:
+            {'family_types': [...], 'house_sizes': [...], 'house_types': [...]}
+            (Oracle 조회 실패 시 None)
+        """
+        return self.get_many([product_id]).get(int(product_id))
+
+    def get_many(self, product_ids: Iterable[int]) -> Dict[int, Dict[str, List[str]]]:
+        """
+        여러 제품 인구통계를 한 번에 조회 (캐시에 없는 제품만 Oracle 조회)
+
+        정규화 테이블에 행이 없는 제품은 빈 리스트로 채워 반환합니다.
+        Oracle 조회에 실패한 제품은 결과에서 빠집니다 (호출자가 JSONField로 폴백).
+        """
+        self._check_version()
+        ids = list(dict.fromkeys(int(pid) for pid in product_ids if pid is not None))
+
+        with self._lock:
+            result = {pid: self._cache[pid] for pid in ids if pid in self._cache}
+        missing = [pid for pid in ids if pid not in result]
+        if not missing:
+            return self._copy(result)
+
+        try:
+            fetched = self._fetch(missing)
+        except Exception as e:
+            print(f"[DemographicsRepository] 정규화 테이블 조회 실패 ({len(missing)}개 제품): {e}", flush=True)
+            return self._copy(result)
+
+        with self._lock:
+            if len(self._cache) + len(fetched) > MAX_CACHED_PRODUCTS:
+                self._cache.clear()
+            self._cache.update(fetched)
+        result.update(fetched)
+        return self._copy(result)
+
+    def resolve_many(self, demographics_list: Iterable) -> Dict[int, Dict[str, List]]:
+        """
+        ProductDemographics 목록의 인구통계 (정규화 테이블 우선, 비어 있으면 JSONField 폴백)
+
+        Returns:
+            {product_id: {'family_types': [...], 'house_sizes': [...], 'house_types': [...]}}
+        """
+        demographics_list = list(demographics_list)
+        normalized = self.get_many(d.product_id for d in demographics_list)
+
+        resolved = {}
+        for demographics in demographics_list:
+            values = normalized.get(demographics.product_id) or _empty()
+            resolved[demographics.product_id] = {
+                field: values[field] or _json_list(getattr(demographics, field))
+                for field in FIELDS
+            }
+        return resolved
+
+    def invalidate(self, product_id: int = None):
+        """캐시 비우기 (product_id 지정 시 해당 제품만)"""
+        with self._lock:
+            if product_id is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(int(product_id), None)
+
+    def _check_version(self):
+        version = get_catalog_version()
+        if self._version == version:
+            return
+        with self._lock:
+            if self._version != version:
+                self._cache.clear()
+                self._version = version
+
+    @staticmethod
+    def _fetch(product_ids: List[int]) -> Dict[int, Dict[str, List[str]]]:
+        fetched = {pid: _empty() for pid in product_ids}
+        with get_reference_connection(*DEMOGRAPHICS_TABLES) as conn:
+            with conn.cursor() as cur:
+                for start in range(0, len(product_ids), IN_LIST_CHUNK):
+                    chunk = product_ids[start:start + IN_LIST_CHUNK]
+                    binds = {f"id{i}": pid for i, pid in enumerate(chunk)}
+                    placeholders = ', '.join(f":{name}" for name in binds)
+                    cur.arraysize = 1000
+                    cur.execute(DEMOGRAPHICS_QUERY.format(ids=placeholders), binds)
+                    for field, product_id, value in cur:
+                        fetched[int(product_id)][field].append(value)
+        return fetched
+
+    @staticmethod
+    def _copy(result: Dict[int, Dict[str, List[str]]]) -> Dict[int, Dict[str, List[str]]]:
+        return {pid: {field: list(values) for field, values in data.items()} for pid, data in result.items()}
+
+
+# 싱글톤 인스턴스
+demographics_repository = DemographicsRepository()
@@ -4,10 +4,16 @@
 Oracle 11g 호환 oracledb 클라이언트 (Thick 모드로 11g 지원)
 """
 import os
+from collections import namedtuple
 from pathlib import Path
 import oracledb
 from dotenv import load_dotenv
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # Oracle 11g 호환을 위해 Thick 모드 활성화
 _thick_mode_initialized = False
 try:
@@ -82,6 +88,12 @@ if not DISABLE_DB:
 else:
     DSN = None
 
+# 대용량 조회 시 네트워크 왕복 1회에 가져올 행 수 (cursor.arraysize 기본 100 대신)
+FETCH_ARRAYSIZE = int(os.getenv("ORACLE_FETCH_ARRAYSIZE", "1000"))
+
+# CLOB/NCLOB를 LOB 로케이터 대신 문자열로 바로 가져옴 (행마다 .read() 왕복 없음, BLOB는 bytes)
+oracledb.defaults.fetch_lobs = False
+
 class DatabaseDisabledError(Exception):
     pass
 
@@ -96,20 +108,111 @@ def get_connection():
         dsn=DSN,
     )
 
+def tune_cursor(cur, arraysize=None):
+    """
+    조회 fetch 크기 설정
+    
+    prefetchrows = arraysize + 1 이므로 결과가 arraysize 행 이하면 execute 한 번의 왕복으로 끝납니다.
+    """
+    size = arraysize or FETCH_ARRAYSIZE
+    cur.arraysize = size
+    cur.prefetchrows = size + 1
+    return cur
+
+def _row_factory(cur, row_type):
+    """row_type: 'tuple' | 'dict' | 'namedtuple' (컬럼명 소문자 필드)"""
+    if row_type == 'tuple':
+        return None
+    cols = [c[0] for c in cur.description]
+    if row_type == 'dict':
+        return lambda row: dict(zip(cols, row))
+    if row_type == 'namedtuple':
+        return namedtuple('Row', [c.lower() for c in cols], rename=True)._make
+    raise ValueError(f"지원하지 않는 row_type: {row_type}")
+
+def stream_cursor(cur, sql, params=None, arraysize=None, row_type='tuple'):
+    """
+    열린 커서로 조회해 행을 하나씩 yield (arraysize 단위로 가져와 전체 결과를 메모리에 두지 않음)
+    
+    Oracle 연결과 참조 복제본(get_reference_connection) 커서 모두에서 사용 가능
+    """
+    tune_cursor(cur, arraysize)
+    cur.execute(sql, params or {})
+    make_row = _row_factory(cur, row_type)
+    while True:
+        rows = cur.fetchmany(cur.arraysize)
+        if not rows:
+            break
+        if make_row is None:
+            yield from rows
+        else:
+            for row in rows:
+                yield make_row(row)
+
+def iter_rows(sql, params=None, arraysize=None, row_type='tuple'):
+    """
+    새 연결로 조회해 행을 스트리밍 (generator)
+    
+    끝까지 소비하거나 close()하면 연결을 닫습니다.
+    
+    사용법:
+        for row in iter_rows(sql, params, row_type='namedtuple'):
+            print(row.product_id, row.price)
+    """
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            yield from stream_cursor(cur, sql, params, arraysize, row_type)
+
+def fetch_columns(sql, params=None, arraysize=None, as_numpy=False):
+    """
+    컬럼 단위 결과 반환 {컬럼명: 값 리스트}
+    
+    Args:
+        as_numpy: True면 NumPy 배열로 반환 (숫자 컬럼은 int64/float64 - NULL은 NaN, 그 외는 object)
+    
+    Raises:
+        ImportError: as_numpy=True인데 NumPy가 설치되지 않음
+    """
+    if as_numpy and np is None:
+        raise ImportError("fetch_columns(as_numpy=True)에는 numpy가 필요합니다.")
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            tune_cursor(cur, arraysize)
+            cur.execute(sql, params or {})
+            cols = [c[0] for c in cur.description]
+            columns = {col: [] for col in cols}
+            while True:
+                rows = cur.fetchmany(cur.arraysize)
+                if not rows:
+                    break
+                for col, values in zip(cols, zip(*rows)):
+                    columns[col].extend(values)
+    if as_numpy:
+        return {col: _to_array(values) for col, values in columns.items()}
+    return columns
+
+def _to_array(values):
+    """숫자 컬럼은 숫자 배열, 그 외는 object 배열"""
+    present = [v for v in values if v is not None]
+    if present and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in present):
+        if len(present) == len(values) and all(isinstance(v, int) for v in present):
+            return np.array(values, dtype=np.int64)
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
 def fetch_all(sql, params=None):
     """모든 행 반환"""
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(sql, params or {})
-            return cur.fetchall()
+            return list(stream_cursor(cur, sql, params))
 
 def fetch_all_dict(sql, params=None):
     """Dict 리스트 반환"""
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(sql, params or {})
-            cols = [c[0] for c in cur.description]
-            return [dict(zip(cols, row)) for row in cur.fetchall()]
+            return list(stream_cursor(cur, sql, params, row_type='dict'))
 
 def fetch_one(sql, params=None):
     """단일 행 반환"""
@@ -123,9 +226,15 @@ def fetch_one(sql, params=None):
 # 데이터 로드 함수 (Oracle → Django)
 # ============================================================
 
-def load_all_lg_products():
+def load_all_lg_products(full=False):
     """
-    Oracle DB의 PRODUCT 테이블에서 모든 LG 가전 제품을 Django Product 모델로 로드
+    Oracle DB의 PRODUCT 테이블에서 LG 가전 제품을 Django Product 모델로 로드
+    
+    증분 동기화 엔진(api.db.catalog_sync)을 사용해 바뀐 제품만 가져와 일괄 반영하고,
+    PRODUCT_SPEC / PRODUCT_IMAGE도 함께 동기화합니다.
+    
+    Args:
+        full: True면 저장된 행 해시를 무시하고 전체 재적재
     
     사용법:
         from api.db.oracle_client import load_all_lg_products
@@ -133,70 +242,22 @@ def load_all_lg_products():
     """
     try:
         from api.models import Product
+        from api.db.catalog_sync import sync_catalog
         
         print("[데이터 로드] Oracle DB에서 제품 데이터 로드 시작...")
         
-        # Oracle DB에서 제품 조회
-        products = fetch_all_dict("""
-            SELECT 
-                PRODUCT_ID,
-                PRODUCT_NAME,
-                MAIN_CATEGORY,
-                SUB_CATEGORY,
-                MODEL_CODE,
-                STATUS,
-                PRICE,
-                DISCOUNT_PRICE,
-                RATING,
-                URL,
-                IMAGE_URL
-            FROM PRODUCT
-            WHERE PRODUCT_NAME IS NOT NULL
-            ORDER BY PRODUCT_ID
-        """)
-        
-        print(f"[데이터 로드] Oracle DB에서 {len(products)}개 제품 조회 완료")
-        
-        created_count = 0
-        updated_count = 0
-        
-        for prod_data in products:
-            product_id = prod_data.get('PRODUCT_ID')
-            if not product_id:
-                continue
-            
-            # Django Product 모델에 저장/업데이트
-            product, created = Product.objects.update_or_create(
-                product_id=product_id,
-                defaults={
-                    'product_name': prod_data.get('PRODUCT_NAME', ''),
-                    'main_category': prod_data.get('MAIN_CATEGORY', ''),
-                    'sub_category': prod_data.get('SUB_CATEGORY'),
-                    'model_code': prod_data.get('MODEL_CODE'),
-                    'status': prod_data.get('STATUS'),
-                    'price': prod_data.get('PRICE'),
-                    'discount_price': prod_data.get('DISCOUNT_PRICE'),
-                    'rating': prod_data.get('RATING'),
-                    'url': prod_data.get('URL'),
-                    'image_url': prod_data.get('IMAGE_URL', ''),
-                    'name': prod_data.get('PRODUCT_NAME', ''),  # 하위 호환성
-                    'model_number': prod_data.get('MODEL_CODE'),
-                    'category': prod_data.get('MAIN_CATEGORY', ''),
-                }
-            )
-            
-            if created:
-                created_count += 1
-            else:
-                updated_count += 1
+        result = sync_catalog(full=full)
+        product_result = result['PRODUCT']
         
-        print(f"[데이터 로드] 완료: {created_count}개 생성, {updated_count}개 업데이트")
+        print(f"[데이터 로드] 완료: {product_result['created']}개 생성, {product_result['updated']}개 업데이트")
         print(f"[데이터 로드] 총 {Product.objects.count()}개 제품이 Django DB에 저장됨")
         
         return {
-            'total': len(products),
-            'created': created_count,
-            'updated': updated_count,
+            'total': product_result['created'] + product_result['updated'],
+            'created': product_result['created'],
+            'updated': product_result['updated'],
+            'deactivated': product_result['deactivated'],
+            'catalog_version': result['catalog_version'],
         }
         
     except Exception as e:
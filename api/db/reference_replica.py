@@ -0,0 +1,552 @@
+"""
+Oracle 참조 테이블 로컬 SQLite 복제본 (읽기 전용)
+
+요청 경로에서 원격 Oracle을 직접 조회하던 참조 테이블(TASTE_CONFIG, TASTE_CATEGORY_SCORES,
+PRODUCT, PRODUCT_SPEC, PRODUCT_IMAGE, PROD_DEMO_*)을 로컬 SQLite 파일로 복제합니다.
+
+- 증분 동기화: 테이블마다 그룹 키(PRODUCT_ID / TASTE_ID) 단위 행 해시(ORA_HASH)를 비교해
+  바뀐 그룹만 Oracle에서 가져오고, 테이블별 한 트랜잭션으로 교체합니다 (catalog_sync와 같은 방식).
+- 읽기 최적화: WAL(동기화 중에도 읽기 가능), mmap, 조회 패턴별 커버링 인덱스,
+  스레드별 읽기 전용 연결 재사용.
+- 전환: REFERENCE_REPLICA_ENABLED=True면 get_reference_connection()이 복제본 연결을 돌려줍니다.
+  조회에 필요한 테이블이 아직 동기화되지 않았거나, 마지막 동기화 성공이 REFERENCE_REPLICA_MAX_AGE보다
+  오래되었으면(동기화 루프 중단 등) Oracle 연결로 폴백합니다.
+
+사용법:
+    python manage.py sync_reference_replica            # 증분 동기화 1회
+    python manage.py sync_reference_replica --loop     # 주기 동기화 (REFERENCE_REPLICA_SYNC_INTERVAL초)
+
+    from api.db.reference_replica import get_reference_connection
+    with get_reference_connection('PRODUCT', 'PRODUCT_SPEC') as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, params)
+"""
+import datetime
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import oracledb
+from django.conf import settings
+
+from api.db.oracle_client import get_connection, tune_cursor
+
+# 복제 대상 테이블: 그룹 키(증분 비교 단위) + 조회 패턴별 커버링 인덱스
+# (인덱스 컬럼이 Oracle 테이블에 없으면 해당 인덱스는 건너뜀)
+REPLICA_TABLES = {
+    'PRODUCT': {
+        'group': 'PRODUCT_ID',
+        'indexes': [
+            ('PRODUCT_ID',),
+            ('MAIN_CATEGORY', 'STATUS', 'PRICE', 'PRODUCT_ID', 'MODEL_CODE', 'PRODUCT_NAME'),
+            ('MODEL_CODE', 'STATUS', 'PRODUCT_ID'),
+        ],
+    },
+    'PRODUCT_SPEC': {
+        'group': 'PRODUCT_ID',
+        'indexes': [('PRODUCT_ID', 'SPEC_TYPE', 'SPEC_KEY', 'SPEC_VALUE')],
+    },
+    'PRODUCT_IMAGE': {
+        'group': 'PRODUCT_ID',
+        'indexes': [('PRODUCT_ID', 'PRODUCT_IMAGE_ID', 'IMAGE_URL')],
+    },
+    'TASTE_CONFIG': {
+        'group': 'TASTE_ID',
+        'indexes': [('TASTE_ID',)],
+    },
+    'TASTE_CATEGORY_SCORES': {
+        'group': 'TASTE_ID',
+        'indexes': [('TASTE_ID', 'CATEGORY_NAME', 'SCORE', 'IS_RECOMMENDED', 'IS_ILL_SUITED')],
+    },
+    'PROD_DEMO_FAMILY_TYPES': {
+        'group': 'PRODUCT_ID',
+        'indexes': [('PRODUCT_ID', 'FAMILY_TYPE')],
+    },
+    'PROD_DEMO_HOUSE_SIZES': {
+        'group': 'PRODUCT_ID',
+        'indexes': [('PRODUCT_ID', 'HOUSE_SIZE')],
+    },
+    'PROD_DEMO_HOUSE_TYPES': {
+        'group': 'PRODUCT_ID',
+        'indexes': [('PRODUCT_ID', 'HOUSE_TYPE')],
+    },
+}
+
+# 동기화 후 카탈로그 버전을 올리는 테이블 (제품 파생 캐시 무효화)
+CATALOG_TABLES = {'PRODUCT', 'PRODUCT_SPEC', 'PRODUCT_IMAGE'}
+
+# 대용량 조회 시 네트워크 왕복 횟수를 줄이기 위한 fetch 크기
+FETCH_ARRAYSIZE = 2000
+# Oracle IN 목록 최대 개수 (ORA-01795)
+IN_LIST_CHUNK = 1000
+# SQLite 바인드 변수 개수 제한 내 청크
+SQLITE_CHUNK = 500
+# 해시 계산 시 CLOB에서 읽을 최대 문자 수
+LOB_HASH_CHARS = 1000
+
+_NUMBER_TYPES = {oracledb.DB_TYPE_NUMBER, oracledb.DB_TYPE_BINARY_DOUBLE, oracledb.DB_TYPE_BINARY_FLOAT, oracledb.DB_TYPE_BINARY_INTEGER}
+_TEXT_TYPES = {
+    oracledb.DB_TYPE_VARCHAR, oracledb.DB_TYPE_NVARCHAR, oracledb.DB_TYPE_CHAR, oracledb.DB_TYPE_NCHAR,
+    oracledb.DB_TYPE_LONG, oracledb.DB_TYPE_CLOB, oracledb.DB_TYPE_NCLOB,
+    oracledb.DB_TYPE_DATE, oracledb.DB_TYPE_TIMESTAMP, oracledb.DB_TYPE_TIMESTAMP_TZ, oracledb.DB_TYPE_TIMESTAMP_LTZ,
+}
+_LOB_TYPES = {oracledb.DB_TYPE_CLOB, oracledb.DB_TYPE_NCLOB, oracledb.DB_TYPE_BLOB, oracledb.DB_TYPE_LONG}
+
+
+def get_replica_path() -> Path:
+    return Path(getattr(settings, 'REFERENCE_REPLICA_PATH', Path(settings.BASE_DIR) / 'replica' / 'reference.sqlite3'))
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _to_sqlite_value(value):
+    """Oracle 값 → SQLite 저장 값 (LOB는 문자열, 날짜는 ISO 문자열)"""
+    if value is None:
+        return None
+    if hasattr(value, 'read'):
+        return value.read()
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat(sep=' ') if isinstance(value, datetime.datetime) else value.isoformat()
+    return value
+
+
+# ============================================================
+# 읽기 연결 (oracledb 연결과 같은 with / cursor 사용법)
+# ============================================================
+
+class ReplicaCursor:
+    """oracledb 커서처럼 with 문으로 쓰는 SQLite 커서 (:name 바인드 그대로 사용)"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._cur = conn.cursor()
+        self.arraysize = FETCH_ARRAYSIZE
+        self.prefetchrows = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._cur.close()
+        return False
+
+    def execute(self, sql, params=None):
+        self._cur.execute(sql, params or {})
+        return self
+
+    def fetchone(self):
+        return self._cur.fetchone()
+
+    def fetchall(self):
+        return self._cur.fetchall()
+
+    def fetchmany(self, size=None):
+        return self._cur.fetchmany(size or self.arraysize)
+
+    @property
+    def description(self):
+        return self._cur.description
+
+    def __iter__(self):
+        return iter(self._cur)
+
+
+class ReplicaConnection:
+    """스레드별로 재사용하는 읽기 전용 연결 (with 블록이 끝나도 닫지 않음)"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def cursor(self):
+        return ReplicaCursor(self._conn)
+
+    def close(self):
+        pass
+
+
+class ReferenceReplica:
+    """참조 테이블 복제본 (동기화 + 읽기 연결)"""
+
+    META_TABLE = '_replica_tables'
+    HASH_TABLE = '_replica_group_hashes'
+
+    def __init__(self):
+        self._local = threading.local()
+        self._sync_lock = threading.Lock()
+        self._synced_at: Dict[str, float] = {}
+        self._synced_checked_at = 0.0
+        self._stale_tables = frozenset()
+
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, 'REFERENCE_REPLICA_ENABLED', False)
+
+    @property
+    def path(self) -> Path:
+        return get_replica_path()
+
+    # ============================================================
+    # SQLite 연결
+    # ============================================================
+
+    def _apply_read_pragmas(self, conn: sqlite3.Connection):
+        mmap_size = getattr(settings, 'REFERENCE_REPLICA_MMAP_SIZE', 256 * 1024 * 1024)
+        conn.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
+        conn.execute("PRAGMA cache_size = -32000")  # 약 32MB 페이지 캐시
+        conn.execute("PRAGMA temp_store = MEMORY")
+
+    def _write_connection(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        self._apply_read_pragmas(conn)
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {self.META_TABLE} (
+                table_name TEXT PRIMARY KEY,
+                columns TEXT NOT NULL,
+                row_count INTEGER NOT NULL DEFAULT 0,
+                group_count INTEGER NOT NULL DEFAULT 0,
+                synced_at REAL NOT NULL
+            )
+        """)
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {self.HASH_TABLE} (
+                table_name TEXT NOT NULL,
+                group_key TEXT NOT NULL,
+                row_hash TEXT NOT NULL,
+                PRIMARY KEY (table_name, group_key)
+            ) WITHOUT ROWID
+        """)
+        return conn
+
+    def _read_connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            uri = f"{self.path.resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA query_only = ON")
+            self._apply_read_pragmas(conn)
+            self._local.conn = conn
+        return conn
+
+    @property
+    def max_age(self) -> float:
+        """마지막 동기화 성공 후 복제본을 사용할 최대 시간 (초, 0이면 제한 없음)"""
+        return getattr(settings, 'REFERENCE_REPLICA_MAX_AGE', 60 * 15)
+
+    def _load_synced_at(self) -> Dict[str, float]:
+        """테이블별 마지막 동기화 성공 시각 (30초마다 다시 확인)"""
+        now = time.monotonic()
+        if now - self._synced_checked_at < 30:
+            return self._synced_at
+        synced_at = {}
+        if self.path.exists():
+            try:
+                rows = self._read_connection().execute(
+                    f"SELECT table_name, synced_at FROM {self.META_TABLE}"
+                ).fetchall()
+                synced_at = {name: float(at) for name, at in rows}
+            except sqlite3.Error:
+                synced_at = {}
+        self._synced_at = synced_at
+        self._synced_checked_at = now
+        return synced_at
+
+    def synced_tables(self) -> frozenset:
+        """최근(max_age 이내)에 동기화에 성공한 테이블"""
+        synced_at = self._load_synced_at()
+        max_age = self.max_age
+        if not max_age:
+            return frozenset(synced_at)
+        cutoff = time.time() - max_age
+        fresh = frozenset(name for name, at in synced_at.items() if at >= cutoff)
+        stale = frozenset(synced_at) - fresh
+        if stale != self._stale_tables:
+            # 상태가 바뀔 때만 기록 (요청마다 로그를 남기지 않도록)
+            if stale - self._stale_tables:
+                print(
+                    f"[ReferenceReplica] ⚠️ 동기화가 {int(max_age)}초 넘게 없어 Oracle로 조회: {sorted(stale)}",
+                    flush=True
+                )
+            self._stale_tables = stale
+        return fresh
+
+    def is_ready(self, *tables) -> bool:
+        """복제본으로 조회 가능 여부 (설정이 켜져 있고 필요한 테이블이 모두 최근에 동기화됨)"""
+        if not self.enabled:
+            return False
+        synced = self.synced_tables()
+        return bool(synced) and all(table in synced for table in (tables or REPLICA_TABLES))
+
+    def connect(self) -> ReplicaConnection:
+        return ReplicaConnection(self._read_connection())
+
+    def fetch_one(self, sql, params=None):
+        with self.connect() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql, params)
+                return cur.fetchone()
+
+    def fetch_all(self, sql, params=None):
+        with self.connect() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql, params)
+                return cur.fetchall()
+
+    # ============================================================
+    # 동기화
+    # ============================================================
+
+    def sync(self, tables: Iterable[str] = None, full: bool = False) -> Dict:
+        """
+        Oracle → SQLite 증분 동기화
+
+        Args:
+            tables: 동기화할 테이블 (기본: REPLICA_TABLES 전체)
+            full: 저장된 그룹 해시를 무시하고 전체 재적재
+
+        Returns:
+            {'tables': {TABLE: {...} 또는 {'error': ...}}, 'changed': bool, 'elapsed': 초}
+        """
+        started = time.time()
+        tables = list(tables or REPLICA_TABLES)
+        result = {'tables': {}, 'changed': False}
+
+        with self._sync_lock:
+            sqlite_conn = self._write_connection()
+            try:
+                with get_connection() as ora_conn:
+                    for table in tables:
+                        try:
+                            stats = self._sync_table(ora_conn, sqlite_conn, table, full)
+                        except Exception as e:
+                            print(f"[ReferenceReplica] {table} 동기화 실패: {e}", flush=True)
+                            stats = {'error': str(e)}
+                        result['tables'][table] = stats
+                        if stats.get('changed_groups') or stats.get('removed_groups'):
+                            result['changed'] = True
+                sqlite_conn.execute("PRAGMA optimize")
+            finally:
+                sqlite_conn.close()
+
+        self._synced_checked_at = 0.0
+        changed_catalog = [
+            table for table, stats in result['tables'].items()
+            if table in CATALOG_TABLES and (stats.get('changed_groups') or stats.get('removed_groups'))
+        ]
+        if changed_catalog:
+            from api.utils.catalog_version import bump_catalog_version
+            result['catalog_version'] = bump_catalog_version()
+
+        result['elapsed'] = round(time.time() - started, 2)
+        print(f"[ReferenceReplica] 동기화 완료 ({result['elapsed']}초, 변경={result['changed']})", flush=True)
+        return result
+
+    def _describe(self, ora_cur, table: str) -> List[tuple]:
+        """Oracle 테이블 컬럼 (이름, 타입)"""
+        ora_cur.execute(f"SELECT * FROM {table} WHERE 1 = 0")
+        return [(col[0], col[1]) for col in ora_cur.description]
+
+    def _hash_query(self, table: str, group_col: str, columns: List[tuple]) -> str:
+        """그룹 키 단위 행 해시 쿼리 (컬럼마다 다른 seed의 ORA_HASH 합)"""
+        terms = []
+        for seed, (name, db_type) in enumerate(columns, start=1):
+            if db_type in (oracledb.DB_TYPE_BLOB,):
+                expr = f"TO_CHAR(NVL(DBMS_LOB.GETLENGTH({name}), -1))"
+            elif db_type in _LOB_TYPES:
+                expr = f"NVL(DBMS_LOB.SUBSTR({name}, {LOB_HASH_CHARS}, 1), '~') || DBMS_LOB.GETLENGTH({name})"
+            else:
+                expr = f"NVL(TO_CHAR({name}), '~')"
+            terms.append(f"ORA_HASH({expr}, 4294967295, {seed})")
+        return f"""
+            SELECT {group_col} AS GROUP_KEY,
+                   COUNT(*) || ':' || SUM({' + '.join(terms)}) AS ROW_HASH
+            FROM {table}
+            WHERE {group_col} IS NOT NULL
+            GROUP BY {group_col}
+        """
+
+    def _ensure_schema(self, sqlite_conn, table: str, columns: List[tuple]) -> bool:
+        """
+        SQLite 테이블/인덱스 생성 (컬럼 구성이 바뀌었으면 다시 만듦)
+
+        Returns:
+            테이블을 새로 만들었으면 True (전체 재적재 필요)
+        """
+        signature = json.dumps([name for name, _ in columns])
+        row = sqlite_conn.execute(
+            f"SELECT columns FROM {self.META_TABLE} WHERE table_name = ?", (table,)
+        ).fetchone()
+        exists = sqlite_conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone()
+        if row and row[0] == signature and exists:
+            return False
+
+        column_defs = []
+        for name, db_type in columns:
+            if db_type in _NUMBER_TYPES:
+                affinity = ' NUMERIC'
+            elif db_type in _TEXT_TYPES:
+                affinity = ' TEXT'
+            else:
+                # 그 외(BLOB 등)는 타입 변환 없이 그대로 저장
+                affinity = ''
+            column_defs.append(f"{_quote(name)}{affinity}")
+
+        names = {name for name, _ in columns}
+        spec = REPLICA_TABLES[table]
+        sqlite_conn.execute("BEGIN")
+        sqlite_conn.execute(f"DROP TABLE IF EXISTS {_quote(table)}")
+        sqlite_conn.execute(f"CREATE TABLE {_quote(table)} ({', '.join(column_defs)})")
+        indexes = [cols for cols in spec['indexes'] if all(c in names for c in cols)]
+        if not any(cols[0] == spec['group'] for cols in indexes):
+            indexes.insert(0, (spec['group'],))
+        for idx, cols in enumerate(indexes):
+            sqlite_conn.execute(
+                f"CREATE INDEX {_quote(f'ix_{table.lower()}_{idx}')} ON {_quote(table)} "
+                f"({', '.join(_quote(c) for c in cols)})"
+            )
+        sqlite_conn.execute(f"DELETE FROM {self.HASH_TABLE} WHERE table_name = ?", (table,))
+        sqlite_conn.execute(f"DELETE FROM {self.META_TABLE} WHERE table_name = ?", (table,))
+        sqlite_conn.execute("COMMIT")
+        print(f"[ReferenceReplica] {table} 테이블 생성 (컬럼 {len(columns)}개, 인덱스 {len(indexes)}개)", flush=True)
+        return True
+
+    def _sync_table(self, ora_conn, sqlite_conn, table: str, full: bool) -> Dict:
+        spec = REPLICA_TABLES[table]
+        group_col = spec['group']
+
+        with ora_conn.cursor() as ora_cur:
+            tune_cursor(ora_cur, FETCH_ARRAYSIZE)
+            columns = self._describe(ora_cur, table)
+            if group_col not in {name for name, _ in columns}:
+                raise ValueError(f"그룹 키 컬럼 없음: {table}.{group_col}")
+            created = self._ensure_schema(sqlite_conn, table, columns)
+
+            ora_cur.execute(self._hash_query(table, group_col, columns))
+            new_hashes = {str(key): str(row_hash) for key, row_hash in ora_cur}
+
+            old_hashes = {} if (full or created) else dict(sqlite_conn.execute(
+                f"SELECT group_key, row_hash FROM {self.HASH_TABLE} WHERE table_name = ?", (table,)
+            ).fetchall())
+            changed = [key for key, h in new_hashes.items() if old_hashes.get(key) != h]
+            removed = [key for key in old_hashes if key not in new_hashes]
+
+            rows = []
+            if changed:
+                select_cols = ', '.join(name for name, _ in columns)
+                if len(changed) == len(new_hashes):
+                    # 전체 재적재: IN 목록 없이 한 번에 스트리밍
+                    ora_cur.execute(f"SELECT {select_cols} FROM {table} WHERE {group_col} IS NOT NULL")
+                    rows = [tuple(_to_sqlite_value(v) for v in row) for row in ora_cur]
+                else:
+                    keys = sorted(changed, key=lambda k: (len(k), k))
+                    for start in range(0, len(keys), IN_LIST_CHUNK):
+                        chunk = keys[start:start + IN_LIST_CHUNK]
+                        binds = {f"k{i}": _group_bind(key) for i, key in enumerate(chunk)}
+                        placeholders = ', '.join(f":{name}" for name in binds)
+                        ora_cur.execute(
+                            f"SELECT {select_cols} FROM {table} WHERE {group_col} IN ({placeholders})",
+                            binds
+                        )
+                        rows.extend(tuple(_to_sqlite_value(v) for v in row) for row in ora_cur)
+
+        # 테이블별 한 트랜잭션으로 교체 (WAL이라 읽기는 이전 스냅샷으로 계속 진행)
+        insert_sql = (
+            f"INSERT INTO {_quote(table)} VALUES ({', '.join('?' for _ in columns)})"
+        )
+        touched = changed + removed
+        sqlite_conn.execute("BEGIN IMMEDIATE")
+        try:
+            if created or full:
+                sqlite_conn.execute(f"DELETE FROM {_quote(table)}")
+                sqlite_conn.execute(f"DELETE FROM {self.HASH_TABLE} WHERE table_name = ?", (table,))
+            else:
+                for start in range(0, len(touched), SQLITE_CHUNK):
+                    chunk = [_group_bind(key) for key in touched[start:start + SQLITE_CHUNK]]
+                    sqlite_conn.execute(
+                        f"DELETE FROM {_quote(table)} WHERE {_quote(group_col)} IN ({', '.join('?' for _ in chunk)})",
+                        chunk
+                    )
+                for start in range(0, len(removed), SQLITE_CHUNK):
+                    chunk = removed[start:start + SQLITE_CHUNK]
+                    sqlite_conn.execute(
+                        f"DELETE FROM {self.HASH_TABLE} WHERE table_name = ? AND group_key IN ({', '.join('?' for _ in chunk)})",
+                        [table] + chunk
+                    )
+            sqlite_conn.executemany(insert_sql, rows)
+            sqlite_conn.executemany(
+                f"INSERT OR REPLACE INTO {self.HASH_TABLE} (table_name, group_key, row_hash) VALUES (?, ?, ?)",
+                [(table, key, new_hashes[key]) for key in changed]
+            )
+            row_count = sqlite_conn.execute(f"SELECT COUNT(*) FROM {_quote(table)}").fetchone()[0]
+            sqlite_conn.execute(
+                f"INSERT OR REPLACE INTO {self.META_TABLE} (table_name, columns, row_count, group_count, synced_at) "
+                f"VALUES (?, ?, ?, ?, ?)",
+                (table, json.dumps([name for name, _ in columns]), row_count, len(new_hashes), time.time())
+            )
+            sqlite_conn.execute("COMMIT")
+        except Exception:
+            sqlite_conn.execute("ROLLBACK")
+            raise
+
+        stats = {
+            'groups': len(new_hashes),
+            'changed_groups': len(changed),
+            'removed_groups': len(removed),
+            'rows_written': len(rows),
+            'row_count': row_count,
+        }
+        print(f"[ReferenceReplica] {table}: {stats}", flush=True)
+        return stats
+
+    def stats(self) -> Dict:
+        """테이블별 동기화 상태"""
+        if not self.path.exists():
+            return {}
+        try:
+            rows = self._read_connection().execute(
+                f"SELECT table_name, row_count, group_count, synced_at FROM {self.META_TABLE} ORDER BY table_name"
+            ).fetchall()
+        except sqlite3.Error:
+            return {}
+        return {
+            name: {'rows': row_count, 'groups': group_count, 'synced_at': synced_at}
+            for name, row_count, group_count, synced_at in rows
+        }
+
+
+def _group_bind(key: str):
+    """저장된 그룹 키(문자열) → 바인드 값 (숫자 키는 숫자로)"""
+    try:
+        return int(key)
+    except (TypeError, ValueError):
+        return key
+
+
+def get_reference_connection(*tables):
+    """
+    참조 테이블 조회용 연결
+
+    REFERENCE_REPLICA_ENABLED이고 tables가 모두 복제되어 있으면 로컬 SQLite 복제본,
+    아니면 Oracle 연결을 돌려줍니다. 두 연결 모두 `with conn.cursor() as cur` / :name 바인드로 사용합니다.
+    """
+    if reference_replica.is_ready(*tables):
+        return reference_replica.connect()
+    return get_connection()
+
+
+# 싱글톤 인스턴스
+reference_replica = ReferenceReplica()
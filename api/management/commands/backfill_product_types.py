@@ -0,0 +1,48 @@
+"""
+Product.product_type 칼럼 채우기 명령어
+- 칼럼 추가 전에 들어온 제품(빈 값)의 제품 종류를 제품명 기반으로 계산해 저장
+- --all: 분류 키워드가 바뀐 경우 전체 제품을 다시 계산
+"""
+from django.core.management.base import BaseCommand
+
+from api.models import Product
+from api.utils.product_type_classifier import clear_product_type_cache, product_type_column_value
+
+
+class Command(BaseCommand):
+    help = "제품명 기반 제품 종류(product_type) 칼럼 채우기"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='이미 값이 있는 제품도 다시 계산 (분류 키워드 변경 시)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='bulk_update 배치 크기 (기본 1000)',
+        )
+
+    def handle(self, *args, **options):
+        queryset = Product.objects.all()
+        if not options['all']:
+            queryset = queryset.filter(product_type='')
+
+        changed = []
+        scanned = 0
+        for product in queryset.only('product_id', 'name', 'category', 'product_type').iterator(chunk_size=2000):
+            scanned += 1
+            value = product_type_column_value(product.name, product.category)
+            if value != product.product_type:
+                product.product_type = value
+                changed.append(product)
+
+        # save()를 거치지 않으므로 updated_at은 건드리지 않음 (카탈로그 버전 유지)
+        Product.objects.bulk_update(changed, ['product_type'], batch_size=options['batch_size'])
+        clear_product_type_cache()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"제품 종류 채우기 완료: 검사 {scanned}개, 갱신 {len(changed)}개"
+        ))
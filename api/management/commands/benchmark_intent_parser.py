@@ -0,0 +1,136 @@
+"""
+로컬 의도 파서 벤치마크 명령어
+- 로그된 자연어 추천 질의(AI_INTENT_QUERY_LOG, JSONL)나 한 줄에 질의 하나인 텍스트 파일을 현재 파서로 다시 파싱
+- 로컬 처리 비율(신뢰도 >= 임계값), 파싱 시간, 슬롯별 추출 비율을 출력
+- LLM에 위임된 질의는 LLM 추출 결과와 로컬 추출 결과의 슬롯별 일치율도 출력 (임계값 조정 근거)
+
+사용법:
+    AI_INTENT_QUERY_LOG=logs/ai_intent_queries.jsonl python manage.py benchmark_intent_parser
+    python manage.py benchmark_intent_parser --file queries.txt --threshold 0.7 --show-misses 20
+"""
+import json
+import time
+from collections import Counter
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.utils.intent_parser import intent_parser
+
+COMPARE_SLOTS = ('household_size', 'budget', 'categories', 'priority', 'housing_type', 'pyung', 'vibe')
+
+
+def _load_queries(path: Path):
+    """JSONL(message / llm 필드) 또는 텍스트(한 줄 한 질의)"""
+    queries = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith('{'):
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if entry.get('message'):
+                    queries.append((entry['message'], entry.get('llm')))
+            else:
+                queries.append((line, None))
+    return queries
+
+
+def _same(slot, local_value, llm_value) -> bool:
+    if slot == 'categories':
+        return sorted(local_value or []) == sorted(llm_value or [])
+    if local_value in (None, '') and llm_value in (None, ''):
+        return True
+    try:
+        return float(local_value) == float(llm_value)
+    except (TypeError, ValueError):
+        return local_value == llm_value
+
+
+class Command(BaseCommand):
+    help = "로컬 의도 파서의 로그 질의 처리 비율 벤치마크"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--file', type=str, default=None, help='질의 파일 (기본: AI_INTENT_QUERY_LOG)')
+        parser.add_argument('--threshold', type=float, default=None, help='신뢰도 임계값 (기본: AI_INTENT_CONFIDENCE_THRESHOLD)')
+        parser.add_argument('--unique', action='store_true', help='같은 질의는 한 번만 측정')
+        parser.add_argument('--show-misses', type=int, default=10, help='LLM 위임 질의 예시 출력 개수')
+
+    def handle(self, *args, **options):
+        file = options['file'] or getattr(settings, 'AI_INTENT_QUERY_LOG', '')
+        if not file:
+            raise CommandError("--file을 지정하거나 AI_INTENT_QUERY_LOG 환경 변수로 질의 로그를 켜세요.")
+        path = Path(file)
+        if not path.is_file():
+            raise CommandError(f"질의 파일이 없습니다: {path}")
+        threshold = options['threshold']
+        if threshold is None:
+            threshold = getattr(settings, 'AI_INTENT_CONFIDENCE_THRESHOLD', 0.8)
+
+        queries = _load_queries(path)
+        if options['unique']:
+            seen = {}
+            for message, llm in queries:
+                if message not in seen or llm is not None:
+                    seen[message] = llm
+            queries = list(seen.items())
+        if not queries:
+            raise CommandError(f"질의가 없습니다: {path}")
+
+        hits = 0
+        timings = []
+        slot_counts = Counter()
+        reasons = Counter()
+        misses = []
+        agreement = Counter()
+        compared = 0
+
+        for message, llm_slots in queries:
+            started = time.perf_counter()
+            result = intent_parser.parse(message)
+            timings.append((time.perf_counter() - started) * 1_000_000)
+
+            for slot in result.matched:
+                slot_counts[slot] += 1
+            if result.is_confident(threshold):
+                hits += 1
+            else:
+                reasons[result.escalate_reason.split(':')[0] if result.escalate_reason else
+                        ('no_slot' if not result.matched else 'low_coverage')] += 1
+                if len(misses) < options['show_misses']:
+                    misses.append((result.confidence, message, result.unknown_tokens))
+
+            if isinstance(llm_slots, dict):
+                compared += 1
+                for slot in COMPARE_SLOTS:
+                    if _same(slot, result.slots.get(slot), llm_slots.get(slot)):
+                        agreement[slot] += 1
+
+        total = len(queries)
+        timings.sort()
+        self.stdout.write(f"질의 파일: {path} ({total}건, 임계값 {threshold})")
+        self.stdout.write(self.style.SUCCESS(
+            f"로컬 처리: {hits}/{total} ({hits / total * 100:.1f}%), LLM 위임: {total - hits}건"
+        ))
+        self.stdout.write(
+            f"파싱 시간: 평균 {sum(timings) / total:.1f}us, "
+            f"p50 {timings[total // 2]:.1f}us, p95 {timings[min(total - 1, int(total * 0.95))]:.1f}us"
+        )
+        self.stdout.write("슬롯 추출 비율: " + ', '.join(
+            f"{slot} {slot_counts[slot] / total * 100:.0f}%" for slot in COMPARE_SLOTS
+        ))
+        if reasons:
+            self.stdout.write("위임 사유: " + ', '.join(f"{k} {v}" for k, v in reasons.most_common()))
+        if compared:
+            self.stdout.write(f"LLM 추출 결과와 슬롯별 일치율 ({compared}건): " + ', '.join(
+                f"{slot} {agreement[slot] / compared * 100:.0f}%" for slot in COMPARE_SLOTS
+            ))
+        if misses:
+            self.stdout.write("LLM 위임 질의 예시:")
+            for confidence, message, unknown in misses:
+                self.stdout.write(f"  {confidence:.2f}  {message}  (미해석: {', '.join(unknown) or '-'})")
@@ -0,0 +1,24 @@
+"""
+리뷰 키워드 인덱스 아티팩트 생성 명령어
+- 제품별 최신 리뷰에서 취향/우선순위 키워드 등장 횟수와 긍정 키워드 순위를 미리 계산
+- 추천 문구 생성기는 워커 기동 시 아티팩트를 로드해 조회만 수행
+"""
+from django.core.management.base import BaseCommand
+
+from api.utils.review_keyword_index import build_review_keyword_index_artifact
+
+
+class Command(BaseCommand):
+    help = "제품별 리뷰 키워드 인덱스(취향/우선순위 키워드 횟수, 긍정 키워드 순위) 아티팩트 생성"
+
+    def handle(self, *args, **options):
+        artifact = build_review_keyword_index_artifact()
+        stats = artifact['stats']
+
+        self.stdout.write(self.style.SUCCESS(
+            f"리뷰 키워드 인덱스 생성 완료 ({stats['elapsed']}초) - "
+            f"카탈로그 버전 v{artifact['catalog_version']}"
+        ))
+        self.stdout.write(
+            f"  제품 {stats['products']}개, 리뷰 {stats['reviews']}개, 파일 {stats['bytes']:,} bytes"
+        )
@@ -0,0 +1,38 @@
+"""
+제품별 리뷰 요약 배치 생성 명령어
+- 리뷰가 있는 모든 제품의 리뷰를 LLM으로 미리 요약해 ProductReviewSummary에 저장
+- 리뷰 묶음 해시가 저장된 값과 같은 제품은 건너뜀 (리뷰가 바뀐 제품만 다시 요약)
+- 동시 요청 수와 분당 요청 수를 제한해 OpenAI 속도 제한을 넘지 않도록 함
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from api.services.review_summary_service import review_summary_service
+
+
+class Command(BaseCommand):
+    help = "제품별 리뷰 요약 배치 생성 (리뷰가 바뀐 제품만)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='리뷰 변경 여부와 관계없이 전체 다시 요약 (LLM 응답 캐시 미사용)')
+        parser.add_argument('--concurrency', type=int, default=None, help='동시 요청 수 (기본: REVIEW_SUMMARY_CONCURRENCY)')
+        parser.add_argument('--rpm', type=float, default=None, help='분당 최대 요청 수 (기본: REVIEW_SUMMARY_RATE_PER_MINUTE, 0이면 제한 없음)')
+        parser.add_argument('--limit', type=int, default=None, help='이번 실행에서 요약할 최대 제품 수')
+        parser.add_argument('--dry-run', action='store_true', help='요약 대상 수만 출력')
+
+    def handle(self, *args, **options):
+        try:
+            stats = review_summary_service.build_summaries(
+                force=options['force'],
+                concurrency=options['concurrency'],
+                rate_per_minute=options['rpm'],
+                limit=options['limit'],
+                dry_run=options['dry_run'],
+            )
+        except RuntimeError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"리뷰 요약 {'대상 확인' if options['dry_run'] else '완료'} ({stats['elapsed']}초) - "
+            f"리뷰 있는 제품 {stats['products']}개, 변경 없음 {stats['unchanged']}개, "
+            f"요약 {stats['summarized']}개, 실패 {stats['failed']}개, 삭제 {stats['removed']}개"
+        ))
@@ -0,0 +1,30 @@
+"""
+SPEC 스키마 아티팩트 생성 명령어
+- 전체 카탈로그 기준 COMMON/VARIANT 칼럼, 제품 종류별 SPEC_KEY 빈도/중요도 계산
+- 기본은 증분 (이전 아티팩트 이후 바뀐 스펙만 디코딩)
+"""
+from django.core.management.base import BaseCommand
+
+from api.utils.spec_schema import build_spec_schema_artifact
+
+
+class Command(BaseCommand):
+    help = "전체 카탈로그 SPEC 스키마(COMMON/VARIANT 칼럼, 키 빈도/중요도) 아티팩트 생성"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='이전 아티팩트를 무시하고 전체 재계산'
+        )
+
+    def handle(self, *args, **options):
+        artifact = build_spec_schema_artifact(full=options.get('full'))
+        stats = artifact['stats']
+
+        self.stdout.write(self.style.SUCCESS(
+            f"SPEC 스키마 생성 완료 ({stats['mode']}, {stats['elapsed']}초) - "
+            f"카탈로그 버전 v{artifact['catalog_version']}"
+        ))
+        self.stdout.write(f"  제품 {stats['products']}개, 디코딩 {stats['decoded_specs']}개")
+        self.stdout.write(f"  제품 종류 {stats['types']}개, COMMON 칼럼 {stats['common_spec_keys']}개")
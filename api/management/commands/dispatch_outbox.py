@@ -0,0 +1,56 @@
+"""
+아웃박스 이벤트 디스패치 명령어
+- 대기 중인 아웃박스 이벤트(온보딩 완료 등)를 Oracle에 반영
+- --loop: 워커로 계속 실행 (OUTBOX_DISPATCH_IN_PROCESS=False 환경용)
+- --retry-failed: 재시도 한도를 넘긴 이벤트를 대기 상태로 되돌린 뒤 반영
+"""
+from django.core.management.base import BaseCommand
+
+from api.services.outbox_service import outbox_service
+
+
+class Command(BaseCommand):
+    help = "아웃박스 이벤트를 Oracle에 반영 (1회 또는 워커 루프)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='종료하지 않고 폴링 주기마다 계속 반영'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=None,
+            help='--loop 폴링 주기 (초, 기본 OUTBOX_POLL_INTERVAL)'
+        )
+        parser.add_argument(
+            '--retry-failed',
+            action='store_true',
+            help='FAILED 이벤트를 대기 상태로 되돌린 뒤 반영'
+        )
+        parser.add_argument(
+            '--stats',
+            action='store_true',
+            help='상태별 이벤트 수만 출력'
+        )
+
+    def handle(self, *args, **options):
+        if options['stats']:
+            for status, count in outbox_service.stats().items():
+                self.stdout.write(f"  {status}: {count}")
+            return
+
+        if options['retry_failed']:
+            count = outbox_service.retry_failed()
+            self.stdout.write(f"FAILED 이벤트 {count}개를 대기 상태로 되돌림")
+
+        if options['loop']:
+            self.stdout.write("아웃박스 디스패처 시작 (Ctrl+C로 종료)")
+            outbox_service.run_forever(poll_interval=options['poll_interval'])
+            return
+
+        totals = outbox_service.dispatch_pending()
+        self.stdout.write(self.style.SUCCESS(
+            f"아웃박스 반영 완료: 반영 {totals['done']}개, 실패 {totals['failed']}개, 연기 {totals['deferred']}개"
+        ))
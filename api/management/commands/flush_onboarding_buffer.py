@@ -0,0 +1,55 @@
+"""
+온보딩 write-behind 버퍼 flush 명령어
+- 완료 시점 flush에 실패한 세션(pending)을 Oracle에 다시 반영
+- 특정 세션 버퍼를 강제로 flush
+- 완료되지 않고 방치된 세션 버퍼 정리
+"""
+from django.core.management.base import BaseCommand
+
+from api.services.onboarding_write_buffer import onboarding_write_buffer
+
+
+class Command(BaseCommand):
+    help = "온보딩 write-behind 버퍼를 Oracle에 반영 (실패한 세션 재시도)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--session-id',
+            type=str,
+            help='특정 세션 버퍼만 flush'
+        )
+        parser.add_argument(
+            '--list',
+            action='store_true',
+            help='재시도 대기 중인 세션 목록만 출력'
+        )
+        parser.add_argument(
+            '--purge-stale',
+            action='store_true',
+            help='ONBOARDING_BUFFER_RETENTION보다 오래 방치된 미완료 세션 버퍼 삭제'
+        )
+
+    def handle(self, *args, **options):
+        session_id = options.get('session_id')
+
+        if options.get('list'):
+            pending = onboarding_write_buffer.pending_sessions()
+            self.stdout.write(f"재시도 대기 세션: {len(pending)}개")
+            for pending_id in pending:
+                self.stdout.write(f"  - {pending_id}")
+            return
+
+        if options.get('purge_stale'):
+            removed = onboarding_write_buffer.purge_stale()
+            self.stdout.write(self.style.SUCCESS(f"방치된 세션 버퍼 {removed}개 삭제"))
+            return
+
+        if session_id:
+            count = onboarding_write_buffer.flush(session_id)
+            self.stdout.write(self.style.SUCCESS(f"세션 {session_id} flush 완료 (응답 {count}개)"))
+            return
+
+        result = onboarding_write_buffer.flush_pending()
+        self.stdout.write(self.style.SUCCESS(f"flush 완료: {len(result['flushed'])}개"))
+        for failed_id, error in result['failed'].items():
+            self.stdout.write(self.style.ERROR(f"  실패 {failed_id}: {error}"))
@@ -5,25 +5,103 @@
 - 평균벡터(추천이유) 파일 활용
 - 취향별 세분화된 고품질 문구 생성
 
+- 병렬 모드: 조합을 프로세스 풀로 나눠 재시도 후보 문구까지 미리 생성하고,
+  중복 제거는 조합 순서대로 병합 단계에서 수행 (워커 수와 무관하게 같은 출력)
+
 사용법:
     python manage.py generate_taste_recommendations
+    python manage.py generate_taste_recommendations --workers 0   # CPU 수만큼 병렬
 """
 import csv
 import os
 import json
 import re
 import hashlib
-from collections import defaultdict, Counter
+import time
+from collections import defaultdict, Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from itertools import product
 from pathlib import Path
 from django.core.management.base import BaseCommand
-from api.models import Product, ProductReview, ProductRecommendReason
 from django.db.models import Count, Avg
 
+# 중복 문구일 때 조합별로 시도하는 문구 변형 수
+MAX_RETRIES = 5
+# 제품당 특징 추출에 쓰는 리뷰 수
+FEATURE_REVIEW_LIMIT = 50
+# 진행 상황 출력/로그 기록 간격 (조합 수)
+PROGRESS_INTERVAL = 50
+
+# 워커 프로세스에 넘기는 제품 스냅샷 (ORM 객체 대신 필요한 필드만)
+ProductSnapshot = namedtuple('ProductSnapshot', ['pk', 'name', 'price', 'model_number', 'review_count'])
+
+# 워커 프로세스별 상태 (_init_worker에서 한 번 설정)
+_worker_state = {}
+
+
+def _init_worker(products, recommend_reasons, review_texts):
+    """워커 프로세스 초기화 (제품 인덱스는 워커마다 한 번만 생성)"""
+    command = Command()
+    command._review_texts = review_texts
+    _worker_state['command'] = command
+    _worker_state['index'] = ProductScoreIndex(command, products)
+    _worker_state['recommend_reasons'] = recommend_reasons
+
+
+def _generate_chunk(chunk):
+    """조합 묶음의 후보 문구 생성 → [(순번, 리뷰 기반 후보, AI 기반 후보)]"""
+    command = _worker_state['command']
+    return [
+        (i, *command._generate_candidates(combo, _worker_state['index'], _worker_state['recommend_reasons']))
+        for i, combo in chunk
+    ]
+
+
+class ProductScoreIndex:
+    """
+    취향 차원 값별 제품 점수 인덱스
+
+    제품 점수는 스타일/우선순위/예산/라인업/메이트 점수와 리뷰 보너스의 가중합이므로,
+    차원 값(예산·라인업은 가격 구간)마다 제품별 점수를 한 번만 계산해 두고
+    각 조합은 해당 구간의 점수만 조회해 더합니다.
+    """
+
+    def __init__(self, command, products):
+        self.command = command
+        self.products = list(products)
+        self.review_bonus = [command._calculate_review_bonus(p) for p in self.products]
+        self._buckets = {}
+
+    def _bucket(self, key, score):
+        scores = self._buckets.get(key)
+        if scores is None:
+            scores = self._buckets[key] = [score(p) for p in self.products]
+        return scores
+
+    def components(self, combo):
+        """조합의 (스타일, 우선순위, 예산, 라인업, 메이트, 리뷰 보너스) 제품별 점수"""
+        command = self.command
+        vibe_key = combo['vibe'].split('(')[1].split(')')[0].strip() if '(' in combo['vibe'] else ''
+        priority = combo['priority']
+        mate = combo['mate']
+        budget_range = command._parse_budget_range(combo['budget'])
+        lineup_range = command._parse_budget_range(combo['lineup'])
+        return (
+            self._bucket(('vibe', vibe_key), lambda p: command._score_vibe_match(p, vibe_key)),
+            self._bucket(('priority', priority), lambda p: command._score_priority_match(p, priority)),
+            self._bucket(('budget', budget_range), lambda p: command._score_budget_match(p, *budget_range)),
+            self._bucket(('lineup', lineup_range), lambda p: command._score_lineup_match(p, *lineup_range)),
+            self._bucket(('mate', mate), lambda p: command._score_mate_match(p, mate)),
+            self.review_bonus,
+        )
+
 
 class Command(BaseCommand):
     help = '768개 취향 조합별 고품질 추천 문구 샘플을 생성합니다'
 
+    # 제품별 리뷰 텍스트 (미리 로드한 경우 특징 추출 시 DB 조회 생략)
+    _review_texts = None
+
     def add_arguments(self, parser):
         parser.add_argument(
             '--output',
@@ -47,12 +125,28 @@ class Command(BaseCommand):
             action='store_true',
             help='기존 파일을 덮어쓰지 않고 타임스탬프가 붙은 새 파일 생성',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='후보 문구 생성 프로세스 수 (1=단일 프로세스, 0=CPU 수)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=16,
+            help='워커에 한 번에 넘기는 조합 수',
+        )
 
     def handle(self, *args, **options):
         output_path = options['output']
         limit = options['limit']
         no_backup = options.get('no_backup', False)
         new_file = options.get('new_file', False)
+        workers = options.get('workers', 1)
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        chunk_size = max(1, options.get('chunk_size', 16))
         
         self.stdout.write(self.style.SUCCESS('\n=== 고품질 취향별 추천 문구 생성 ===\n'))
         
@@ -61,69 +155,119 @@ class Command(BaseCommand):
         taste_combinations = self._generate_taste_combinations(limit)
         products_with_reviews = self._get_products_with_reviews()
         recommend_reasons = self._load_recommend_reasons()
+        review_texts = self._load_review_texts(products_with_reviews)
         
         self.stdout.write(f'  - 취향 조합: {len(taste_combinations)}개')
         self.stdout.write(f'  - 리뷰가 있는 제품: {len(products_with_reviews)}개')
         self.stdout.write(f'  - 추천이유 데이터: {len(recommend_reasons)}개\n')
         
-        # 2. 각 취향 조합별로 추천 문구 생성 (중복 방지)
-        self.stdout.write('[2] 추천 문구 생성 중...')
+        # 진행 상황 로그 파일 경로
+        progress_log_path = str(self._resolve_output_path(output_path).parent / 'taste_generation_progress.log')
+        os.makedirs(os.path.dirname(progress_log_path), exist_ok=True)
+        
+        # 2. 각 취향 조합별 후보 문구 생성 (재시도 변형 포함)
+        self.stdout.write(f'[2] 추천 문구 후보 생성 중... (워커 {workers}개)')
+        started = time.time()
+        candidates = self._generate_all_candidates(
+            taste_combinations, products_with_reviews, recommend_reasons, review_texts,
+            workers, chunk_size, progress_log_path
+        )
+        elapsed = time.time() - started
+        rate = len(taste_combinations) / elapsed if elapsed > 0 else 0.0
+        self.stdout.write(f'  - 후보 생성: {len(taste_combinations)}개 조합, {elapsed:.1f}초 ({rate:.1f} 조합/초)')
+        
+        # 3. 조합 순서대로 중복 제거 병합
+        recommendations = self._merge_candidates(taste_combinations, candidates)
+        
+        # 4. CSV 저장
+        self._save_to_csv(recommendations, output_path, no_backup=no_backup, new_file=new_file)
+        
+        # 완료 로그 기록
+        with open(progress_log_path, 'w', encoding='utf-8') as log_file:
+            log_file.write(f"완료: {len(recommendations)}/{len(recommendations)} (100.0%)\n")
+            log_file.write(f"처리 속도: {rate:.1f} 조합/초 (워커 {workers}개)\n")
+            log_file.write("상태: 완료\n")
+        
+        self.stdout.write(self.style.SUCCESS(f'\n[OK] 완료! {len(recommendations)}개 추천 문구 생성'))
+        self.stdout.write(f'[FILE] 저장 위치: {output_path}')
+
+    def _generate_all_candidates(self, combos, products, recommend_reasons, review_texts,
+                                 workers, chunk_size, progress_log_path):
+        """조합별 (리뷰 기반 후보, AI 기반 후보) 목록 (조합 순서 유지)"""
+        total = len(combos)
+        candidates = [None] * total
+        started = time.time()
+        
+        def report(done):
+            progress = (done / total) * 100
+            elapsed = time.time() - started
+            rate = done / elapsed if elapsed > 0 else 0.0
+            with open(progress_log_path, 'w', encoding='utf-8') as log_file:
+                log_file.write(f"진행 중: {done}/{total} ({progress:.1f}%)\n")
+                log_file.write(f"처리 속도: {rate:.1f} 조합/초\n")
+            self.stdout.write(f'  진행 중... {done}/{total} ({progress:.1f}%, {rate:.1f} 조합/초)')
+        
+        if workers <= 1:
+            self._review_texts = review_texts
+            index = ProductScoreIndex(self, products)
+            for i, combo in enumerate(combos):
+                candidates[i] = self._generate_candidates(combo, index, recommend_reasons)
+                if (i + 1) % PROGRESS_INTERVAL == 0:
+                    report(i + 1)
+            return candidates
+        
+        indexed = list(enumerate(combos))
+        chunks = [indexed[start:start + chunk_size] for start in range(0, total, chunk_size)]
+        done = 0
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(products, recommend_reasons, review_texts),
+        ) as executor:
+            for results in executor.map(_generate_chunk, chunks):
+                for i, review_candidates, ai_candidates in results:
+                    candidates[i] = (review_candidates, ai_candidates)
+                reported = done // PROGRESS_INTERVAL
+                done += len(results)
+                if done // PROGRESS_INTERVAL > reported:
+                    report(done)
+        return candidates
+
+    def _generate_candidates(self, combo, products, recommend_reasons):
+        """조합의 재시도 변형별 후보 문구 (리뷰 기반 MAX_RETRIES개, AI 기반 MAX_RETRIES개)"""
+        context = self._review_context(combo, products, recommend_reasons)
+        review_candidates = [self._compose_review_text(combo, context, retry) for retry in range(MAX_RETRIES)]
+        ai_candidates = [
+            self._generate_ai_based_recommendation(combo, recommend_reasons, retry)
+            for retry in range(MAX_RETRIES)
+        ]
+        return review_candidates, ai_candidates
+
+    def _pick_unique(self, candidates, seen, combo):
+        """앞선 조합과 겹치지 않는 첫 후보 (모두 겹치면 기본 문구)"""
+        for text in candidates:
+            # 중복 체크 (정규화된 텍스트로 비교)
+            normalized = self._normalize_text(text)
+            if normalized not in seen:
+                seen.add(normalized)
+                return text
+        
+        # 최대 재시도 후에도 중복이면 기본 문구 사용
+        text = self._generate_fallback_recommendation(combo)
+        seen.add(self._normalize_text(text))
+        return text
+
+    def _merge_candidates(self, combos, candidates):
+        """조합 순서대로 중복 제거 병합 (단일/병렬 실행 모두 같은 결과)"""
         recommendations = []
         
         # 중복 방지를 위한 추적
         generated_review_texts = set()
         generated_ai_texts = set()
         
-        # 진행 상황 로그 파일 경로
-        progress_log_path = str(Path(output_path).parent / 'taste_generation_progress.log')
-        
-        for i, combo in enumerate(taste_combinations, 1):
-            # 진행 상황 로그 기록
-            progress = (i / len(taste_combinations)) * 100
-            with open(progress_log_path, 'w', encoding='utf-8') as log_file:
-                log_file.write(f"진행 중: {i}/{len(taste_combinations)} ({progress:.1f}%)\n")
-                log_file.write(f"현재 처리 중: {combo['vibe']} | {combo['mate']} | {combo['priority']}\n")
-                log_file.write(f"고유 리뷰 문구: {len(generated_review_texts)}개\n")
-                log_file.write(f"고유 AI 문구: {len(generated_ai_texts)}개\n")
-            
-            if i % 50 == 0:
-                self.stdout.write(f'  진행 중... {i}/{len(taste_combinations)} ({progress:.1f}%)')
-                self.stdout.write(f'  고유 리뷰 문구: {len(generated_review_texts)}개, 고유 AI 문구: {len(generated_ai_texts)}개')
-            
-            # 리뷰 기반 문구 생성 (중복 방지)
-            max_retries = 5
-            review_based_text = None
-            for retry in range(max_retries):
-                text = self._generate_review_based_recommendation(
-                    combo, products_with_reviews, recommend_reasons, retry
-                )
-                # 중복 체크 (정규화된 텍스트로 비교)
-                normalized = self._normalize_text(text)
-                if normalized not in generated_review_texts:
-                    generated_review_texts.add(normalized)
-                    review_based_text = text
-                    break
-            
-            if not review_based_text:
-                # 최대 재시도 후에도 중복이면 기본 문구 사용
-                review_based_text = self._generate_fallback_recommendation(combo)
-                generated_review_texts.add(self._normalize_text(review_based_text))
-            
-            # AI 기반 문구 생성 (중복 방지)
-            ai_based_text = None
-            for retry in range(max_retries):
-                text = self._generate_ai_based_recommendation(combo, recommend_reasons, retry)
-                # 중복 체크
-                normalized = self._normalize_text(text)
-                if normalized not in generated_ai_texts:
-                    generated_ai_texts.add(normalized)
-                    ai_based_text = text
-                    break
-            
-            if not ai_based_text:
-                # 최대 재시도 후에도 중복이면 기본 문구 사용
-                ai_based_text = self._generate_fallback_recommendation(combo)
-                generated_ai_texts.add(self._normalize_text(ai_based_text))
+        for i, (combo, (review_candidates, ai_candidates)) in enumerate(zip(combos, candidates), 1):
+            review_based_text = self._pick_unique(review_candidates, generated_review_texts, combo)
+            ai_based_text = self._pick_unique(ai_candidates, generated_ai_texts, combo)
             
             recommendations.append({
                 'taste_id': i,
@@ -136,17 +280,10 @@ class Command(BaseCommand):
                 'AI_기반_추천문구': ai_based_text,
             })
         
-        # 3. CSV 저장
-        self._save_to_csv(recommendations, output_path, no_backup=no_backup, new_file=new_file)
-        
-        # 완료 로그 기록
-        progress_log_path = str(Path(output_path).parent / 'taste_generation_progress.log')
-        with open(progress_log_path, 'w', encoding='utf-8') as log_file:
-            log_file.write(f"완료: {len(recommendations)}/{len(recommendations)} (100.0%)\n")
-            log_file.write("상태: 완료\n")
-        
-        self.stdout.write(self.style.SUCCESS(f'\n[OK] 완료! {len(recommendations)}개 추천 문구 생성'))
-        self.stdout.write(f'[FILE] 저장 위치: {output_path}')
+        self.stdout.write(
+            f'  고유 리뷰 문구: {len(generated_review_texts)}개, 고유 AI 문구: {len(generated_ai_texts)}개'
+        )
+        return recommendations
 
     def _generate_taste_combinations(self, limit):
         """768개 취향 조합 생성"""
@@ -200,12 +337,31 @@ class Command(BaseCommand):
         return combinations
 
     def _get_products_with_reviews(self):
-        """리뷰 데이터가 있는 제품 조회"""
-        products = Product.objects.annotate(
+        """리뷰 데이터가 있는 제품 조회 (워커에 넘길 수 있도록 필요한 필드만 스냅샷)"""
+        from api.models import Product
+        
+        rows = Product.objects.annotate(
             review_count=Count('reviews')
-        ).filter(review_count__gt=0).select_related('spec')
+        ).filter(review_count__gt=0).order_by('pk').values_list(
+            'pk', 'name', 'price', 'model_number', 'review_count'
+        )
         
-        return list(products)
+        return [ProductSnapshot(*row) for row in rows]
+
+    def _load_review_texts(self, products):
+        """제품별 최신 리뷰 텍스트 (FEATURE_REVIEW_LIMIT개, 한 번의 조회)"""
+        from api.models import ProductReview
+        
+        wanted = {p.pk for p in products}
+        review_texts = {}
+        rows = ProductReview.objects.order_by('product_id', '-created_at', '-id').values_list('product_id', 'review_text')
+        for product_id, text in rows.iterator(chunk_size=5000):
+            if product_id not in wanted:
+                continue
+            texts = review_texts.setdefault(product_id, [])
+            if len(texts) < FEATURE_REVIEW_LIMIT:
+                texts.append(text)
+        return review_texts
 
     def _load_recommend_reasons(self):
         """평균벡터(추천이유) 파일 로드"""
@@ -238,11 +394,16 @@ class Command(BaseCommand):
     
     def _generate_review_based_recommendation(self, combo, products_with_reviews, recommend_reasons, retry=0):
         """리뷰 데이터 기반 고품질 추천 문구 생성 (중복 방지)"""
+        context = self._review_context(combo, products_with_reviews, recommend_reasons)
+        return self._compose_review_text(combo, context, retry)
+
+    def _review_context(self, combo, products_with_reviews, recommend_reasons):
+        """리뷰 기반 문구 재료 (재시도와 무관 - 조합당 한 번 계산)"""
         # 취향에 맞는 제품 필터링 및 점수 계산
         scored_products = self._filter_and_score_products(combo, products_with_reviews)
         
         if not scored_products:
-            return self._generate_fallback_recommendation(combo)
+            return None
         
         # 상위 제품 선택 (취향 조합별로 다르게)
         top_products = self._select_diverse_products(scored_products, combo, limit=3)
@@ -268,6 +429,20 @@ class Command(BaseCommand):
                 if key_sentences:
                     recommend_texts.extend(key_sentences[:2])
         
+        return {
+            'product_features': product_features,
+            'product_names': product_names,
+            'recommend_texts': recommend_texts,
+        }
+
+    def _compose_review_text(self, combo, context, retry=0):
+        """리뷰 기반 문구 조립 (retry마다 다른 템플릿 조합)"""
+        if context is None:
+            return self._generate_fallback_recommendation(combo)
+        product_features = context['product_features']
+        product_names = context['product_names']
+        recommend_texts = context['recommend_texts']
+        
         # 문구 생성 (고유성 강화)
         vibe_name = combo['vibe'].split('(')[0].strip()
         mate_desc = self._get_mate_description(combo['mate'])
@@ -404,7 +579,8 @@ class Command(BaseCommand):
                 all_keywords.extend(features['keywords'])
         
         if all_keywords:
-            unique_keywords = list(set(all_keywords))[:5]
+            # 순서를 유지한 중복 제거 (set 순서는 프로세스마다 달라 출력이 바뀜)
+            unique_keywords = list(dict.fromkeys(all_keywords))[:5]
             keyword_list = ', '.join(unique_keywords)
             
             feature_templates = [
@@ -573,34 +749,12 @@ class Command(BaseCommand):
 
     def _filter_and_score_products(self, combo, products):
         """취향에 맞는 제품 필터링 및 점수 계산 (고품질)"""
+        index = products if isinstance(products, ProductScoreIndex) else ProductScoreIndex(self, products)
         scored = []
-        vibe_key = combo['vibe'].split('(')[1].split(')')[0].strip() if '(' in combo['vibe'] else ''
-        priority = combo['priority']
-        budget_min, budget_max = self._parse_budget_range(combo['budget'])
-        lineup_min, lineup_max = self._parse_budget_range(combo['lineup'])
-        mate = combo['mate']
         
-        for product in products:
-            score = 0.0
-            
-            # 1. 인테리어 스타일 매칭 (가중치: 4.0)
-            score += self._score_vibe_match(product, vibe_key) * 4.0
-            
-            # 2. 우선순위 매칭 (가중치: 3.0)
-            score += self._score_priority_match(product, priority) * 3.0
-            
-            # 3. 예산 매칭 (가중치: 2.5)
-            score += self._score_budget_match(product, budget_min, budget_max) * 2.5
-            
-            # 4. 라인업 매칭 (가중치: 1.5)
-            score += self._score_lineup_match(product, lineup_min, lineup_max) * 1.5
-            
-            # 5. 메이트 구성 매칭 (가중치: 1.0)
-            score += self._score_mate_match(product, mate) * 1.0
-            
-            # 6. 리뷰 품질 보너스 (가중치: 1.0)
-            review_bonus = self._calculate_review_bonus(product)
-            score += review_bonus * 1.0
+        for product, vibe, priority, budget, lineup, mate, review_bonus in zip(index.products, *index.components(combo)):
+            # 인테리어 스타일 4.0 + 우선순위 3.0 + 예산 2.5 + 라인업 1.5 + 메이트 구성 1.0 + 리뷰 품질 보너스 1.0
+            score = 0.0 + vibe * 4.0 + priority * 3.0 + budget * 2.5 + lineup * 1.5 + mate * 1.0 + review_bonus * 1.0
             
             if score >= 5.0:  # 최소 점수 이상만 선택
                 scored.append((product, score))
@@ -680,7 +834,10 @@ class Command(BaseCommand):
 
     def _calculate_review_bonus(self, product):
         """리뷰 품질 보너스 점수"""
-        review_count = ProductReview.objects.filter(product=product).count()
+        review_count = getattr(product, 'review_count', None)
+        if review_count is None:
+            from api.models import ProductReview
+            review_count = ProductReview.objects.filter(product=product).count()
         if review_count >= 100:
             return 1.0
         elif review_count >= 50:
@@ -712,11 +869,15 @@ class Command(BaseCommand):
 
     def _extract_product_features(self, product, combo):
         """제품의 리뷰에서 특징 추출"""
-        reviews = ProductReview.objects.filter(product=product)[:50]
+        if self._review_texts is not None:
+            reviews = self._review_texts.get(product.pk, [])
+        else:
+            from api.models import ProductReview
+            reviews = [r.review_text for r in ProductReview.objects.filter(product=product)[:FEATURE_REVIEW_LIMIT]]
         if not reviews:
             return None
         
-        review_texts = [r.review_text for r in reviews if r.review_text]
+        review_texts = [text for text in reviews if text]
         if not review_texts:
             return None
         
@@ -832,7 +993,7 @@ class Command(BaseCommand):
                 all_keywords.extend(features['keywords'])
         
         if all_keywords:
-            unique_keywords = list(set(all_keywords))[:5]
+            unique_keywords = list(dict.fromkeys(all_keywords))[:5]
             return f"리뷰에서 자주 언급되는 {', '.join(unique_keywords)} 등의 특징이 돋보여요."
         
         return "실제 사용자들의 긍정적인 피드백이 많은 제품들이에요."
@@ -960,12 +1121,16 @@ class Command(BaseCommand):
             return (30000000, None)
         return (None, None)
 
+    def _resolve_output_path(self, output_path):
+        """상대 경로는 프로젝트 루트 기준 절대 경로로"""
+        if not os.path.isabs(output_path):
+            return Path(__file__).parent.parent.parent.parent / output_path
+        return Path(output_path)
+
     def _save_to_csv(self, recommendations, output_path, no_backup=False, new_file=False):
         """CSV 파일로 저장"""
         # 절대 경로로 변환
-        if not os.path.isabs(output_path):
-            base_dir = Path(__file__).parent.parent.parent.parent
-            output_path = str(base_dir / output_path)
+        output_path = str(self._resolve_output_path(output_path))
         
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
@@ -8,12 +8,47 @@ ONBOARDING_SESSION, PRODUCT_DEMOGRAPHICS, USER_SAMPLE 테이블을
     python manage.py migrate_all_to_normalized
     python manage.py migrate_all_to_normalized --dry-run  # 테스트만 실행
     python manage.py migrate_all_to_normalized --table onboarding  # 특정 테이블만
+    python manage.py migrate_all_to_normalized --resume  # 마지막으로 커밋한 청크 이후부터 이어서
+
+자식 행은 BulkLoader(api/db/bulk_loader.py)로 모아 executemany(batcherrors=True)로 적재하고
+부모 레코드 --chunk-size개마다 커밋합니다. 중복 키 등 행 오류는 해당 행만 건너뜁니다.
 """
 import json
 from django.core.management.base import BaseCommand
-from api.db.oracle_client import get_connection
+from api.db.bulk_loader import BulkLoader, ChunkCheckpoint
+from api.db.oracle_client import get_connection, stream_cursor
 from api.models import ProductDemographics, UserSample
 
+ONBOARDING_STATEMENTS = {
+    'ONBOARD_SESS_MAIN_SPACES': "INSERT INTO ONBOARD_SESS_MAIN_SPACES (SESSION_ID, MAIN_SPACE) VALUES (:1, :2)",
+    'ONBOARD_SESS_PRIORITIES': "INSERT INTO ONBOARD_SESS_PRIORITIES (SESSION_ID, PRIORITY, PRIORITY_ORDER) VALUES (:1, :2, :3)",
+    'ONBOARD_SESS_CATEGORIES': "INSERT INTO ONBOARD_SESS_CATEGORIES (SESSION_ID, CATEGORY_NAME) VALUES (:1, :2)",
+    'ONBOARD_SESS_REC_PRODUCTS': "INSERT INTO ONBOARD_SESS_REC_PRODUCTS (SESSION_ID, PRODUCT_ID, RANK_ORDER) VALUES (:1, :2, :3)",
+}
+
+DEMOGRAPHICS_STATEMENTS = {
+    'PROD_DEMO_FAMILY_TYPES': "INSERT INTO PROD_DEMO_FAMILY_TYPES (PRODUCT_ID, FAMILY_TYPE) VALUES (:1, :2)",
+    'PROD_DEMO_HOUSE_SIZES': "INSERT INTO PROD_DEMO_HOUSE_SIZES (PRODUCT_ID, HOUSE_SIZE) VALUES (:1, :2)",
+    'PROD_DEMO_HOUSE_TYPES': "INSERT INTO PROD_DEMO_HOUSE_TYPES (PRODUCT_ID, HOUSE_TYPE) VALUES (:1, :2)",
+}
+
+USER_SAMPLE_STATEMENTS = {
+    'USER_SAMPLE_RECOMMENDATIONS': (
+        "INSERT INTO USER_SAMPLE_RECOMMENDATIONS (USER_ID, CATEGORY_NAME, RECOMMENDED_VALUE, RECOMMENDED_UNIT) "
+        "VALUES (:1, :2, :3, :4)"
+    ),
+    'USER_SAMPLE_PURCHASED_ITEMS': "INSERT INTO USER_SAMPLE_PURCHASED_ITEMS (USER_ID, PRODUCT_ID) VALUES (:1, :2)",
+}
+
+# USER_SAMPLE 추천 필드 → (카테고리, 단위)
+USER_SAMPLE_CATEGORY_MAPPING = {
+    '냉장고': ('recommended_fridge_l', 'L'),
+    '세탁기': ('recommended_washer_kg', 'KG'),
+    'TV': ('recommended_tv_inch', 'INCH'),
+    '청소기': ('recommended_vacuum', None),
+    '오븐': ('recommended_oven', None),
+}
+
 
 class Command(BaseCommand):
     help = '모든 테이블을 정규화된 구조로 마이그레이션'
@@ -31,10 +66,23 @@ class Command(BaseCommand):
             default='all',
             help='마이그레이션할 테이블 선택',
         )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=None,
+            help='커밋 단위 부모 레코드 수 (기본: BULK_LOAD_CHUNK_SIZE)',
+        )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='이전 실행에서 마지막으로 커밋한 청크 이후부터 이어서 진행',
+        )
 
     def handle(self, *args, **options):
         dry_run = options['dry_run']
         table = options['table']
+        self.chunk_size = options.get('chunk_size')
+        self.resume = options.get('resume', False)
         
         if dry_run:
             self.stdout.write(self.style.WARNING('=== DRY RUN 모드 (실제 변경 없음) ===\n'))
@@ -345,15 +393,84 @@ class Command(BaseCommand):
                 """)
             cur.execute("CREATE INDEX IDX_USR_SMP_PURCH ON USER_SAMPLE_PURCHASED_ITEMS(USER_ID)")
 
+    def _checkpoint(self, name, dry_run):
+        """
+        마이그레이션별 체크포인트와 재개 키
+        
+        --resume이 아니면 이전 기록을 지우고 처음부터 진행 (dry-run은 기록하지 않음)
+        """
+        if dry_run:
+            return None, None
+        checkpoint = ChunkCheckpoint(f'migrate_all_to_normalized.{name}')
+        if not self.resume:
+            checkpoint.clear()
+            return checkpoint, None
+        
+        state = checkpoint.get() or {}
+        last_key = state.get('last_key')
+        if state.get('completed'):
+            self.stdout.write(self.style.WARNING(f'  이전 실행에서 완료됨 (마지막 키 {last_key}) - 이후 추가된 레코드만 진행'))
+        elif last_key is not None:
+            self.stdout.write(f'  재개: 청크 {state.get("chunks", 0)}개 완료, 마지막 키 {last_key} 이후부터')
+        return checkpoint, last_key
+
+    def _make_loader(self, conn, statements, checkpoint, dry_run):
+        return BulkLoader(
+            conn, statements, chunk_size=self.chunk_size, checkpoint=checkpoint,
+            dry_run=dry_run, log=self.stdout.write,
+        )
+
+    def _report(self, label, stats, dry_run):
+        """적재 결과 출력 (문장별 행 수, 오류, 초당 행 수)"""
+        prefix = '(DRY RUN) ' if dry_run else ''
+        self.stdout.write(self.style.SUCCESS(
+            f"  {prefix}완료: {stats['parents']}개 {label}, {stats['rows']}행 적재 "
+            f"({stats['elapsed']}초, {stats['rows_per_sec']}행/초)"
+        ))
+        for name, stat in stats['statements'].items():
+            line = f"    {name}: {stat['rows']}행"
+            if stat['errors']:
+                line += f", 건너뜀 {stat['errors']}행"
+            self.stdout.write(line)
+            for sample in stat['error_samples']:
+                self.stdout.write(self.style.WARNING(f"      {sample}"))
+
     def _migrate_onboarding_session(self, dry_run):
         """ONBOARDING_SESSION 데이터 마이그레이션 (Oracle DB 직접 접근)"""
         self.stdout.write('\n[ONBOARDING_SESSION] 마이그레이션 시작...')
         
         try:
+            checkpoint, last_key = self._checkpoint('onboarding', dry_run)
+            
+            def build_rows(row):
+                session_id, main_space_clob, priority_list_clob, selected_categories_clob, recommended_products_clob = row
+                
+                # MAIN_SPACE
+                for space in self._json_list(self._parse_json_clob(main_space_clob)):
+                    yield 'ONBOARD_SESS_MAIN_SPACES', (session_id, str(space))
+                
+                # PRIORITY_LIST
+                for idx, priority in enumerate(self._json_list(self._parse_json_clob(priority_list_clob)), start=1):
+                    yield 'ONBOARD_SESS_PRIORITIES', (session_id, str(priority), idx)
+                
+                # SELECTED_CATEGORIES
+                for category in self._json_list(self._parse_json_clob(selected_categories_clob)):
+                    yield 'ONBOARD_SESS_CATEGORIES', (session_id, str(category))
+                
+                # RECOMMENDED_PRODUCTS
+                for idx, product_id in enumerate(self._json_list(self._parse_json_clob(recommended_products_clob)), start=1):
+                    product_id = self._to_int(product_id)
+                    if product_id is not None:
+                        yield 'ONBOARD_SESS_REC_PRODUCTS', (session_id, product_id, idx)
+            
             with get_connection() as conn:
-                with conn.cursor() as cur:
-                    # 모든 세션 조회 (MEMBER_ID 오름차순 정렬)
-                    cur.execute("""
+                with conn.cursor() as read_cur:
+                    read_cur.execute("SELECT COUNT(*) FROM ONBOARDING_SESSION")
+                    total = read_cur.fetchone()[0]
+                    
+                    # 세션 ID 오름차순 스트리밍 (재개 시 마지막 커밋 청크의 세션 이후부터)
+                    where = "WHERE SESSION_ID > :p_last_key" if last_key is not None else ""
+                    sessions = stream_cursor(read_cur, f"""
                         SELECT 
                             SESSION_ID,
                             MAIN_SPACE,
@@ -361,86 +478,14 @@ class Command(BaseCommand):
                             SELECTED_CATEGORIES,
                             RECOMMENDED_PRODUCTS
                         FROM ONBOARDING_SESSION
-                        ORDER BY MEMBER_ID ASC
-                    """)
-                    
-                    rows = cur.fetchall()
-                    count = 0
-                    
-                    for row in rows:
-                        session_id = row[0]
-                        main_space_clob = row[1]
-                        priority_list_clob = row[2]
-                        selected_categories_clob = row[3]
-                        recommended_products_clob = row[4]
-                        
-                        if not dry_run:
-                            # MAIN_SPACE 마이그레이션
-                            if main_space_clob:
-                                main_spaces = self._parse_json_clob(main_space_clob)
-                                if main_spaces and isinstance(main_spaces, list):
-                                    for space in main_spaces:
-                                        cur.execute("""
-                                            INSERT INTO ONBOARD_SESS_MAIN_SPACES 
-                                            (SESSION_ID, MAIN_SPACE)
-                                            VALUES (:p_session_id, :p_space)
-                                        """, {
-                                            'p_session_id': session_id,
-                                            'p_space': str(space)
-                                        })
-                            
-                            # PRIORITY_LIST 마이그레이션
-                            if priority_list_clob:
-                                priorities = self._parse_json_clob(priority_list_clob)
-                                if priorities and isinstance(priorities, list):
-                                    for idx, priority in enumerate(priorities, start=1):
-                                        cur.execute("""
-                                            INSERT INTO ONBOARD_SESS_PRIORITIES 
-                                            (SESSION_ID, PRIORITY, PRIORITY_ORDER)
-                                            VALUES (:p_session_id, :p_priority, :p_order)
-                                        """, {
-                                            'p_session_id': session_id,
-                                            'p_priority': str(priority),
-                                            'p_order': idx
-                                        })
-                            
-                            # SELECTED_CATEGORIES 마이그레이션
-                            if selected_categories_clob:
-                                categories = self._parse_json_clob(selected_categories_clob)
-                                if categories and isinstance(categories, list):
-                                    for category in categories:
-                                        cur.execute("""
-                                            INSERT INTO ONBOARD_SESS_CATEGORIES 
-                                            (SESSION_ID, CATEGORY_NAME)
-                                            VALUES (:p_session_id, :p_category)
-                                        """, {
-                                            'p_session_id': session_id,
-                                            'p_category': str(category)
-                                        })
-                            
-                            # RECOMMENDED_PRODUCTS 마이그레이션
-                            if recommended_products_clob:
-                                products = self._parse_json_clob(recommended_products_clob)
-                                if products and isinstance(products, list):
-                                    for idx, product_id in enumerate(products, start=1):
-                                        cur.execute("""
-                                            INSERT INTO ONBOARD_SESS_REC_PRODUCTS 
-                                            (SESSION_ID, PRODUCT_ID, RANK_ORDER)
-                                            VALUES (:p_session_id, :p_product_id, :p_rank)
-                                        """, {
-                                            'p_session_id': session_id,
-                                            'p_product_id': int(product_id),
-                                            'p_rank': idx
-                                        })
-                        
-                        count += 1
-                        if count % 10 == 0:
-                            self.stdout.write(f'  진행: {count}/{len(rows)}...')
+                        {where}
+                        ORDER BY SESSION_ID ASC
+                    """, {'p_last_key': last_key} if last_key is not None else None)
                     
-                    if not dry_run:
-                        conn.commit()
+                    loader = self._make_loader(conn, ONBOARDING_STATEMENTS, checkpoint, dry_run)
+                    stats = loader.load(sessions, key=lambda row: row[0], build_rows=build_rows, total=total)
             
-            self.stdout.write(self.style.SUCCESS(f'  완료: {count}개 세션'))
+            self._report('세션', stats, dry_run)
         
         except Exception as e:
             self.stdout.write(
@@ -452,77 +497,32 @@ class Command(BaseCommand):
         self.stdout.write('\n[PRODUCT_DEMOGRAPHICS] 마이그레이션 시작...')
         
         try:
-            demographics = ProductDemographics.objects.all()
-            count = 0
+            checkpoint, last_key = self._checkpoint('demographics', dry_run)
+            demographics = ProductDemographics.objects.order_by('pk')
+            total = demographics.count()
+            if last_key is not None:
+                demographics = demographics.filter(pk__gt=last_key)
             
-            for demo in demographics:
-                if not dry_run:
-                    # PRODUCT_ID가 Oracle DB에 존재하는지 확인
-                    with get_connection() as conn:
-                        with conn.cursor() as cur:
-                            cur.execute("""
-                                SELECT COUNT(*) FROM PRODUCT WHERE PRODUCT_ID = :p_product_id
-                            """, {'p_product_id': demo.product_id})
-                            product_exists = cur.fetchone()[0] > 0
-                            
-                            if not product_exists:
-                                continue  # Oracle DB에 없는 제품은 건너뛰기
-                            
-                            # FAMILY_TYPES 마이그레이션
-                            if demo.family_types:
-                                family_types = demo.family_types if isinstance(demo.family_types, list) else json.loads(demo.family_types) if isinstance(demo.family_types, str) else []
-                                for family_type in family_types:
-                                    try:
-                                        cur.execute("""
-                                            INSERT INTO PROD_DEMO_FAMILY_TYPES 
-                                            (PRODUCT_ID, FAMILY_TYPE)
-                                            VALUES (:p_product_id, :p_family_type)
-                                        """, {
-                                            'p_product_id': demo.product_id,
-                                            'p_family_type': str(family_type)
-                                        })
-                                    except:
-                                        pass  # 중복 등 오류 무시
-                            
-                            # HOUSE_SIZES 마이그레이션
-                            if demo.house_sizes:
-                                house_sizes = demo.house_sizes if isinstance(demo.house_sizes, list) else json.loads(demo.house_sizes) if isinstance(demo.house_sizes, str) else []
-                                for house_size in house_sizes:
-                                    try:
-                                        cur.execute("""
-                                            INSERT INTO PROD_DEMO_HOUSE_SIZES 
-                                            (PRODUCT_ID, HOUSE_SIZE)
-                                            VALUES (:p_product_id, :p_house_size)
-                                        """, {
-                                            'p_product_id': demo.product_id,
-                                            'p_house_size': str(house_size)
-                                        })
-                                    except:
-                                        pass
-                            
-                            # HOUSE_TYPES 마이그레이션
-                            if demo.house_types:
-                                house_types = demo.house_types if isinstance(demo.house_types, list) else json.loads(demo.house_types) if isinstance(demo.house_types, str) else []
-                                for house_type in house_types:
-                                    try:
-                                        cur.execute("""
-                                            INSERT INTO PROD_DEMO_HOUSE_TYPES 
-                                            (PRODUCT_ID, HOUSE_TYPE)
-                                            VALUES (:p_product_id, :p_house_type)
-                                        """, {
-                                            'p_product_id': demo.product_id,
-                                            'p_house_type': str(house_type)
-                                        })
-                                    except:
-                                        pass
-                            
-                            conn.commit()
+            with get_connection() as conn:
+                # Oracle DB에 있는 제품 ID (제품별 존재 확인 쿼리 대신 한 번에 조회)
+                with conn.cursor() as read_cur:
+                    oracle_product_ids = {row[0] for row in stream_cursor(read_cur, "SELECT PRODUCT_ID FROM PRODUCT")}
+                
+                def build_rows(demo):
+                    if demo.product_id not in oracle_product_ids:
+                        return  # Oracle DB에 없는 제품은 건너뛰기
+                    for family_type in self._json_list(demo.family_types):
+                        yield 'PROD_DEMO_FAMILY_TYPES', (demo.product_id, str(family_type))
+                    for house_size in self._json_list(demo.house_sizes):
+                        yield 'PROD_DEMO_HOUSE_SIZES', (demo.product_id, str(house_size))
+                    for house_type in self._json_list(demo.house_types):
+                        yield 'PROD_DEMO_HOUSE_TYPES', (demo.product_id, str(house_type))
                 
-                count += 1
-                if count % 10 == 0:
-                    self.stdout.write(f'  진행: {count}/{demographics.count()}...')
+                loader = self._make_loader(conn, DEMOGRAPHICS_STATEMENTS, checkpoint, dry_run)
+                stats = loader.load(demographics.iterator(chunk_size=2000), key=lambda demo: demo.pk,
+                                    build_rows=build_rows, total=total)
             
-            self.stdout.write(self.style.SUCCESS(f'  완료: {count}개 제품'))
+            self._report('제품', stats, dry_run)
         
         except Exception as e:
             self.stdout.write(
@@ -534,68 +534,52 @@ class Command(BaseCommand):
         self.stdout.write('\n[USER_SAMPLE] 마이그레이션 시작...')
         
         try:
-            users = UserSample.objects.all()
-            count = 0
+            checkpoint, last_key = self._checkpoint('user_sample', dry_run)
+            users = UserSample.objects.order_by('pk')
+            total = users.count()
+            if last_key is not None:
+                users = users.filter(pk__gt=last_key)
             
-            for user in users:
-                if not dry_run:
-                    # 추천 제품 정보 마이그레이션
-                    category_mapping = {
-                        '냉장고': ('recommended_fridge_l', 'L'),
-                        '세탁기': ('recommended_washer_kg', 'KG'),
-                        'TV': ('recommended_tv_inch', 'INCH'),
-                        '청소기': ('recommended_vacuum', None),
-                        '오븐': ('recommended_oven', None),
-                    }
-                    
-                    for category, (field_name, unit) in category_mapping.items():
-                        value = getattr(user, field_name, None)
-                        if value:
-                            with get_connection() as conn:
-                                with conn.cursor() as cur:
-                                    cur.execute("""
-                                        INSERT INTO USER_SAMPLE_RECOMMENDATIONS 
-                                        (USER_ID, CATEGORY_NAME, RECOMMENDED_VALUE, RECOMMENDED_UNIT)
-                                        VALUES (:p_user_id, :p_category, :p_value, :p_unit)
-                                    """, {
-                                        'p_user_id': user.user_id,
-                                        'p_category': category,
-                                        'p_value': str(value),
-                                        'p_unit': unit
-                                    })
-                                    conn.commit()
-                    
-                    # PURCHASED_ITEMS 마이그레이션
-                    if user.purchased_items:
-                        try:
-                            items = json.loads(user.purchased_items) if isinstance(user.purchased_items, str) else user.purchased_items
-                            if isinstance(items, list):
-                                for product_id in items:
-                                    with get_connection() as conn:
-                                        with conn.cursor() as cur:
-                                            cur.execute("""
-                                                INSERT INTO USER_SAMPLE_PURCHASED_ITEMS 
-                                                (USER_ID, PRODUCT_ID)
-                                                VALUES (:p_user_id, :p_product_id)
-                                            """, {
-                                                'p_user_id': user.user_id,
-                                                'p_product_id': int(product_id)
-                                            })
-                                            conn.commit()
-                        except:
-                            pass
+            def build_rows(user):
+                # 추천 제품 정보
+                for category, (field_name, unit) in USER_SAMPLE_CATEGORY_MAPPING.items():
+                    value = getattr(user, field_name, None)
+                    if value:
+                        yield 'USER_SAMPLE_RECOMMENDATIONS', (user.user_id, category, str(value), unit)
                 
-                count += 1
-                if count % 10 == 0:
-                    self.stdout.write(f'  진행: {count}/{users.count()}...')
+                # PURCHASED_ITEMS
+                for product_id in self._json_list(user.purchased_items):
+                    product_id = self._to_int(product_id)
+                    if product_id is not None:
+                        yield 'USER_SAMPLE_PURCHASED_ITEMS', (user.user_id, product_id)
             
-            self.stdout.write(self.style.SUCCESS(f'  완료: {count}개 사용자'))
+            with get_connection() as conn:
+                loader = self._make_loader(conn, USER_SAMPLE_STATEMENTS, checkpoint, dry_run)
+                stats = loader.load(users.iterator(chunk_size=2000), key=lambda user: user.pk,
+                                    build_rows=build_rows, total=total)
+            
+            self._report('사용자', stats, dry_run)
         
         except Exception as e:
             self.stdout.write(
                 self.style.ERROR(f'  오류: {str(e)}')
             )
     
+    def _json_list(self, value):
+        """JSON 배열 값 (리스트 또는 JSON 문자열) → 리스트, 그 외는 빈 리스트"""
+        if isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except json.JSONDecodeError:
+                return []
+        return value if isinstance(value, list) else []
+    
+    def _to_int(self, value):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+    
     def _parse_json_clob(self, clob_value):
         """CLOB 값을 JSON으로 파싱"""
         if not clob_value:
@@ -0,0 +1,155 @@
+"""
+Taste별 카테고리 선택 사전 계산 명령어
+- 1920개 taste의 대표 온보딩 시그니처(TasteConfig 대표값 + 인덱스 기반 생성값)에 대해
+  select_categories_for_taste 결과를 계산해 JSON 테이블로 저장
+- --benchmark: 캐시 미사용 / LRU / 사전 계산 테이블 조회 속도 비교
+- 카테고리 인벤토리가 대체 결과(Oracle 장애)면 테이블을 저장하지 않고 실패
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.models import TasteConfig
+from api.utils.catalog_version import get_catalog_version
+from api.utils.category_inventory import category_inventory
+from api.utils.category_selection_cache import (
+    category_selection_cache,
+    onboarding_signature,
+    signature_key,
+)
+from api.utils.taste_category_selector import TasteCategorySelector
+
+TOTAL_TASTES = 1920
+
+
+def generate_onboarding_data_for_taste(taste_id: int) -> dict:
+    """taste_id 인덱스 기반 온보딩 데이터 (populate_taste_config와 동일한 규칙)"""
+    vibes = ['modern', 'cozy', 'pop', 'luxury']
+    household_sizes = [1, 2, 3, 4, 5]
+    priorities = ['design', 'tech', 'eco', 'value']
+    budget_levels = ['low', 'medium', 'high']
+    main_spaces = ['living', 'kitchen', 'dressing', 'bedroom']
+    cooking_options = ['daily', 'sometimes', 'rarely']
+    laundry_options = ['daily', 'weekly', 'biweekly']
+    media_options = ['balanced', 'entertainment', 'minimal']
+
+    idx = taste_id - 1
+
+    return {
+        'vibe': vibes[idx % len(vibes)],
+        'household_size': household_sizes[idx % len(household_sizes)],
+        'pyung': 20 + (idx % 20),
+        'priority': priorities[idx % len(priorities)],
+        'budget_level': budget_levels[idx % len(budget_levels)],
+        'has_pet': (idx % 3 == 0),
+        'cooking': cooking_options[idx % len(cooking_options)],
+        'laundry': laundry_options[idx % len(laundry_options)],
+        'media': media_options[idx % len(media_options)],
+        'main_space': main_spaces[idx % len(main_spaces)],
+    }
+
+
+def representative_onboarding_data(config: TasteConfig) -> dict:
+    """TasteConfig 대표 온보딩 값 (비어 있는 필드는 제외)"""
+    data = {
+        'vibe': config.representative_vibe or None,
+        'household_size': config.representative_household_size,
+        'main_space': config.representative_main_space or None,
+        'has_pet': config.representative_has_pet,
+        'priority': config.representative_priority or None,
+        'budget_level': config.representative_budget_level or None,
+    }
+    return {key: value for key, value in data.items() if value is not None}
+
+
+class Command(BaseCommand):
+    help = "1920개 taste × 대표 온보딩 시그니처의 카테고리 선택 결과를 사전 계산"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--benchmark',
+            action='store_true',
+            help='캐시 미사용 / LRU / 사전 계산 테이블 조회 속도 비교'
+        )
+        parser.add_argument(
+            '--rounds',
+            type=int,
+            default=3,
+            help='벤치마크 반복 횟수 (기본값: 3)'
+        )
+        parser.add_argument(
+            '--no-save',
+            action='store_true',
+            help='테이블을 저장하지 않음 (벤치마크만 실행할 때)'
+        )
+
+    def _collect_profiles(self):
+        """사전 계산 대상 온보딩 데이터 (시그니처 중복 제거)"""
+        profiles = [{}]
+        profiles.extend(generate_onboarding_data_for_taste(taste_id) for taste_id in range(1, TOTAL_TASTES + 1))
+        try:
+            profiles.extend(
+                representative_onboarding_data(config)
+                for config in TasteConfig.objects.all().order_by('taste_id')
+            )
+        except Exception as e:
+            self.stdout.write(self.style.WARNING(f"TasteConfig 대표값 조회 실패 (인덱스 기반 값만 사용): {e}"))
+
+        unique = {}
+        for data in profiles:
+            unique.setdefault(signature_key(onboarding_signature(data), None), data)
+        return unique
+
+    def handle(self, *args, **options):
+        catalog_version = get_catalog_version(refresh=True)
+        profiles = self._collect_profiles()
+        self.stdout.write(f"사전 계산 대상: {len(profiles)}개 시그니처 (catalog_version={catalog_version})")
+
+        started = time.perf_counter()
+        entries = {
+            key: TasteCategorySelector._select_categories_uncached(data, None)
+            for key, data in profiles.items()
+        }
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f"계산 완료: {len(entries)}개, {elapsed:.2f}초")
+
+        if not options.get('no_save'):
+            inventory = category_inventory.info()
+            if inventory['degraded']:
+                raise CommandError(
+                    f"카테고리 인벤토리가 대체 결과(source={inventory['source']})라 저장하지 않습니다. "
+                    f"Oracle 연결을 확인한 뒤 다시 실행하세요."
+                )
+            category_selection_cache.save_precomputed(entries, catalog_version)
+            self.stdout.write(self.style.SUCCESS(f"저장 완료: {category_selection_cache.precomputed_path}"))
+
+        if options.get('benchmark'):
+            self._benchmark(list(profiles.values()), options['rounds'], catalog_version, entries)
+
+    def _benchmark(self, profiles, rounds, catalog_version, entries):
+        calls = len(profiles) * rounds
+
+        def run(fn):
+            started = time.perf_counter()
+            for _ in range(rounds):
+                for data in profiles:
+                    fn(data)
+            return time.perf_counter() - started
+
+        uncached = run(lambda data: TasteCategorySelector._select_categories_uncached(data, None))
+
+        # 사전 계산 테이블 조회 (LRU 비움)
+        category_selection_cache.set_precomputed(entries, catalog_version)
+        category_selection_cache.clear()
+        precomputed = run(lambda data: TasteCategorySelector.select_categories_for_taste(0, data, None))
+
+        # LRU 조회 (위 실행으로 이미 채워짐)
+        lru = run(lambda data: TasteCategorySelector.select_categories_for_taste(0, data, None))
+
+        self.stdout.write("")
+        self.stdout.write(f"벤치마크 ({calls}회 호출)")
+        for label, seconds in (('캐시 미사용', uncached), ('사전 계산 테이블', precomputed), ('LRU', lru)):
+            per_call = seconds / calls * 1e6 if calls else 0
+            speedup = uncached / seconds if seconds else 0
+            self.stdout.write(f"  {label:<12} {seconds:8.3f}초  {per_call:8.1f}us/회  x{speedup:.1f}")
+        self.stdout.write(f"캐시 통계: {category_selection_cache.stats()}")
@@ -0,0 +1,52 @@
+"""
+Oracle → Django 카탈로그 증분 동기화 명령어
+- PRODUCT / PRODUCT_SPEC / PRODUCT_IMAGE 행 해시 비교로 바뀐 제품만 반영
+- 변경이 있으면 카탈로그 버전 증가 + SPEC 스키마 / 리뷰 키워드 인덱스 아티팩트 갱신
+"""
+from django.core.management.base import BaseCommand
+
+from api.db.catalog_sync import sync_catalog
+from api.utils.review_keyword_index import build_review_keyword_index_artifact
+from api.utils.spec_schema import build_spec_schema_artifact
+
+
+class Command(BaseCommand):
+    help = "Oracle 카탈로그(PRODUCT/PRODUCT_SPEC/PRODUCT_IMAGE)를 Django DB로 증분 동기화"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='저장된 행 해시를 무시하고 전체 재적재'
+        )
+        parser.add_argument(
+            '--skip-spec-schema',
+            action='store_true',
+            help='변경이 있어도 SPEC 스키마 아티팩트를 갱신하지 않음'
+        )
+        parser.add_argument(
+            '--skip-review-index',
+            action='store_true',
+            help='변경이 있어도 리뷰 키워드 인덱스 아티팩트를 갱신하지 않음'
+        )
+
+    def handle(self, *args, **options):
+        result = sync_catalog(full=options.get('full'))
+
+        for table in ('PRODUCT', 'PRODUCT_SPEC', 'PRODUCT_IMAGE'):
+            self.stdout.write(f"  {table}: {result[table]}")
+
+        if result['changed']:
+            self.stdout.write(self.style.SUCCESS(
+                f"동기화 완료 ({result['elapsed']}초) - 카탈로그 버전 v{result['catalog_version']}"
+            ))
+            if not options.get('skip_spec_schema'):
+                stats = build_spec_schema_artifact()['stats']
+                self.stdout.write(f"  SPEC 스키마 갱신: {stats}")
+            if not options.get('skip_review_index'):
+                stats = build_review_keyword_index_artifact()['stats']
+                self.stdout.write(f"  리뷰 키워드 인덱스 갱신: {stats}")
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f"변경 없음 ({result['elapsed']}초) - 카탈로그 버전 v{result['catalog_version']} 유지"
+            ))
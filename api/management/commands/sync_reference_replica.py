@@ -0,0 +1,76 @@
+"""
+Oracle 참조 테이블 → 로컬 SQLite 복제본 동기화 명령어
+- 그룹 키(PRODUCT_ID / TASTE_ID) 단위 행 해시 비교로 바뀐 그룹만 반영
+- --loop: REFERENCE_REPLICA_SYNC_INTERVAL초마다 반복 (스케줄러 없이 주기 동기화)
+"""
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api.db.reference_replica import REPLICA_TABLES, reference_replica
+
+
+class Command(BaseCommand):
+    help = "Oracle 참조 테이블(TASTE_CONFIG, PRODUCT, PRODUCT_SPEC, PROD_DEMO_* 등)을 로컬 SQLite 복제본으로 증분 동기화"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='저장된 행 해시를 무시하고 전체 재적재'
+        )
+        parser.add_argument(
+            '--tables',
+            nargs='+',
+            choices=sorted(REPLICA_TABLES),
+            help='동기화할 테이블 (기본: 전체)'
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='종료하지 않고 주기적으로 동기화'
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=None,
+            help='--loop 동기화 주기 (초, 기본 REFERENCE_REPLICA_SYNC_INTERVAL)'
+        )
+        parser.add_argument(
+            '--stats',
+            action='store_true',
+            help='복제본 테이블별 상태만 출력'
+        )
+
+    def handle(self, *args, **options):
+        if options['stats']:
+            self._print_stats()
+            return
+
+        interval = options['interval'] or getattr(settings, 'REFERENCE_REPLICA_SYNC_INTERVAL', 300)
+        full = options['full']
+        while True:
+            result = reference_replica.sync(tables=options['tables'], full=full)
+            for table, stats in result['tables'].items():
+                if 'error' in stats:
+                    self.stdout.write(self.style.ERROR(f"  {table}: 실패 - {stats['error']}"))
+                else:
+                    self.stdout.write(f"  {table}: {stats}")
+            self.stdout.write(self.style.SUCCESS(
+                f"복제본 동기화 완료 ({result['elapsed']}초, 변경 {'있음' if result['changed'] else '없음'})"
+            ))
+            if not options['loop']:
+                break
+            # 전체 재적재는 첫 회만
+            full = False
+            time.sleep(interval)
+
+    def _print_stats(self):
+        stats = reference_replica.stats()
+        self.stdout.write(f"복제본: {reference_replica.path}")
+        if not stats:
+            self.stdout.write("  동기화된 테이블 없음")
+        for table, info in stats.items():
+            synced_at = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(info['synced_at']))
+            self.stdout.write(f"  {table}: 행 {info['rows']}개, 그룹 {info['groups']}개, 동기화 {synced_at}")
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.16 on 2026-10-18 23:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_fix_primary_key_warnings'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogSyncState',
+            fields=[
+                ('table_name', models.CharField(max_length=50, primary_key=True, serialize=False, verbose_name='테이블명')),
+                ('row_hashes', models.TextField(default='{}', verbose_name='제품별 행 해시 (JSON)')),
+                ('catalog_version', models.IntegerField(default=0, verbose_name='카탈로그 버전')),
+                ('synced_at', models.DateTimeField(auto_now=True, verbose_name='마지막 동기화 일시')),
+            ],
+            options={
+                'verbose_name': '카탈로그 동기화 상태',
+                'verbose_name_plural': '카탈로그 동기화 상태',
+                'db_table': 'catalog_sync_state',
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.16 on 2026-10-18 23:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_catalogsyncstate'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='portfolio',
+            name='candidate_rankings',
+            field=models.JSONField(blank=True, default=dict, help_text='카테고리별 후보 순위 (다른 추천/다시 추천받기용)'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.16 on 2026-10-18 23:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_portfolio_candidate_rankings'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='product_type',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=50, verbose_name='제품 종류'),
+        ),
+    ]
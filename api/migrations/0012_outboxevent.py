@@ -0,0 +1,37 @@
+# Generated by Django 4.2.16 on 2026-10-18 23:33
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_product_product_type'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('idempotency_key', models.CharField(max_length=128, unique=True, verbose_name='멱등성 키')),
+                ('event_type', models.CharField(db_index=True, max_length=50, verbose_name='이벤트 종류')),
+                ('aggregate_id', models.CharField(db_index=True, max_length=100, verbose_name='대상 ID (세션 ID 등)')),
+                ('payload', models.JSONField(default=dict, verbose_name='이벤트 데이터')),
+                ('status', models.CharField(choices=[('PENDING', '반영 대기'), ('DONE', '반영 완료'), ('FAILED', '실패 (재시도 한도 초과)')], db_index=True, default='PENDING', max_length=10, verbose_name='상태')),
+                ('attempts', models.IntegerField(default=0, verbose_name='시도 횟수')),
+                ('next_attempt_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now, verbose_name='다음 시도 일시')),
+                ('locked_until', models.DateTimeField(blank=True, null=True, verbose_name='처리 점유 만료 일시')),
+                ('last_error', models.TextField(blank=True, default='', verbose_name='마지막 오류')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('dispatched_at', models.DateTimeField(blank=True, null=True, verbose_name='반영 일시')),
+            ],
+            options={
+                'verbose_name': '아웃박스 이벤트',
+                'verbose_name_plural': '아웃박스 이벤트',
+                'db_table': 'outbox_event',
+                'ordering': ['id'],
+            },
+        ),
+    ]
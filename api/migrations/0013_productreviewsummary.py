@@ -0,0 +1,30 @@
+# Generated by Django 4.2.16 on 2026-10-18 23:47
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_outboxevent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductReviewSummary',
+            fields=[
+                ('product', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='review_summary', serialize=False, to='api.product', verbose_name='제품')),
+                ('summary', models.TextField(verbose_name='리뷰 요약')),
+                ('review_hash', models.CharField(max_length=64, verbose_name='리뷰 묶음 해시')),
+                ('review_count', models.IntegerField(default=0, verbose_name='요약에 사용한 리뷰 수')),
+                ('model_name', models.CharField(blank=True, default='', max_length=50, verbose_name='생성 모델')),
+                ('generated_at', models.DateTimeField(auto_now=True, verbose_name='생성 일시')),
+            ],
+            options={
+                'verbose_name': '제품 리뷰 요약',
+                'verbose_name_plural': '제품 리뷰 요약',
+                'db_table': 'product_review_summary',
+            },
+        ),
+    ]
@@ -48,6 +48,9 @@ class Product(models.Model):
     is_active = models.BooleanField(default=True, verbose_name='판매중')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
     
+    # 제품명 기반 제품 종류 (extract_product_type 결과 비정규화, 저장/동기화 시 계산)
+    product_type = models.CharField(max_length=50, blank=True, default='', db_index=True, verbose_name='제품 종류')
+    
     class Meta:
         verbose_name = '제품'
         verbose_name_plural = '제품'
@@ -65,7 +68,13 @@ class Product(models.Model):
             self.model_number = self.model_code
         if not self.category and self.main_category:
             self.category = self.main_category
+        # 제품 종류는 제품명/카테고리로 매번 다시 계산 (update_fields 저장 시에는 갱신 대상에 있을 때만)
+        from api.utils.product_type_classifier import clear_product_type_cache, product_type_column_value
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'product_type' in update_fields:
+            self.product_type = product_type_column_value(self.name, self.category)
         super().save(*args, **kwargs)
+        clear_product_type_cache(self.pk)
 
 
 class ProductSpec(models.Model):
@@ -121,51 +130,26 @@ class ProductDemographics(models.Model):
     def __str__(self):
         return f"Demographics<{self.product_id}>"
     
+    def _get_normalized(self, field):
+        """정규화 테이블 값 (demographics_repository 캐시 사용, 조회 실패 시 기존 JSONField)"""
+        from api.db.demographics_repository import demographics_repository
+        values = demographics_repository.get(self.product_id)
+        if values is None:
+            fallback = getattr(self, field)
+            return fallback if isinstance(fallback, list) else []
+        return values[field]
+    
     def get_family_types_from_normalized(self):
         """정규화 테이블에서 family_types 읽기"""
-        try:
-            from api.db.oracle_client import get_connection
-            with get_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT FAMILY_TYPE FROM PROD_DEMO_FAMILY_TYPES
-                        WHERE PRODUCT_ID = :product_id
-                        ORDER BY FAMILY_TYPE
-                    """, {'product_id': self.product_id})
-                    return [row[0] for row in cur.fetchall()]
-        except:
-            # 정규화 테이블이 없거나 오류 시 기존 JSONField 반환
-            return self.family_types if isinstance(self.family_types, list) else []
+        return self._get_normalized('family_types')
     
     def get_house_sizes_from_normalized(self):
         """정규화 테이블에서 house_sizes 읽기"""
-        try:
-            from api.db.oracle_client import get_connection
-            with get_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT HOUSE_SIZE FROM PROD_DEMO_HOUSE_SIZES
-                        WHERE PRODUCT_ID = :product_id
-                        ORDER BY HOUSE_SIZE
-                    """, {'product_id': self.product_id})
-                    return [row[0] for row in cur.fetchall()]
-        except:
-            return self.house_sizes if isinstance(self.house_sizes, list) else []
+        return self._get_normalized('house_sizes')
     
     def get_house_types_from_normalized(self):
         """정규화 테이블에서 house_types 읽기"""
-        try:
-            from api.db.oracle_client import get_connection
-            with get_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT HOUSE_TYPE FROM PROD_DEMO_HOUSE_TYPES
-                        WHERE PRODUCT_ID = :product_id
-                        ORDER BY HOUSE_TYPE
-                    """, {'product_id': self.product_id})
-                    return [row[0] for row in cur.fetchall()]
-        except:
-            return self.house_types if isinstance(self.house_types, list) else []
+        return self._get_normalized('house_types')
     
     def save_to_normalized(self):
         """정규화 테이블에 데이터 저장"""
@@ -201,7 +185,9 @@ class ProductDemographics(models.Model):
                         """, {'product_id': self.product_id, 'house_type': str(ht)})
                     
                     conn.commit()
-                    return True
+            from api.db.demographics_repository import demographics_repository
+            demographics_repository.invalidate(self.product_id)
+            return True
         except Exception as e:
             # 오류 발생 시에도 계속 진행 (하위 호환성)
             return False
@@ -668,6 +654,14 @@ class Portfolio(models.Model):
         help_text="추천 제품 목록 [{id, name, price, ...}, ...]"
     )
     
+    # 포트폴리오 생성 시 추천 실행의 카테고리별 전체 후보 순위
+    # {"catalog_version": 3, "score_ref": "taste:12", "categories": {"TV": {"category": "TV", "ranking": [[product_id, score], ...]}}}
+    candidate_rankings = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="카테고리별 후보 순위 (다른 추천/다시 추천받기용)"
+    )
+    
     # 가격 정보
     total_original_price = models.DecimalField(
         max_digits=12,
@@ -1666,3 +1660,103 @@ class CategoryCommonSpec(models.Model):
     
     def __str__(self):
         return f"{self.main_category} - {self.spec_key}"
+
+
+class CatalogSyncState(models.Model):
+    """
+    Oracle → Django 카탈로그 증분 동기화 상태
+    
+    테이블(PRODUCT, PRODUCT_SPEC, PRODUCT_IMAGE)별로 제품 단위 행 해시를 저장해
+    다음 동기화 때 바뀐 제품만 가져옵니다.
+    table_name='CATALOG' 행의 catalog_version은 카탈로그가 바뀔 때마다 1씩 증가하며
+    다운스트림 캐시의 키로 사용됩니다.
+    """
+    table_name = models.CharField(max_length=50, primary_key=True, verbose_name='테이블명')
+    row_hashes = models.TextField(default='{}', verbose_name='제품별 행 해시 (JSON)')
+    catalog_version = models.IntegerField(default=0, verbose_name='카탈로그 버전')
+    synced_at = models.DateTimeField(auto_now=True, verbose_name='마지막 동기화 일시')
+    
+    class Meta:
+        verbose_name = '카탈로그 동기화 상태'
+        verbose_name_plural = '카탈로그 동기화 상태'
+        db_table = 'catalog_sync_state'
+    
+    def __str__(self):
+        return f"{self.table_name} (v{self.catalog_version})"
+    
+    def get_row_hashes(self):
+        try:
+            return json.loads(self.row_hashes) if self.row_hashes else {}
+        except (json.JSONDecodeError, TypeError):
+            return {}
+    
+    def set_row_hashes(self, hashes):
+        self.row_hashes = json.dumps(hashes, ensure_ascii=False)
+
+
+class OutboxEvent(models.Model):
+    """
+    트랜잭셔널 아웃박스 이벤트
+    
+    요청 처리 중 Oracle에 바로 쓰지 않고 로컬 트랜잭션 안에서 이벤트로 기록해 두면,
+    디스패처(outbox_service)가 배치로 꺼내 Oracle에 반영합니다.
+    idempotency_key가 같은 이벤트는 한 번만 기록되며, 실패 시 지수 백오프로 재시도합니다.
+    """
+    STATUS_PENDING = 'PENDING'
+    STATUS_DONE = 'DONE'
+    STATUS_FAILED = 'FAILED'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, '반영 대기'),
+        (STATUS_DONE, '반영 완료'),
+        (STATUS_FAILED, '실패 (재시도 한도 초과)'),
+    ]
+    
+    idempotency_key = models.CharField(max_length=128, unique=True, verbose_name='멱등성 키')
+    event_type = models.CharField(max_length=50, db_index=True, verbose_name='이벤트 종류')
+    aggregate_id = models.CharField(max_length=100, db_index=True, verbose_name='대상 ID (세션 ID 등)')
+    payload = models.JSONField(default=dict, verbose_name='이벤트 데이터')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING, db_index=True, verbose_name='상태')
+    attempts = models.IntegerField(default=0, verbose_name='시도 횟수')
+    next_attempt_at = models.DateTimeField(default=timezone.now, db_index=True, verbose_name='다음 시도 일시')
+    locked_until = models.DateTimeField(null=True, blank=True, verbose_name='처리 점유 만료 일시')
+    last_error = models.TextField(blank=True, default='', verbose_name='마지막 오류')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
+    dispatched_at = models.DateTimeField(null=True, blank=True, verbose_name='반영 일시')
+    
+    class Meta:
+        verbose_name = '아웃박스 이벤트'
+        verbose_name_plural = '아웃박스 이벤트'
+        db_table = 'outbox_event'
+        ordering = ['id']
+    
+    def __str__(self):
+        return f"{self.event_type} {self.aggregate_id} ({self.status})"
+
+
+class ProductReviewSummary(models.Model):
+    """
+    제품별 리뷰 요약 (오프라인 배치 생성)
+    
+    build_review_summaries 명령어가 리뷰가 있는 모든 제품의 리뷰를 미리 요약해 저장합니다.
+    review_hash는 요약에 사용한 리뷰 묶음의 해시로, 리뷰가 바뀐 제품만 다시 요약합니다.
+    """
+    product = models.OneToOneField(
+        "Product",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="review_summary",
+        verbose_name='제품',
+    )
+    summary = models.TextField(verbose_name='리뷰 요약')
+    review_hash = models.CharField(max_length=64, verbose_name='리뷰 묶음 해시')
+    review_count = models.IntegerField(default=0, verbose_name='요약에 사용한 리뷰 수')
+    model_name = models.CharField(max_length=50, blank=True, default='', verbose_name='생성 모델')
+    generated_at = models.DateTimeField(auto_now=True, verbose_name='생성 일시')
+    
+    class Meta:
+        verbose_name = '제품 리뷰 요약'
+        verbose_name_plural = '제품 리뷰 요약'
+        db_table = 'product_review_summary'
+    
+    def __str__(self):
+        return f"ReviewSummary<{self.product_id}>"
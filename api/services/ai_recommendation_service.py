@@ -2,8 +2,10 @@
 고급 AI 추천 서비스 (자연어 대화 기반)
 """
 import json
+from django.conf import settings
 from .chatgpt_service import chatgpt_service
 from .recommendation_engine import recommendation_engine
+from api.utils.intent_parser import intent_parser, record_query
 
 
 class AIRecommendationService:
@@ -21,7 +23,21 @@ class AIRecommendationService:
         Returns:
             추천 결과 딕셔너리
         """
+        # 정형화된 요청은 로컬 의도 파서로 바로 처리 (신뢰도가 낮을 때만 LLM 호출)
+        local_result = None
+        if getattr(settings, 'AI_INTENT_FAST_PATH', True):
+            local_result = intent_parser.parse_with_history(user_message, conversation_history)
+            threshold = getattr(settings, 'AI_INTENT_CONFIDENCE_THRESHOLD', 0.8)
+            if local_result.is_confident(threshold):
+                print(f"[AI 추천] 로컬 의도 파서 응답 (신뢰도 {local_result.confidence:.2f}, {local_result.elapsed_us:.0f}us)")
+                record_query(user_message, local_result, 'local')
+                return cls._recommend_with_info(local_result.slots, user_message, 'local')
+        
         if not chatgpt_service.is_available():
+            # LLM을 쓸 수 없으면 신뢰도가 낮더라도 로컬 추출 결과가 있을 때 그것으로 추천
+            if local_result is not None and local_result.matched:
+                record_query(user_message, local_result, 'local_fallback')
+                return cls._recommend_with_info(local_result.slots, user_message, 'local')
             return {
                 'success': False,
                 'error': 'OpenAI API를 사용할 수 없습니다.'
@@ -61,7 +77,8 @@ class AIRecommendationService:
             response_text = chatgpt_service.chat_response(
                 user_message=prompt,
                 context={'history': []},
-                require_json=True
+                require_json=True,
+                cache_site='intent_extraction'
             )
             
             # JSON 파싱 - 더 견고한 추출 로직
@@ -71,31 +88,10 @@ class AIRecommendationService:
             if extracted_info is None:
                 print(f"[AI 추천] JSON 파싱 실패, 사용자 메시지에서 직접 추출 시도: {user_message}")
                 extracted_info = cls._extract_info_from_message(user_message)
+            elif local_result is not None:
+                record_query(user_message, local_result, 'llm', extracted_info)
             
-            # 기본값 설정
-            user_profile = {
-                'vibe': extracted_info.get('vibe') or 'modern',
-                'household_size': extracted_info.get('household_size') or 2,
-                'housing_type': extracted_info.get('housing_type') or 'apartment',
-                'pyung': extracted_info.get('pyung') or 25,
-                'priority': extracted_info.get('priority') or 'value',
-                'budget_level': cls._calculate_budget_level(extracted_info.get('budget')),
-                'categories': extracted_info.get('categories') or ['TV', '냉장고', '세탁기'],
-                'additional_info': extracted_info.get('additional_info', '')
-            }
-            
-            # 추천 엔진 호출
-            result = recommendation_engine.get_recommendations(
-                user_profile=user_profile,
-                limit=5
-            )
-            
-            # 추가 정보 포함
-            if result.get('success'):
-                result['extracted_info'] = extracted_info
-                result['user_message'] = user_message
-            
-            return result
+            return cls._recommend_with_info(extracted_info, user_message, 'llm')
             
         except Exception as e:
             print(f"[AI 추천] 추천 실패: {e}")
@@ -106,27 +102,7 @@ class AIRecommendationService:
             try:
                 print(f"[AI 추천] 기본값으로 추천 시도")
                 extracted_info = cls._extract_info_from_message(user_message)
-                user_profile = {
-                    'vibe': extracted_info.get('vibe') or 'modern',
-                    'household_size': extracted_info.get('household_size') or 2,
-                    'housing_type': extracted_info.get('housing_type') or 'apartment',
-                    'pyung': extracted_info.get('pyung') or 25,
-                    'priority': extracted_info.get('priority') or 'value',
-                    'budget_level': cls._calculate_budget_level(extracted_info.get('budget')),
-                    'categories': extracted_info.get('categories') or ['TV', '냉장고', '세탁기'],
-                    'additional_info': extracted_info.get('additional_info', '')
-                }
-                
-                result = recommendation_engine.get_recommendations(
-                    user_profile=user_profile,
-                    limit=5
-                )
-                
-                if result.get('success'):
-                    result['extracted_info'] = extracted_info
-                    result['user_message'] = user_message
-                
-                return result
+                return cls._recommend_with_info(extracted_info, user_message, 'local')
             except Exception as fallback_error:
                 print(f"[AI 추천] 기본값 추천도 실패: {fallback_error}")
                 return {
@@ -134,6 +110,41 @@ class AIRecommendationService:
                     'error': '추천 중 오류가 발생했어요. 다시 시도해주세요.'
                 }
     
+    @classmethod
+    def _build_user_profile(cls, extracted_info: dict) -> dict:
+        """추출한 정보 → 추천 엔진 사용자 프로필 (빈 값은 기본값)"""
+        return {
+            'vibe': extracted_info.get('vibe') or 'modern',
+            'household_size': extracted_info.get('household_size') or 2,
+            'housing_type': extracted_info.get('housing_type') or 'apartment',
+            'pyung': extracted_info.get('pyung') or 25,
+            'priority': extracted_info.get('priority') or 'value',
+            'budget_level': cls._calculate_budget_level(extracted_info.get('budget')),
+            'categories': extracted_info.get('categories') or ['TV', '냉장고', '세탁기'],
+            'additional_info': extracted_info.get('additional_info', '')
+        }
+    
+    @classmethod
+    def _recommend_with_info(cls, extracted_info: dict, user_message: str, intent_source: str) -> dict:
+        """
+        추출한 정보로 추천 엔진 호출
+        
+        Args:
+            intent_source: 정보 추출 경로 ('local': 로컬 의도 파서, 'llm': ChatGPT)
+        """
+        result = recommendation_engine.get_recommendations(
+            user_profile=cls._build_user_profile(extracted_info),
+            limit=5
+        )
+        
+        # 추가 정보 포함
+        if result.get('success'):
+            result['extracted_info'] = extracted_info
+            result['user_message'] = user_message
+            result['intent_source'] = intent_source
+        
+        return result
+    
     @classmethod
     def _extract_json_from_response(cls, response_text: str) -> dict:
         """응답 텍스트에서 JSON 추출 (견고한 파싱)"""
@@ -176,76 +187,8 @@ class AIRecommendationService:
     
     @classmethod
     def _extract_info_from_message(cls, user_message: str) -> dict:
-        """사용자 메시지에서 직접 정보 추출 (간단한 패턴 매칭)"""
-        import re
-        
-        extracted = {
-            'household_size': None,
-            'budget': None,
-            'categories': [],
-            'priority': None,
-            'housing_type': None,
-            'pyung': None,
-            'vibe': None,
-            'additional_info': user_message
-        }
-        
-        # 가구 인원 추출
-        household_match = re.search(r'(\d+)\s*인\s*가구', user_message)
-        if household_match:
-            extracted['household_size'] = int(household_match.group(1))
-        
-        # 예산 추출 (만원 단위)
-        budget_match = re.search(r'예산\s*(\d+)\s*만원', user_message)
-        if budget_match:
-            extracted['budget'] = int(budget_match.group(1))
-        else:
-            # 숫자 + 만원 패턴
-            budget_match = re.search(r'(\d+)\s*만원', user_message)
-            if budget_match:
-                extracted['budget'] = int(budget_match.group(1))
-        
-        # 카테고리 추출
-        categories_map = {
-            '냉장고': '냉장고',
-            '세탁기': '세탁기',
-            'TV': 'TV',
-            '티비': 'TV',
-            '에어컨': '에어컨',
-            '청소기': '청소기',
-            '주방': '냉장고',
-            '거실': 'TV'
-        }
-        
-        for keyword, category in categories_map.items():
-            if keyword in user_message:
-                if category not in extracted['categories']:
-                    extracted['categories'].append(category)
-        
-        # 주거 형태 추출
-        if '아파트' in user_message or 'apt' in user_message.lower():
-            extracted['housing_type'] = 'apartment'
-        elif '주택' in user_message or '단독' in user_message:
-            extracted['housing_type'] = 'house'
-        elif '오피스텔' in user_message or '원룸' in user_message:
-            extracted['housing_type'] = 'officetel'
-        
-        # 평수 추출
-        pyung_match = re.search(r'(\d+)\s*평', user_message)
-        if pyung_match:
-            extracted['pyung'] = int(pyung_match.group(1))
-        
-        # 우선순위 추출
-        if '가성비' in user_message or '저렴' in user_message or '예산' in user_message:
-            extracted['priority'] = 'value'
-        elif '디자인' in user_message or '예쁜' in user_message:
-            extracted['priority'] = 'design'
-        elif '기술' in user_message or '스마트' in user_message or 'AI' in user_message:
-            extracted['priority'] = 'tech'
-        elif '친환경' in user_message or '에코' in user_message:
-            extracted['priority'] = 'eco'
-        
-        return extracted
+        """사용자 메시지에서 직접 정보 추출 (로컬 의도 파서, 신뢰도와 관계없이 추출된 슬롯 사용)"""
+        return intent_parser.parse(user_message).slots
     
     @classmethod
     def _calculate_budget_level(cls, budget):
@@ -261,18 +204,8 @@ class AIRecommendationService:
             return 'high'
     
     @classmethod
-    def chat_recommendation(cls, user_message: str, conversation_history: list = None):
-        """
-        대화형 추천 (사용자와 대화하며 추천)
-        
-        Args:
-            user_message: 사용자 메시지
-            conversation_history: 대화 기록
-            
-        Returns:
-            AI 응답 및 추천 결과
-        """
-        # 먼저 일반적인 대화인지 추천 요청인지 판단
+    def _is_recommendation_request(cls, user_message: str) -> bool:
+        """일반 대화인지 추천 요청인지 판단"""
         recommendation_keywords = ['추천', '추천해', '추천해줘', '어떤', '뭐가', '제품', '가전', '구매', '살까']
         product_info_keywords = ['가구', '주방', '예산', '평수', '거실', '침실', '냉장고', '세탁기', 'TV', '에어컨', '청소기']
         number_keywords = ['인', '만원', '원', '평']
@@ -285,42 +218,58 @@ class AIRecommendationService:
         has_number = any(keyword in user_message for keyword in number_keywords) or any(char.isdigit() for char in user_message)
         
         # 추천 요청으로 판단: 명시적 키워드가 있거나, 제품 정보 + 숫자가 함께 있는 경우
-        is_recommendation_request = has_recommendation_keyword or (has_product_info and has_number)
+        return has_recommendation_keyword or (has_product_info and has_number)
+    
+    @classmethod
+    def _recommendation_reply(cls, result: dict) -> dict:
+        """추천 결과 → 대화형 응답"""
+        if result.get('success'):
+            recommendations = result.get('recommendations', [])
+            if recommendations:
+                # 추천 결과를 자연어로 변환
+                response_text = "다음 제품들을 추천드려요:\n\n"
+                for i, rec in enumerate(recommendations[:3], 1):
+                    response_text += f"{i}. {rec.get('name', '제품')} - {rec.get('price', 0):,}원\n"
+                    if rec.get('reason'):
+                        response_text += f"   {rec.get('reason')}\n"
+                response_text += "\n더 자세한 정보가 필요하시면 말씀해주세요!"
+            else:
+                response_text = "조건에 맞는 제품을 찾지 못했어요. 다른 조건으로 다시 말씀해주세요."
+        else:
+            error_msg = result.get('error', '알 수 없는 오류')
+            print(f"[AI 추천] 추천 실패: {error_msg}")
+            # 사용자에게 더 친절한 메시지 제공
+            if 'OpenAI API' in error_msg:
+                response_text = "죄송해요, 현재 AI 서비스를 이용할 수 없어요. 잠시 후 다시 시도해주세요."
+            else:
+                # 오류 상세 내용을 사용자에게 노출하지 않고 친절한 메시지 제공
+                response_text = "죄송해요, 요청을 이해하는데 문제가 있었어요. 예를 들어 '2인 가구, 작은 주방, 예산 200만원, 냉장고 추천해줘'처럼 구체적으로 말씀해주시면 더 정확한 추천을 드릴 수 있어요."
+        
+        return {
+            'type': 'recommendation',
+            'message': response_text,
+            'recommendations': result.get('recommendations', []) if result.get('success') else [],
+            'raw_result': result,
+            'success': result.get('success', False),
+            'error': result.get('error') if not result.get('success') else None
+        }
+    
+    @classmethod
+    def chat_recommendation(cls, user_message: str, conversation_history: list = None):
+        """
+        대화형 추천 (사용자와 대화하며 추천)
         
-        if is_recommendation_request:
+        Args:
+            user_message: 사용자 메시지
+            conversation_history: 대화 기록
+            
+        Returns:
+            AI 응답 및 추천 결과
+        """
+        if cls._is_recommendation_request(user_message):
             # 추천 요청인 경우
             result = cls.recommend_from_conversation(user_message, conversation_history)
-            
-            if result.get('success'):
-                recommendations = result.get('recommendations', [])
-                if recommendations:
-                    # 추천 결과를 자연어로 변환
-                    response_text = "다음 제품들을 추천드려요:\n\n"
-                    for i, rec in enumerate(recommendations[:3], 1):
-                        response_text += f"{i}. {rec.get('name', '제품')} - {rec.get('price', 0):,}원\n"
-                        if rec.get('reason'):
-                            response_text += f"   {rec.get('reason')}\n"
-                    response_text += "\n더 자세한 정보가 필요하시면 말씀해주세요!"
-                else:
-                    response_text = "조건에 맞는 제품을 찾지 못했어요. 다른 조건으로 다시 말씀해주세요."
-            else:
-                error_msg = result.get('error', '알 수 없는 오류')
-                print(f"[AI 추천] 추천 실패: {error_msg}")
-                # 사용자에게 더 친절한 메시지 제공
-                if 'OpenAI API' in error_msg:
-                    response_text = "죄송해요, 현재 AI 서비스를 이용할 수 없어요. 잠시 후 다시 시도해주세요."
-                else:
-                    # 오류 상세 내용을 사용자에게 노출하지 않고 친절한 메시지 제공
-                    response_text = "죄송해요, 요청을 이해하는데 문제가 있었어요. 예를 들어 '2인 가구, 작은 주방, 예산 200만원, 냉장고 추천해줘'처럼 구체적으로 말씀해주시면 더 정확한 추천을 드릴 수 있어요."
-            
-            return {
-                'type': 'recommendation',
-                'message': response_text,
-                'recommendations': result.get('recommendations', []) if result.get('success') else [],
-                'raw_result': result,
-                'success': result.get('success', False),
-                'error': result.get('error') if not result.get('success') else None
-            }
+            return cls._recommendation_reply(result)
         else:
             # 일반 대화인 경우 ChatGPT로 응답
             try:
@@ -344,6 +293,38 @@ class AIRecommendationService:
                     'success': False,
                     'error': str(e)
                 }
+    
+    @classmethod
+    def stream_chat_recommendation(cls, user_message: str, conversation_history: list = None):
+        """
+        대화형 추천 스트리밍 (chat_recommendation의 스트리밍 버전)
+        
+        Yields:
+            (이벤트 이름, 데이터) 튜플
+            - ('status', {'stage': ...}): 추천 처리 시작 (첫 바이트를 바로 보내기 위함)
+            - ('token', {'text': ...}): 일반 대화 응답 텍스트 조각
+            - ('done', {...}): chat_recommendation과 같은 형식의 최종 결과
+        """
+        if cls._is_recommendation_request(user_message):
+            yield 'status', {'stage': 'recommendation', 'message': '추천을 생성하고 있어요...'}
+            result = cls.recommend_from_conversation(user_message, conversation_history)
+            yield 'done', cls._recommendation_reply(result)
+            return
+        
+        parts = []
+        for text in chatgpt_service.stream_chat_response(
+            user_message=user_message,
+            context={'history': conversation_history or []}
+        ):
+            parts.append(text)
+            yield 'token', {'text': text}
+        
+        yield 'done', {
+            'type': 'chat',
+            'message': ''.join(parts).strip(),
+            'recommendations': [],
+            'success': True
+        }
 
 
 # 싱글톤 인스턴스
@@ -7,6 +7,8 @@ ChatGPT API 연동 서비스
 import json
 from django.conf import settings
 
+from api.utils.llm_cache import llm_response_cache
+
 try:
     from openai import OpenAI
     client = OpenAI(api_key=settings.OPENAI_API_KEY)
@@ -26,6 +28,29 @@ class ChatGPTService:
     def is_available(cls):
         return OPENAI_AVAILABLE and client is not None
     
+    @classmethod
+    def _complete(cls, call_site: str, cache: bool = True, **kwargs) -> str:
+        """
+        chat.completions 호출 (같은 요청은 LLM 응답 캐시에서 재사용)
+        
+        Args:
+            call_site: 캐시 통계용 호출 위치 이름
+            cache: False면 캐시를 거치지 않음 (대화 이력이 있는 챗봇 응답 등)
+            **kwargs: chat.completions.create 인자
+        
+        Returns:
+            응답 문자열 (앞뒤 공백 제거)
+        """
+        def call():
+            response = client.chat.completions.create(**kwargs)
+            usage = getattr(response, 'usage', None)
+            tokens = getattr(usage, 'total_tokens', 0) or 0
+            return response.choices[0].message.content.strip(), tokens
+        
+        if not cache:
+            return call()[0]
+        return llm_response_cache.get_or_call(call_site, kwargs, call)
+    
     @classmethod
     def generate_recommendation_reason(cls, product_info: dict, user_profile: dict) -> str:
         """
@@ -66,7 +91,8 @@ class ChatGPTService:
 5. 한국어로 작성
 """
             
-            response = client.chat.completions.create(
+            return cls._complete(
+                'recommendation_reason',
                 model=cls.MODEL,
                 messages=[
                     {"role": "system", "content": "당신은 LG전자 가전 전문 컨설턴트입니다. 친근하고 전문적인 톤으로 답변합니다."},
@@ -75,8 +101,6 @@ class ChatGPTService:
                 max_tokens=200,
                 temperature=0.7
             )
-            
-            return response.choices[0].message.content.strip()
         
         except Exception as e:
             print(f"ChatGPT 추천 이유 생성 오류: {e}")
@@ -139,7 +163,8 @@ JSON 형식으로 응답해주세요:
 서브타이틀은 사용자의 구체적인 조건을 반영해서 작성해주세요.
 """
             
-            response = client.chat.completions.create(
+            content = cls._complete(
+                'style_message',
                 model=cls.MODEL,
                 messages=[
                     {"role": "system", "content": "당신은 인테리어 스타일 전문가입니다. JSON 형식으로만 응답합니다."},
@@ -150,7 +175,7 @@ JSON 형식으로 응답해주세요:
                 response_format={"type": "json_object"}
             )
             
-            result = json.loads(response.choices[0].message.content)
+            result = json.loads(content)
             return {
                 "title": result.get("title", "나에게 딱 맞는 스타일"),
                 "subtitle": result.get("subtitle", "당신의 라이프스타일에 맞춰 구성했어요.")
@@ -186,6 +211,10 @@ JSON 형식으로 응답해주세요:
         
         return messages.get(style, messages['modern'])
     
+    # 리뷰 요약에 사용하는 최대 리뷰 수 (토큰 제한)
+    REVIEW_SUMMARY_MAX_REVIEWS = 20
+    REVIEW_SUMMARY_FALLBACK = "다양한 고객들이 만족하며 사용 중인 제품이에요."
+    
     @classmethod
     def summarize_reviews(cls, reviews: list, product_name: str = "") -> str:
         """
@@ -199,14 +228,34 @@ JSON 형식으로 응답해주세요:
             요약된 리뷰 문자열
         """
         if not cls.is_available() or not reviews:
-            return "다양한 고객들이 만족하며 사용 중인 제품이에요."
+            return cls.REVIEW_SUMMARY_FALLBACK
         
         try:
-            # 최대 20개 리뷰만 사용 (토큰 제한)
-            sample_reviews = reviews[:20]
-            reviews_text = "\n".join([f"- {r}" for r in sample_reviews])
-            
-            prompt = f"""
+            return cls.generate_review_summary(reviews, product_name)
+        
+        except Exception as e:
+            print(f"ChatGPT 리뷰 요약 오류: {e}")
+            return cls.REVIEW_SUMMARY_FALLBACK
+    
+    @classmethod
+    def generate_review_summary(cls, reviews: list, product_name: str = "", force: bool = False) -> str:
+        """
+        리뷰 요약 생성 (오류 시 예외 - 배치 요약에서 재시도/저장 여부 판단용)
+        
+        Args:
+            force: True면 LLM 응답 캐시를 거치지 않고 새로 생성 (build_review_summaries --force)
+        
+        Raises:
+            RuntimeError: OpenAI를 사용할 수 없음
+            openai 예외: API 호출 실패
+        """
+        if not cls.is_available():
+            raise RuntimeError("OpenAI API를 사용할 수 없습니다.")
+        
+        sample_reviews = reviews[:cls.REVIEW_SUMMARY_MAX_REVIEWS]
+        reviews_text = "\n".join([f"- {r}" for r in sample_reviews])
+        
+        prompt = f"""
 다음은 "{product_name}" 제품의 고객 리뷰입니다. 핵심 내용을 3줄로 요약해주세요.
 
 ## 리뷰
@@ -219,44 +268,20 @@ JSON 형식으로 응답해주세요:
 4. 이모지 사용 금지
 5. 각 줄은 한 문장으로
 """
-            
-            response = client.chat.completions.create(
-                model=cls.MODEL,
-                messages=[
-                    {"role": "system", "content": "당신은 제품 리뷰 분석 전문가입니다. 핵심만 간결하게 요약합니다."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=200,
-                temperature=0.5
-            )
-            
-            return response.choices[0].message.content.strip()
         
-        except Exception as e:
-            print(f"ChatGPT 리뷰 요약 오류: {e}")
-            return "다양한 고객들이 만족하며 사용 중인 제품이에요."
+        return cls._complete(
+            'review_summary',
+            cache=not force,
+            model=cls.MODEL,
+            messages=[
+                {"role": "system", "content": "당신은 제품 리뷰 분석 전문가입니다. 핵심만 간결하게 요약합니다."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=200,
+            temperature=0.5
+        )
     
-    @classmethod
-    def chat_response(cls, user_message: str, context: dict = None, require_json: bool = False) -> str:
-        """
-        AI 상담 챗봇 응답
-        
-        Args:
-            user_message: 사용자 메시지
-            context: 대화 컨텍스트 (선택)
-            require_json: JSON 형식 응답 강제 여부
-        
-        Returns:
-            AI 응답 문자열
-        """
-        if not cls.is_available():
-            return "죄송해요, 현재 AI 상담 서비스를 이용할 수 없어요. 잠시 후 다시 시도해주세요."
-        
-        try:
-            if require_json:
-                system_prompt = "당신은 LG전자 가전 추천 전문가입니다. 사용자의 자연어 요청을 분석하여 제품 추천에 필요한 정보를 JSON 형식으로만 응답합니다. 반드시 유효한 JSON 형식으로만 응답하세요."
-            else:
-                system_prompt = """
+    CHAT_SYSTEM_PROMPT = """
 당신은 LG전자 가전 전문 상담사 'LG 홈스타일링 AI'입니다.
 
 역할:
@@ -275,34 +300,102 @@ JSON 형식으로 응답해주세요:
 - 가격 정보는 정확하지 않을 수 있다고 안내
 - 구매는 LG전자 공식 사이트 안내
 """
-            
-            messages = [{"role": "system", "content": system_prompt}]
-            
-            # 컨텍스트가 있으면 추가
-            if context and context.get('history'):
-                for msg in context['history'][-5:]:  # 최근 5개 대화만
-                    messages.append(msg)
-            
-            messages.append({"role": "user", "content": user_message})
-            
-            # JSON 응답 강제 옵션
-            kwargs = {
-                "model": cls.MODEL,
-                "messages": messages,
-                "max_tokens": 500,
-                "temperature": 0.7
-            }
-            
-            if require_json:
-                kwargs["response_format"] = {"type": "json_object"}
-            
-            response = client.chat.completions.create(**kwargs)
-            
-            return response.choices[0].message.content.strip()
+    JSON_SYSTEM_PROMPT = "당신은 LG전자 가전 추천 전문가입니다. 사용자의 자연어 요청을 분석하여 제품 추천에 필요한 정보를 JSON 형식으로만 응답합니다. 반드시 유효한 JSON 형식으로만 응답하세요."
+    UNAVAILABLE_MESSAGE = "죄송해요, 현재 AI 상담 서비스를 이용할 수 없어요. 잠시 후 다시 시도해주세요."
+    ERROR_MESSAGE = "죄송해요, 일시적인 오류가 발생했어요. 다시 시도해주세요."
+    
+    @classmethod
+    def _chat_kwargs(cls, user_message: str, context: dict = None, require_json: bool = False) -> dict:
+        """챗봇 요청 파라미터 (일반/스트리밍 공용)"""
+        messages = [{"role": "system", "content": cls.JSON_SYSTEM_PROMPT if require_json else cls.CHAT_SYSTEM_PROMPT}]
+        
+        # 컨텍스트가 있으면 추가
+        if context and context.get('history'):
+            for msg in context['history'][-5:]:  # 최근 5개 대화만
+                messages.append(msg)
+        
+        messages.append({"role": "user", "content": user_message})
+        
+        kwargs = {
+            "model": cls.MODEL,
+            "messages": messages,
+            "max_tokens": 500,
+            "temperature": 0.7
+        }
+        
+        # JSON 응답 강제 옵션
+        if require_json:
+            kwargs["response_format"] = {"type": "json_object"}
+        return kwargs
+    
+    @classmethod
+    def chat_response(cls, user_message: str, context: dict = None, require_json: bool = False,
+                      cache_site: str = None) -> str:
+        """
+        AI 상담 챗봇 응답
+        
+        Args:
+            user_message: 사용자 메시지
+            context: 대화 컨텍스트 (선택)
+            require_json: JSON 형식 응답 강제 여부
+            cache_site: 지정하면 같은 요청의 응답을 캐시에서 재사용 (제품/프로필로 만든 프롬프트용, 통계 이름)
+        
+        Returns:
+            AI 응답 문자열
+        """
+        if not cls.is_available():
+            return cls.UNAVAILABLE_MESSAGE
+        
+        try:
+            return cls._complete(
+                cache_site or 'chat',
+                cache=bool(cache_site),
+                **cls._chat_kwargs(user_message, context, require_json)
+            )
         
         except Exception as e:
             print(f"ChatGPT 챗봇 오류: {e}")
-            return "죄송해요, 일시적인 오류가 발생했어요. 다시 시도해주세요."
+            return cls.ERROR_MESSAGE
+    
+    @classmethod
+    def stream_chat_response(cls, user_message: str, context: dict = None):
+        """
+        AI 상담 챗봇 응답 스트리밍 (토큰이 도착하는 대로 텍스트 조각을 yield)
+        
+        호출한 쪽이 제너레이터를 닫으면(클라이언트 연결 종료 등) OpenAI 스트림도 닫아
+        남은 생성을 중단합니다.
+        
+        Yields:
+            응답 텍스트 조각 (서비스를 쓸 수 없거나 오류가 나면 안내 문구 한 번)
+        """
+        if not cls.is_available():
+            yield cls.UNAVAILABLE_MESSAGE
+            return
+        
+        stream = None
+        received = False
+        try:
+            stream = client.chat.completions.create(stream=True, **cls._chat_kwargs(user_message, context))
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                text = chunk.choices[0].delta.content
+                if text:
+                    received = True
+                    yield text
+        except GeneratorExit:
+            print("[ChatGPT] 스트리밍 중단 (클라이언트 연결 종료)")
+            raise
+        except Exception as e:
+            print(f"ChatGPT 챗봇 스트리밍 오류: {e}")
+            if not received:
+                yield cls.ERROR_MESSAGE
+        finally:
+            if stream is not None:
+                try:
+                    stream.close()
+                except Exception:
+                    pass
 
 
 # 싱글톤 인스턴스
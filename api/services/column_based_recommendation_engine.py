@@ -91,10 +91,9 @@ class ColumnBasedRecommendationEngine:
                     'recommendations': []
                 }
             
-            # 4. SPEC 구조 분석 (최초 1회)
-            if not self.spec_structure_analyzed:
-                spec_column_scorer.analyze_spec_structure(products_list)
-                self.spec_structure_analyzed = True
+            # 4. SPEC 구조 (전체 카탈로그 스키마 아티팩트, 없으면 최초 1회 분석)
+            spec_column_scorer.ensure_schema(products_list)
+            self.spec_structure_analyzed = True
             
             # 5. 제품 종류별 칼럼 점수 산출
             product_type_column_scores = self._calculate_product_type_column_scores(
@@ -8,6 +8,8 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.models import User
 import json
 
+from api.utils.http_client import http_client
+
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
@@ -66,7 +68,7 @@ class KakaoAuthService:
         }
         
         try:
-            response = requests.post(url, data=data, timeout=10)
+            response = http_client.post(url, data=data)
             response.raise_for_status()
             token_data = response.json()
             
@@ -100,7 +102,7 @@ class KakaoAuthService:
         }
         
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = http_client.get(url, headers=headers)
             
             # 토큰 만료 처리
             if response.status_code == 401:
@@ -181,7 +183,7 @@ class KakaoAuthService:
         }
         
         try:
-            response = requests.post(url, data=data, timeout=10)
+            response = http_client.post(url, data=data)
             response.raise_for_status()
             token_data = response.json()
             logger.info(f"[Kakao Auth] 토큰 갱신 성공")
@@ -6,6 +6,8 @@ import logging
 from django.conf import settings
 import json
 
+from api.utils.http_client import http_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -98,7 +100,7 @@ class KakaoMessageService:
             응답 JSON
         """
         try:
-            response = requests.post(url, headers=headers, data=data, timeout=10)
+            response = http_client.post(url, headers=headers, data=data)
             
             # 토큰 만료 처리
             if response.status_code == 401:
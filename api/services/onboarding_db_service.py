@@ -3,6 +3,8 @@
 """
 import json
 import uuid
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from api.db.oracle_client import get_connection, fetch_all_dict, fetch_one
 from api.services.taste_calculation_service import taste_calculation_service
@@ -16,6 +18,83 @@ class OnboardingDBService:
     _table_columns_checked = False
     _session_id_type_checked = False
     
+    # 배치 모드 상태 (스레드별 공유 연결 + 커밋 후 실행할 콜백)
+    _batch_state = threading.local()
+    
+    @staticmethod
+    @contextmanager
+    def batch():
+        """
+        여러 저장 호출을 하나의 연결/트랜잭션으로 묶기
+        
+        블록 안의 create_or_update_session, save_user_response, save_multiple_responses는
+        같은 연결을 공유하고 개별 커밋을 건너뛰며, 블록이 정상 종료될 때 한 번만 커밋합니다.
+        예외가 발생하면 전체를 롤백합니다.
+        
+        스키마 확인/보정(_ensure_schema)은 DDL과 자체 커밋을 포함하므로 트랜잭션을 시작하기 전에
+        먼저 실행하고, 블록 안에서는 건너뜁니다.
+        
+        사용법:
+            with onboarding_db_service.batch():
+                onboarding_db_service.create_or_update_session(...)
+                onboarding_db_service.save_user_response(...)
+        """
+        state = OnboardingDBService._batch_state
+        if getattr(state, 'conn', None) is not None:
+            # 중첩 배치는 바깥 트랜잭션에 합류
+            yield state.conn
+            return
+        
+        callbacks = []
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                OnboardingDBService._ensure_schema(conn, cur)
+            state.conn = conn
+            state.after_commit = callbacks
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                state.conn = None
+                state.after_commit = None
+        
+        for callback in callbacks:
+            callback()
+    
+    @staticmethod
+    @contextmanager
+    def _connection():
+        """배치 모드면 공유 연결, 아니면 새 연결"""
+        batch_conn = getattr(OnboardingDBService._batch_state, 'conn', None)
+        if batch_conn is not None:
+            yield batch_conn
+        else:
+            with get_connection() as conn:
+                yield conn
+    
+    @staticmethod
+    def _in_batch(conn):
+        return getattr(OnboardingDBService._batch_state, 'conn', None) is conn
+    
+    @staticmethod
+    def _commit(conn):
+        """배치 모드가 아닐 때만 커밋 (배치 모드는 batch() 종료 시 한 번에 커밋)"""
+        if OnboardingDBService._in_batch(conn):
+            return
+        conn.commit()
+    
+    @staticmethod
+    def _after_commit(callback):
+        """커밋 이후 실행할 작업 등록 (배치 모드가 아니면 즉시 실행)"""
+        callbacks = getattr(OnboardingDBService._batch_state, 'after_commit', None)
+        if callbacks is None:
+            callback()
+        else:
+            callbacks.append(callback)
+    
     @staticmethod
     def _ensure_member_id_default_guest(conn, cur):
         """MEMBER_ID 컬럼이 NOT NULL이고 기본값 'GUEST'인지 확인하고, 필요시 수정"""
@@ -314,6 +393,21 @@ class OnboardingDBService:
             print(f"[OnboardingDBService] ⚠️ GUEST 레코드 확인/생성 중 오류: {e}", flush=True)
             # 오류가 발생해도 계속 진행 (NULL로 처리 가능)
     
+    @staticmethod
+    def _ensure_schema(conn, cur):
+        """세션 저장 전 스키마 확인 및 보정 (DDL/커밋 포함 - 트랜잭션 밖에서 실행)"""
+        # 1. SESSION_ID 타입 확인 및 수정 (가장 먼저 실행)
+        OnboardingDBService._ensure_session_id_type(conn, cur)
+        
+        # 2. 필요한 컬럼 존재 확인 및 추가
+        OnboardingDBService._ensure_table_columns_exist(conn, cur)
+        
+        # 3. MEMBER_ID NOT NULL 및 기본값 'GUEST' 확인 및 수정
+        OnboardingDBService._ensure_member_id_default_guest(conn, cur)
+        
+        # 4. GUEST 레코드 존재 확인 및 생성
+        OnboardingDBService._ensure_guest_member_exists(conn, cur)
+    
     @staticmethod
     def _convert_to_numeric(value):
         """
@@ -361,21 +455,13 @@ class OnboardingDBService:
         print(f"\n[create_or_update_session] 함수 진입 - session_id={session_id}, step={current_step}", flush=True)
         try:
             print(f"[create_or_update_session] Oracle DB 연결 시도...", flush=True)
-            with get_connection() as conn:
+            with OnboardingDBService._connection() as conn:
                 print(f"[create_or_update_session] Oracle DB 연결 성공!", flush=True)
                 
                 with conn.cursor() as cur:
-                    # 1. SESSION_ID 타입 확인 및 수정 (가장 먼저 실행)
-                    OnboardingDBService._ensure_session_id_type(conn, cur)
-                    
-                    # 2. 필요한 컬럼 존재 확인 및 추가
-                    OnboardingDBService._ensure_table_columns_exist(conn, cur)
-                    
-                    # 3. MEMBER_ID NOT NULL 및 기본값 'GUEST' 확인 및 수정
-                    OnboardingDBService._ensure_member_id_default_guest(conn, cur)
-                    
-                    # 4. GUEST 레코드 존재 확인 및 생성
-                    OnboardingDBService._ensure_guest_member_exists(conn, cur)
+                    # 스키마 확인 및 보정 (배치 모드는 batch() 시작 시 이미 실행)
+                    if not OnboardingDBService._in_batch(conn):
+                        OnboardingDBService._ensure_schema(conn, cur)
                     
                     # 테이블 존재 여부 확인
                     try:
@@ -1132,7 +1218,7 @@ class OnboardingDBService:
                     print(f"  SESSION_ID = {session_id}", flush=True)
                     print(f"  [커밋 실행 중...]", flush=True)
                     try:
-                        conn.commit()
+                        OnboardingDBService._commit(conn)
                         print(f"  [커밋 완료!]", flush=True)
                         print(f"    ✅ 트랜잭션이 성공적으로 커밋되었습니다.", flush=True)
                     except Exception as commit_error:
@@ -1165,39 +1251,43 @@ class OnboardingDBService:
                     # Taste 계산 및 할당 (온보딩 완료 시, 회원인 경우)
                     # ============================================================
                     if status == 'COMPLETED' and final_member_id and final_member_id != 'GUEST':
-                        try:
-                            print(f"\n{'='*80}", flush=True)
-                            print(f"[Taste 계산 및 할당] 시작", flush=True)
-                            print(f"{'='*80}", flush=True)
-                            print(f"  MEMBER_ID: {final_member_id}", flush=True)
-                            print(f"  SESSION_ID: {session_id}", flush=True)
-                            print(f"  STATUS: {status} (완료)", flush=True)
+                        def _assign_taste(final_member_id=final_member_id, session_id=session_id):
+                            # 세션이 커밋된 뒤에 별도 연결로 조회하므로 배치 모드에서는 커밋 이후로 미룸
+                            try:
+                                print(f"\n{'='*80}", flush=True)
+                                print(f"[Taste 계산 및 할당] 시작", flush=True)
+                                print(f"{'='*80}", flush=True)
+                                print(f"  MEMBER_ID: {final_member_id}", flush=True)
+                                print(f"  SESSION_ID: {session_id}", flush=True)
+                                print(f"  STATUS: {status} (완료)", flush=True)
                             
-                            # Taste 계산 및 저장
-                            taste_id = taste_calculation_service.calculate_and_save_taste(
-                                member_id=final_member_id,
-                                onboarding_session_id=session_id
-                            )
+                                # Taste 계산 및 저장
+                                taste_id = taste_calculation_service.calculate_and_save_taste(
+                                    member_id=final_member_id,
+                                    onboarding_session_id=session_id
+                                )
                             
-                            print(f"  ✅ Taste 계산 및 저장 성공!", flush=True)
-                            print(f"    계산된 TASTE_ID: {taste_id} (1~1920 범위)", flush=True)
-                            print(f"    MEMBER 테이블 업데이트 완료", flush=True)
-                            print(f"{'='*80}\n", flush=True)
-                        except Exception as taste_error:
-                            # Taste 계산 실패해도 온보딩 저장은 성공으로 처리
-                            print(f"\n{'='*80}", flush=True)
-                            print(f"[Taste 계산 및 할당] ⚠️ 경고: Taste 계산 실패", flush=True)
-                            print(f"{'='*80}", flush=True)
-                            print(f"  MEMBER_ID: {final_member_id}", flush=True)
-                            print(f"  SESSION_ID: {session_id}", flush=True)
-                            print(f"  에러 타입: {type(taste_error).__name__}", flush=True)
-                            print(f"  에러 메시지: {str(taste_error)}", flush=True)
-                            print(f"  ⚠️ 온보딩 데이터는 정상 저장되었지만, Taste 계산은 실패했습니다.", flush=True)
-                            print(f"  ⚠️ 나중에 수동으로 Taste를 계산할 수 있습니다.", flush=True)
-                            import traceback
-                            print(f"  [트레이스백]", flush=True)
-                            traceback.print_exc()
-                            print(f"{'='*80}\n", flush=True)
+                                print(f"  ✅ Taste 계산 및 저장 성공!", flush=True)
+                                print(f"    계산된 TASTE_ID: {taste_id} (1~1920 범위)", flush=True)
+                                print(f"    MEMBER 테이블 업데이트 완료", flush=True)
+                                print(f"{'='*80}\n", flush=True)
+                            except Exception as taste_error:
+                                # Taste 계산 실패해도 온보딩 저장은 성공으로 처리
+                                print(f"\n{'='*80}", flush=True)
+                                print(f"[Taste 계산 및 할당] ⚠️ 경고: Taste 계산 실패", flush=True)
+                                print(f"{'='*80}", flush=True)
+                                print(f"  MEMBER_ID: {final_member_id}", flush=True)
+                                print(f"  SESSION_ID: {session_id}", flush=True)
+                                print(f"  에러 타입: {type(taste_error).__name__}", flush=True)
+                                print(f"  에러 메시지: {str(taste_error)}", flush=True)
+                                print(f"  ⚠️ 온보딩 데이터는 정상 저장되었지만, Taste 계산은 실패했습니다.", flush=True)
+                                print(f"  ⚠️ 나중에 수동으로 Taste를 계산할 수 있습니다.", flush=True)
+                                import traceback
+                                print(f"  [트레이스백]", flush=True)
+                                traceback.print_exc()
+                                print(f"{'='*80}\n", flush=True)
+                        
+                        OnboardingDBService._after_commit(_assign_taste)
                     elif status == 'COMPLETED' and (not final_member_id or final_member_id == 'GUEST'):
                         print(f"\n[Taste 계산 및 할당] 건너뜀 (GUEST 회원이므로 Taste 계산하지 않음)", flush=True)
                         print(f"  MEMBER_ID: {final_member_id}", flush=True)
@@ -1266,7 +1356,7 @@ class OnboardingDBService:
             question_id: 질문 ID (선택적, 자동 조회)
             answer_id: 답변 ID (선택적, 자동 조회)
         """
-        with get_connection() as conn:
+        with OnboardingDBService._connection() as conn:
             with conn.cursor() as cur:
                 # ONBOARDING_QUESTION 테이블 존재 여부 확인
                 try:
@@ -1399,7 +1489,7 @@ class OnboardingDBService:
                         'response_text': answer_text
                     })
                 
-                conn.commit()
+                OnboardingDBService._commit(conn)
                 return True
     
     @staticmethod
@@ -1414,7 +1504,7 @@ class OnboardingDBService:
             answer_values: 선택한 값 리스트
         """
         # 기존 응답 삭제 (같은 세션, 같은 질문 타입)
-        with get_connection() as conn:
+        with OnboardingDBService._connection() as conn:
             with conn.cursor() as cur:
                 # 질문 CODE 조회 (ERD 기준: QUESTION_CODE가 PK)
                 # STEP_NUMBER가 없으면 QUESTION_TYPE만으로 조회
@@ -1648,7 +1738,7 @@ class OnboardingDBService:
                         print(f"[save_multiple_responses] ⚠️ 응답 저장 중 오류: {e}", flush=True)
                         continue
                 
-                conn.commit()
+                OnboardingDBService._commit(conn)
                 return True
     
     @staticmethod
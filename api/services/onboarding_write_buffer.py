@@ -0,0 +1,329 @@
+"""
+온보딩 단계별 Oracle 저장을 완료 시점까지 모아두는 write-behind 버퍼
+
+Step 1~6에서는 세션 필드와 사용자 응답을 로컬 저널 파일에만 기록하고,
+온보딩 완료 시 flush()로 ONBOARDING_SESSION + 정규화 테이블(ONBOARD_SESS_*) +
+ONBOARDING_USER_RESPONSE를 하나의 연결/트랜잭션으로 Oracle에 반영합니다.
+
+저장소 (ONBOARDING_BUFFER_DIR, 캐시가 아니므로 만료/정리로 사라지지 않음):
+- sessions/<세션 ID>.jsonl: 세션별 추가 전용(append-only) 저널. 단계 저장은 한 줄 추가만 하므로
+  워커 간 읽기-수정-쓰기 경합이 없고, 다시 읽을 때 뒤에 쓴 값이 우선합니다.
+- pending/<세션 ID>: flush 실패(또는 flush 도중 중단) 세션 표시. 세션마다 파일 하나라서
+  여러 워커가 동시에 표시/해제해도 서로의 항목을 지우지 않습니다.
+
+flush는 저널을 <세션 ID>.flushing으로 이름을 바꿔 선점한 뒤 반영하므로, 같은 세션을 두 워커가
+동시에 flush해도 한 번만 반영됩니다. 저널에 쓸 수 없으면(디스크 오류 등) 해당 단계는 Oracle에
+바로 저장합니다. 실패한 세션은 `python manage.py flush_onboarding_buffer`로 재시도할 수 있습니다.
+"""
+import json
+import os
+import re
+import time
+from pathlib import Path
+
+from django.conf import settings
+
+from api.services.onboarding_db_service import onboarding_db_service
+
+# 파일 이름으로 쓸 수 있는 세션 ID만 버퍼링 (그 외는 바로 저장)
+SESSION_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-][A-Za-z0-9_.-]{0,99}$')
+
+
+class OnboardingWriteBuffer:
+    """온보딩 세션 write-behind 버퍼 (onboarding_db_service와 같은 저장 메서드 제공)"""
+
+    @property
+    def enabled(self):
+        return getattr(settings, 'ONBOARDING_WRITE_BEHIND', False)
+
+    @property
+    def root(self):
+        return Path(getattr(settings, 'ONBOARDING_BUFFER_DIR', Path(settings.BASE_DIR) / 'data' / 'onboarding_buffer'))
+
+    @property
+    def claim_timeout(self):
+        return getattr(settings, 'ONBOARDING_BUFFER_CLAIM_TIMEOUT', 60 * 10)
+
+    def _journal_path(self, session_id):
+        return self.root / 'sessions' / f"{session_id}.jsonl"
+
+    def _claim_path(self, session_id):
+        return self.root / 'sessions' / f"{session_id}.flushing"
+
+    def _pending_path(self, session_id):
+        return self.root / 'pending' / session_id
+
+    @staticmethod
+    def _bufferable(session_id):
+        return bool(session_id) and bool(SESSION_ID_PATTERN.match(str(session_id)))
+
+    # ============================================================
+    # 저널 입출력
+    # ============================================================
+
+    def _append(self, session_id, record):
+        """저널에 기록 한 줄 추가 (한 번의 write로 추가하고 디스크까지 동기화)"""
+        path = self._journal_path(session_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        line = (json.dumps(record, ensure_ascii=False, default=str) + '\n').encode('utf-8')
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, line)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _replay(data):
+        """저널 내용 → {'session': {...}, 'responses': {...}} (뒤에 쓴 값 우선)"""
+        state = {'session': {}, 'responses': {}}
+        for line in data.decode('utf-8').splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # 기록 도중 중단된 마지막 줄
+                continue
+            state['session'].update(record.get('session') or {})
+            response = record.get('response')
+            if response:
+                state['responses'][f"{response['step_number']}:{response['question_type']}"] = response
+        return state
+
+    def _write_atomic(self, path, data):
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _claim(self, session_id):
+        """
+        저널 선점 (이름 변경은 원자적이라 동시에 flush해도 한 워커만 성공)
+
+        Returns:
+            선점한 저널 경로, 버퍼가 없거나 다른 워커가 flush 중이면 None
+        """
+        journal = self._journal_path(session_id)
+        claimed = self._claim_path(session_id)
+        if claimed.exists():
+            # 중단된 flush가 남긴 선점 파일 - 충분히 오래되었으면 넘겨받음
+            if time.time() - claimed.stat().st_mtime < self.claim_timeout:
+                return None
+            if journal.exists():
+                self._restore(session_id, claimed.read_bytes(), {})
+            else:
+                os.utime(claimed)
+                return claimed
+        try:
+            os.replace(journal, claimed)
+        except FileNotFoundError:
+            return None
+        return claimed
+
+    def _restore(self, session_id, data, final_fields):
+        """flush 실패 시 선점한 저널을 되돌림 (flush 도중 새로 추가된 기록은 뒤에 유지)"""
+        journal = self._journal_path(session_id)
+        claimed = self._claim_path(session_id)
+        restored = data
+        if final_fields:
+            restored += (json.dumps({'session': final_fields}, ensure_ascii=False, default=str) + '\n').encode('utf-8')
+        if journal.exists():
+            restored += journal.read_bytes()
+        self._write_atomic(journal, restored)
+        claimed.unlink(missing_ok=True)
+
+    def _mark_pending(self, session_id, pending):
+        path = self._pending_path(session_id)
+        if pending:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch()
+        else:
+            path.unlink(missing_ok=True)
+
+    # ============================================================
+    # 단계별 저장 (저널에만 기록)
+    # ============================================================
+
+    def create_or_update_session(self, session_id=None, user_id=None, member_id=None, current_step=None, status=None, **kwargs):
+        """
+        세션 필드를 버퍼에 기록 (전달된 None이 아닌 값만, 최신 값 우선)
+
+        session_id가 없으면 Oracle에서 생성해야 하므로 즉시 저장으로 넘어갑니다.
+        """
+        fields = dict(kwargs, user_id=user_id, member_id=member_id, current_step=current_step, status=status)
+        fields = {key: value for key, value in fields.items() if value is not None}
+        if self._bufferable(session_id):
+            session_id = str(session_id)
+            try:
+                self._append(session_id, {'session': fields})
+                return session_id
+            except OSError as e:
+                print(f"[OnboardingWriteBuffer] ⚠️ 버퍼 기록 실패, Oracle에 바로 저장: {e}", flush=True)
+
+        fields.setdefault('current_step', 1)
+        fields.setdefault('status', 'IN_PROGRESS')
+        return onboarding_db_service.create_or_update_session(session_id=session_id, **fields)
+
+    def save_user_response(self, session_id, step_number, question_type, answer_value, answer_text=None, question_id=None, answer_id=None):
+        """단일 응답을 버퍼에 기록 (같은 단계/질문은 최신 응답으로 교체)"""
+        payload = {
+            'answer_value': answer_value,
+            'answer_text': answer_text,
+            'question_id': question_id,
+            'answer_id': answer_id,
+        }
+        if self._stage_response(session_id, step_number, question_type, payload):
+            return True
+        return onboarding_db_service.save_user_response(
+            session_id=session_id, step_number=step_number, question_type=question_type, **payload
+        )
+
+    def save_multiple_responses(self, session_id, step_number, question_type, answer_values):
+        """다중 선택 응답을 버퍼에 기록"""
+        if self._stage_response(session_id, step_number, question_type, {'answer_values': list(answer_values)}):
+            return True
+        return onboarding_db_service.save_multiple_responses(
+            session_id=session_id, step_number=step_number, question_type=question_type, answer_values=answer_values
+        )
+
+    def _stage_response(self, session_id, step_number, question_type, payload):
+        """응답을 저널에 기록 (버퍼에 쓸 수 없으면 False - 호출자가 바로 저장)"""
+        if not self._bufferable(session_id):
+            return False
+        payload = dict(payload, step_number=step_number, question_type=question_type)
+        try:
+            self._append(str(session_id), {'response': payload})
+            return True
+        except OSError as e:
+            print(f"[OnboardingWriteBuffer] ⚠️ 버퍼 기록 실패, Oracle에 바로 저장: {e}", flush=True)
+            return False
+
+    # ============================================================
+    # 완료 시 일괄 반영
+    # ============================================================
+
+    def flush(self, session_id, **final_fields):
+        """
+        버퍼에 쌓인 세션/응답을 하나의 트랜잭션으로 Oracle에 반영
+
+        버퍼가 없으면(이미 flush됨, 다른 워커가 flush 중 등) final_fields만 반영하고,
+        final_fields도 없으면 DB에 쓰지 않습니다. 세션 행에는 버퍼에 기록되었거나
+        final_fields로 전달된 필드만 넘기므로 완료된 세션을 기본값으로 되돌리지 않습니다.
+
+        Args:
+            session_id: 세션 ID
+            **final_fields: 완료 시점에 덮어쓸 세션 필드 (status, recommended_products 등)
+
+        Returns:
+            반영한 응답 수
+
+        Raises:
+            Oracle 저장 실패 시 예외를 그대로 전달 (버퍼는 유지되고 pending으로 표시됨)
+        """
+        session_id = str(session_id)
+        final_fields = {k: v for k, v in final_fields.items() if v is not None}
+        claimed = self._claim(session_id) if self._bufferable(session_id) else None
+        if claimed is None:
+            if not final_fields:
+                print(f"[OnboardingWriteBuffer] 세션 {session_id} 버퍼 없음 - flush 건너뜀", flush=True)
+                return 0
+            onboarding_db_service.create_or_update_session(session_id=session_id, **final_fields)
+            self._mark_pending(session_id, False)
+            return 0
+
+        self._mark_pending(session_id, True)
+        data = claimed.read_bytes()
+        state = self._replay(data)
+        session_fields = dict(state['session'], **final_fields)
+        responses = sorted(
+            state['responses'].values(),
+            key=lambda r: (r['step_number'], r['question_type'])
+        )
+
+        try:
+            with onboarding_db_service.batch():
+                if session_fields:
+                    onboarding_db_service.create_or_update_session(session_id=session_id, **session_fields)
+                for response in responses:
+                    if 'answer_values' in response:
+                        onboarding_db_service.save_multiple_responses(
+                            session_id=session_id,
+                            step_number=response['step_number'],
+                            question_type=response['question_type'],
+                            answer_values=response['answer_values'],
+                        )
+                    else:
+                        onboarding_db_service.save_user_response(
+                            session_id=session_id,
+                            step_number=response['step_number'],
+                            question_type=response['question_type'],
+                            answer_value=response['answer_value'],
+                            answer_text=response.get('answer_text'),
+                            question_id=response.get('question_id'),
+                            answer_id=response.get('answer_id'),
+                        )
+        except Exception:
+            # 완료 시점 필드까지 포함해 저널을 되돌리고 재시도 대상으로 남김
+            self._restore(session_id, data, final_fields)
+            raise
+
+        claimed.unlink(missing_ok=True)
+        if not self._journal_path(session_id).exists():
+            self._mark_pending(session_id, False)
+
+        print(f"[OnboardingWriteBuffer] ✅ 세션 {session_id} flush 완료 (응답 {len(responses)}개, 단일 커밋)", flush=True)
+        return len(responses)
+
+    def pending_sessions(self):
+        """flush에 실패해 재시도가 필요한 세션 ID 목록"""
+        pending_dir = self.root / 'pending'
+        if not pending_dir.is_dir():
+            return []
+        return sorted(path.name for path in pending_dir.iterdir() if path.is_file())
+
+    def flush_pending(self):
+        """
+        pending 세션 재시도
+
+        Returns:
+            {'flushed': [...], 'failed': {session_id: error}}
+        """
+        flushed, failed = [], {}
+        for session_id in self.pending_sessions():
+            try:
+                self.flush(session_id)
+                flushed.append(session_id)
+            except Exception as e:
+                failed[session_id] = str(e)
+        return {'flushed': flushed, 'failed': failed}
+
+    def purge_stale(self, max_age=None):
+        """
+        완료되지 않고 방치된 세션 저널 삭제 (pending 세션은 유지)
+
+        Args:
+            max_age: 마지막 기록 후 경과 시간(초), 생략 시 ONBOARDING_BUFFER_RETENTION
+
+        Returns:
+            삭제한 세션 수
+        """
+        max_age = max_age if max_age is not None else getattr(settings, 'ONBOARDING_BUFFER_RETENTION', 60 * 60 * 24 * 7)
+        sessions_dir = self.root / 'sessions'
+        if not sessions_dir.is_dir():
+            return 0
+        pending = set(self.pending_sessions())
+        cutoff = time.time() - max_age
+        removed = 0
+        for path in sessions_dir.glob('*.jsonl'):
+            if path.stem in pending or path.stat().st_mtime >= cutoff:
+                continue
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+
+# 싱글톤 인스턴스
+onboarding_write_buffer = OnboardingWriteBuffer()
@@ -0,0 +1,289 @@
+"""
+트랜잭셔널 아웃박스 (요청 후처리 Oracle 저장)
+
+요청 처리 중에는 Oracle에 직접 쓰지 않고 OutboxEvent를 로컬 DB 트랜잭션 안에서 기록합니다.
+트랜잭션이 커밋되면 디스패처가 깨어나 대기 이벤트를 배치로 점유해 Oracle에 반영합니다.
+
+- 멱등성: 같은 idempotency_key(기본값: 이벤트 종류 + 대상 ID + 데이터 해시)는 한 번만 기록되고,
+  핸들러는 같은 이벤트가 두 번 반영되어도 결과가 같도록(upsert) 작성합니다.
+- 순서: 같은 대상(aggregate_id)의 이벤트는 ID 순으로 처리하며, 앞 이벤트가 실패하면 뒤 이벤트는 다음 배치로 미룹니다.
+- 재시도: 실패 시 지수 백오프 + 지터로 next_attempt_at을 늦추고, OUTBOX_MAX_ATTEMPTS를 넘으면 FAILED로 둡니다.
+- 디스패처: OUTBOX_DISPATCH_IN_PROCESS=True면 웹 프로세스 안의 백그라운드 스레드,
+  아니면 `python manage.py dispatch_outbox --loop` 워커가 처리합니다.
+"""
+import hashlib
+import json
+import random
+import threading
+import time
+from datetime import timedelta
+from typing import Callable, Dict, List, Optional
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from api.models import OutboxEvent
+
+# 이벤트 종류
+EVENT_ONBOARDING_COMPLETED = 'onboarding.completed'
+
+# 이벤트 종류별 핸들러 (핸들러는 OutboxEvent를 받아 Oracle에 반영, 실패 시 예외)
+_handlers: Dict[str, Callable[[OutboxEvent], None]] = {}
+
+
+def register_handler(event_type: str):
+    """아웃박스 이벤트 핸들러 등록 데코레이터"""
+    def decorator(func):
+        _handlers[event_type] = func
+        return func
+    return decorator
+
+
+def _payload_digest(payload: Dict) -> str:
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, cls=DjangoJSONEncoder)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:20]
+
+
+class OutboxService:
+    """아웃박스 이벤트 기록 + 배치 디스패치"""
+
+    def __init__(self):
+        self._wake = threading.Event()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+
+    @property
+    def batch_size(self):
+        return getattr(settings, 'OUTBOX_BATCH_SIZE', 50)
+
+    @property
+    def max_attempts(self):
+        return getattr(settings, 'OUTBOX_MAX_ATTEMPTS', 8)
+
+    @property
+    def lease_seconds(self):
+        return getattr(settings, 'OUTBOX_LEASE_SECONDS', 60)
+
+    # ============================================================
+    # 기록
+    # ============================================================
+
+    def enqueue(self, event_type: str, aggregate_id, payload: Dict, idempotency_key: str = None) -> OutboxEvent:
+        """
+        이벤트 기록 (호출한 쪽 트랜잭션에 포함, 커밋 후 디스패처를 깨움)
+
+        Returns:
+            기록된 이벤트 (같은 idempotency_key가 이미 있으면 기존 이벤트)
+        """
+        # JSONField에 저장 가능한 형태로 정규화 (Decimal/datetime 등)
+        payload = json.loads(json.dumps(payload, cls=DjangoJSONEncoder))
+        aggregate_id = str(aggregate_id)
+        if not idempotency_key:
+            idempotency_key = f"{event_type}:{aggregate_id}:{_payload_digest(payload)}"
+
+        event, created = OutboxEvent.objects.get_or_create(
+            idempotency_key=idempotency_key,
+            defaults={
+                'event_type': event_type,
+                'aggregate_id': aggregate_id,
+                'payload': payload,
+            }
+        )
+        if created:
+            print(f"[Outbox] 이벤트 기록: {event_type} {aggregate_id} (#{event.pk})", flush=True)
+        else:
+            print(f"[Outbox] 중복 이벤트 무시: {idempotency_key}", flush=True)
+        transaction.on_commit(self.wake)
+        return event
+
+    # ============================================================
+    # 디스패치
+    # ============================================================
+
+    def _claim(self, limit: int) -> List[OutboxEvent]:
+        """반영 시점이 된 대기 이벤트를 점유 (다른 워커와 겹치지 않도록 행 단위 조건부 UPDATE)"""
+        now = timezone.now()
+        candidates = list(
+            OutboxEvent.objects
+            .filter(status=OutboxEvent.STATUS_PENDING, next_attempt_at__lte=now)
+            .filter(Q(locked_until__isnull=True) | Q(locked_until__lt=now))
+            .order_by('id')[:limit]
+        )
+        lease = now + timedelta(seconds=self.lease_seconds)
+        claimed = []
+        for event in candidates:
+            updated = (
+                OutboxEvent.objects
+                .filter(pk=event.pk, status=OutboxEvent.STATUS_PENDING)
+                .filter(Q(locked_until__isnull=True) | Q(locked_until__lt=now))
+                .update(locked_until=lease)
+            )
+            if updated:
+                event.locked_until = lease
+                claimed.append(event)
+        return claimed
+
+    def _retry_delay(self, attempts: int) -> float:
+        """지수 백오프 + 지터 (초)"""
+        base = getattr(settings, 'OUTBOX_RETRY_BASE_SECONDS', 5)
+        cap = getattr(settings, 'OUTBOX_RETRY_MAX_SECONDS', 600)
+        delay = min(cap, base * (2 ** max(attempts - 1, 0)))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _mark_done(self, event: OutboxEvent):
+        event.status = OutboxEvent.STATUS_DONE
+        event.dispatched_at = timezone.now()
+        event.locked_until = None
+        event.last_error = ''
+        event.save(update_fields=['status', 'attempts', 'dispatched_at', 'locked_until', 'last_error'])
+
+    def _mark_failed(self, event: OutboxEvent, error: Exception):
+        event.last_error = f"{type(error).__name__}: {error}"[:2000]
+        event.locked_until = None
+        if event.attempts >= self.max_attempts:
+            event.status = OutboxEvent.STATUS_FAILED
+            print(f"[Outbox] ❌ 재시도 한도 초과: {event.event_type} {event.aggregate_id} (#{event.pk}) - {event.last_error}", flush=True)
+        else:
+            delay = self._retry_delay(event.attempts)
+            event.next_attempt_at = timezone.now() + timedelta(seconds=delay)
+            print(f"[Outbox] ⚠️ 반영 실패, {delay:.1f}초 후 재시도 ({event.attempts}/{self.max_attempts}): #{event.pk} - {event.last_error}", flush=True)
+        event.save(update_fields=['status', 'attempts', 'next_attempt_at', 'locked_until', 'last_error'])
+
+    def _release(self, event: OutboxEvent):
+        """처리하지 않은 점유 이벤트 반납 (시도 횟수는 그대로)"""
+        OutboxEvent.objects.filter(pk=event.pk).update(locked_until=None)
+
+    def dispatch_batch(self, limit: int = None) -> Dict:
+        """
+        대기 이벤트 한 배치를 Oracle에 반영
+
+        Returns:
+            {'claimed': n, 'done': n, 'failed': n, 'deferred': n}
+        """
+        events = self._claim(limit or self.batch_size)
+        stats = {'claimed': len(events), 'done': 0, 'failed': 0, 'deferred': 0}
+
+        for event in events:
+            # 같은 대상의 앞 이벤트가 아직 반영되지 않았으면(실패 후 재시도 대기 등) 순서를 지키도록 미룸
+            has_earlier = OutboxEvent.objects.filter(
+                event_type=event.event_type,
+                aggregate_id=event.aggregate_id,
+                status=OutboxEvent.STATUS_PENDING,
+                id__lt=event.pk,
+            ).exists()
+            if has_earlier:
+                self._release(event)
+                stats['deferred'] += 1
+                continue
+
+            handler = _handlers.get(event.event_type)
+            event.attempts += 1
+            try:
+                if handler is None:
+                    raise LookupError(f"등록되지 않은 이벤트 종류: {event.event_type}")
+                handler(event)
+            except Exception as e:
+                self._mark_failed(event, e)
+                stats['failed'] += 1
+            else:
+                self._mark_done(event)
+                stats['done'] += 1
+
+        if events:
+            print(f"[Outbox] 배치 처리: {stats}", flush=True)
+        return stats
+
+    def dispatch_pending(self, max_batches: int = None) -> Dict:
+        """반영 시점이 된 이벤트가 없을 때까지 배치 반복"""
+        totals = {'claimed': 0, 'done': 0, 'failed': 0, 'deferred': 0}
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            stats = self.dispatch_batch()
+            batches += 1
+            for name, value in stats.items():
+                totals[name] += value
+            # 전부 실패/연기된 배치는 같은 이벤트를 바로 다시 집지 않도록 종료
+            if stats['claimed'] == 0 or stats['done'] == 0:
+                break
+        return totals
+
+    def retry_failed(self) -> int:
+        """FAILED 이벤트를 대기 상태로 되돌림 (시도 횟수 초기화)"""
+        return OutboxEvent.objects.filter(status=OutboxEvent.STATUS_FAILED).update(
+            status=OutboxEvent.STATUS_PENDING,
+            attempts=0,
+            next_attempt_at=timezone.now(),
+            locked_until=None,
+        )
+
+    def stats(self) -> Dict:
+        counts = {status: 0 for status, _ in OutboxEvent.STATUS_CHOICES}
+        for row in OutboxEvent.objects.values('status').order_by().annotate(n=Count('id')):
+            counts[row['status']] = row['n']
+        return counts
+
+    # ============================================================
+    # 프로세스 내 백그라운드 디스패처
+    # ============================================================
+
+    def wake(self):
+        """커밋된 이벤트가 있음을 디스패처에 알림 (프로세스 내 디스패처가 꺼져 있으면 워커가 폴링으로 처리)"""
+        if not getattr(settings, 'OUTBOX_DISPATCH_IN_PROCESS', True):
+            return
+        self._ensure_thread()
+        self._wake.set()
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._thread_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self.run_forever, name='outbox-dispatcher', daemon=True)
+            self._thread.start()
+
+    def run_forever(self, poll_interval: float = None, stop_event: Optional[threading.Event] = None):
+        """깨움 신호 또는 폴링 주기마다 대기 이벤트를 반영 (백그라운드 스레드 / 워커 명령어 공용)"""
+        poll_interval = poll_interval or getattr(settings, 'OUTBOX_POLL_INTERVAL', 5)
+        while not (stop_event and stop_event.is_set()):
+            close_old_connections()
+            try:
+                self.dispatch_pending()
+            except Exception as e:
+                # 로컬 DB 오류 등 - 다음 주기에 다시 시도
+                print(f"[Outbox] 디스패처 오류: {e}", flush=True)
+                time.sleep(1)
+            finally:
+                close_old_connections()
+            self._wake.wait(poll_interval)
+            self._wake.clear()
+
+
+# ============================================================
+# 이벤트 핸들러
+# ============================================================
+
+@register_handler(EVENT_ONBOARDING_COMPLETED)
+def persist_onboarding_completed(event: OutboxEvent):
+    """
+    온보딩 완료(추천 결과 포함) 세션을 Oracle에 반영
+
+    write-behind 모드면 버퍼에 쌓인 단계별 응답과 함께 단일 트랜잭션으로 flush하고,
+    아니면 세션만 upsert합니다. 두 경로 모두 같은 세션을 다시 써도 결과가 같습니다.
+    """
+    from api.services.onboarding_db_service import onboarding_db_service
+    from api.services.onboarding_write_buffer import onboarding_write_buffer
+
+    fields = dict(event.payload)
+    session_id = fields.pop('session_id', None) or event.aggregate_id
+    if onboarding_write_buffer.enabled:
+        onboarding_write_buffer.flush(session_id, **fields)
+    else:
+        onboarding_db_service.create_or_update_session(session_id=session_id, **fields)
+
+
+# 싱글톤 인스턴스
+outbox_service = OutboxService()
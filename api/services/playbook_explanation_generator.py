@@ -312,7 +312,7 @@ JSON 형식으로 반환해주세요.
 """
         
         try:
-            response = chatgpt_service.chat_response(prompt, {})
+            response = chatgpt_service.chat_response(prompt, {}, cache_site='playbook_explanation')
             # JSON 파싱 시도 (간단한 구현)
             # 실제로는 더 정교한 파싱 필요
             return self.generate_explanation(
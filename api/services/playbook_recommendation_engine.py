@@ -13,7 +13,7 @@ from api.utils.playbook_scoring import playbook_scoring_model, ScoreBreakdown
 from api.utils.playbook_filters import playbook_hard_filter
 from api.services.playbook_explanation_generator import playbook_explanation_generator
 from api.services.chatgpt_service import chatgpt_service
-from api.utils.product_type_classifier import extract_product_type
+from api.utils.product_type_classifier import extract_product_type, group_products_by_type
 
 logger = logging.getLogger(__name__)
 
@@ -75,8 +75,8 @@ class PlaybookRecommendationEngine:
             seen_product_ids = set()
             filtered_products = []
             for p in all_filtered_products:
-                if p.id not in seen_product_ids:
-                    seen_product_ids.add(p.id)
+                if p.pk not in seen_product_ids:
+                    seen_product_ids.add(p.pk)
                     filtered_products.append(p)
             
             if not filtered_products:
@@ -106,14 +106,12 @@ class PlaybookRecommendationEngine:
             
             all_recommendations = []
             
+            # 필터링된 제품을 한 번만 분류해 제품 타입별로 묶음
+            products_by_type = group_products_by_type(filtered_products)
+            
             # 제품 타입별로 추천
             for product_type in target_product_types:
-                # 제품 타입별 제품 필터링
-                type_products = []
-                for p in filtered_products:
-                    p_type = extract_product_type(p)
-                    if p_type == product_type:
-                        type_products.append(p)
+                type_products = products_by_type.get(product_type, [])
                 
                 if not type_products:
                     print(f"[Playbook Recommendation] 제품 타입 '{product_type}': 추천 제품 없음")
@@ -323,7 +321,7 @@ class PlaybookRecommendationEngine:
                           f"Price={score_breakdown.price_score:.1f})")
             
             except Exception as e:
-                logger.warning(f"Score calculation failed for product {product.id}: {str(e)}", exc_info=True)
+                logger.warning(f"Score calculation failed for product {product.pk}: {str(e)}", exc_info=True)
                 print(f"[Playbook Score Error] {product.name}: {e}")
                 # 기본 점수
                 score_breakdown = ScoreBreakdown()
@@ -354,7 +352,7 @@ class PlaybookRecommendationEngine:
         # 가격 처리: price가 0이거나 None인 경우 경고
         price = float(product.price) if product.price and product.price > 0 else 0
         if price == 0:
-            print(f"[가격 경고] 제품 {product.id} ({product.name}): 가격이 0원입니다. (DB price={product.price})")
+            print(f"[가격 경고] 제품 {product.pk} ({product.name}): 가격이 0원입니다. (DB price={product.price})")
         
         discount_price = None
         if product.discount_price and product.discount_price > 0:
@@ -364,7 +362,7 @@ class PlaybookRecommendationEngine:
         
         # 기본 정보
         recommendation = {
-            'product_id': product.id,
+            'product_id': product.pk,
             'model': product.name,
             'name': product.name,
             'model_number': product.model_number,
@@ -9,6 +9,7 @@ from django.db.models import Q
 from api.models import Product, Portfolio, OnboardingSession
 from .recommendation_engine import recommendation_engine
 from .style_analysis_service import style_analysis_service
+from api.utils.catalog_version import get_catalog_version
 
 
 class PortfolioService:
@@ -18,7 +19,8 @@ class PortfolioService:
     def create_portfolio_from_onboarding(
         session_id: str,
         user_id: str,
-        exclude_product_ids: List[int] = None
+        exclude_product_ids: List[int] = None,
+        candidate_rankings: dict = None
     ) -> dict:
         """
         온보딩 세션 기반 포트폴리오 생성
@@ -27,6 +29,7 @@ class PortfolioService:
             session_id: 온보딩 세션 ID
             user_id: 사용자 ID
             exclude_product_ids: 제외할 제품 ID 리스트 (다시 추천받기용)
+            candidate_rankings: 이전 포트폴리오의 저장된 후보 순위 (카탈로그 버전이 같으면 추천 엔진을 다시 돌리지 않음)
             
         Returns:
             {
@@ -86,40 +89,46 @@ class PortfolioService:
                 user_profile=user_profile
             )
             
-            # 추천 엔진 호출
-            result = recommendation_engine.get_recommendations(
-                user_profile=user_profile,
-                limit=10  # 충분히 많은 제품 추천
-            )
-            
-            if not result.get('success'):
-                return {
-                    'success': False,
-                    'error': result.get('error', '추천 실패')
-                }
-            
-            recommendations = result.get('recommendations', [])
-            
-            # 제외할 제품 필터링 (다시 추천받기용)
-            if exclude_product_ids:
-                recommendations = [
-                    r for r in recommendations
-                    if r.get('product_id') not in exclude_product_ids
-                ]
-            
-            # 카테고리별로 최대 3개씩 선택
-            category_products = {}
-            for rec in recommendations:
-                category = rec.get('category') or rec.get('main_category', '기타')
-                if category not in category_products:
-                    category_products[category] = []
-                if len(category_products[category]) < 3:
-                    category_products[category].append(rec)
-            
-            # 최종 추천 리스트 생성
-            final_recommendations = []
-            for category, products in category_products.items():
-                final_recommendations.extend(products)
+            if PortfolioService._is_rankings_current(candidate_rankings):
+                # 저장된 후보 순위에서 제외 제품을 건너뛰고 카테고리별 상위 3개 선택
+                final_recommendations = PortfolioService._recommendations_from_rankings(
+                    candidate_rankings,
+                    exclude_product_ids=exclude_product_ids
+                )
+            else:
+                # 추천 엔진 호출
+                result = recommendation_engine.get_recommendations(
+                    user_profile=user_profile,
+                    limit=10  # 충분히 많은 제품 추천
+                )
+                
+                if not result.get('success'):
+                    return {
+                        'success': False,
+                        'error': result.get('error', '추천 실패')
+                    }
+                
+                candidate_rankings = result.get('candidate_rankings') or {}
+                
+                if exclude_product_ids and candidate_rankings.get('categories'):
+                    final_recommendations = PortfolioService._recommendations_from_rankings(
+                        candidate_rankings,
+                        exclude_product_ids=exclude_product_ids
+                    )
+                else:
+                    # 카테고리별로 최대 3개씩 선택
+                    category_products = {}
+                    for rec in result.get('recommendations', []):
+                        category = rec.get('category') or rec.get('main_category', '기타')
+                        if category not in category_products:
+                            category_products[category] = []
+                        if len(category_products[category]) < 3:
+                            category_products[category].append(rec)
+                    
+                    # 최종 추천 리스트 생성
+                    final_recommendations = []
+                    for category, products in category_products.items():
+                        final_recommendations.extend(products)
             
             if not final_recommendations:
                 return {
@@ -148,7 +157,8 @@ class PortfolioService:
                     total_original_price=total_price,
                     total_discount_price=total_discount_price,
                     match_score=85,  # 기본 매칭 점수
-                    status='draft'
+                    status='draft',
+                    candidate_rankings=candidate_rankings or {}
                 )
                 print(f"[Portfolio Service] 포트폴리오 Django DB 저장 성공: portfolio_id={portfolio.portfolio_id}")
                 
@@ -234,7 +244,8 @@ class PortfolioService:
                 return PortfolioService.create_portfolio_from_onboarding(
                     session_id=portfolio.onboarding_session.session_id,
                     user_id=portfolio.user_id,
-                    exclude_product_ids=list(set(existing_product_ids))  # 중복 제거
+                    exclude_product_ids=list(set(existing_product_ids)),  # 중복 제거
+                    candidate_rankings=portfolio.candidate_rankings
                 )
             else:
                 return {
@@ -288,53 +299,31 @@ class PortfolioService:
                     'error': '온보딩 세션 정보가 없습니다.'
                 }
             
-            session = portfolio.onboarding_session
-            user_profile = session.to_user_profile()
-            
-            # 온보딩 데이터 추출
-            onboarding_data = portfolio.onboarding_data or {}
-            
             # 기존 추천 제품 ID 수집
             existing_product_ids = [
                 p.get('product_id') for p in portfolio.products
                 if p.get('product_id')
             ]
             
-            # 추천 엔진 호출
-            result = recommendation_engine.get_recommendations(
-                user_profile=user_profile,
-                limit=20  # 충분히 많은 제품 추천
-            )
-            
-            if not result.get('success'):
+            # 저장된 후보 순위 (카탈로그가 바뀌었으면 다시 계산)
+            candidate_rankings = PortfolioService._get_candidate_rankings(portfolio)
+            if candidate_rankings is None:
                 return {
                     'success': False,
-                    'error': result.get('error', '추천 실패')
+                    'error': '추천 실패'
                 }
             
-            recommendations = result.get('recommendations', [])
-            
-            # 기존 제품 제외
-            recommendations = [
-                r for r in recommendations
-                if r.get('product_id') not in existing_product_ids
-            ]
+            # 기존 제품 제외 후 카테고리별 최대 3개
+            recommendations = PortfolioService._recommendations_from_rankings(
+                candidate_rankings,
+                exclude_product_ids=existing_product_ids,
+                category=category
+            )
             
-            # 카테고리별로 그룹화
             category_products = {}
             for rec in recommendations:
                 rec_category = rec.get('category') or rec.get('main_category', '기타')
-                
-                # 특정 카테고리만 요청한 경우 필터링
-                if category and rec_category != category:
-                    continue
-                
-                if rec_category not in category_products:
-                    category_products[rec_category] = []
-                
-                # 카테고리별 최대 3개
-                if len(category_products[rec_category]) < 3:
-                    category_products[rec_category].append(rec)
+                category_products.setdefault(rec_category, []).append(rec)
             
             # 결과 포맷팅
             alternatives = []
@@ -361,6 +350,111 @@ class PortfolioService:
                 'error': str(e)
             }
     
+    # ============================================================
+    # 저장된 후보 순위 (다른 추천 / 다시 추천받기)
+    # ============================================================
+    
+    @staticmethod
+    def _is_rankings_current(candidate_rankings: Optional[dict]) -> bool:
+        """저장된 후보 순위가 현재 카탈로그 버전 기준인지"""
+        if not candidate_rankings or not candidate_rankings.get('categories'):
+            return False
+        return candidate_rankings.get('catalog_version') == get_catalog_version()
+    
+    @staticmethod
+    def _get_candidate_rankings(portfolio: Portfolio) -> Optional[dict]:
+        """
+        포트폴리오의 후보 순위 반환
+        
+        카탈로그 버전이 바뀌었거나 저장된 순위가 없을 때만 추천 엔진을 다시 실행하고 저장합니다.
+        """
+        if PortfolioService._is_rankings_current(portfolio.candidate_rankings):
+            return portfolio.candidate_rankings
+        
+        print(f"[Portfolio Service] 후보 순위 재계산: portfolio_id={portfolio.portfolio_id}")
+        result = recommendation_engine.get_recommendations(
+            user_profile=portfolio.onboarding_session.to_user_profile(),
+            limit=20
+        )
+        if not result.get('success'):
+            return None
+        
+        portfolio.candidate_rankings = result.get('candidate_rankings') or {}
+        portfolio.save(update_fields=['candidate_rankings', 'updated_at'])
+        return portfolio.candidate_rankings
+    
+    @staticmethod
+    def _recommendations_from_rankings(
+        candidate_rankings: dict,
+        exclude_product_ids: List[int] = None,
+        category: str = None,
+        per_category: int = 3
+    ) -> List[dict]:
+        """
+        저장된 후보 순위를 잘라 추천 목록 생성 (제외 제품 건너뜀, 제품 조회 1회)
+        
+        추천 이유는 다시 생성하지 않고 ProductRecommendReason에 저장된 문구를 사용합니다.
+        """
+        exclude = set(exclude_product_ids or [])
+        categories = candidate_rankings.get('categories', {})
+        
+        selected = []
+        for main_category, entry in categories.items():
+            django_category = entry.get('category')
+            if category and category not in (main_category, django_category):
+                continue
+            ranking = [(pid, score) for pid, score in entry.get('ranking', []) if pid not in exclude]
+            selected.append((main_category, django_category, ranking))
+        
+        product_ids = {pid for _, _, ranking in selected for pid, _ in ranking}
+        products = {
+            p.pk: p
+            for p in Product.objects.filter(pk__in=product_ids, is_active=True).select_related('recommend_reason')
+        }
+        
+        recommendations = []
+        for main_category, django_category, ranking in selected:
+            picked = 0
+            for pid, score in ranking:
+                product = products.get(pid)
+                if product is None:
+                    continue
+                recommendations.append(
+                    PortfolioService._format_ranked_product(product, score, main_category, django_category)
+                )
+                picked += 1
+                if picked >= per_category:
+                    break
+        return recommendations
+    
+    @staticmethod
+    def _format_ranked_product(product: Product, score: float, main_category: str, django_category: str) -> dict:
+        """추천 엔진 응답과 같은 형식으로 제품 포맷팅"""
+        price = float(product.price) if product.price and product.price > 0 else 0
+        if product.discount_price and product.discount_price > 0:
+            discount_price = float(product.discount_price)
+        else:
+            discount_price = price or None
+        
+        reason = ''
+        if hasattr(product, 'recommend_reason'):
+            reason = product.recommend_reason.reason_text or ''
+        
+        return {
+            'product_id': product.pk,
+            'model': product.name,
+            'name': product.name,
+            'model_number': product.model_number,
+            'category': django_category or product.category,
+            'main_category': main_category,
+            'category_display': product.get_category_display(),
+            'price': price,
+            'discount_price': discount_price,
+            'image_url': product.image_url or '',
+            'score': round(score, 2),
+            'reason': reason,
+        }
+    
     @staticmethod
     def add_products_to_cart(
         portfolio_id: str,
@@ -788,6 +882,82 @@ class PortfolioService:
                 'error': str(e)
             }
     
+    @staticmethod
+    def optimize_package(
+        portfolio_id: str,
+        budget: int,
+        top_n: int = 3,
+        required_categories: List[str] = None,
+        category_constraints: dict = None
+    ) -> dict:
+        """
+        예산 내 최적 패키지 조합 (저장된 후보 순위 기준)
+
+        Args:
+            portfolio_id: 포트폴리오 ID
+            budget: 총 예산 (원)
+            top_n: 패키지 수
+            required_categories: 반드시 포함할 MAIN_CATEGORY (None이면 후보가 있는 모든 카테고리)
+            category_constraints: MAIN_CATEGORY별 제약 {'TV': {'min_price': ..., 'max_price': ..., 'min_score': ...}}
+
+        Returns:
+            {
+                "success": True,
+                "budget": 5000000,
+                "packages": [{"rank", "total_score", "total_price", "remaining_budget", "items"}, ...],
+                "stats": {...}
+            }
+        """
+        from api.utils.package_optimizer import candidates_from_rankings, package_optimizer
+
+        try:
+            portfolio = Portfolio.objects.get(portfolio_id=portfolio_id)
+            if not portfolio.onboarding_session:
+                return {
+                    'success': False,
+                    'error': '온보딩 세션 정보가 없습니다.'
+                }
+
+            candidate_rankings = PortfolioService._get_candidate_rankings(portfolio)
+            if candidate_rankings is None:
+                return {
+                    'success': False,
+                    'error': '추천 실패'
+                }
+
+            result = package_optimizer.optimize(
+                candidates_from_rankings(candidate_rankings),
+                budget=budget,
+                top_n=top_n,
+                required_categories=required_categories,
+                category_constraints=category_constraints
+            )
+            if not result['success']:
+                return {
+                    'success': False,
+                    'error': result.get('message') or '예산 안에서 구성할 수 있는 패키지가 없습니다.',
+                    'stats': result['stats']
+                }
+
+            return {
+                'success': True,
+                'budget': int(budget),
+                'packages': result['packages'],
+                'stats': result['stats']
+            }
+
+        except Portfolio.DoesNotExist:
+            return {
+                'success': False,
+                'error': '포트폴리오를 찾을 수 없습니다.'
+            }
+        except Exception as e:
+            print(f"[Package Optimization Error] {e}")
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
     @staticmethod
     def _convert_portfolio_id_to_num(portfolio_id_str: str) -> int:
         """
@@ -116,7 +116,8 @@ JSON 형식으로만 응답하고, 다른 설명은 하지 마세요."""
             # ChatGPT 호출
             response_text = chatgpt_service.chat_response(
                 user_message=prompt,
-                context={}
+                context={},
+                cache_site='product_comparison'
             )
             
             # JSON 파싱
@@ -0,0 +1,245 @@
+"""
+제품 상세 통합 조회 서비스
+
+제품 상세 화면에 필요한 스펙, 리뷰(상위 3개 + 통계), 추천 이유, 인구통계, 이미지를
+한 번에 조립합니다.
+
+- Django: Product + demographics + recommend_reason (select_related 1회), 리뷰 1회
+- Oracle: PRODUCT_SPEC / PRODUCT_IMAGE 를 UNION ALL 1회
+- 인구통계: demographics_repository (정규화 테이블 UNION ALL, 카탈로그 버전별 캐시)
+- 결과는 (제품, 카탈로그 버전) 단위로 캐시하고, 응답 본문 해시를 ETag로 사용
+  (Oracle 장애로 Django DB에서 조립한 결과는 PRODUCT_DETAIL_DEGRADED_CACHE_TIMEOUT 동안만 캐시)
+"""
+import hashlib
+import json
+import re
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from api.db.demographics_repository import demographics_repository
+from api.db.reference_replica import get_reference_connection
+from api.models import Product, ProductReview
+from api.utils.catalog_version import get_catalog_version
+
+# 상세 화면에 노출하는 리뷰 개수
+TOP_REVIEW_COUNT = 3
+
+# 스펙 값으로 보지 않는 문자열
+_EMPTY_SPEC_VALUES = {'', 'nan', 'null', 'undefined'}
+
+_STAR_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+
+# PRODUCT_DETAIL_QUERY가 읽는 테이블 (참조 테이블 복제본 사용 가능 여부 판단)
+PRODUCT_DETAIL_TABLES = ('PRODUCT_SPEC', 'PRODUCT_IMAGE')
+
+PRODUCT_DETAIL_QUERY = """
+    SELECT 'spec' AS KIND, SPEC_KEY AS NAME, SPEC_VALUE AS VALUE, SPEC_ID AS ORD
+    FROM PRODUCT_SPEC WHERE PRODUCT_ID = :product_id
+    UNION ALL
+    SELECT 'image', NULL, IMAGE_URL, PRODUCT_IMAGE_ID
+    FROM PRODUCT_IMAGE WHERE PRODUCT_ID = :product_id AND IMAGE_URL IS NOT NULL
+    ORDER BY 1, 4, 3
+"""
+
+
+def _clean_spec_value(value) -> Optional[str]:
+    if value is None:
+        return None
+    value = str(value).strip()
+    if value.lower() in _EMPTY_SPEC_VALUES:
+        return None
+    return value
+
+
+def _parse_star(star: str) -> Optional[float]:
+    """별점 문자열 → 숫자 ('5', '4.5점', '★★★★☆' 등)"""
+    if not star:
+        return None
+    match = _STAR_NUMBER_RE.search(star)
+    if match:
+        return float(match.group())
+    filled = star.count('★')
+    return float(filled) if filled else None
+
+
+class ProductDetailService:
+    """제품 상세 통합 조회"""
+
+    @property
+    def cache_timeout(self):
+        return getattr(settings, 'PRODUCT_DETAIL_CACHE_TIMEOUT', 60 * 10)
+
+    @property
+    def degraded_cache_timeout(self):
+        return getattr(settings, 'PRODUCT_DETAIL_DEGRADED_CACHE_TIMEOUT', 30)
+
+    def get_detail(self, product_id: int) -> Optional[Tuple[Dict, str]]:
+        """
+        제품 상세 (payload, etag) 반환 (제품이 없으면 None)
+        """
+        version = get_catalog_version()
+        cache_key = f"product_detail:v{version}:{product_id}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        built = self._build(product_id)
+        if built is None:
+            return None
+        payload, degraded = built
+
+        body = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+        etag = hashlib.md5(f"{version}:{body}".encode('utf-8')).hexdigest()
+        result = (payload, etag)
+        # 대체 경로 결과는 짧게만 캐시해 Oracle 복구 후 정상 응답으로 바뀌도록
+        timeout = min(self.cache_timeout, self.degraded_cache_timeout) if degraded else self.cache_timeout
+        if timeout > 0:
+            cache.set(cache_key, result, timeout)
+        return result
+
+    def get_etag(self, product_id: int) -> Optional[str]:
+        detail = self.get_detail(product_id)
+        return detail[1] if detail else None
+
+    def invalidate(self, product_id: int):
+        cache.delete(f"product_detail:v{get_catalog_version()}:{product_id}")
+
+    # ============================================================
+    # 조립
+    # ============================================================
+
+    def _build(self, product_id: int) -> Optional[Tuple[Dict, bool]]:
+        """(payload, degraded) - degraded는 Oracle 조회 실패로 Django DB에서 조립한 경우"""
+        product = (
+            Product.objects
+            .select_related('demographics', 'recommend_reason')
+            .filter(product_id=product_id)
+            .first()
+        )
+        if product is None:
+            return None
+
+        oracle_data = self._fetch_oracle(product_id)
+        degraded = oracle_data is None
+        if degraded:
+            oracle_data = self._fetch_local(product)
+
+        demographics = product.demographics if hasattr(product, 'demographics') else None
+        demographics_data = None
+        if demographics is not None:
+            demographics_data = demographics_repository.resolve_many([demographics])[demographics.product_id]
+            demographics_data['source'] = demographics.source
+            demographics_data['updated_at'] = demographics.updated_at.isoformat() if demographics.updated_at else None
+
+        reason = product.recommend_reason if hasattr(product, 'recommend_reason') else None
+        reviews, review_stats = self._reviews(product_id)
+
+        return {
+            'product_id': product.product_id,
+            'product_name': product.product_name or product.name,
+            'model_code': product.model_code or product.model_number,
+            'main_category': product.main_category,
+            'price': float(product.price) if product.price is not None else None,
+            'discount_price': float(product.discount_price) if product.discount_price else None,
+            'rating': product.rating,
+            'image_url': oracle_data['image_url'] or product.image_url or '',
+            'specs': oracle_data['specs'],
+            'reviews': reviews,
+            'review_stats': review_stats,
+            'recommend_reason': {
+                'reason_text': reason.reason_text,
+                'source': reason.source,
+                'created_at': reason.created_at.isoformat() if reason.created_at else None,
+            } if reason and reason.reason_text else None,
+            'demographics': demographics_data,
+        }, degraded
+
+    @staticmethod
+    def _fetch_oracle(product_id: int) -> Optional[Dict]:
+        """스펙/이미지 UNION ALL 1회 조회 (실패 시 None)"""
+        data = {'specs': {}, 'image_url': ''}
+        try:
+            with get_reference_connection(*PRODUCT_DETAIL_TABLES) as conn:
+                with conn.cursor() as cur:
+                    cur.arraysize = 500
+                    cur.execute(PRODUCT_DETAIL_QUERY, {'product_id': product_id})
+                    for kind, name, value, _ in cur:
+                        if kind == 'spec':
+                            value = _clean_spec_value(value)
+                            if name and value is not None:
+                                data['specs'][name] = value
+                        elif kind == 'image':
+                            if not data['image_url'] and value and str(value).strip():
+                                data['image_url'] = str(value).strip()
+        except Exception as e:
+            print(f"[ProductDetail] Oracle 조회 실패, Django DB 사용: {e}", flush=True)
+            return None
+        return data
+
+    @staticmethod
+    def _fetch_local(product: Product) -> Dict:
+        """Oracle 연결 실패 시 동기화된 Django 테이블에서 조회"""
+        from api.models import ProductImage, ProductSpecNew
+
+        specs = {}
+        for key, value in (
+            ProductSpecNew.objects
+            .filter(product_id=product.product_id)
+            .order_by('spec_id')
+            .values_list('spec_key', 'spec_value')
+        ):
+            value = _clean_spec_value(value)
+            if key and value is not None:
+                specs[key] = value
+
+        image_url = (
+            ProductImage.objects
+            .filter(product_id=product.product_id)
+            .exclude(image_url__isnull=True)
+            .exclude(image_url='')
+            .order_by('product_image_id')
+            .values_list('image_url', flat=True)
+            .first()
+        )
+        return {
+            'specs': specs,
+            'image_url': image_url or '',
+        }
+
+    @staticmethod
+    def _reviews(product_id: int) -> Tuple[list, Dict]:
+        """상위 리뷰 + 통계 (리뷰 테이블 1회 조회)"""
+        rows = list(
+            ProductReview.objects
+            .filter(product_id=product_id)
+            .order_by('-created_at')
+            .values_list('id', 'star', 'review_text', 'created_at')
+        )
+        reviews = [
+            {
+                'id': review_id,
+                'star': star,
+                'review_text': text,
+                'created_at': created_at.isoformat() if created_at else None,
+            }
+            for review_id, star, text, created_at in rows[:TOP_REVIEW_COUNT]
+        ]
+
+        stars = [s for s in (_parse_star(star) for _, star, _, _ in rows) if s is not None]
+        distribution = {}
+        for s in stars:
+            bucket = str(int(round(s)))
+            distribution[bucket] = distribution.get(bucket, 0) + 1
+
+        return reviews, {
+            'count': len(rows),
+            'rated_count': len(stars),
+            'average_star': round(sum(stars) / len(stars), 2) if stars else None,
+            'distribution': dict(sorted(distribution.items(), reverse=True)),
+        }
+
+
+# 싱글톤 인스턴스
+product_detail_service = ProductDetailService()
@@ -8,17 +8,48 @@ Recommendation Engine Service Layer
 4. 최종 추천 반환
 """
 import logging
+import threading
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Dict, List
+from django.conf import settings
+from django.db import close_old_connections
 from django.db.models import QuerySet, Count
 from api.models import Product
 from api.rule_engine import UserProfile, build_profile
+from api.utils.catalog_version import get_catalog_version
 from api.utils.scoring import calculate_product_score
 from api.utils.taste_scoring import calculate_product_score_with_taste_logic
 from .recommendation_reason_generator import reason_generator
 
 logger = logging.getLogger(__name__)
 
+# 카테고리 파이프라인용 스레드 풀 (프로세스 공유, 지연 생성)
+_category_executor = None
+_category_executor_lock = threading.Lock()
+
+
+def _get_category_executor() -> ThreadPoolExecutor:
+    global _category_executor
+    if _category_executor is None:
+        with _category_executor_lock:
+            if _category_executor is None:
+                _category_executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, 'RECOMMENDATION_MAX_WORKERS', 4),
+                    thread_name_prefix='recommendation-category'
+                )
+    return _category_executor
+
+
+def _with_db_connection(func, *args):
+    """작업 스레드에서 실행 (스레드별 DB 연결을 작업 전후로 정리)"""
+    close_old_connections()
+    try:
+        return func(*args)
+    finally:
+        close_old_connections()
+
 
 class RecommendationEngine:
     """추천 엔진 서비스 클래스 (Singleton 패턴)"""
@@ -56,11 +87,18 @@ class RecommendationEngine:
         user_profile: dict,
         limit: int = 3,
         taste_id: int = None,
-        taste_info: dict = None
+        taste_info: dict = None,
+        parallel: bool = None,
+        deadline_seconds: float = None
     ) -> dict:
         """
         최종 추천 반환 (View에서만 호출)
         
+        parallel이 True면 카테고리별 파이프라인을 스레드 풀에서 동시에 실행하고,
+        요청 시작 후 deadline_seconds 안에 끝나지 않은 카테고리는 빼고 나머지 결과만 반환합니다.
+        순차 모드(기본)는 마감 시간 없이 모든 카테고리를 처리합니다.
+        (기본값은 settings.RECOMMENDATION_PARALLEL / RECOMMENDATION_DEADLINE_SECONDS)
+        
         입력:
         {
             'vibe': 'modern',
@@ -161,77 +199,29 @@ class RecommendationEngine:
                             'recommendations': []
                         }
             
-            all_recommendations = []
+            # 필터링된 제품을 한 번만 로드해 카테고리 파이프라인이 공유 (읽기 전용)
+            catalog = self._build_catalog_view(filtered_products)
+            
+            # 각 MAIN CATEGORY별 파이프라인 (필터 → 스코어링 → 포맷팅/이미지)
+            category_results, timed_out_categories = self._run_category_pipelines(
+                selected_main_categories,
+                catalog,
+                user_profile,
+                taste_id=taste_id,
+                taste_info=taste_info,
+                parallel=parallel,
+                deadline_seconds=deadline_seconds
+            )
             
-            # 각 MAIN CATEGORY별로 처리
+            # 선택된 카테고리 순서대로 결과 조립 (순차/병렬 모드 결과 동일)
+            all_recommendations = []
+            candidate_rankings = {}
             for main_category in selected_main_categories:
-                # MAIN_CATEGORY를 Django category로 매핑 (fallback용)
-                django_category = get_django_categories_for_main_categories([main_category])[0] if main_category else 'LIVING'
-                
-                # MAIN_CATEGORY 기반으로 제품 필터링 (spec_json에서 MAIN_CATEGORY 확인)
-                import json
-                valid_products = []
-                for product in filtered_products:
-                    matched = False
-                    
-                    # spec_json에서 MAIN_CATEGORY 확인
-                    if hasattr(product, 'spec') and product.spec and product.spec.spec_json:
-                        try:
-                            spec_data = json.loads(product.spec.spec_json)
-                            main_cat_from_spec = spec_data.get('MAIN_CATEGORY', '').strip()
-                            product_type = spec_data.get('PRODUCT_TYPE', '').strip()
-                            
-                            # MAIN_CATEGORY가 일치하는지 확인
-                            if main_cat_from_spec == main_category or product_type == main_category:
-                                valid_products.append(product)
-                                matched = True
-                        except:
-                            pass
-                    
-                    # MAIN_CATEGORY 매칭 실패 시 Django category로 fallback
-                    if not matched and product.category == django_category:
-                        valid_products.append(product)
-                
-                if not valid_products:
-                    print(f"[Recommendation] MAIN_CATEGORY '{main_category}' (Django: '{django_category}'): 추천 제품 없음")
-                    continue
-                
-                # QuerySet으로 변환
-                product_ids = [p.id for p in valid_products]
-                category_products = filtered_products.filter(id__in=product_ids)
-                
-                if not category_products.exists():
-                    print(f"[Recommendation] MAIN_CATEGORY '{main_category}': 추천 제품 없음")
+                result = category_results.get(main_category)
+                if not result:
                     continue
-                
-                # 카테고리별 스코어링
-                scored_products = self._score_products(
-                    category_products,
-                    user_profile,
-                    taste_id=taste_id
-                )
-                
-                # 카테고리별 상위 3개 선택
-                top_category_products = sorted(
-                    scored_products,
-                    key=lambda x: x['score'],
-                    reverse=True
-                )[:3]  # 각 카테고리별로 최대 3개
-                
-                # 카테고리별 추천 포맷팅
-                category_recommendations = [
-                    self._format_recommendation(item, user_profile, taste_id=taste_id, taste_info=taste_info)
-                    for item in top_category_products
-                ]
-                
-                # category 정보 추가 (MAIN_CATEGORY와 Django category 모두)
-                django_category = get_django_categories_for_main_categories([main_category])[0] if main_category else 'LIVING'
-                for rec in category_recommendations:
-                    rec['category'] = django_category  # Django category (호환성)
-                    rec['main_category'] = main_category  # 원본 MAIN_CATEGORY
-                
-                all_recommendations.extend(category_recommendations)
-                print(f"[Recommendation] MAIN_CATEGORY '{main_category}': {len(category_recommendations)}개 추천")
+                candidate_rankings[main_category] = result['ranking']
+                all_recommendations.extend(result['recommendations'])
             
             recommendations = all_recommendations
             
@@ -298,6 +288,13 @@ class RecommendationEngine:
                 'recommended_product_scores': recommended_product_scores,  # 전체 점수 정보도 포함
                 'taste_title': taste_title,  # taste별 제목
                 'taste_description': taste_description,  # taste별 설명
+                'candidate_rankings': {  # 카테고리별 전체 후보 순위 (포트폴리오 저장용)
+                    'catalog_version': get_catalog_version(),
+                    'score_ref': f"taste:{taste_id}" if taste_id is not None else 'rule',
+                    'categories': candidate_rankings,
+                },
+                'partial': bool(timed_out_categories),  # 시간 초과로 빠진 카테고리가 있는지
+                'timed_out_categories': timed_out_categories,
             }
         
         except ValueError as e:
@@ -405,17 +402,17 @@ class RecommendationEngine:
                         
                         # MAIN_CATEGORY가 선택된 카테고리 중 하나와 일치하는지 확인
                         if main_cat_from_spec in main_categories or product_type in main_categories:
-                            valid_product_ids.append(product.id)
+                            valid_product_ids.append(product.pk)
                             matched = True
                     except:
                         pass
                 
                 # MAIN_CATEGORY가 없거나 매칭 실패 시 Django category로 fallback
                 if not matched and product.category in django_categories:
-                    valid_product_ids.append(product.id)
+                    valid_product_ids.append(product.pk)
             
             if valid_product_ids:
-                products = products.filter(id__in=valid_product_ids)
+                products = products.filter(pk__in=valid_product_ids)
             else:
                 # MAIN_CATEGORY 매칭 실패 시 Django category로 fallback
                 products = products.filter(category__in=django_categories)
@@ -466,8 +463,8 @@ class RecommendationEngine:
         
         # 필터링된 제품 ID 리스트로 QuerySet 재생성
         if filtered_products:
-            product_ids = [p.id for p in filtered_products]
-            products = Product.objects.filter(id__in=product_ids)
+            product_ids = [p.pk for p in filtered_products]
+            products = Product.objects.filter(pk__in=product_ids)
         else:
             # 필터링 결과가 없으면 빈 QuerySet 반환
             products = Product.objects.none()
@@ -522,14 +519,178 @@ class RecommendationEngine:
         filtered_products = apply_all_filters(products_list, user_profile)
         
         if filtered_products:
-            product_ids = [p.id for p in filtered_products]
-            products = Product.objects.filter(id__in=product_ids)
+            product_ids = [p.pk for p in filtered_products]
+            products = Product.objects.filter(pk__in=product_ids)
         else:
             products = Product.objects.none()
         
         return products
     
-    def _score_products(self, products: QuerySet, user_profile: dict, taste_id: int = None) -> List[dict]:
+    def _build_catalog_view(self, filtered_products: QuerySet) -> List[tuple]:
+        """
+        카테고리 파이프라인이 공유하는 읽기 전용 제품 목록
+        
+        제품과 스펙을 한 번에 로드하고 spec_json의 MAIN_CATEGORY / PRODUCT_TYPE을 미리 디코딩합니다.
+        
+        Returns:
+            [(product, main_category_from_spec, product_type), ...] (디코딩 실패 시 None, None)
+        """
+        import json
+        
+        catalog = []
+        for product in filtered_products.select_related('spec'):
+            main_cat_from_spec = product_type = None
+            if hasattr(product, 'spec') and product.spec and product.spec.spec_json:
+                try:
+                    spec_data = json.loads(product.spec.spec_json)
+                    main_cat_from_spec = spec_data.get('MAIN_CATEGORY', '').strip()
+                    product_type = spec_data.get('PRODUCT_TYPE', '').strip()
+                except:
+                    main_cat_from_spec = product_type = None
+            catalog.append((product, main_cat_from_spec, product_type))
+        return catalog
+    
+    def _run_category_pipelines(
+        self,
+        main_categories: List[str],
+        catalog: List[tuple],
+        user_profile: dict,
+        taste_id: int = None,
+        taste_info: dict = None,
+        parallel: bool = None,
+        deadline_seconds: float = None
+    ) -> tuple:
+        """
+        MAIN CATEGORY별 파이프라인 실행 (순차 또는 스레드 풀 병렬)
+        
+        Returns:
+            ({main_category: 파이프라인 결과}, 시간 초과된 카테고리 목록)
+        """
+        if parallel is None:
+            parallel = getattr(settings, 'RECOMMENDATION_PARALLEL', False)
+        if deadline_seconds is None:
+            deadline_seconds = getattr(settings, 'RECOMMENDATION_DEADLINE_SECONDS', 10.0)
+        
+        results = {}
+        
+        if not parallel or len(main_categories) <= 1:
+            # 순차 모드: 마감 시간 없이 모든 카테고리 처리
+            for main_category in main_categories:
+                results[main_category] = self._run_category_pipeline(
+                    main_category, catalog, user_profile,
+                    taste_id=taste_id, taste_info=taste_info
+                )
+            return results, []
+        
+        # 요청 단위 마감 시간 (작업은 단계마다 확인해 마감 후에는 남은 단계를 건너뜀)
+        deadline = time.monotonic() + deadline_seconds
+        timed_out = set()
+        
+        def run(main_category):
+            result = self._run_category_pipeline(
+                main_category, catalog, user_profile,
+                taste_id=taste_id, taste_info=taste_info, deadline=deadline
+            )
+            if result is None and time.monotonic() > deadline:
+                timed_out.add(main_category)
+            return result
+        
+        futures = {
+            _get_category_executor().submit(_with_db_connection, run, main_category): main_category
+            for main_category in main_categories
+        }
+        # 마감 시간까지 끝난 카테고리만 사용 (남은 작업은 풀에서 마저 끝나고 결과는 버림)
+        done, pending = wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+        for future in done:
+            main_category = futures[future]
+            try:
+                results[main_category] = future.result()
+            except Exception as e:
+                logger.warning(f"Category pipeline failed for {main_category}: {str(e)}", exc_info=True)
+                print(f"[Recommendation] MAIN_CATEGORY '{main_category}' 파이프라인 오류: {e}")
+        timed_out.update(futures[future] for future in pending)
+        
+        timed_out = [c for c in main_categories if c in timed_out]
+        if timed_out:
+            print(f"[Recommendation] 시간 초과로 제외된 카테고리: {timed_out} (deadline={deadline_seconds}초)")
+        
+        return results, timed_out
+    
+    def _run_category_pipeline(
+        self,
+        main_category: str,
+        catalog: List[tuple],
+        user_profile: dict,
+        taste_id: int = None,
+        taste_info: dict = None,
+        deadline: float = None
+    ) -> dict:
+        """
+        MAIN CATEGORY 하나의 추천 파이프라인 (카테고리 필터 → 스코어링 → 상위 3개 포맷팅)
+        
+        Returns:
+            {'ranking': {'category', 'ranking'}, 'recommendations': [...]} (추천 제품이 없거나 시간 초과면 None)
+        """
+        from api.utils.category_mapping import get_django_categories_for_main_categories
+        
+        # MAIN_CATEGORY를 Django category로 매핑 (fallback용)
+        django_category = get_django_categories_for_main_categories([main_category])[0] if main_category else 'LIVING'
+        
+        # MAIN_CATEGORY 기반으로 제품 필터링 (spec_json의 MAIN_CATEGORY / PRODUCT_TYPE 확인)
+        # MAIN_CATEGORY 매칭 실패 시 Django category로 fallback
+        category_products = [
+            product for product, main_cat_from_spec, product_type in catalog
+            if (main_cat_from_spec is not None and main_category in (main_cat_from_spec, product_type))
+            or product.category == django_category
+        ]
+        
+        if not category_products:
+            print(f"[Recommendation] MAIN_CATEGORY '{main_category}' (Django: '{django_category}'): 추천 제품 없음")
+            return None
+        
+        # 카테고리별 스코어링
+        scored_products = self._score_products(
+            category_products,
+            user_profile,
+            taste_id=taste_id
+        )
+        
+        ranked_products = sorted(
+            scored_products,
+            key=lambda x: x['score'],
+            reverse=True
+        )
+        
+        if deadline is not None and time.monotonic() > deadline:
+            print(f"[Recommendation] MAIN_CATEGORY '{main_category}': 스코어링 후 시간 초과")
+            return None
+        
+        # 카테고리별 상위 3개 선택 후 포맷팅 (추천 이유, 이미지 조회 - I/O가 있어 제품마다 마감 시간 확인)
+        category_recommendations = []
+        for item in ranked_products[:3]:
+            if deadline is not None and time.monotonic() > deadline:
+                print(f"[Recommendation] MAIN_CATEGORY '{main_category}': 포맷팅 중 시간 초과")
+                return None
+            category_recommendations.append(
+                self._format_recommendation(item, user_profile, taste_id=taste_id, taste_info=taste_info)
+            )
+        
+        # category 정보 추가 (MAIN_CATEGORY와 Django category 모두)
+        for rec in category_recommendations:
+            rec['category'] = django_category  # Django category (호환성)
+            rec['main_category'] = main_category  # 원본 MAIN_CATEGORY
+        
+        print(f"[Recommendation] MAIN_CATEGORY '{main_category}': {len(category_recommendations)}개 추천")
+        return {
+            # 전체 후보 순위 (제품 ID, 점수) - 다른 추천/다시 추천받기에서 재사용
+            'ranking': {
+                'category': django_category,
+                'ranking': [[item['product'].pk, round(item['score'], 4)] for item in ranked_products],
+            },
+            'recommendations': category_recommendations,
+        }
+    
+    def _score_products(self, products: List[Product], user_profile: dict, taste_id: int = None) -> List[dict]:
         """
         Step 2: Soft Scoring
         - 각 제품 점수 계산 (스코어링 함수 호출)
@@ -590,7 +751,7 @@ class RecommendationEngine:
                     print(f"[Score] {idx}. {product.name}: {score:.2f}")
             
             except Exception as e:
-                logger.warning(f"Score calculation failed for product {product.id}: {str(e)}", exc_info=True)
+                logger.warning(f"Score calculation failed for product {product.pk}: {str(e)}", exc_info=True)
                 print(f"[Score Error] {product.name}: {e}")
                 # 스코어 계산 실패 시 기본값 0.5
                 scored.append({
@@ -678,7 +839,7 @@ class RecommendationEngine:
         # 가격 처리: price가 0이거나 None인 경우 경고
         price = float(product.price) if product.price and product.price > 0 else 0
         if price == 0:
-            print(f"[가격 경고] 제품 {product.id} ({product.name}): 가격이 0원입니다. (DB price={product.price})")
+            print(f"[가격 경고] 제품 {product.pk} ({product.name}): 가격이 0원입니다. (DB price={product.price})")
         
         discount_price = None
         if product.discount_price and product.discount_price > 0:
@@ -687,7 +848,7 @@ class RecommendationEngine:
             discount_price = price  # discount_price가 없으면 정가를 할인가로 사용
         
         return {
-            'product_id': product.id,
+            'product_id': product.pk,
             'model': product.name,
             'name': product.name,  # 호환성
             'model_number': product.model_number,
@@ -4,18 +4,25 @@
 구매리뷰 분석 + 고객 취향 데이터 → 제품을 고객에게 추천하는 이유를 한 줄로 설명
 """
 import re
-from typing import Dict, List, Optional
-from collections import Counter
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from functools import lru_cache
 from ..models import Product, ProductReview, ProductRecommendReason
+from ..utils.review_keyword_index import REVIEWS_PER_PRODUCT, ReviewKeywordHits, review_keyword_index
+
+# 리뷰 키워드 인덱스가 없을 때 직접 집계한 결과를 보관할 최대 제품 수
+REVIEW_HITS_CACHE_SIZE = 512
 
 
 class RecommendationReasonGenerator:
     """추천 문구 생성기"""
     
     def __init__(self):
-        # 리뷰 캐시 (제품 ID -> 리뷰 텍스트 리스트)
-        self._reviews_cache = {}
+        # 리뷰 키워드 집계 캐시 (인덱스 미로드 시 폴백, 제품 ID -> ReviewKeywordHits, LRU)
+        self._review_hits_cache = OrderedDict()
+        # 카테고리 스레드 풀에서 동시에 호출되므로 LRU 조회/갱신은 잠금 안에서
+        self._review_hits_lock = threading.Lock()
         # 취향별 키워드 매핑
         self.taste_keywords = {
             'modern': ['모던', '미니멀', '깔끔', '심플', '세련'],
@@ -32,6 +39,12 @@ class RecommendationReasonGenerator:
             'value': ['가격', '가성비', '저렴', '합리', '실용'],
         }
         
+        # 리뷰 긍정 키워드
+        self.positive_words = [
+            '좋', '만족', '추천', '훌륭', '최고', '완벽', '뛰어', '우수',
+            '편리', '깔끔', '예쁘', '이쁘', '멋', '세련', '실용', '가성비'
+        ]
+        
         # 취향 조합별 1:1 매칭 템플릿
         # 키: (vibe, priority, household_size_category) 튜플
         # 값: 추천 이유 템플릿 리스트
@@ -137,20 +150,20 @@ class RecommendationReasonGenerator:
         user_profile: dict,
         taste_info: Optional[Dict] = None
     ) -> str:
-        """리뷰 분석 기반 추천 문구 생성 (캐싱 적용)"""
-        # 제품 리뷰 가져오기 (캐싱 적용)
-        review_texts = self._get_cached_reviews(product.id)
-        if not review_texts:
+        """리뷰 분석 기반 추천 문구 생성 (리뷰 키워드 인덱스 조회)"""
+        # 제품 리뷰 키워드 집계 (사전 계산 인덱스 우선)
+        review_hits = self._get_review_hits(product.pk)
+        if review_hits is None:
             return None
         
         # 취향 키워드 추출
         target_keywords = self._extract_taste_keywords(user_profile, taste_info)
         
         # 리뷰에서 취향과 관련된 키워드 찾기
-        matched_keywords = self._find_matching_keywords(review_texts, target_keywords)
+        matched_keywords = review_hits.match(target_keywords)
         
-        # 리뷰에서 자주 언급되는 긍정 키워드 추출
-        positive_keywords = self._extract_positive_keywords(review_texts)
+        # 리뷰에서 자주 언급되는 긍정 키워드
+        positive_keywords = review_hits.positive
         
         # 추천 문구 생성
         reason_parts = []
@@ -218,50 +231,58 @@ class RecommendationReasonGenerator:
         
         return list(set(keywords))  # 중복 제거
     
-    def _get_cached_reviews(self, product_id: int) -> List[str]:
-        """제품 리뷰를 캐시에서 가져오기"""
-        if product_id not in self._reviews_cache:
-            reviews = ProductReview.objects.filter(product_id=product_id)[:20]
-            review_texts = [r.review_text for r in reviews if r.review_text]
-            self._reviews_cache[product_id] = review_texts
-        return self._reviews_cache[product_id]
-    
-    def clear_cache(self):
-        """캐시 초기화"""
-        self._reviews_cache.clear()
+    def review_vocabulary(self) -> Tuple[List[str], List[str]]:
+        """리뷰 키워드 인덱스 어휘 (취향/우선순위 키워드, 긍정 키워드)"""
+        keywords = []
+        for words in list(self.taste_keywords.values()) + list(self.priority_keywords.values()):
+            keywords.extend(words)
+        return list(dict.fromkeys(keywords)), list(self.positive_words)
     
-    def _find_matching_keywords(
-        self,
-        review_texts: List[str],
-        target_keywords: List[str]
-    ) -> List[tuple]:
-        """리뷰에서 취향 키워드와 매칭되는 키워드 찾기"""
-        matches = Counter()
-        
-        for review in review_texts:
-            review_lower = review.lower()
-            for keyword in target_keywords:
-                if keyword in review_lower:
-                    matches[keyword] += 1
-        
-        # 빈도순으로 정렬
-        return matches.most_common(3)
+    def load_review_index(self) -> bool:
+        """사전 계산된 리뷰 키워드 인덱스 로드"""
+        keywords, positive_words = self.review_vocabulary()
+        return review_keyword_index.load(keywords, positive_words)
     
-    def _extract_positive_keywords(self, review_texts: List[str]) -> List[tuple]:
-        """리뷰에서 긍정 키워드 추출"""
-        positive_words = [
-            '좋', '만족', '추천', '훌륭', '최고', '완벽', '뛰어', '우수',
-            '편리', '깔끔', '예쁘', '이쁘', '멋', '세련', '실용', '가성비'
-        ]
-        
-        matches = Counter()
-        for review in review_texts:
-            review_lower = review.lower()
-            for word in positive_words:
-                if word in review_lower:
-                    matches[word] += 1
+    def _get_review_hits(self, product_id: int) -> Optional[ReviewKeywordHits]:
+        """
+        제품 리뷰 키워드 집계 (리뷰가 없으면 None)
         
-        return matches.most_common(3)
+        인덱스에 있으면 조회만 하고, 인덱스가 없거나 인덱스 생성 후 추가된 제품이면
+        최신 리뷰를 직접 집계해 LRU 캐시에 보관합니다.
+        """
+        if review_keyword_index.needs_check():
+            self.load_review_index()
+        if review_keyword_index.is_loaded:
+            hits = review_keyword_index.get(product_id)
+            if hits is not None:
+                return hits
+        
+        with self._review_hits_lock:
+            if product_id in self._review_hits_cache:
+                self._review_hits_cache.move_to_end(product_id)
+                return self._review_hits_cache[product_id]
+        
+        review_texts = list(
+            ProductReview.objects.filter(product_id=product_id)
+            .exclude(review_text='')
+            .values_list('review_text', flat=True)[:REVIEWS_PER_PRODUCT]
+        )
+        hits = None
+        if review_texts:
+            keywords, positive_words = self.review_vocabulary()
+            hits = ReviewKeywordHits.from_reviews(review_texts, keywords, positive_words)
+        
+        with self._review_hits_lock:
+            self._review_hits_cache[product_id] = hits
+            self._review_hits_cache.move_to_end(product_id)
+            if len(self._review_hits_cache) > REVIEW_HITS_CACHE_SIZE:
+                self._review_hits_cache.popitem(last=False)
+        return hits
+    
+    def clear_cache(self):
+        """캐시 초기화"""
+        with self._review_hits_lock:
+            self._review_hits_cache.clear()
     
     def _generate_default_reason(
         self,
@@ -0,0 +1,252 @@
+"""
+제품별 리뷰 요약 (오프라인 배치 + 요청 시 조회)
+
+요청마다 같은 제품의 리뷰를 LLM으로 다시 요약하지 않도록, 리뷰가 있는 모든 제품의 요약을
+배치로 미리 만들어 ProductReviewSummary에 저장합니다.
+
+- 리뷰 묶음 해시: 요약에 넣는 리뷰(제품당 최신 REVIEW_SUMMARY_MAX_REVIEWS개) + 제품명 + 프롬프트 버전.
+  저장된 해시와 같으면 다시 요약하지 않습니다.
+- 배치: 스레드 풀로 동시 요청하되 분당 요청 수를 제한하고(토큰 버킷), 실패는 백오프 후 재시도.
+  DB 저장은 메인 스레드에서 수행합니다.
+- 조회: 저장된 요약을 바로 반환하고, 없을 때만 실시간 생성 후 저장합니다.
+
+사용법:
+    python manage.py build_review_summaries            # 리뷰가 바뀐 제품만 요약
+    python manage.py build_review_summaries --force    # 전체 다시 요약
+"""
+import hashlib
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+from django.conf import settings
+
+from api.models import Product, ProductReview, ProductReviewSummary
+from .chatgpt_service import chatgpt_service
+
+# 요약 프롬프트가 바뀌면 올려서 저장된 요약을 모두 다시 생성
+SUMMARY_PROMPT_VERSION = 1
+
+
+def review_set_hash(review_texts: List[str], product_name: str = '') -> str:
+    """요약 입력(리뷰 묶음 + 제품명 + 프롬프트 버전) 해시"""
+    digest = hashlib.sha256()
+    digest.update(f"v{SUMMARY_PROMPT_VERSION}\x1f{product_name}\x1f{chatgpt_service.MODEL}".encode('utf-8'))
+    for text in review_texts:
+        digest.update(b'\x1e')
+        digest.update(text.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class RateLimiter:
+    """스레드 공용 토큰 버킷 (분당 요청 수 제한)"""
+
+    def __init__(self, per_minute: float):
+        self.interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+class ReviewSummaryService:
+    """리뷰 요약 조회 + 배치 생성"""
+
+    @property
+    def max_reviews(self) -> int:
+        return chatgpt_service.REVIEW_SUMMARY_MAX_REVIEWS
+
+    def reviews_for_product(self, product_id) -> List[str]:
+        """요약에 넣을 리뷰 (최신순, 빈 리뷰 제외)"""
+        return list(
+            ProductReview.objects
+            .filter(product_id=product_id)
+            .exclude(review_text='')
+            .order_by('-created_at', '-id')
+            .values_list('review_text', flat=True)[:self.max_reviews]
+        )
+
+    def _reviews_by_product(self, product_ids=None) -> Dict[int, List[str]]:
+        """제품별 요약 입력 리뷰 (한 번의 조회로 제품당 최신 max_reviews개)"""
+        queryset = ProductReview.objects.exclude(review_text='')
+        if product_ids is not None:
+            queryset = queryset.filter(product_id__in=product_ids)
+        reviews: Dict[int, List[str]] = {}
+        rows = queryset.order_by('product_id', '-created_at', '-id').values_list('product_id', 'review_text')
+        for product_id, text in rows.iterator(chunk_size=5000):
+            texts = reviews.setdefault(product_id, [])
+            if len(texts) < self.max_reviews:
+                texts.append(text)
+        return reviews
+
+    # ============================================================
+    # 조회
+    # ============================================================
+
+    def get_summary(self, product: Product, generate_on_miss: bool = True) -> Optional[Dict]:
+        """
+        제품 리뷰 요약 조회 (저장된 요약 우선, 없으면 실시간 생성 후 저장)
+
+        Returns:
+            {'summary', 'review_count', 'ai_generated', 'source': 'stored' | 'live'} 또는 리뷰가 없으면 None
+        """
+        stored = ProductReviewSummary.objects.filter(product_id=product.pk).first()
+        if stored is not None:
+            return {
+                'summary': stored.summary,
+                'review_count': stored.review_count,
+                'ai_generated': True,
+                'source': 'stored',
+            }
+        if not generate_on_miss:
+            return None
+
+        reviews = self.reviews_for_product(product.pk)
+        if not reviews:
+            return None
+
+        product_name = product.name or ''
+        if not chatgpt_service.is_available():
+            return {
+                'summary': chatgpt_service.REVIEW_SUMMARY_FALLBACK,
+                'review_count': len(reviews),
+                'ai_generated': False,
+                'source': 'live',
+            }
+        try:
+            summary = chatgpt_service.generate_review_summary(reviews, product_name)
+        except Exception as e:
+            print(f"[리뷰 요약] 실시간 생성 실패 (제품 {product.pk}): {e}", flush=True)
+            return {
+                'summary': chatgpt_service.REVIEW_SUMMARY_FALLBACK,
+                'review_count': len(reviews),
+                'ai_generated': False,
+                'source': 'live',
+            }
+        self._save(product.pk, summary, review_set_hash(reviews, product_name), len(reviews))
+        return {'summary': summary, 'review_count': len(reviews), 'ai_generated': True, 'source': 'live'}
+
+    def _save(self, product_id, summary: str, review_hash: str, review_count: int):
+        ProductReviewSummary.objects.update_or_create(
+            product_id=product_id,
+            defaults={
+                'summary': summary,
+                'review_hash': review_hash,
+                'review_count': review_count,
+                'model_name': chatgpt_service.MODEL,
+            }
+        )
+
+    # ============================================================
+    # 배치
+    # ============================================================
+
+    def _summarize_with_retry(self, limiter: RateLimiter, reviews: List[str], product_name: str, max_attempts: int,
+                              force: bool = False) -> str:
+        for attempt in range(1, max_attempts + 1):
+            limiter.acquire()
+            try:
+                return chatgpt_service.generate_review_summary(reviews, product_name, force=force)
+            except Exception:
+                if attempt >= max_attempts:
+                    raise
+                # 429 등 일시 오류 - 지수 백오프 + 지터
+                time.sleep(min(30.0, 2 ** attempt) * random.uniform(0.5, 1.0))
+
+    def build_summaries(self, force: bool = False, concurrency: int = None, rate_per_minute: float = None,
+                        limit: int = None, dry_run: bool = False, max_attempts: int = 3) -> Dict:
+        """
+        리뷰가 있는 모든 제품의 요약 생성 (리뷰 묶음 해시가 바뀐 제품만)
+
+        force면 모든 제품을 LLM 응답 캐시 없이 새로 요약합니다.
+
+        Returns:
+            {'products', 'unchanged', 'summarized', 'failed', 'removed', 'elapsed'}
+        """
+        started = time.time()
+        concurrency = concurrency or getattr(settings, 'REVIEW_SUMMARY_CONCURRENCY', 4)
+        if rate_per_minute is None:
+            rate_per_minute = getattr(settings, 'REVIEW_SUMMARY_RATE_PER_MINUTE', 60)
+
+        reviews_by_product = self._reviews_by_product()
+        names = {
+            pk: name
+            for pk, name in Product.objects.filter(reviews__isnull=False).distinct().values_list('pk', 'name')
+            if pk in reviews_by_product
+        }
+        stored_hashes = dict(ProductReviewSummary.objects.values_list('product_id', 'review_hash'))
+
+        jobs = []
+        for product_id, reviews in reviews_by_product.items():
+            if product_id not in names:
+                continue
+            review_hash = review_set_hash(reviews, names[product_id] or '')
+            if force or stored_hashes.get(product_id) != review_hash:
+                jobs.append((product_id, reviews, review_hash))
+        jobs.sort(key=lambda job: job[0])
+        unchanged = len(names) - len(jobs)
+        if limit:
+            jobs = jobs[:limit]
+
+        # 리뷰가 모두 사라진 제품의 요약 삭제
+        orphan_ids = [pid for pid in stored_hashes if pid not in reviews_by_product]
+
+        stats = {
+            'products': len(names),
+            'unchanged': unchanged,
+            'summarized': 0,
+            'failed': 0,
+            'removed': len(orphan_ids),
+        }
+        print(
+            f"[리뷰 요약] 대상 {len(jobs)}개 / 리뷰 있는 제품 {len(names)}개 "
+            f"(동시 {concurrency}, 분당 {rate_per_minute}회)",
+            flush=True
+        )
+        if dry_run:
+            stats['elapsed'] = round(time.time() - started, 2)
+            return stats
+
+        if orphan_ids:
+            ProductReviewSummary.objects.filter(product_id__in=orphan_ids).delete()
+
+        if jobs and not chatgpt_service.is_available():
+            raise RuntimeError("OpenAI API를 사용할 수 없어 리뷰 요약을 생성할 수 없습니다.")
+
+        limiter = RateLimiter(rate_per_minute)
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='review-summary') as executor:
+            futures = {
+                executor.submit(self._summarize_with_retry, limiter, reviews, names[product_id] or '', max_attempts, force):
+                    (product_id, reviews, review_hash)
+                for product_id, reviews, review_hash in jobs
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                product_id, reviews, review_hash = futures[future]
+                try:
+                    summary = future.result()
+                except Exception as e:
+                    stats['failed'] += 1
+                    print(f"[리뷰 요약] ⚠️ 제품 {product_id} 요약 실패: {e}", flush=True)
+                    continue
+                self._save(product_id, summary, review_hash, len(reviews))
+                stats['summarized'] += 1
+                if done % 50 == 0:
+                    print(f"[리뷰 요약] 진행 {done}/{len(jobs)}", flush=True)
+
+        stats['elapsed'] = round(time.time() - started, 2)
+        print(f"[리뷰 요약] 완료: {stats}", flush=True)
+        return stats
+
+
+# 싱글톤 인스턴스
+review_summary_service = ReviewSummaryService()
@@ -218,7 +218,7 @@ JSON 형식으로 응답:
 """
         
         try:
-            response = chatgpt_service.chat_response(prompt, {})
+            response = chatgpt_service.chat_response(prompt, {}, cache_site='style_analysis')
             # JSON 파싱 시도
             import re
             json_match = re.search(r'\{[^}]+\}', response, re.DOTALL)
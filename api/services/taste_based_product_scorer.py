@@ -44,7 +44,8 @@ from typing import Dict, List, Optional, Tuple
 from collections import defaultdict
 from django.db.models import Q
 from api.models import Product, ProductSpec, TasteConfig
-from api.db.oracle_client import get_connection
+from api.db.reference_replica import get_reference_connection
+from api.db.oracle_client import stream_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -136,7 +137,7 @@ class TasteBasedProductScorer:
     def _get_taste_config(self, taste_id: int) -> Optional[Dict]:
         """Oracle DB에서 TasteConfig 조회 (정규화된 구조 사용)"""
         try:
-            with get_connection() as conn:
+            with get_reference_connection('TASTE_CONFIG', 'TASTE_CATEGORY_SCORES') as conn:
                 with conn.cursor() as cur:
                     # 1. 기본 TASTE_CONFIG 정보 조회 (RECOMMENDED_PRODUCTS, RECOMMENDED_PRODUCT_SCORES 포함)
                     cur.execute("""
@@ -259,10 +260,10 @@ class TasteBasedProductScorer:
         products_data = []
         
         try:
-            with get_connection() as conn:
+            with get_reference_connection('PRODUCT', 'PRODUCT_SPEC') as conn:
                 with conn.cursor() as cur:
-                    # JOIN을 사용하여 한 번의 쿼리로 제품과 스펙 정보 모두 조회
-                    cur.execute("""
+                    # JOIN을 사용하여 한 번의 쿼리로 제품과 스펙 정보 모두 조회 (arraysize 단위 스트리밍)
+                    rows = stream_cursor(cur, """
                         SELECT 
                             P.PRODUCT_ID,
                             P.MODEL_CODE,
@@ -282,8 +283,6 @@ class TasteBasedProductScorer:
                         ORDER BY P.PRICE ASC, P.PRODUCT_ID, PS.SPEC_KEY
                     """, {'p_category': category})
                     
-                    rows = cur.fetchall()
-                    
                     # 결과를 제품별로 그룹화
                     current_product_id = None
                     current_product_data = None
@@ -78,22 +78,48 @@ async function sendChatbotMessage() {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
+                'Accept': 'text/event-stream',
             },
             body: JSON.stringify({
                 message: message,
                 context: {
                     history: chatHistory
-                }
+                },
+                stream: true
             })
         });
         
-        const data = await response.json();
+        let data = null;
+        if ((response.headers.get('Content-Type') || '').includes('text/event-stream')) {
+            // 스트리밍: 토큰이 도착하는 대로 답변 말풍선에 이어 붙임
+            let botMessageId = null;
+            let text = '';
+            await readEventStream(response, (event, payload) => {
+                if (event === 'token') {
+                    if (!botMessageId) {
+                        document.getElementById(loadingId)?.remove();
+                        botMessageId = addChatbotMessage('', 'bot');
+                    }
+                    text += payload.text;
+                    updateChatbotMessage(botMessageId, text);
+                } else if (event === 'done' || event === 'error') {
+                    data = payload;
+                }
+            });
+            if (botMessageId && data && data.success) {
+                data.rendered = true;
+            }
+        } else {
+            data = await response.json();
+        }
         
         // 로딩 메시지 제거
         document.getElementById(loadingId)?.remove();
         
-        if (data.success) {
-            addChatbotMessage(data.response, 'bot');
+        if (data && data.success) {
+            if (!data.rendered) {
+                addChatbotMessage(data.response, 'bot');
+            }
             chatHistory.push(
                 { role: 'user', content: message },
                 { role: 'assistant', content: data.response }
@@ -146,6 +172,44 @@ function addChatbotMessage(text, type, isLoading = false) {
     return messageId;
 }
 
+function updateChatbotMessage(messageId, text) {
+    const content = document.querySelector(`#${messageId} .message-content`);
+    if (!content) return;
+    content.innerHTML = escapeHtml(text).replace(/\n/g, '<br>');
+    const messages = document.getElementById('chatbotMessages');
+    messages.scrollTop = messages.scrollHeight;
+}
+
+/**
+ * SSE 응답 본문을 읽어 이벤트마다 onEvent(event, data) 호출
+ */
+async function readEventStream(response, onEvent) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder('utf-8');
+    let buffer = '';
+    
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const block = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+            let event = 'message';
+            const dataLines = [];
+            block.split('\n').forEach(line => {
+                if (line.startsWith('event:')) event = line.slice(6).trim();
+                else if (line.startsWith('data:')) dataLines.push(line.slice(5).trim());
+            });
+            if (dataLines.length) {
+                onEvent(event, JSON.parse(dataLines.join('\n')));
+            }
+        }
+    }
+}
+
 function escapeHtml(text) {
     const div = document.createElement('div');
     div.textContent = text;
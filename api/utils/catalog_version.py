@@ -0,0 +1,103 @@
+"""
+카탈로그 버전 관리
+
+카탈로그 동기화(sync_catalog)가 제품/스펙/이미지 변경을 반영할 때마다 버전을 올리고,
+제품 데이터에서 파생된 캐시(카테고리 인벤토리, 검색 인덱스 등)는 이 버전을 키로 사용해
+버전이 바뀌면 다시 계산합니다.
+
+버전은 CatalogSyncState 테이블(table_name='CATALOG')에 저장되어 워커 간에 공유되며,
+요청마다 DB를 조회하지 않도록 프로세스 내에서 CATALOG_VERSION_CHECK_INTERVAL초 동안 캐시합니다.
+동기화 외 경로(관리자 화면, API)에서 제품/스펙을 저장하거나 삭제해도 커밋 후 버전을 올립니다.
+"""
+import threading
+import time
+
+from django.conf import settings
+
+CATALOG_STATE_KEY = 'CATALOG'
+
+_lock = threading.Lock()
+_cached = {'version': None, 'checked_at': 0.0}
+
+
+def _check_interval():
+    return getattr(settings, 'CATALOG_VERSION_CHECK_INTERVAL', 5)
+
+
+def get_catalog_version(refresh=False):
+    """
+    현재 카탈로그 버전 반환
+
+    Args:
+        refresh: True면 프로세스 캐시를 무시하고 DB에서 다시 조회
+
+    Returns:
+        카탈로그 버전 (동기화 이력이 없거나 조회 실패 시 0)
+    """
+    now = time.monotonic()
+    if not refresh and _cached['version'] is not None and now - _cached['checked_at'] < _check_interval():
+        return _cached['version']
+
+    try:
+        from api.models import CatalogSyncState
+        version = (
+            CatalogSyncState.objects
+            .filter(table_name=CATALOG_STATE_KEY)
+            .values_list('catalog_version', flat=True)
+            .first()
+        ) or 0
+    except Exception as e:
+        print(f"[CatalogVersion] 버전 조회 실패 (이전 값 사용): {e}", flush=True)
+        version = _cached['version'] or 0
+
+    with _lock:
+        _cached['version'] = version
+        _cached['checked_at'] = now
+    return version
+
+
+def bump_catalog_version():
+    """
+    카탈로그 버전을 1 올리고 새 버전 반환 (카탈로그 변경 반영 후 호출)
+    """
+    from django.db import transaction
+    from django.db.models import F
+    from api.models import CatalogSyncState
+
+    with transaction.atomic():
+        CatalogSyncState.objects.get_or_create(table_name=CATALOG_STATE_KEY)
+        CatalogSyncState.objects.filter(table_name=CATALOG_STATE_KEY).update(
+            catalog_version=F('catalog_version') + 1
+        )
+    version = get_catalog_version(refresh=True)
+    print(f"[CatalogVersion] 카탈로그 버전 갱신: v{version}", flush=True)
+    return version
+
+
+def _bump_on_change(sender, **kwargs):
+    """제품/스펙 저장·삭제 시그널 - 커밋 후 버전 올림 (fixture 적재는 제외)"""
+    if kwargs.get('raw'):
+        return
+
+    def _bump():
+        try:
+            bump_catalog_version()
+        except Exception as e:
+            print(f"[CatalogVersion] 버전 갱신 실패: {e}", flush=True)
+
+    from django.db import transaction
+    transaction.on_commit(_bump)
+
+
+def connect_catalog_signals():
+    """
+    Product / ProductSpecNew 저장·삭제 시 카탈로그 버전을 올리도록 시그널 연결 (ApiConfig.ready에서 호출)
+
+    sync_catalog의 bulk_create / bulk_update는 시그널을 보내지 않으며, 동기화 끝에 한 번 버전을 올립니다.
+    """
+    from django.db.models.signals import post_delete, post_save
+    from api.models import Product, ProductSpecNew
+
+    for model in (Product, ProductSpecNew):
+        post_save.connect(_bump_on_change, sender=model, dispatch_uid=f'catalog_version_save_{model.__name__}')
+        post_delete.connect(_bump_on_change, sender=model, dispatch_uid=f'catalog_version_delete_{model.__name__}')
@@ -0,0 +1,268 @@
+"""
+MAIN_CATEGORY 인벤토리 (메모리 캐시)
+
+카테고리별 제품 수, 판매중 제품 수, 가격 분위수를 한 번의 집계 쿼리로 계산해 메모리에 보관합니다.
+카테고리 선택(TasteCategorySelector)과 ill-suited 판별이 요청마다 PRODUCT를 스캔하지 않도록
+이 인벤토리를 조회하며, 카탈로그 버전이 바뀌면 다시 적재합니다.
+Oracle 장애로 Django DB/기본 카테고리로 만든 인벤토리는 CATEGORY_INVENTORY_DEGRADED_MAX_AGE 후 다시 시도합니다.
+"""
+import threading
+import time
+from typing import Dict, List, Optional
+
+from django.conf import settings
+
+from api.db.oracle_client import get_connection
+from api.db.reference_replica import reference_replica
+from api.utils.catalog_version import get_catalog_version
+
+# 인벤토리를 만들 수 없을 때 사용하는 기본 카테고리
+DEFAULT_CATEGORIES = ['TV', '냉장고', '에어컨', '세탁기', '청소기', '공기청정기']
+
+
+def _quantile(sorted_values: List[float], q: float) -> Optional[float]:
+    """정렬된 값 리스트의 분위수 (선형 보간, Oracle PERCENTILE_CONT와 동일)"""
+    if not sorted_values:
+        return None
+    pos = (len(sorted_values) - 1) * q
+    lower = int(pos)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (pos - lower)
+
+
+class CategoryInventory:
+    """
+    MAIN_CATEGORY별 통계 인벤토리
+
+    각 카테고리 항목:
+        {
+            'main_category': 'TV',
+            'total_count': 120,       # 전체 제품 수
+            'active_count': 98,       # 판매중 + 가격 있는 제품 수
+            'is_active': True,        # active_count > 0
+            'price_min': ..., 'price_p25': ..., 'price_median': ..., 'price_p75': ..., 'price_max': ...
+        }
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._categories: Dict[str, Dict] = {}
+        self._ordered: List[str] = []
+        self._version = None
+        self._loaded_at = 0.0
+        self._source = None
+        self._ttl = 0.0
+
+    @property
+    def max_age(self):
+        return getattr(settings, 'CATEGORY_INVENTORY_MAX_AGE', 60 * 60)
+
+    @property
+    def degraded_max_age(self):
+        return getattr(settings, 'CATEGORY_INVENTORY_DEGRADED_MAX_AGE', 60)
+
+    # ============================================================
+    # 조회
+    # ============================================================
+
+    def get_available_categories(self) -> List[str]:
+        """판매중 제품이 있는 카테고리 리스트 (판매중 제품 수 많은 순서)"""
+        self._ensure_fresh()
+        return list(self._ordered)
+
+    def get_stats(self, category: str) -> Optional[Dict]:
+        """카테고리 통계 (없으면 None)"""
+        self._ensure_fresh()
+        stats = self._categories.get(category)
+        return dict(stats) if stats else None
+
+    def get_all_stats(self) -> Dict[str, Dict]:
+        self._ensure_fresh()
+        return {name: dict(stats) for name, stats in self._categories.items()}
+
+    def is_active(self, category: str) -> bool:
+        stats = self.get_stats(category)
+        return bool(stats and stats['is_active'])
+
+    def get_product_count(self, category: str, active_only: bool = True) -> int:
+        stats = self.get_stats(category)
+        if not stats:
+            return 0
+        return stats['active_count'] if active_only else stats['total_count']
+
+    def get_price_quantiles(self, category: str) -> Optional[Dict[str, float]]:
+        """{'min', 'p25', 'median', 'p75', 'max'} 가격 분위수"""
+        stats = self.get_stats(category)
+        if not stats:
+            return None
+        return {
+            'min': stats['price_min'],
+            'p25': stats['price_p25'],
+            'median': stats['price_median'],
+            'p75': stats['price_p75'],
+            'max': stats['price_max'],
+        }
+
+    def info(self) -> Dict:
+        return {
+            'catalog_version': self._version,
+            'loaded_at': self._loaded_at,
+            'source': self._source,
+            'degraded': self._source not in (None, 'oracle', 'replica'),
+            'categories': len(self._categories),
+        }
+
+    # ============================================================
+    # 적재
+    # ============================================================
+
+    def invalidate(self):
+        with self._lock:
+            self._version = None
+
+    def _ensure_fresh(self):
+        version = get_catalog_version()
+        if self._version == version and time.time() - self._loaded_at <= self._ttl:
+            return
+        with self._lock:
+            if self._version == version and time.time() - self._loaded_at <= self._ttl:
+                return
+            self._reload(version)
+
+    def _reload(self, version):
+        try:
+            if reference_replica.is_ready('PRODUCT'):
+                rows = self._load_from_replica()
+                source = 'replica'
+            else:
+                rows = self._load_from_oracle()
+                source = 'oracle'
+        except Exception as e:
+            print(f"[CategoryInventory] Oracle 집계 실패, Django DB 사용: {e}", flush=True)
+            try:
+                rows = self._load_from_django()
+                source = 'django'
+            except Exception as django_error:
+                print(f"[CategoryInventory] Django DB 집계 실패, 기본 카테고리 사용: {django_error}", flush=True)
+                rows = []
+                source = 'default'
+
+        if not any(r['is_active'] for r in rows):
+            rows = [
+                {
+                    'main_category': name, 'total_count': 0, 'active_count': 0, 'is_active': True,
+                    'price_min': None, 'price_p25': None, 'price_median': None, 'price_p75': None, 'price_max': None,
+                }
+                for name in DEFAULT_CATEGORIES
+            ]
+            source = 'default'
+
+        self._categories = {r['main_category']: r for r in rows}
+        self._ordered = [
+            r['main_category']
+            for r in sorted(rows, key=lambda r: (-r['active_count'], r['main_category']))
+            if r['is_active']
+        ]
+        self._version = version
+        self._loaded_at = time.time()
+        self._source = source
+        # Oracle/복제본이 아닌 대체 결과는 짧게만 유지하고 다시 시도
+        self._ttl = self.max_age if source in ('oracle', 'replica') else min(self.max_age, self.degraded_max_age)
+        print(
+            f"[CategoryInventory] 적재 완료: {len(self._ordered)}개 카테고리 "
+            f"(source={source}, catalog_version={version})",
+            flush=True
+        )
+
+    @staticmethod
+    def _load_from_oracle() -> List[Dict]:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT MAIN_CATEGORY,
+                           COUNT(*) AS TOTAL_CNT,
+                           COUNT(ACTIVE_PRICE) AS ACTIVE_CNT,
+                           MIN(ACTIVE_PRICE) AS PRICE_MIN,
+                           PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY ACTIVE_PRICE) AS PRICE_P25,
+                           PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY ACTIVE_PRICE) AS PRICE_MEDIAN,
+                           PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY ACTIVE_PRICE) AS PRICE_P75,
+                           MAX(ACTIVE_PRICE) AS PRICE_MAX
+                    FROM (
+                        SELECT MAIN_CATEGORY,
+                               CASE WHEN STATUS = '판매중' AND PRICE > 0 THEN PRICE END AS ACTIVE_PRICE
+                        FROM PRODUCT
+                        WHERE MAIN_CATEGORY IS NOT NULL
+                    )
+                    GROUP BY MAIN_CATEGORY
+                """)
+                rows = []
+                for name, total, active, p_min, p25, median, p75, p_max in cur.fetchall():
+                    rows.append({
+                        'main_category': name,
+                        'total_count': int(total or 0),
+                        'active_count': int(active or 0),
+                        'is_active': bool(active),
+                        'price_min': float(p_min) if p_min is not None else None,
+                        'price_p25': float(p25) if p25 is not None else None,
+                        'price_median': float(median) if median is not None else None,
+                        'price_p75': float(p75) if p75 is not None else None,
+                        'price_max': float(p_max) if p_max is not None else None,
+                    })
+                return rows
+
+    @staticmethod
+    def _load_from_replica() -> List[Dict]:
+        """참조 테이블 복제본(SQLite)에서 집계 (PERCENTILE_CONT 대신 파이썬 분위수)"""
+        rows = reference_replica.fetch_all("""
+            SELECT MAIN_CATEGORY,
+                   CASE WHEN STATUS = '판매중' AND PRICE > 0 THEN PRICE END AS ACTIVE_PRICE
+            FROM PRODUCT
+            WHERE MAIN_CATEGORY IS NOT NULL
+        """)
+        return _aggregate(rows)
+
+    @staticmethod
+    def _load_from_django() -> List[Dict]:
+        from api.models import Product
+
+        # Oracle 집계와 같은 판매중 조건 (STATUS = '판매중' AND PRICE > 0)
+        return _aggregate(
+            (main_category, price if status == '판매중' and price and price > 0 else None)
+            for main_category, price, status in (
+                Product.objects
+                .exclude(main_category__isnull=True)
+                .exclude(main_category='')
+                .values_list('main_category', 'price', 'status')
+            )
+        )
+
+
+def _aggregate(category_prices) -> List[Dict]:
+    """(카테고리, 판매중 가격 또는 None) 목록 → 카테고리 통계 (Oracle 집계 쿼리와 같은 결과)"""
+    totals: Dict[str, int] = {}
+    prices: Dict[str, List[float]] = {}
+    for main_category, active_price in category_prices:
+        totals[main_category] = totals.get(main_category, 0) + 1
+        bucket = prices.setdefault(main_category, [])
+        if active_price is not None:
+            bucket.append(float(active_price))
+
+    rows = []
+    for name, total in totals.items():
+        values = sorted(prices.get(name, []))
+        rows.append({
+            'main_category': name,
+            'total_count': total,
+            'active_count': len(values),
+            'is_active': bool(values),
+            'price_min': values[0] if values else None,
+            'price_p25': _quantile(values, 0.25),
+            'price_median': _quantile(values, 0.5),
+            'price_p75': _quantile(values, 0.75),
+            'price_max': values[-1] if values else None,
+        })
+    return rows
+
+
+# 싱글톤 인스턴스
+category_inventory = CategoryInventory()
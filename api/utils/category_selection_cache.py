@@ -0,0 +1,195 @@
+"""
+Taste별 MAIN CATEGORY 선택 결과 메모이제이션
+
+select_categories_for_taste의 결과는 카탈로그(사용 가능한 카테고리), num_categories,
+그리고 점수 계산에 쓰이는 온보딩 필드(SIGNATURE_FIELDS)에만 의존합니다.
+이 값들로 만든 키로 결과를 캐시해 같은 조합이면 점수 계산/컷오프 분석을 다시 하지 않습니다.
+
+- 1단계: 프로세스 내 LRU (CATEGORY_SELECTION_CACHE_SIZE)
+- 2단계: 사전 계산 테이블 (precompute_category_selection 명령어로 생성한 JSON, 카탈로그 버전 일치 시에만 사용)
+
+Oracle 장애로 대체 인벤토리(category_inventory degraded)에서 계산한 결과는 LRU에 저장하지 않습니다.
+(저장하면 카탈로그 버전이 바뀔 때까지 대체 인벤토리 기준 결과가 남음)
+"""
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+from api.utils.catalog_version import get_catalog_version
+from api.utils.category_inventory import category_inventory
+
+# _calculate_category_score / 컷오프 분석이 참조하는 온보딩 필드
+SIGNATURE_FIELDS = (
+    'vibe', 'household_size', 'main_space', 'has_pet', 'pet', 'priority',
+    'budget_level', 'cooking', 'laundry', 'media', 'pyung',
+)
+
+DEFAULT_PRECOMPUTED_PATH = Path(__file__).parent.parent / 'scoring_logic' / 'category_selection_precomputed.json'
+
+
+def _freeze(value):
+    """리스트/딕셔너리를 해시 가능한 값으로 변환"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def onboarding_signature(onboarding_data: Optional[Dict]) -> Tuple:
+    """카테고리 선택에 영향을 주는 온보딩 필드만 뽑은 시그니처"""
+    onboarding_data = onboarding_data or {}
+    return tuple(
+        (field, _freeze(onboarding_data[field]))
+        for field in SIGNATURE_FIELDS
+        if field in onboarding_data
+    )
+
+
+def signature_key(signature: Tuple, num_categories: Optional[int]) -> str:
+    """사전 계산 테이블(JSON)용 문자열 키"""
+    return json.dumps([num_categories, signature], ensure_ascii=False, default=str)
+
+
+class CategorySelectionCache:
+    """카테고리 선택 결과 LRU + 사전 계산 테이블"""
+
+    def __init__(self, maxsize: int = None):
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._lru: "OrderedDict[Tuple, List[str]]" = OrderedDict()
+        self._precomputed: Dict[str, List[str]] = {}
+        self._precomputed_version = None
+        self._precomputed_loaded = False
+        self.hits = 0
+        self.precomputed_hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self):
+        if self._maxsize is not None:
+            return self._maxsize
+        return getattr(settings, 'CATEGORY_SELECTION_CACHE_SIZE', 4096)
+
+    @property
+    def precomputed_path(self) -> Path:
+        return Path(getattr(settings, 'CATEGORY_SELECTION_PRECOMPUTED_PATH', DEFAULT_PRECOMPUTED_PATH))
+
+    def get_or_compute(
+        self,
+        onboarding_data: Optional[Dict],
+        num_categories: Optional[int],
+        compute: Callable[[], List[str]],
+    ) -> List[str]:
+        """
+        캐시된 선택 결과 반환 (없으면 compute()로 계산 후 저장)
+
+        반환값은 복사본이므로 호출자가 수정해도 캐시에 영향이 없습니다.
+        """
+        version = get_catalog_version()
+        signature = onboarding_signature(onboarding_data)
+        key = (version, num_categories, signature)
+
+        with self._lock:
+            cached = self._lru.get(key)
+            if cached is not None:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return list(cached)
+
+        precomputed = self._lookup_precomputed(version, signature, num_categories)
+        if precomputed is not None:
+            with self._lock:
+                self.precomputed_hits += 1
+            result = precomputed
+        else:
+            result = list(compute())
+            with self._lock:
+                self.misses += 1
+            if category_inventory.info()['degraded']:
+                return list(result)
+
+        with self._lock:
+            self._lru[key] = result
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.maxsize:
+                self._lru.popitem(last=False)
+        return list(result)
+
+    # ============================================================
+    # 사전 계산 테이블
+    # ============================================================
+
+    def _lookup_precomputed(self, version, signature, num_categories) -> Optional[List[str]]:
+        if not self._precomputed_loaded:
+            self.load_precomputed()
+        if self._precomputed_version != version:
+            return None
+        return self._precomputed.get(signature_key(signature, num_categories))
+
+    def load_precomputed(self):
+        """사전 계산 테이블 로드 (파일이 없으면 비활성)"""
+        with self._lock:
+            self._precomputed_loaded = True
+            path = self.precomputed_path
+            if not path.exists():
+                return
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self._precomputed = data.get('entries', {})
+                self._precomputed_version = data.get('catalog_version')
+                print(
+                    f"[CategorySelectionCache] 사전 계산 테이블 로드: {len(self._precomputed)}개 "
+                    f"(catalog_version={self._precomputed_version})",
+                    flush=True
+                )
+            except Exception as e:
+                print(f"[CategorySelectionCache] 사전 계산 테이블 로드 실패: {e}", flush=True)
+                self._precomputed = {}
+                self._precomputed_version = None
+
+    def save_precomputed(self, entries: Dict[str, List[str]], catalog_version: int):
+        path = self.precomputed_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'catalog_version': catalog_version, 'entries': entries}, f, ensure_ascii=False)
+        self.set_precomputed(entries, catalog_version)
+
+    def set_precomputed(self, entries: Dict[str, List[str]], catalog_version: int):
+        """파일 저장 없이 메모리의 사전 계산 테이블만 교체"""
+        with self._lock:
+            self._precomputed = entries
+            self._precomputed_version = catalog_version
+            self._precomputed_loaded = True
+
+    # ============================================================
+    # 관리
+    # ============================================================
+
+    def clear(self):
+        with self._lock:
+            self._lru.clear()
+            self.hits = self.precomputed_hits = self.misses = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            total = self.hits + self.precomputed_hits + self.misses
+            return {
+                'size': len(self._lru),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'precomputed_hits': self.precomputed_hits,
+                'misses': self.misses,
+                'hit_rate': round((self.hits + self.precomputed_hits) / total, 4) if total else 0.0,
+                'precomputed_entries': len(self._precomputed),
+                'precomputed_version': self._precomputed_version,
+            }
+
+
+# 싱글톤 인스턴스
+category_selection_cache = CategorySelectionCache()
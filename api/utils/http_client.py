@@ -0,0 +1,307 @@
+"""
+외부 HTTP 호출 공용 클라이언트 (카카오 API, 제품 이미지 다운로드 등)
+
+모듈 수준 requests.get/post는 호출마다 새 TCP+TLS 연결을 맺으므로, 공용 Session 하나로
+호스트별 keep-alive 연결 풀을 재사용합니다.
+
+- 타임아웃: 연결/응답 타임아웃을 분리 (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+- 재시도: 멱등 요청(GET/HEAD/PUT/DELETE/OPTIONS)은 연결 오류·타임아웃·429/502/503/504에서
+  지수 백오프 + 지터로 재시도. POST 등은 요청이 서버에 도달하지 않은 연결 타임아웃만 재시도
+- 서킷 브레이커: 호스트별 연속 실패가 HTTP_CIRCUIT_FAILURE_THRESHOLD회를 넘으면
+  HTTP_CIRCUIT_RESET_SECONDS 동안 바로 CircuitOpenError를 내고, 이후 요청 1건으로 복구 여부 확인
+- 지표: 호스트별 요청/오류/재시도/차단 횟수와 지연 시간(평균, p50, p95) - http_client.stats()
+
+사용법:
+    from api.utils.http_client import http_client
+    response = http_client.get(url, headers=headers)
+    response = http_client.post(url, data=data)
+"""
+import http.cookiejar
+import random
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+# 재시도해도 서버 상태가 달라지지 않는 메서드
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+# 일시적 오류로 보고 재시도하는 응답 코드
+RETRY_STATUSES = {429, 502, 503, 504}
+# 지연 시간 분위수 계산에 쓰는 최근 표본 수 (호스트별)
+LATENCY_SAMPLES = 512
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """서킷이 열려 있어 요청을 보내지 않음 (기존 RequestException 처리로 함께 잡힘)"""
+
+
+class CircuitBreaker:
+    """호스트별 서킷 브레이커 (closed → open → half_open → closed)"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_seconds:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probing = False
+            # half_open: 복구 확인용 요청은 한 번에 1건만
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self) -> bool:
+        """실패 기록. 이번 실패로 서킷이 열렸으면 True"""
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                opened = self.state != self.OPEN
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                return opened
+            return False
+
+    def release_probe(self):
+        """결과를 기록하지 못하고 끝난 요청의 복구 확인 슬롯 반환 (예외로 빠져나간 경우)"""
+        with self._lock:
+            self._probing = False
+
+    def retry_after(self) -> float:
+        with self._lock:
+            if self.state != self.OPEN:
+                return 0.0
+            return max(0.0, self.reset_seconds - (time.monotonic() - self.opened_at))
+
+
+class HostMetrics:
+    """호스트별 호출 지표"""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.rejected = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.status_counts: Dict[int, int] = {}
+        self.samples = deque(maxlen=LATENCY_SAMPLES)
+
+    def record(self, elapsed_ms: float, status: Optional[int] = None, error: bool = False):
+        self.requests += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.samples.append(elapsed_ms)
+        if error:
+            self.errors += 1
+        if status is not None:
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def snapshot(self) -> Dict:
+        samples = sorted(self.samples)
+
+        def percentile(p):
+            if not samples:
+                return 0.0
+            return round(samples[min(len(samples) - 1, int(len(samples) * p))], 1)
+
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'retries': self.retries,
+            'rejected': self.rejected,
+            'avg_ms': round(self.total_ms / self.requests, 1) if self.requests else 0.0,
+            'p50_ms': percentile(0.5),
+            'p95_ms': percentile(0.95),
+            'max_ms': round(self.max_ms, 1),
+            'status': dict(self.status_counts),
+        }
+
+
+class HttpClient:
+    """keep-alive 연결 풀 + 재시도 + 서킷 브레이커 + 지표를 갖춘 공용 HTTP 클라이언트"""
+
+    def __init__(self):
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._metrics: Dict[str, HostMetrics] = {}
+        self._state_lock = threading.Lock()
+
+    @property
+    def timeout(self):
+        return (
+            getattr(settings, 'HTTP_CONNECT_TIMEOUT', 3.05),
+            getattr(settings, 'HTTP_READ_TIMEOUT', 10),
+        )
+
+    @property
+    def max_retries(self):
+        return getattr(settings, 'HTTP_MAX_RETRIES', 2)
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        # 호스트별 연결 풀 (pool_connections: 풀을 유지할 호스트 수, pool_maxsize: 호스트당 유지 연결 수)
+        adapter = HTTPAdapter(
+            pool_connections=getattr(settings, 'HTTP_POOL_CONNECTIONS', 10),
+            pool_maxsize=getattr(settings, 'HTTP_POOL_MAXSIZE', 20),
+            max_retries=0,
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        # 여러 사용자 요청이 세션을 공유하므로 응답 쿠키를 저장하지 않음
+        session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        return session
+
+    def _host_state(self, host: str):
+        with self._state_lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(
+                    getattr(settings, 'HTTP_CIRCUIT_FAILURE_THRESHOLD', 5),
+                    getattr(settings, 'HTTP_CIRCUIT_RESET_SECONDS', 30),
+                )
+                self._metrics[host] = HostMetrics()
+            return breaker, self._metrics[host]
+
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """지수 백오프 + 전체 지터 (초). 429/503의 Retry-After(초)가 있으면 상한 안에서 따름"""
+        cap = getattr(settings, 'HTTP_RETRY_BACKOFF_MAX', 5)
+        if retry_after and retry_after.isdigit():
+            return min(cap, float(retry_after))
+        base = getattr(settings, 'HTTP_RETRY_BACKOFF_BASE', 0.3)
+        return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+    def request(self, method: str, url: str, *, timeout=None, retries: int = None,
+                idempotent: bool = None, **kwargs) -> requests.Response:
+        """
+        HTTP 요청 (requests.request와 같은 인자)
+
+        Args:
+            timeout: 생략 시 (연결, 응답) 기본 타임아웃
+            retries: 최대 재시도 횟수 (생략 시 HTTP_MAX_RETRIES)
+            idempotent: 재시도 가능 여부 (생략 시 메서드로 판단)
+
+        Raises:
+            CircuitOpenError: 호스트 서킷이 열려 있음
+            requests.exceptions.RequestException: 재시도 후에도 연결/타임아웃 오류
+        """
+        method = method.upper()
+        host = urlsplit(url).netloc
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        max_retries = self.max_retries if retries is None else retries
+        breaker, metrics = self._host_state(host)
+
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                metrics.rejected += 1
+                raise CircuitOpenError(
+                    f"{host} 서킷 열림 ({breaker.retry_after():.0f}초 후 재시도 가능)"
+                )
+
+            started = time.monotonic()
+            recorded = False
+            try:
+                response = self.session.request(method, url, timeout=timeout or self.timeout, **kwargs)
+            except requests.exceptions.RequestException as e:
+                recorded = True
+                metrics.record((time.monotonic() - started) * 1000, error=True)
+                if breaker.record_failure():
+                    print(f"[HTTP] ⚠️ {host} 서킷 열림 (연속 실패 {breaker.failures}회): {e}", flush=True)
+                # 연결 타임아웃은 요청이 전송되지 않았으므로 POST도 재시도 가능
+                retryable = isinstance(e, requests.exceptions.ConnectTimeout) or (
+                    idempotent and isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+                )
+                if not retryable or attempt >= max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                print(f"[HTTP] {method} {host} 재시도 {attempt + 1}/{max_retries} ({delay:.2f}초 후): {type(e).__name__}", flush=True)
+            else:
+                status = response.status_code
+                metrics.record((time.monotonic() - started) * 1000, status=status, error=status >= 500)
+                recorded = True
+                if status >= 500:
+                    if breaker.record_failure():
+                        print(f"[HTTP] ⚠️ {host} 서킷 열림 (연속 실패 {breaker.failures}회): HTTP {status}", flush=True)
+                else:
+                    breaker.record_success()
+                if not (idempotent and status in RETRY_STATUSES and attempt < max_retries):
+                    return response
+                delay = self._backoff(attempt, response.headers.get('Retry-After'))
+                print(f"[HTTP] {method} {host} 재시도 {attempt + 1}/{max_retries} ({delay:.2f}초 후): HTTP {status}", flush=True)
+                response.close()
+            finally:
+                # RequestException 외의 예외(잘못된 인자 등)로 끝나도 half_open 복구 확인 슬롯이 묶이지 않도록
+                if not recorded:
+                    breaker.release_probe()
+
+            metrics.retries += 1
+            attempt += 1
+            time.sleep(delay)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def stats(self) -> Dict:
+        """호스트별 지표 + 서킷 상태"""
+        with self._state_lock:
+            hosts = list(self._metrics)
+        result = {}
+        for host in hosts:
+            breaker, metrics = self._host_state(host)
+            result[host] = {**metrics.snapshot(), 'circuit': breaker.state}
+        return result
+
+    def reset(self):
+        """연결 풀/서킷/지표 초기화"""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+        with self._state_lock:
+            self._breakers.clear()
+            self._metrics.clear()
+
+
+# 싱글톤 인스턴스
+http_client = HttpClient()
@@ -17,7 +17,7 @@ class IllSuitedCategoryDetector:
     """
     
     @staticmethod
-    def detect_ill_suited_categories(onboarding_data: Dict, all_categories: List[str]) -> List[str]:
+    def detect_ill_suited_categories(onboarding_data: Dict, all_categories: List[str] = None) -> List[str]:
         """
         온보딩 데이터를 분석하여 ill-suited 카테고리 리스트 반환
         
@@ -34,11 +34,15 @@ class IllSuitedCategoryDetector:
                 - vibe: 인테리어 무드 (str)
                 - priority: 우선순위 (str)
                 - budget_level: 예산 수준 (str)
-            all_categories: 모든 사용 가능한 카테고리 리스트
+            all_categories: 모든 사용 가능한 카테고리 리스트 (None이면 카테고리 인벤토리에서 조회)
         
         Returns:
             ill-suited 카테고리 리스트 (완전히 부적합한 카테고리들)
         """
+        if all_categories is None:
+            from api.utils.category_inventory import category_inventory
+            all_categories = category_inventory.get_available_categories()
+        
         ill_suited = []
         
         has_pet = onboarding_data.get('has_pet', False) or onboarding_data.get('pet', False)
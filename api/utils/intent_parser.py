@@ -0,0 +1,392 @@
+"""
+자연어 추천 요청 로컬 의도 파서 (LLM 호출 전 fast path)
+
+"2인 가구, 예산 200만원"처럼 정형화된 짧은 요청은 미리 컴파일한 패턴 문법과
+카테고리/숫자 어휘로 바로 슬롯을 채우고, 신뢰도가 임계값보다 낮을 때만 LLM으로 넘깁니다.
+
+슬롯은 LLM 추출 결과와 같은 형식입니다:
+    household_size, budget(만원), categories(MAIN_CATEGORY), priority, housing_type, pyung, vibe, additional_info
+
+신뢰도:
+    메시지 토큰 중 문법/어휘/허용 어휘(조사, "추천해줘" 등)로 설명되는 글자 비율.
+    부정("말고", "빼고")이나 이전 대화 참조("아까 그거")처럼 LLM이 필요한 표현이 있으면 낮춥니다.
+
+AI_INTENT_QUERY_LOG를 지정하면 요청별 파싱 결과(로컬 응답/LLM 위임, LLM 추출 결과)를 JSONL로 남기고,
+`python manage.py benchmark_intent_parser`로 로그된 질의에 대한 로컬 처리 비율을 측정합니다.
+로그에는 사용자 메시지 원문(개인정보 포함 가능)이 저장되므로 기본값은 꺼져 있으며, 측정할 때만 켜세요.
+
+사용법:
+    from api.utils.intent_parser import intent_parser
+    result = intent_parser.parse("2인 가구, 예산 200만원 냉장고 추천해줘")
+    result.slots, result.confidence
+"""
+import json
+import re
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+# ============================================================
+# 어휘
+# ============================================================
+
+# 카테고리 키워드 → MAIN_CATEGORY (긴 키워드 우선으로 매칭)
+CATEGORY_LEXICON = {
+    'tv': 'TV', '티비': 'TV', '텔레비전': 'TV', '테레비': 'TV', 'oled': 'TV', '올레드': 'TV',
+    '사운드바': '사운드바', '프로젝터': '프로젝터', '스탠바이미': '스탠바이미',
+    '냉장고': '냉장고', '김치냉장고': '김치냉장고', '김치 냉장고': '김치냉장고', '김냉': '김치냉장고',
+    '식기세척기': '식기세척기', '식세기': '식기세척기',
+    '전기레인지': '전기레인지', '인덕션': '인덕션', '오븐': '오븐', '전자레인지': '전자레인지',
+    '정수기': '정수기', '와인셀러': '와인셀러',
+    '세탁기': '세탁기', '통돌이': '세탁기', '드럼세탁기': '세탁기', '워시타워': '세탁기',
+    '건조기': '건조기', '청소기': '청소기', '로봇청소기': '청소기', '무선청소기': '청소기',
+    '스타일러': '의류관리기', '의류관리기': '의류관리기', '신발관리기': '신발관리',
+    '공기청정기': '공기청정기', '공청기': '공기청정기', '가습기': '가습기', '제습기': '제습기',
+    '에어컨': '에어컨', '시스템에어컨': '시스템 에어컨', '시스템 에어컨': '시스템 에어컨',
+    '안마의자': '안마의자',
+}
+
+# 명시적 카테고리가 없을 때만 쓰는 공간 힌트 (LLM 프롬프트 예시와 같은 해석)
+SPACE_HINTS = {'주방': '냉장고', '부엌': '냉장고', '거실': 'TV'}
+
+HOUSING_LEXICON = {
+    '아파트': 'apartment', 'apt': 'apartment',
+    '주택': 'house', '단독': 'house', '빌라': 'house', '전원주택': 'house',
+    '오피스텔': 'officetel', '원룸': 'officetel', '투룸': 'officetel',
+}
+
+PRIORITY_LEXICON = {
+    '가성비': 'value', '저렴': 'value', '싼': 'value', '실속': 'value', '알뜰': 'value',
+    '디자인': 'design', '예쁜': 'design', '이쁜': 'design', '인테리어': 'design',
+    '기술': 'tech', '스마트': 'tech', 'ai': 'tech', '최신': 'tech', '고성능': 'tech', '성능': 'tech',
+    '친환경': 'eco', '에코': 'eco', '절전': 'eco', '에너지효율': 'eco', '전기세': 'eco', '전기요금': 'eco',
+}
+
+VIBE_LEXICON = {
+    '모던': 'modern', '심플': 'modern', '미니멀': 'modern',
+    '아늑': 'cozy', '따뜻': 'cozy', '포근': 'cozy',
+    '내추럴': 'natural', '자연': 'natural', '우드': 'natural',
+    '럭셔리': 'luxury', '고급': 'luxury', '프리미엄': 'luxury',
+}
+
+# 가구원 수를 나타내는 관용 표현
+HOUSEHOLD_WORDS = {'혼자': 1, '자취': 1, '1인가구': 1, '신혼': 2, '부부': 2, '둘이': 2}
+KOREAN_COUNTS = {'한': 1, '하나': 1, '두': 2, '둘': 2, '세': 3, '셋': 3, '네': 4, '넷': 4, '다섯': 5, '여섯': 6}
+
+# 공간 크기 힌트 → additional_info
+SIZE_HINTS = {
+    '작은': '컴팩트한 제품 선호', '좁은': '컴팩트한 제품 선호', '소형': '컴팩트한 제품 선호',
+    '큰': '대형 제품 선호', '넓은': '대형 제품 선호', '대형': '대형 제품 선호', '대용량': '대용량 제품 선호',
+}
+
+# 슬롯은 아니지만 요청 의미를 바꾸지 않는 어휘 (신뢰도 계산 시 설명된 것으로 봄)
+FILLER_WORDS = {
+    '추천', '추천해', '추천좀', '추천해줘', '추천해주세요', '추천해줄래', '추천부탁', '부탁', '부탁해요', '부탁드려요',
+    '알려줘', '알려주세요', '찾아줘', '찾아주세요', '보여줘', '보여주세요', '골라줘', '골라주세요',
+    '필요', '필요해', '필요해요', '필요합니다', '원해', '원해요', '원합니다', '사고', '싶어', '싶어요', '싶은데',
+    '사려고', '사려고요', '살까', '살까요', '구매', '구입', '장만', '바꾸려고', '교체', '새로',
+    '제품', '가전', '가전제품', '모델', '좀', '좀요', '하나', '요', '예산', '가구', '가족', '식구', '우리', '저희', '집',
+    '신혼집', '이사', '정도', '이하', '이내', '까지', '안쪽', '내외', '미만', '최대', '대략', '약', '쯤', '선에서',
+    '쓸', '쓸만한', '괜찮은', '좋은', '무난한', '적당한', '어떤', '뭐가', '뭐', '있나요', '있어', '있을까요',
+    '그리고', '및', '또는', '랑', '하고', '같이', '함께', '세트', '패키지', '사는', '사는데', '살', '용', '짜리', '주방용',
+    'lg', '엘지', '스타일', '느낌', '분위기', '제일', '가장', '많이',
+}
+
+# 조사/어미 (토큰 끝에서 반복 제거)
+PARTICLES = sorted([
+    '해주세요', '해줘요', '해줘', '주세요', '으로', '에서', '이랑', '하고', '이나', '까지', '부터', '정도',
+    '이고', '이며', '인데', '이에요', '예요', '입니다', '이요',
+    '하게', '스러운', '한',
+    '요', '은', '는', '이', '가', '을', '를', '에', '의', '도', '랑', '과', '와', '로', '용', '고',
+], key=len, reverse=True)
+
+# LLM 해석이 필요한 표현 (부정/비교/이전 대화 참조)
+ESCALATE_WORDS = ('말고', '빼고', '제외', '없이', '싫어', '아닌', '대신', '비교', '차이', '그거', '아까', '방금', '이전', '위에꺼', '다른거', '다른 거')
+
+# ============================================================
+# 패턴 문법 (모듈 로드 시 한 번 컴파일)
+# ============================================================
+
+_NUM = r'(\d{1,3}(?:,\d{3})+|\d+(?:\.\d+)?)'
+
+
+def _alternation(words) -> str:
+    return '|'.join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+
+
+# 예산: 범위(상한 사용) → 억 → 천/백만원 → 만원 → 원 → "예산 200"(단위 생략 시 만원)
+_BUDGET_RANGE_RE = re.compile(_NUM + r'\s*(?:만\s*원?)?\s*[~\-–]\s*' + _NUM + r'\s*(천|백)?\s*만\s*원?')
+_BUDGET_EOK_RE = re.compile(_NUM + r'\s*억(?:\s*원)?')
+_BUDGET_MAN_RE = re.compile(r'(?:' + _NUM + r'\s*|(?<![가-힣]))(천|백)\s*만\s*원?|' + _NUM + r'\s*만\s*원?')
+_BUDGET_WON_RE = re.compile(r'(\d{1,3}(?:,\d{3}){2,}|\d{6,})\s*원')
+_BUDGET_BARE_RE = re.compile(r'예산\s*(?:은|는|이|:)?\s*' + _NUM + r'(?!\s*(?:평|인|명|만|천|백|억|원|\d))')
+
+# 가구원 수 ("65인치"의 "65인"은 제외)
+_HOUSEHOLD_NUM_RE = re.compile(r'(\d{1,2})\s*인(?!치)(?:\s*(?:가구|가족|용))?|(\d{1,2})\s*(?:명|식구)')
+_HOUSEHOLD_KO_RE = re.compile(r'(' + _alternation(KOREAN_COUNTS) + r')\s*(?:명|식구)')
+_HOUSEHOLD_WORD_RE = re.compile(_alternation(HOUSEHOLD_WORDS))
+
+# 평수 / 면적(㎡ → 평)
+# 크기/용량 스펙 ("65인치", "4K", "20kg") → additional_info
+_SPEC_RE = re.compile(r'\d+(?:\.\d+)?\s*(?:인치|inch|리터|kg|킬로|hz|k|l)(?![a-z])')
+_PYUNG_RE = re.compile(_NUM + r'\s*평(?:형|대)?')
+_AREA_RE = re.compile(_NUM + r'\s*(?:㎡|m2|m²|제곱미터)')
+
+_CATEGORY_RE = re.compile(_alternation(CATEGORY_LEXICON))
+_SPACE_RE = re.compile(_alternation(SPACE_HINTS))
+_HOUSING_RE = re.compile(_alternation(HOUSING_LEXICON))
+_PRIORITY_RE = re.compile(_alternation(PRIORITY_LEXICON))
+_VIBE_RE = re.compile(_alternation(VIBE_LEXICON))
+_SIZE_RE = re.compile(_alternation(SIZE_HINTS))
+_TOKEN_RE = re.compile(r'[가-힣a-z0-9]+')
+
+SQM_PER_PYUNG = 3.3058
+# 핵심 슬롯 (하나 이상 있어야 로컬 결과로 응답)
+STRONG_SLOTS = ('household_size', 'budget', 'categories', 'pyung', 'housing_type')
+
+
+def _to_number(text: Optional[str]) -> Optional[float]:
+    if not text:
+        return None
+    return float(text.replace(',', ''))
+
+
+def _as_int(value: float) -> int:
+    return int(round(value))
+
+
+@dataclass
+class IntentParseResult:
+    """로컬 파싱 결과"""
+    slots: Dict
+    confidence: float
+    matched: List[str] = field(default_factory=list)
+    unknown_tokens: List[str] = field(default_factory=list)
+    escalate_reason: Optional[str] = None
+    elapsed_us: float = 0.0
+
+    def is_confident(self, threshold: float) -> bool:
+        return self.confidence >= threshold
+
+
+class IntentParser:
+    """패턴 문법 + 어휘 기반 로컬 의도 추출기"""
+
+    def parse(self, message: str) -> IntentParseResult:
+        started = time.perf_counter()
+        text = unicodedata.normalize('NFKC', message or '').lower()
+        slots = {
+            'household_size': None,
+            'budget': None,
+            'categories': [],
+            'priority': None,
+            'housing_type': None,
+            'pyung': None,
+            'vibe': None,
+            'additional_info': '',
+        }
+        conflicts = []
+        masked = list(text)
+
+        def consume(match):
+            for i in range(match.start(), match.end()):
+                masked[i] = ' '
+
+        def unconsumed(match) -> bool:
+            return all(masked[i] != ' ' or text[i] == ' ' for i in range(match.start(), match.end()))
+
+        def set_slot(name, value):
+            if slots[name] is not None and slots[name] != value:
+                conflicts.append(name)
+            slots[name] = value
+
+        # 예산 (숫자 패턴 중 가장 먼저 - "200만원"의 숫자가 다른 패턴에 잡히지 않도록)
+        for match in _BUDGET_RANGE_RE.finditer(text):
+            upper = _to_number(match.group(2)) * {'천': 1000, '백': 100}.get(match.group(3), 1)
+            set_slot('budget', _as_int(upper))
+            consume(match)
+        for match in _BUDGET_EOK_RE.finditer(text):
+            if unconsumed(match):
+                set_slot('budget', _as_int(_to_number(match.group(1)) * 10000))
+                consume(match)
+        for match in _BUDGET_MAN_RE.finditer(text):
+            if not unconsumed(match):
+                continue
+            if match.group(2):
+                value = (_to_number(match.group(1)) or 1) * (1000 if match.group(2) == '천' else 100)
+            else:
+                value = _to_number(match.group(3))
+            set_slot('budget', _as_int(value))
+            consume(match)
+        for match in _BUDGET_WON_RE.finditer(text):
+            if unconsumed(match):
+                set_slot('budget', _as_int(_to_number(match.group(1)) / 10000))
+                consume(match)
+        for match in _BUDGET_BARE_RE.finditer(text):
+            value = _to_number(match.group(1))
+            if unconsumed(match) and 10 <= value <= 100000:
+                set_slot('budget', _as_int(value))
+                consume(match)
+
+        # 평수
+        for match in _PYUNG_RE.finditer(text):
+            if unconsumed(match):
+                set_slot('pyung', _as_int(_to_number(match.group(1))))
+                consume(match)
+        for match in _AREA_RE.finditer(text):
+            if unconsumed(match):
+                set_slot('pyung', _as_int(_to_number(match.group(1)) / SQM_PER_PYUNG))
+                consume(match)
+
+        # 가구원 수
+        for match in _HOUSEHOLD_NUM_RE.finditer(text):
+            value = int(match.group(1) or match.group(2))
+            if unconsumed(match) and 1 <= value <= 10:
+                set_slot('household_size', value)
+                consume(match)
+        for match in _HOUSEHOLD_KO_RE.finditer(text):
+            if unconsumed(match):
+                set_slot('household_size', KOREAN_COUNTS[match.group(1)])
+                consume(match)
+        if slots['household_size'] is None:
+            for match in _HOUSEHOLD_WORD_RE.finditer(text):
+                set_slot('household_size', HOUSEHOLD_WORDS[match.group(0)])
+                consume(match)
+
+        # 카테고리 (명시적 카테고리가 없을 때만 공간 힌트 사용)
+        for match in _CATEGORY_RE.finditer(text):
+            category = CATEGORY_LEXICON[match.group(0)]
+            if category not in slots['categories']:
+                slots['categories'].append(category)
+            consume(match)
+        for match in _SPACE_RE.finditer(text):
+            if not slots['categories']:
+                slots['categories'].append(SPACE_HINTS[match.group(0)])
+            consume(match)
+
+        # 단일 값 어휘 슬롯
+        for name, pattern, lexicon in (
+            ('housing_type', _HOUSING_RE, HOUSING_LEXICON),
+            ('priority', _PRIORITY_RE, PRIORITY_LEXICON),
+            ('vibe', _VIBE_RE, VIBE_LEXICON),
+        ):
+            for match in pattern.finditer(text):
+                if unconsumed(match):
+                    set_slot(name, lexicon[match.group(0)])
+                    consume(match)
+
+        # "예산"만 언급되고 다른 우선순위가 없으면 가성비로 해석 (기존 규칙과 동일)
+        if slots['priority'] is None and '예산' in text:
+            slots['priority'] = 'value'
+
+        hints = []
+        for match in _SPEC_RE.finditer(text):
+            if unconsumed(match):
+                hints.append(f"{match.group(0).replace(' ', '')} 선호")
+                consume(match)
+        for match in _SIZE_RE.finditer(text):
+            hint = SIZE_HINTS[match.group(0)]
+            if hint not in hints:
+                hints.append(hint)
+            consume(match)
+        slots['additional_info'] = ', '.join(hints) if hints else (message or '')
+
+        # 신뢰도: 설명되지 않은 토큰 글자 비율
+        total_chars = sum(len(t) for t in _TOKEN_RE.findall(text)) or 1
+        unknown = [t for t in _TOKEN_RE.findall(''.join(masked)) if not self._is_filler(t)]
+        coverage = 1.0 - sum(len(t) for t in unknown) / total_chars
+
+        matched = [name for name in slots if name != 'additional_info' and slots[name]]
+        if any(name in matched for name in STRONG_SLOTS):
+            confidence = coverage
+        elif matched:
+            confidence = coverage * 0.6
+        else:
+            confidence = 0.0
+
+        escalate_reason = None
+        escalate_word = next((w for w in ESCALATE_WORDS if w in text), None)
+        if escalate_word:
+            escalate_reason = f"escalate_word:{escalate_word}"
+            confidence = min(confidence, 0.3)
+        elif conflicts:
+            escalate_reason = f"conflict:{','.join(sorted(set(conflicts)))}"
+            confidence = min(confidence, 0.5)
+
+        return IntentParseResult(
+            slots=slots,
+            confidence=round(max(0.0, confidence), 3),
+            matched=matched,
+            unknown_tokens=unknown,
+            escalate_reason=escalate_reason,
+            elapsed_us=round((time.perf_counter() - started) * 1_000_000, 1),
+        )
+
+    def parse_with_history(self, message: str, conversation_history: list = None) -> IntentParseResult:
+        """
+        현재 메시지를 파싱하고, 비어 있는 슬롯은 최근 사용자 발화(최대 3개)에서 채움
+        (LLM 프롬프트에 최근 3개 대화를 맥락으로 주는 것과 같은 범위). 신뢰도는 현재 메시지 기준.
+        """
+        result = self.parse(message)
+        for turn in reversed((conversation_history or [])[-3:]):
+            previous = self.parse(turn.get('user', '') if isinstance(turn, dict) else str(turn))
+            for name, value in previous.slots.items():
+                if name == 'additional_info':
+                    continue
+                if value and not result.slots[name]:
+                    result.slots[name] = value
+        return result
+
+    @staticmethod
+    def _is_filler(token: str) -> bool:
+        stripped = token
+        while stripped and stripped not in FILLER_WORDS:
+            for particle in PARTICLES:
+                if stripped.endswith(particle) and len(stripped) > len(particle):
+                    stripped = stripped[:-len(particle)]
+                    break
+            else:
+                return stripped in PARTICLES
+        return True
+
+
+_log_lock = threading.Lock()
+
+
+def record_query(message: str, result: IntentParseResult, source: str, llm_slots: Dict = None):
+    """
+    질의 로그 기록 (benchmark_intent_parser 입력, AI_INTENT_QUERY_LOG 지정 시에만)
+
+    메시지 원문을 그대로 기록하므로 개인정보가 포함될 수 있습니다.
+
+    Args:
+        source: 'local'(로컬 응답) | 'llm'(LLM 위임) | 'local_fallback'(LLM 사용 불가로 로컬 응답)
+        llm_slots: LLM이 추출한 슬롯 (위임한 경우 - 로컬 결과와의 일치율 비교용)
+    """
+    from django.conf import settings
+
+    path = getattr(settings, 'AI_INTENT_QUERY_LOG', '')
+    if not path:
+        return
+    entry = {
+        'ts': time.time(),
+        'message': message,
+        'source': source,
+        'confidence': result.confidence,
+        'local': result.slots,
+    }
+    if llm_slots is not None:
+        entry['llm'] = llm_slots
+    try:
+        line = json.dumps(entry, ensure_ascii=False, default=str)
+        with _log_lock:
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+    except OSError as e:
+        print(f"[Intent Parser] 질의 로그 기록 실패: {e}", flush=True)
+
+
+# 싱글톤 인스턴스
+intent_parser = IntentParser()
@@ -0,0 +1,178 @@
+"""
+LLM 응답 캐시 (내용 주소 방식)
+
+추천 이유, 스타일 메시지, 제품 비교, 추천 설명처럼 제품/프로필 필드로 만든 프롬프트는
+같은 입력이면 같은 요청이 되므로, 요청 내용의 해시를 키로 완성 결과를 저장해 재사용합니다.
+
+- 키: sha256(모델, 메시지(시스템/사용자 프롬프트), 온도 구간, max_tokens, response_format)
+- 저장소: 'llm' 캐시 alias (파일 기반, 프로세스 재시작 후에도 유지) - TTL(LLM_CACHE_TTL),
+  최대 항목 수(MAX_ENTRIES), 응답 크기 상한(LLM_CACHE_MAX_VALUE_BYTES)
+- single-flight: 같은 키의 요청이 동시에 들어오면 한 요청만 API를 호출하고 나머지는 결과를 기다림 (프로세스 내)
+- 통계: 호출 위치(call_site)별 히트/미스/합류/오류 수와 절약한 토큰 수 - llm_response_cache.stats()
+
+사용법:
+    text = llm_response_cache.get_or_call('recommendation_reason', request_kwargs, call)
+    # call()은 (응답 텍스트, 사용 토큰 수)를 반환
+"""
+import hashlib
+import json
+import threading
+from typing import Callable, Dict, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+KEY_PREFIX = 'llm:v1:'
+
+
+def temperature_bucket(temperature) -> str:
+    """온도 구간 (0.1 단위, 0.2 이하는 결정적 응답으로 같은 구간)"""
+    if temperature is None:
+        return 'default'
+    if temperature <= 0.2:
+        return 'det'
+    return f"{round(float(temperature), 1):.1f}"
+
+
+def request_key(request_kwargs: Dict) -> str:
+    """요청 내용 해시 키 (stream 등 응답 내용과 무관한 인자는 제외)"""
+    material = {
+        'model': request_kwargs.get('model'),
+        'messages': request_kwargs.get('messages'),
+        'temperature': temperature_bucket(request_kwargs.get('temperature')),
+        'max_tokens': request_kwargs.get('max_tokens'),
+        'response_format': request_kwargs.get('response_format'),
+    }
+    raw = json.dumps(material, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return KEY_PREFIX + hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class _Flight:
+    """진행 중인 API 호출 (같은 키의 후속 요청이 결과를 기다림)"""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class LLMResponseCache:
+    """LLM 완성 결과 캐시 + single-flight + 호출 위치별 통계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, 'LLM_CACHE_ENABLED', True)
+
+    @property
+    def cache(self):
+        return caches[getattr(settings, 'LLM_CACHE_ALIAS', 'llm')]
+
+    def _count(self, call_site: str, name: str, value: int = 1):
+        with self._lock:
+            site = self._stats.setdefault(call_site, {
+                'hits': 0, 'misses': 0, 'coalesced': 0, 'errors': 0, 'tokens_saved': 0, 'tokens_spent': 0,
+            })
+            site[name] += value
+
+    def _cache_get(self, key: str):
+        try:
+            return self.cache.get(key)
+        except Exception as e:
+            print(f"[LLM Cache] 캐시 조회 실패: {e}", flush=True)
+            return None
+
+    def _cache_set(self, key: str, text: str, tokens: int):
+        max_bytes = getattr(settings, 'LLM_CACHE_MAX_VALUE_BYTES', 32 * 1024)
+        if len(text.encode('utf-8')) > max_bytes:
+            return
+        try:
+            self.cache.set(key, {'text': text, 'tokens': tokens}, timeout=getattr(settings, 'LLM_CACHE_TTL', None))
+        except Exception as e:
+            print(f"[LLM Cache] 캐시 저장 실패: {e}", flush=True)
+
+    def get_or_call(self, call_site: str, request_kwargs: Dict, call: Callable[[], Tuple[str, int]]) -> str:
+        """
+        캐시된 응답을 반환하거나, 없으면 call()로 생성해 저장
+
+        Args:
+            call_site: 통계 구분용 호출 위치 이름
+            request_kwargs: chat.completions.create 인자 (키 계산용)
+            call: API 호출 함수 - (응답 텍스트, 사용 토큰 수) 반환, 실패 시 예외
+
+        Raises:
+            call()이 낸 예외 (오류 응답은 캐시하지 않음)
+        """
+        if not self.enabled:
+            text, tokens = call()
+            self._count(call_site, 'misses')
+            self._count(call_site, 'tokens_spent', tokens)
+            return text
+
+        key = request_key(request_kwargs)
+        cached = self._cache_get(key)
+        if cached is not None:
+            self._count(call_site, 'hits')
+            self._count(call_site, 'tokens_saved', cached.get('tokens', 0))
+            return cached['text']
+
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            # 같은 요청이 진행 중 - 그 결과를 기다림
+            timeout = getattr(settings, 'LLM_CACHE_SINGLE_FLIGHT_TIMEOUT', 60)
+            if flight.done.wait(timeout) and flight.error is None:
+                self._count(call_site, 'coalesced')
+                self._count(call_site, 'tokens_saved', flight.result[1])
+                return flight.result[0]
+            if flight.error is not None:
+                self._count(call_site, 'errors')
+                raise flight.error
+            # 대기 시간 초과 - 직접 호출
+            text, tokens = call()
+            self._count(call_site, 'misses')
+            self._count(call_site, 'tokens_spent', tokens)
+            return text
+
+        try:
+            text, tokens = call()
+            flight.result = (text, tokens)
+            self._cache_set(key, text, tokens)
+            self._count(call_site, 'misses')
+            self._count(call_site, 'tokens_spent', tokens)
+            return text
+        except Exception as e:
+            flight.error = e
+            self._count(call_site, 'errors')
+            raise
+        finally:
+            flight.done.set()
+            with self._lock:
+                self._flights.pop(key, None)
+
+    def stats(self) -> Dict:
+        """호출 위치별 통계 (hit_rate 포함)"""
+        with self._lock:
+            snapshot = {site: dict(values) for site, values in self._stats.items()}
+        for values in snapshot.values():
+            served = values['hits'] + values['coalesced'] + values['misses']
+            values['hit_rate'] = round((values['hits'] + values['coalesced']) / served, 3) if served else 0.0
+        return snapshot
+
+    def clear(self):
+        """저장된 응답 전체 삭제"""
+        self.cache.clear()
+
+
+# 싱글톤 인스턴스
+llm_response_cache = LLMResponseCache()
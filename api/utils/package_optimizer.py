@@ -0,0 +1,372 @@
+"""
+예산 제약 패키지 최적화
+
+카테고리별 후보(점수, 가격) 중 카테고리마다 최대 1개를 골라 총 예산 안에서
+총점이 가장 높은 패키지 상위 N개를 찾습니다. (multiple-choice knapsack)
+
+분기 한정(branch and bound)으로 탐색합니다.
+- 전처리: 같은 카테고리에서 N개 이상의 후보에게 지배되는(더 비싸고 점수도 낮은) 후보 제거
+- 상한: LP 완화 - 카테고리별 (가격, 점수) 상단 볼록 껍질의 증분을 효율(점수/가격) 순으로 채운 값
+  (남은 카테고리 조합마다 누적 가격/점수를 미리 계산해 두고 bisect 1회로 계산)
+- 가지치기: 상한이 현재 N번째 패키지 점수 이하이거나, 필수 카테고리 최저가 합이 남은 예산을 넘으면 중단
+
+사용법:
+    from api.utils.package_optimizer import package_optimizer
+    result = package_optimizer.optimize(
+        {'TV': [{'product_id': 1, 'score': 0.9, 'price': 1500000}, ...], '냉장고': [...]},
+        budget=5000000,
+        top_n=3,
+    )
+"""
+import bisect
+import heapq
+import itertools
+import time
+from typing import Dict, Iterable, List, Optional
+
+# 탐색 노드 상한 (초과 시 지금까지 찾은 패키지 반환, complete=False)
+DEFAULT_MAX_NODES = 200000
+
+# LP 상한 부동소수 오차 여유
+_EPSILON = 1e-9
+
+
+def _candidate_price(candidate: Dict) -> int:
+    """할인가 우선 가격 (원 단위 정수)"""
+    price = candidate.get('discount_price') or candidate.get('price') or 0
+    return int(round(float(price)))
+
+
+def _candidate_score(candidate: Dict) -> float:
+    score = candidate.get('score')
+    if score is None:
+        score = candidate.get('total_score', 0)
+    return float(score or 0)
+
+
+def candidates_from_recommendations(recommendations: Iterable[Dict], group_key: str = None) -> Dict[str, List[Dict]]:
+    """
+    추천 엔진 결과를 카테고리별 후보로 변환
+
+    RecommendationEngine 결과는 main_category, PlaybookRecommendationEngine 결과는 product_type으로 묶습니다.
+    점수는 score(0~1) 또는 total_score(0~100)를 그대로 사용합니다.
+    """
+    grouped: Dict[str, List[Dict]] = {}
+    for rec in recommendations:
+        key = rec.get(group_key) if group_key else (
+            rec.get('main_category') or rec.get('product_type') or rec.get('category')
+        )
+        grouped.setdefault(key or '기타', []).append({
+            'product_id': rec.get('product_id'),
+            'score': _candidate_score(rec),
+            'price': _candidate_price(rec),
+            'name': rec.get('name') or rec.get('model'),
+        })
+    return grouped
+
+
+def candidates_from_rankings(candidate_rankings: Dict) -> Dict[str, List[Dict]]:
+    """
+    포트폴리오에 저장된 후보 순위(candidate_rankings)를 카테고리별 후보로 변환 (제품 가격 조회 1회)
+    """
+    from api.models import Product
+
+    categories = (candidate_rankings or {}).get('categories', {})
+    product_ids = {pid for entry in categories.values() for pid, _ in entry.get('ranking', [])}
+    products = {
+        pk: (name, price, discount_price)
+        for pk, name, price, discount_price in Product.objects.filter(
+            pk__in=product_ids, is_active=True
+        ).values_list('pk', 'name', 'price', 'discount_price')
+    }
+
+    grouped: Dict[str, List[Dict]] = {}
+    for main_category, entry in categories.items():
+        bucket = grouped.setdefault(main_category, [])
+        for pid, score in entry.get('ranking', []):
+            if pid not in products:
+                continue
+            name, price, discount_price = products[pid]
+            bucket.append({
+                'product_id': pid,
+                'score': float(score),
+                'price': _candidate_price({'price': price, 'discount_price': discount_price}),
+                'name': name,
+            })
+    return grouped
+
+
+class _Category:
+    """탐색용 카테고리 (후보는 점수 내림차순, LP 상한용 볼록 껍질 증분)"""
+
+    __slots__ = ('name', 'required', 'options', 'min_price', 'base_score', 'segments')
+
+    def __init__(self, name: str, required: bool, items: List[Dict]):
+        self.name = name
+        self.required = required
+        self.options = sorted(items, key=lambda c: (-c['_score'], c['_price']))
+        by_price = sorted(items, key=lambda c: (c['_price'], -c['_score']))
+        self.min_price = by_price[0]['_price'] if required else 0
+        self.base_score, self.segments = self._hull_segments(by_price)
+
+    def _hull_segments(self, by_price: List[Dict]):
+        """
+        LP 완화 상한용 상단 볼록 껍질
+
+        가장 싼 점(선택 카테고리는 건너뛰기 = (0, 0))에서 시작해
+        (효율, 가격 증분, 점수 증분) 목록을 효율 내림차순으로 반환합니다.
+        """
+        points = [(c['_price'], c['_score']) for c in by_price]
+        if not self.required:
+            points.insert(0, (0, 0.0))
+            points.sort(key=lambda p: (p[0], -p[1]))
+
+        # 파레토 경계 (가격이 오를 때 점수도 올라야 함)
+        frontier = []
+        for price, score in points:
+            if not frontier or score > frontier[-1][1]:
+                if frontier and frontier[-1][0] == price:
+                    continue
+                frontier.append((price, score))
+
+        hull = []
+        for point in frontier:
+            while len(hull) >= 2:
+                (x1, y1), (x2, y2) = hull[-2], hull[-1]
+                # hull[-1]이 hull[-2]→point 직선 아래(또는 위)에 있으면 제거
+                if (y2 - y1) * (point[0] - x1) <= (point[1] - y1) * (x2 - x1):
+                    hull.pop()
+                else:
+                    break
+            hull.append(point)
+
+        segments = [
+            ((y2 - y1) / (x2 - x1), x2 - x1, y2 - y1)
+            for (x1, y1), (x2, y2) in zip(hull, hull[1:])
+        ]
+        return hull[0][1], segments
+
+
+class PackageOptimizer:
+    """카테고리별 후보에서 예산 내 최고 점수 패키지 탐색"""
+
+    def optimize(
+        self,
+        candidates_by_category: Dict[str, List[Dict]],
+        budget: float,
+        top_n: int = 3,
+        required_categories: Optional[List[str]] = None,
+        category_constraints: Optional[Dict[str, Dict]] = None,
+        max_nodes: int = DEFAULT_MAX_NODES,
+    ) -> Dict:
+        """
+        예산 내 총점 상위 N개 패키지
+
+        Args:
+            candidates_by_category: {카테고리: [{'product_id', 'score', 'price', ...}, ...]}
+            budget: 총 예산 (원)
+            top_n: 반환할 패키지 수
+            required_categories: 반드시 1개 포함할 카테고리 (None이면 모든 카테고리 필수)
+            category_constraints: 카테고리별 제약
+                {'TV': {'min_price': 1000000, 'max_price': 3000000, 'min_score': 0.5, 'required': True}}
+            max_nodes: 탐색 노드 상한
+
+        Returns:
+            {
+                'success': bool,
+                'packages': [
+                    {'rank': 1, 'total_score': 2.41, 'total_price': 4870000,
+                     'remaining_budget': 130000, 'items': [{'category', 'product_id', 'score', 'price', ...}]},
+                    ...
+                ],
+                'stats': {'nodes', 'pruned', 'candidates', 'kept_candidates', 'complete', 'elapsed_ms'}
+            }
+        """
+        started = time.perf_counter()
+        budget = int(budget)
+        top_n = max(1, int(top_n))
+        category_constraints = category_constraints or {}
+        required = set(candidates_by_category) if required_categories is None else set(required_categories)
+
+        categories = []
+        total_candidates = 0
+        for name, candidates in candidates_by_category.items():
+            constraint = category_constraints.get(name, {})
+            is_required = constraint.get('required', name in required)
+            total_candidates += len(candidates)
+            items = self._prepare_items(name, candidates, constraint, budget, top_n)
+            if not items:
+                if is_required:
+                    return self._infeasible(f"'{name}' 카테고리에 예산/제약을 만족하는 후보가 없습니다.", started)
+                continue
+            categories.append(_Category(name, is_required, items))
+
+        missing = sorted(required - set(candidates_by_category))
+        if missing:
+            return self._infeasible(f"필수 카테고리 '{missing[0]}'의 후보가 없습니다.", started)
+
+        # 필수 카테고리 먼저, 그다음 최고 점수가 큰 카테고리부터 (좋은 해를 빨리 찾아 가지치기 강화)
+        categories.sort(key=lambda c: (not c.required, -c.options[0]['_score'], c.name))
+
+        # suffix_min_price[i]: i번째 이후 필수 카테고리 최저가 합
+        suffix_min_price = [0] * (len(categories) + 1)
+        for i in range(len(categories) - 1, -1, -1):
+            suffix_min_price[i] = suffix_min_price[i + 1] + categories[i].min_price
+
+        if suffix_min_price[0] > budget:
+            return self._infeasible('필수 카테고리 최저가 합이 예산을 초과합니다.', started)
+
+        # LP 완화 상한용: i번째 이후 카테고리의 기본 점수 합과, 효율 내림차순 껍질 증분의 누적 가격/점수
+        suffix_base_score = [0.0] * (len(categories) + 1)
+        suffix_hull = [([], [], [])] * (len(categories) + 1)
+        segments: List = []
+        for i in range(len(categories) - 1, -1, -1):
+            suffix_base_score[i] = suffix_base_score[i + 1] + categories[i].base_score
+            segments = sorted(segments + categories[i].segments, reverse=True)
+            cum_prices, cum_scores, efficiencies = [], [], []
+            total_price, total_score = 0, 0.0
+            for efficiency, d_price, d_score in segments:
+                total_price += d_price
+                total_score += d_score
+                cum_prices.append(total_price)
+                cum_scores.append(total_score)
+                efficiencies.append(efficiency)
+            suffix_hull[i] = (cum_prices, cum_scores, efficiencies)
+
+        heap: List = []  # (score, -price, seq, items) 최소 힙 - 상위 N개 유지
+        seq = itertools.count()
+        stats = {'nodes': 0, 'pruned': 0}
+        chosen: List[Dict] = []
+
+        def upper_bound(i: int, remaining: int) -> float:
+            """i번째 이후 카테고리로 remaining 예산 안에서 얻을 수 있는 점수의 LP 완화 상한"""
+            cap = remaining - suffix_min_price[i]
+            if cap < 0:
+                return float('-inf')
+            cum_prices, cum_scores, efficiencies = suffix_hull[i]
+            k = bisect.bisect_right(cum_prices, cap)
+            bound = suffix_base_score[i]
+            if k:
+                bound += cum_scores[k - 1]
+                cap -= cum_prices[k - 1]
+            if k < len(efficiencies):
+                bound += efficiencies[k] * cap
+            return bound
+
+        def search(i: int, score: float, price: int) -> bool:
+            stats['nodes'] += 1
+            if stats['nodes'] > max_nodes:
+                return False
+
+            if i == len(categories):
+                entry = (score, -price, next(seq), list(chosen))
+                if len(heap) < top_n:
+                    heapq.heappush(heap, entry)
+                elif entry[:2] > heap[0][:2]:
+                    heapq.heapreplace(heap, entry)
+                return True
+
+            remaining = budget - price
+            if len(heap) >= top_n and score + upper_bound(i, remaining) + _EPSILON <= heap[0][0]:
+                stats['pruned'] += 1
+                return True
+
+            cat = categories[i]
+            reserve = suffix_min_price[i + 1]
+            for option in cat.options:
+                if option['_price'] + reserve > remaining:
+                    continue
+                if len(heap) >= top_n and (
+                    score + option['_score'] + upper_bound(i + 1, remaining - option['_price']) + _EPSILON
+                    <= heap[0][0]
+                ):
+                    stats['pruned'] += 1
+                    continue
+                chosen.append(option)
+                ok = search(i + 1, score + option['_score'], price + option['_price'])
+                chosen.pop()
+                if not ok:
+                    return False
+
+            if not cat.required:
+                return search(i + 1, score, price)
+            return True
+
+        complete = search(0, 0.0, 0)
+
+        packages = []
+        for rank, (score, neg_price, _, items) in enumerate(sorted(heap, key=lambda e: (-e[0], -e[1], e[2])), 1):
+            packages.append({
+                'rank': rank,
+                'total_score': round(score, 4),
+                'total_price': -neg_price,
+                'remaining_budget': budget + neg_price,
+                'items': [
+                    {k: v for k, v in item.items() if not k.startswith('_')}
+                    for item in items
+                ],
+            })
+
+        return {
+            'success': bool(packages),
+            'packages': packages,
+            'stats': {
+                'nodes': stats['nodes'],
+                'pruned': stats['pruned'],
+                'candidates': total_candidates,
+                'kept_candidates': sum(len(c.options) for c in categories),
+                'complete': complete,
+                'elapsed_ms': round((time.perf_counter() - started) * 1000, 3),
+            },
+        }
+
+    @staticmethod
+    def _prepare_items(category: str, candidates: List[Dict], constraint: Dict, budget: int, top_n: int) -> List[Dict]:
+        """제약 적용 + 중복 제거 + top_n개 이상에게 지배되는 후보 제거"""
+        min_price = constraint.get('min_price')
+        max_price = constraint.get('max_price')
+        min_score = constraint.get('min_score')
+
+        items = []
+        seen = set()
+        for candidate in candidates:
+            product_id = candidate.get('product_id')
+            if product_id is not None and product_id in seen:
+                continue
+            price = _candidate_price(candidate)
+            score = _candidate_score(candidate)
+            if price > budget:
+                continue
+            if min_price is not None and price < min_price:
+                continue
+            if max_price is not None and price > max_price:
+                continue
+            if min_score is not None and score < min_score:
+                continue
+            seen.add(product_id)
+            items.append(dict(candidate, category=category, _price=price, _score=score))
+
+        # 가격 오름차순으로 보면서, 자신보다 싸거나 같고 점수가 높거나 같은 후보가 top_n개 이상이면 제거
+        # (그 후보들로 바꾼 패키지가 top_n개 이상 같거나 더 좋으므로 상위 N개에 들 필요가 없음)
+        items.sort(key=lambda c: (c['_price'], -c['_score']))
+        kept = []
+        seen_scores: List[float] = []
+        for item in items:
+            dominators = len(seen_scores) - bisect.bisect_left(seen_scores, item['_score'])
+            if dominators < top_n:
+                kept.append(item)
+            bisect.insort(seen_scores, item['_score'])
+        return kept
+
+    @staticmethod
+    def _infeasible(message: str, started: float) -> Dict:
+        return {
+            'success': False,
+            'message': message,
+            'packages': [],
+            'stats': {'elapsed_ms': round((time.perf_counter() - started) * 1000, 3), 'complete': True},
+        }
+
+
+# 싱글톤 인스턴스
+package_optimizer = PackageOptimizer()
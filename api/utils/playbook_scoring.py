@@ -3,10 +3,20 @@ Playbook 설계 기반 Scoring 모델
 
 TotalScore = SpecScore + PreferenceScore + LifestyleScore + ReviewScore + PriceScore
 각 Score는 정수/실수로 합산 가능한 형태
+
+각 컴포넌트는 제품 외에 의존하는 입력을 COMPONENT_DEPENDENCIES에 선언하고,
+결과는 (카탈로그 버전, 제품, 선언된 입력 값) 키로 캐시됩니다.
+예) ReviewScore는 제품만, PriceScore는 제품 + 예산으로 결정되므로 사용자 간에 재사용됩니다.
+ReviewScore는 카탈로그 밖의 리뷰 데이터에 의존하므로(리뷰 적재는 카탈로그 버전을 올리지 않음)
+COMPONENT_TTL_SETTINGS의 시간 구간도 키에 포함해 주기적으로 다시 계산합니다.
 """
 import json
-from typing import Dict, Optional, List
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass
+from django.conf import settings
 from ..models import Product, ProductReview
 from .policy_loader import policy_loader
 from .scoring import (
@@ -16,6 +26,87 @@ from .scoring import (
     score_capacity, score_energy_efficiency, score_design
 )
 from ..rule_engine import UserProfile
+from .catalog_version import get_catalog_version
+
+# 컴포넌트별 의존 입력 (제품 외). 'profile.*'는 UserProfile 속성, 나머지는 딕셔너리 키
+# 컴포넌트 계산 로직이 새 입력을 읽게 되면 여기에도 추가해야 캐시가 올바르게 분리됩니다.
+COMPONENT_DEPENDENCIES = {
+    'spec': ('user_profile.household_size', 'user_profile.main_space', 'onboarding_data.media'),
+    'preference': ('user_profile.priority', 'profile.priority', 'profile.vibe'),
+    'lifestyle': ('onboarding_data.cooking', 'onboarding_data.laundry', 'onboarding_data.media'),
+    'review': (),
+    'price': ('user_profile.budget_level', 'user_profile.budget_amount'),
+}
+
+# 카탈로그 버전으로 무효화되지 않는 데이터에 의존하는 컴포넌트의 캐시 유지 시간 설정 (초, 0이면 제한 없음)
+COMPONENT_TTL_SETTINGS = {
+    'review': ('PLAYBOOK_REVIEW_SCORE_TTL', 600),
+}
+
+
+def _freeze(value):
+    """캐시 키용 해시 가능한 값으로 변환"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, set):
+        return tuple(sorted(value))
+    return value
+
+
+class ScoreComponentCache:
+    """컴포넌트별 점수 캐시 (LRU, 히트/미스 통계)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, OrderedDict] = {name: OrderedDict() for name in COMPONENT_DEPENDENCIES}
+        self._hits = {name: 0 for name in COMPONENT_DEPENDENCIES}
+        self._misses = {name: 0 for name in COMPONENT_DEPENDENCIES}
+
+    @property
+    def max_entries(self) -> int:
+        return getattr(settings, 'PLAYBOOK_SCORE_CACHE_SIZE', 20000)
+
+    def get(self, component: str, key: Tuple):
+        """캐시된 점수 (없으면 None)"""
+        entries = self._entries[component]
+        with self._lock:
+            value = entries.get(key)
+            if value is None:
+                self._misses[component] += 1
+                return None
+            entries.move_to_end(key)
+            self._hits[component] += 1
+            return value
+
+    def set(self, component: str, key: Tuple, value: float):
+        entries = self._entries[component]
+        with self._lock:
+            entries[key] = value
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            for name in COMPONENT_DEPENDENCIES:
+                self._entries[name].clear()
+                self._hits[name] = 0
+                self._misses[name] = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = {}
+            for name in COMPONENT_DEPENDENCIES:
+                hits, misses = self._hits[name], self._misses[name]
+                stats[name] = {
+                    'entries': len(self._entries[name]),
+                    'hits': hits,
+                    'misses': misses,
+                    'hit_rate': round(hits / (hits + misses), 3) if hits + misses else 0.0,
+                }
+            return stats
 
 
 @dataclass
@@ -53,6 +144,10 @@ class ScoreBreakdown:
 class PlaybookScoringModel:
     """Playbook 설계 기반 Scoring 모델"""
     
+    def __init__(self):
+        # 컴포넌트별 점수 캐시 (선언된 의존 입력 단위로 사용자 간 공유)
+        self.cache = ScoreComponentCache()
+    
     def calculate_product_score(
         self,
         product: Product,
@@ -73,32 +168,88 @@ class PlaybookScoringModel:
             ScoreBreakdown 객체
         """
         breakdown = ScoreBreakdown()
+        sources = {
+            'profile': profile,
+            'user_profile': user_profile or {},
+            'onboarding_data': onboarding_data or {},
+        }
+        catalog_version = get_catalog_version()
         
         # 1. SpecScore 계산
-        breakdown.spec_score = self._calculate_spec_score(
-            product, profile, user_profile, onboarding_data
+        breakdown.spec_score = self._cached_component(
+            'spec', product, sources, catalog_version,
+            lambda: self._calculate_spec_score(product, profile, user_profile, onboarding_data)
         )
         
         # 2. PreferenceScore 계산
-        breakdown.preference_score = self._calculate_preference_score(
-            product, profile, user_profile
+        breakdown.preference_score = self._cached_component(
+            'preference', product, sources, catalog_version,
+            lambda: self._calculate_preference_score(product, profile, user_profile)
         )
         
         # 3. LifestyleScore 계산
-        breakdown.lifestyle_score = self._calculate_lifestyle_score(
-            product, profile, user_profile, onboarding_data
+        breakdown.lifestyle_score = self._cached_component(
+            'lifestyle', product, sources, catalog_version,
+            lambda: self._calculate_lifestyle_score(product, profile, user_profile, onboarding_data)
         )
         
         # 4. ReviewScore 계산
-        breakdown.review_score = self._calculate_review_score(product)
+        breakdown.review_score = self._cached_component(
+            'review', product, sources, catalog_version,
+            lambda: self._calculate_review_score(product)
+        )
         
         # 5. PriceScore 계산
-        breakdown.price_score = self._calculate_price_score(
-            product, profile, user_profile
+        breakdown.price_score = self._cached_component(
+            'price', product, sources, catalog_version,
+            lambda: self._calculate_price_score(product, profile, user_profile)
         )
         
         return breakdown
     
+    def _cached_component(self, component: str, product: Product, sources: Dict, catalog_version, compute) -> float:
+        """
+        컴포넌트 점수를 (카탈로그 버전, 제품, 선언된 의존 입력) 키로 캐시
+        
+        제품 PK가 없으면(저장되지 않은 제품) 캐시하지 않습니다.
+        COMPONENT_TTL_SETTINGS에 있는 컴포넌트는 시간 구간을 키에 더해 유지 시간이 지나면 다시 계산합니다.
+        """
+        if product.pk is None:
+            return compute()
+        
+        key = (catalog_version, product.pk) + tuple(
+            self._resolve_dependency(sources, dependency)
+            for dependency in COMPONENT_DEPENDENCIES[component]
+        )
+        if component in COMPONENT_TTL_SETTINGS:
+            setting_name, default = COMPONENT_TTL_SETTINGS[component]
+            ttl = getattr(settings, setting_name, default)
+            if ttl:
+                key += (int(time.time() // ttl),)
+        cached = self.cache.get(component, key)
+        if cached is not None:
+            return cached
+        
+        value = compute()
+        self.cache.set(component, key, value)
+        return value
+    
+    @staticmethod
+    def _resolve_dependency(sources: Dict, dependency: str):
+        source_name, field = dependency.split('.', 1)
+        source = sources[source_name]
+        if isinstance(source, dict):
+            return _freeze(source.get(field))
+        return _freeze(getattr(source, field, None))
+    
+    def cache_stats(self) -> Dict:
+        """컴포넌트별 캐시 통계"""
+        return self.cache.stats()
+    
+    def clear_cache(self):
+        """컴포넌트 캐시 초기화"""
+        self.cache.clear()
+    
     def _calculate_spec_score(
         self,
         product: Product,
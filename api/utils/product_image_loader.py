@@ -1,8 +1,14 @@
 """
 Oracle DB의 PRODUCT_IMAGE 테이블에서 제품 이미지 URL 가져오기
+
+REFERENCE_REPLICA_ENABLED이면 로컬 SQLite 복제본(reference_replica)에서 조회합니다.
+복제본과 Oracle 쿼리는 같은 행을 돌려주도록 조건/정렬을 맞춥니다.
+(Oracle은 정렬한 서브쿼리에 ROWNUM = 1, 복제본은 ORDER BY ... LIMIT 1.
+Oracle에서 ''는 NULL이므로 빈 값 제외는 IS NOT NULL로 충분하며, 부분 일치는 양쪽 모두 대소문자를 구분하는 INSTR)
 """
 import logging
 from api.db.oracle_client import fetch_one, fetch_all_dict
+from api.db.reference_replica import reference_replica
 
 logger = logging.getLogger(__name__)
 
@@ -36,15 +42,26 @@ def get_image_url_from_product_image_table(
                 return ''
         
         # PRODUCT_IMAGE 테이블에서 이미지 URL 가져오기
-        result = fetch_one("""
-            SELECT IMAGE_URL
-            FROM CAMPUS_24K_LG3_DX7_P3_4.PRODUCT_IMAGE
-            WHERE PRODUCT_ID = :product_id
-            AND IMAGE_URL IS NOT NULL
-            AND IMAGE_URL != ''
-            AND ROWNUM = 1
-            ORDER BY PRODUCT_IMAGE_ID
-        """, {'product_id': product_id})
+        if reference_replica.is_ready('PRODUCT_IMAGE'):
+            result = reference_replica.fetch_one("""
+                SELECT IMAGE_URL
+                FROM PRODUCT_IMAGE
+                WHERE PRODUCT_ID = :product_id
+                AND IMAGE_URL IS NOT NULL
+                ORDER BY PRODUCT_IMAGE_ID
+                LIMIT 1
+            """, {'product_id': product_id})
+        else:
+            result = fetch_one("""
+                SELECT IMAGE_URL FROM (
+                    SELECT IMAGE_URL
+                    FROM CAMPUS_24K_LG3_DX7_P3_4.PRODUCT_IMAGE
+                    WHERE PRODUCT_ID = :product_id
+                    AND IMAGE_URL IS NOT NULL
+                    ORDER BY PRODUCT_IMAGE_ID
+                )
+                WHERE ROWNUM = 1
+            """, {'product_id': product_id})
         
         if result and result[0]:
             image_url = str(result[0]).strip()
@@ -71,14 +88,20 @@ def _get_product_id_from_name(product_name: str) -> int:
         PRODUCT_ID (없으면 None)
     """
     try:
-        result = fetch_one("""
-            SELECT PRODUCT_ID
-            FROM PRODUCT
-            WHERE PRODUCT_NAME LIKE :product_name
-            AND STATUS = '판매중'
-            AND ROWNUM = 1
-            ORDER BY PRODUCT_ID DESC
-        """, {'product_name': f'%{product_name}%'})
+        if reference_replica.is_ready('PRODUCT'):
+            result = reference_replica.fetch_one("""
+                SELECT MAX(PRODUCT_ID)
+                FROM PRODUCT
+                WHERE INSTR(PRODUCT_NAME, :product_name) > 0
+                AND STATUS = '판매중'
+            """, {'product_name': product_name})
+        else:
+            result = fetch_one("""
+                SELECT MAX(PRODUCT_ID)
+                FROM PRODUCT
+                WHERE INSTR(PRODUCT_NAME, :product_name) > 0
+                AND STATUS = '판매중'
+            """, {'product_name': product_name})
         
         if result and result[0]:
             return int(result[0])
@@ -101,14 +124,21 @@ def _get_product_id_from_model_number(model_number: str) -> int:
         PRODUCT_ID (없으면 None)
     """
     try:
-        result = fetch_one("""
-            SELECT PRODUCT_ID
-            FROM PRODUCT
-            WHERE MODEL_NUMBER = :model_number
-            AND STATUS = '판매중'
-            AND ROWNUM = 1
-            ORDER BY PRODUCT_ID DESC
-        """, {'model_number': model_number})
+        # 복제본과 Oracle 모두 PRODUCT.MODEL_CODE로 조회 (같은 모델명이면 가장 최근 PRODUCT_ID)
+        if reference_replica.is_ready('PRODUCT'):
+            result = reference_replica.fetch_one("""
+                SELECT MAX(PRODUCT_ID)
+                FROM PRODUCT
+                WHERE MODEL_CODE = :model_number
+                AND STATUS = '판매중'
+            """, {'model_number': model_number})
+        else:
+            result = fetch_one("""
+                SELECT MAX(PRODUCT_ID)
+                FROM PRODUCT
+                WHERE MODEL_CODE = :model_number
+                AND STATUS = '판매중'
+            """, {'model_number': model_number})
         
         if result and result[0]:
             return int(result[0])
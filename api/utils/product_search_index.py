@@ -0,0 +1,385 @@
+"""
+제품 검색 인덱스 (메모리 역색인)
+
+Product의 제품명, 모델 코드, 설명, 주요 스펙 값을 문자 bigram/trigram으로 토큰화해
+메모리 역색인을 만들고 BM25로 순위를 매깁니다. 띄어쓰기가 일정하지 않은 한국어 제품명
+(예: "오브제컬렉션 냉장고" / "냉장고")도 부분 문자열로 매칭됩니다.
+
+- 검색: BM25 점수 + 카테고리 facet (DB 조회 없음). n-gram을 만들 수 없는 한 글자 검색어는
+  제품명/모델 코드/설명 부분 문자열 검색(최신 제품 순)으로 처리
+- 자동완성: 제품명/모델 코드/단어 접두어 (정렬 리스트 + bisect)
+- 갱신: 카탈로그 버전이 바뀌면(동기화, 관리자 화면/API 저장) 제품별 서명(동기화 행 해시 + updated_at)을
+  비교해 바뀐 제품만 다시 색인. 동기화 이력이 없는 Django 전용 제품도 포함
+"""
+import bisect
+import math
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from api.utils.catalog_version import get_catalog_version
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 필드별 가중치 (term frequency에 곱함)
+FIELD_WEIGHTS = {
+    'name': 3.0,
+    'model': 2.0,
+    'spec': 1.0,
+    'description': 1.0,
+}
+
+# 제품당 색인할 스펙 값 개수 / 최대 길이 (긴 설명형 스펙 값은 제외)
+MAX_SPEC_VALUES = 30
+MAX_SPEC_VALUE_LENGTH = 50
+
+# 쿼리 n-gram 중 이 비율 이상 매칭된 제품만 결과에 포함
+MIN_SHOULD_MATCH = 0.6
+
+# 가장 짧은 n-gram 길이 (이보다 짧은 검색어는 부분 문자열 검색)
+MIN_NGRAM = 2
+
+_WORD_RE = re.compile(r'[0-9a-z가-힣]+')
+
+
+def normalize(text: Optional[str]) -> str:
+    if not text:
+        return ''
+    return unicodedata.normalize('NFKC', str(text)).lower()
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    문자 bigram/trigram 토큰화
+
+    단어(한글/영문/숫자 연속)마다 2-gram, 3-gram을 만들고, 2글자 이하 단어는 단어 자체를 토큰으로 사용합니다.
+    """
+    tokens = []
+    for word in _WORD_RE.findall(normalize(text)):
+        if len(word) <= 2:
+            tokens.append(word)
+            continue
+        tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        tokens.extend(word[i:i + 3] for i in range(len(word) - 2))
+    return tokens
+
+
+class ProductSearchIndex:
+    """
+    제품 검색 역색인
+
+    문서(제품)마다 응답에 필요한 필드를 함께 보관하므로 검색 결과를 만들 때 DB를 조회하지 않습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        self._doc_terms: Dict[int, Dict[str, float]] = {}
+        self._doc_len: Dict[int, float] = {}
+        self._total_len = 0.0
+        self._docs: Dict[int, Dict] = {}
+        self._doc_hashes: Dict[int, Tuple] = {}
+        self._prefixes: List[Tuple[str, int]] = []
+        self._version = None
+        self._built_at = 0.0
+
+    # ============================================================
+    # 검색
+    # ============================================================
+
+    def search(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> Dict:
+        """
+        BM25 검색
+
+        Returns:
+            {
+                'total_count': int,
+                'results': [{'score': float, **문서 필드}, ...],
+                'facets': {'category': [{'value': 'TV', 'count': 12}, ...]}
+            }
+        """
+        self._ensure_fresh()
+        key = normalize(query).strip()
+        query_terms = Counter(tokenize(query))
+        if not query_terms and len(key) >= MIN_NGRAM:
+            return {'total_count': 0, 'results': [], 'facets': {'category': []}}
+
+        with self._lock:
+            substring = len(key) < MIN_NGRAM
+            if substring:
+                # 한 글자 검색어 - n-gram 대신 부분 문자열 검색 (기존 icontains 검색과 같은 필드)
+                scores = defaultdict(float)
+                candidates = self._substring_candidates(key) if key else []
+            else:
+                scores, matched = self._score(query_terms)
+                min_match = max(1, math.ceil(len(query_terms) * MIN_SHOULD_MATCH))
+                candidates = [pid for pid, count in matched.items() if count >= min_match]
+
+            facet_counts = Counter(self._docs[pid]['main_category'] for pid in candidates)
+            if category:
+                candidates = [
+                    pid for pid in candidates
+                    if category in (self._docs[pid]['main_category'], self._docs[pid]['category'])
+                ]
+
+            if substring:
+                # 점수가 없으므로 최신 제품 순
+                candidates.sort()
+                candidates.sort(key=lambda pid: self._docs[pid]['created_at'] or '', reverse=True)
+            else:
+                candidates.sort(key=lambda pid: (-scores[pid], pid))
+            page = candidates[offset:offset + limit]
+            results = [dict(self._docs[pid], score=round(scores[pid], 4)) for pid in page]
+
+        return {
+            'total_count': len(candidates),
+            'results': results,
+            'facets': {
+                'category': [
+                    {'value': value, 'count': count}
+                    for value, count in facet_counts.most_common()
+                    if value
+                ],
+            },
+        }
+
+    def _score(self, query_terms: Counter) -> Tuple[Dict[int, float], Counter]:
+        scores: Dict[int, float] = defaultdict(float)
+        matched: Counter = Counter()
+        n_docs = len(self._docs) or 1
+        avg_len = (self._total_len / n_docs) or 1.0
+
+        for term, query_tf in query_terms.items():
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            for pid, tf in postings.items():
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self._doc_len[pid] / avg_len)
+                scores[pid] += query_tf * idf * tf * (BM25_K1 + 1) / (tf + norm)
+                matched[pid] += 1
+        return scores, matched
+
+    def _substring_candidates(self, key: str) -> List[int]:
+        return [
+            pid for pid, doc in self._docs.items()
+            if any(key in normalize(doc[field]) for field in ('name', 'model_number', 'description'))
+        ]
+
+    def autocomplete(self, prefix: str, limit: int = 10) -> List[Dict]:
+        """제품명/모델 코드/단어 접두어 자동완성 (제품명 중복 제거)"""
+        self._ensure_fresh()
+        key = normalize(prefix).strip()
+        if not key:
+            return []
+
+        suggestions = []
+        seen = set()
+        with self._lock:
+            start = bisect.bisect_left(self._prefixes, (key, -1))
+            for entry, pid in self._prefixes[start:]:
+                if not entry.startswith(key):
+                    break
+                doc = self._docs.get(pid)
+                if not doc or doc['name'] in seen:
+                    continue
+                seen.add(doc['name'])
+                suggestions.append({
+                    'id': pid,
+                    'name': doc['name'],
+                    'model_number': doc['model_number'],
+                    'main_category': doc['main_category'],
+                })
+                if len(suggestions) >= limit:
+                    break
+        return suggestions
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'documents': len(self._docs),
+                'terms': len(self._postings),
+                'prefixes': len(self._prefixes),
+                'catalog_version': self._version,
+                'built_at': self._built_at,
+            }
+
+    # ============================================================
+    # 색인
+    # ============================================================
+
+    def invalidate(self):
+        with self._lock:
+            self._version = None
+
+    def _ensure_fresh(self):
+        version = get_catalog_version()
+        if self._version == version:
+            return
+        with self._lock:
+            if self._version == version:
+                return
+            started = time.time()
+            try:
+                mode, count = self._refresh()
+            except Exception as e:
+                print(f"[ProductSearchIndex] 색인 실패: {e}", flush=True)
+                return
+            self._version = version
+            self._built_at = time.time()
+            print(
+                f"[ProductSearchIndex] {mode} 색인 완료: 문서 {len(self._docs)}개, 갱신 {count}개 "
+                f"(catalog_version={version}, {time.time() - started:.2f}초)",
+                flush=True
+            )
+
+    def _refresh(self) -> Tuple[str, int]:
+        """바뀐 제품만 다시 색인 (첫 색인이면 전체)"""
+        signatures = self._load_signatures()
+        if not self._docs:
+            self._rebuild_all(signatures)
+            return '전체', len(self._docs)
+
+        changed = [pid for pid, sig in signatures.items() if self._doc_hashes.get(pid) != sig]
+        removed = [pid for pid in self._docs if pid not in signatures]
+        for pid in removed:
+            self._remove_document(pid)
+        self._index_products(changed)
+        for pid in changed:
+            if pid in self._docs:
+                self._doc_hashes[pid] = signatures[pid]
+        self._rebuild_prefixes()
+        return '증분', len(changed) + len(removed)
+
+    def _rebuild_all(self, signatures: Dict[int, Tuple]):
+        self._postings = defaultdict(dict)
+        self._doc_terms = {}
+        self._doc_len = {}
+        self._total_len = 0.0
+        self._docs = {}
+        self._index_products(None)
+        self._doc_hashes = {pid: signatures.get(pid) for pid in self._docs}
+        self._rebuild_prefixes()
+
+    @staticmethod
+    def _load_signatures() -> Dict[int, Tuple]:
+        """
+        색인 대상(판매중) 제품별 서명: (PRODUCT 행 해시, PRODUCT_SPEC 행 해시, updated_at)
+
+        동기화 해시는 sync_catalog의 bulk 반영(updated_at 미갱신)을, updated_at은 관리자 화면/API 저장을 잡습니다.
+        동기화 이력이 없는 Django 전용 제품은 해시 없이 updated_at만으로 비교합니다.
+        """
+        from api.models import CatalogSyncState, Product
+
+        states = {
+            state.table_name: state.get_row_hashes()
+            for state in CatalogSyncState.objects.filter(table_name__in=['PRODUCT', 'PRODUCT_SPEC'])
+        }
+        products = states.get('PRODUCT') or {}
+        specs = states.get('PRODUCT_SPEC') or {}
+        return {
+            pid: (products.get(str(pid)), specs.get(str(pid)), updated_at.isoformat() if updated_at else None)
+            for pid, updated_at in Product.objects.filter(is_active=True).values_list('product_id', 'updated_at')
+        }
+
+    def _index_products(self, product_ids: Optional[Iterable[int]]):
+        """제품/스펙을 한 번씩 조회해 색인 (product_ids가 None이면 전체)"""
+        from api.models import Product, ProductSpecNew
+
+        products = Product.objects.filter(is_active=True)
+        specs = ProductSpecNew.objects.exclude(spec_value__isnull=True)
+        if product_ids is not None:
+            product_ids = list(product_ids)
+            if not product_ids:
+                return
+            for pid in product_ids:
+                self._remove_document(pid)
+            products = products.filter(product_id__in=product_ids)
+            specs = specs.filter(product_id__in=product_ids)
+
+        spec_values: Dict[int, List[str]] = defaultdict(list)
+        for pid, value in specs.order_by('product_id', 'spec_id').values_list('product_id', 'spec_value'):
+            bucket = spec_values[pid]
+            if len(bucket) < MAX_SPEC_VALUES and value and len(value) <= MAX_SPEC_VALUE_LENGTH:
+                bucket.append(value)
+
+        for product in products.iterator(chunk_size=2000):
+            self._add_document(product, spec_values.get(product.product_id, []))
+
+    def _add_document(self, product, spec_values: List[str]):
+        pid = product.product_id
+        name = product.product_name or product.name or ''
+        model = product.model_code or product.model_number or ''
+
+        terms: Dict[str, float] = defaultdict(float)
+        for field, text in (
+            ('name', name),
+            ('model', model),
+            ('spec', ' '.join(spec_values)),
+            ('description', product.description),
+        ):
+            weight = FIELD_WEIGHTS[field]
+            for token in tokenize(text):
+                terms[token] += weight
+
+        for term, tf in terms.items():
+            self._postings[term][pid] = tf
+        self._doc_terms[pid] = dict(terms)
+        self._doc_len[pid] = sum(terms.values())
+        self._total_len += self._doc_len[pid]
+        self._docs[pid] = {
+            'id': pid,
+            'name': name,
+            'model_number': model,
+            'category': product.category,
+            'main_category': product.main_category,
+            'category_display': product.get_category_display(),
+            'description': product.description,
+            'price': float(product.price) if product.price is not None else None,
+            'discount_price': float(product.discount_price) if product.discount_price else None,
+            'image_url': product.image_url,
+            'created_at': product.created_at.isoformat() if product.created_at else None,
+        }
+
+    def _remove_document(self, pid: int):
+        terms = self._doc_terms.pop(pid, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(pid, None)
+                if not postings:
+                    del self._postings[term]
+        self._total_len -= self._doc_len.pop(pid, 0.0)
+        self._docs.pop(pid, None)
+        self._doc_hashes.pop(pid, None)
+
+    def _rebuild_prefixes(self):
+        """자동완성용 (접두어 키, 제품 ID) 정렬 리스트"""
+        entries = set()
+        for pid, doc in self._docs.items():
+            for text in (doc['name'], doc['model_number']):
+                normalized = normalize(text).strip()
+                if not normalized:
+                    continue
+                entries.add((normalized, pid))
+                for word in normalized.split()[1:]:
+                    entries.add((word, pid))
+        self._prefixes = sorted(entries)
+
+
+# 싱글톤 인스턴스
+product_search_index = ProductSearchIndex()
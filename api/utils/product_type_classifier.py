@@ -2,11 +2,27 @@
 제품 종류 분류 유틸리티
 
 제품명에서 제품 종류를 추출하고 분류합니다.
+
+분류 결과는 두 단계로 캐시합니다.
+- Product.product_type: 저장/동기화 시 계산해 두는 비정규화 칼럼 (분류 불가는 UNCLASSIFIED)
+- 프로세스 내 제품 ID → 제품 종류 맵 (카탈로그 버전이 바뀌면 비움)
 """
 import re
+import threading
+from functools import lru_cache
 from typing import Optional, Dict, List
 from ..models import Product
 
+# product_type 칼럼에 저장하는 "분류 불가" 값 (빈 문자열은 아직 계산 안 됨)
+UNCLASSIFIED = '기타'
+
+# 프로세스 내 맵 최대 제품 수 (초과 시 전체 비움)
+MAX_CACHED_PRODUCTS = 50000
+
+_type_map_lock = threading.Lock()
+_type_map: Dict[int, Optional[str]] = {}
+_type_map_version = {'version': None}
+
 
 # 제품 종류 키워드 매핑 (우선순위 순서대로 - 더 구체적인 것부터)
 PRODUCT_TYPE_KEYWORDS = {
@@ -58,6 +74,8 @@ def extract_product_type(product: Product) -> Optional[str]:
     """
     제품명에서 제품 종류를 추출합니다.
     
+    프로세스 내 맵 → product_type 칼럼 → 제품명 분류 순으로 조회합니다.
+    
     Args:
         product: Product 객체
         
@@ -67,8 +85,65 @@ def extract_product_type(product: Product) -> Optional[str]:
     if not product or not product.name:
         return None
     
-    product_name_upper = product.name.upper()
-    product_name = product.name
+    product_id = product.pk
+    if product_id is not None:
+        _check_type_map_version()
+        if product_id in _type_map:
+            return _type_map[product_id]
+    
+    # only()/defer()로 칼럼이 빠진 경우 추가 쿼리를 만들지 않도록 __dict__에서 확인
+    stored = product.__dict__.get('product_type')
+    if stored:
+        product_type = None if stored == UNCLASSIFIED else stored
+    else:
+        product_type = classify_product_type(product.name, product.category)
+    
+    if product_id is not None:
+        with _type_map_lock:
+            if len(_type_map) >= MAX_CACHED_PRODUCTS:
+                _type_map.clear()
+            _type_map[product_id] = product_type
+    return product_type
+
+
+def product_type_column_value(name: Optional[str], category: Optional[str]) -> str:
+    """product_type 칼럼에 저장할 값 (분류 불가는 UNCLASSIFIED)"""
+    if not name:
+        return ''
+    return classify_product_type(name, category) or UNCLASSIFIED
+
+
+def clear_product_type_cache(product_id: int = None):
+    """프로세스 내 제품 종류 맵 비우기 (product_id 지정 시 해당 제품만)"""
+    with _type_map_lock:
+        if product_id is None:
+            _type_map.clear()
+        else:
+            _type_map.pop(product_id, None)
+
+
+def _check_type_map_version():
+    from .catalog_version import get_catalog_version
+    
+    version = get_catalog_version()
+    if _type_map_version['version'] == version:
+        return
+    with _type_map_lock:
+        if _type_map_version['version'] != version:
+            _type_map.clear()
+            _type_map_version['version'] = version
+
+
+@lru_cache(maxsize=8192)
+def classify_product_type(name: str, category: Optional[str]) -> Optional[str]:
+    """
+    제품명 + 카테고리로 제품 종류 분류 (extract_product_type의 계산 부분)
+    """
+    if not name:
+        return None
+    
+    product_name_upper = name.upper()
+    product_name = name
     
     # 특수 케이스: 컨버터블은 무조건 냉장고 (카테고리 오분류 방지)
     if '컨버터블' in product_name or 'CONVERTIBLE' in product_name_upper:
@@ -86,7 +161,6 @@ def extract_product_type(product: Product) -> Optional[str]:
                 return product_type
     
     # 카테고리 기반 기본 분류 (제품명 키워드가 없을 때만)
-    category = product.category
     if category == 'TV':
         # TV 카테고리지만 냉장고 키워드가 있으면 냉장고로 분류
         if any(kw in product_name_upper for kw in ['냉장고', '냉동고', '컨버터블', 'DIOS']):
@@ -0,0 +1,286 @@
+"""
+제품별 리뷰 키워드 인덱스 (오프라인 아티팩트)
+
+추천 문구 생성 시 매번 리뷰를 조회하고 텍스트를 다시 훑지 않도록,
+제품마다 취향/우선순위 키워드 등장 횟수와 긍정 키워드 순위를 미리 계산해 둡니다.
+
+- 등장 횟수: 키워드가 포함된 리뷰 수 (제품당 최신 리뷰 REVIEWS_PER_PRODUCT개 기준)
+- 저장 형식: 키워드는 어휘 목록의 인덱스로, 제품별 [인덱스, 횟수, 인덱스, 횟수, ...] 평탄 리스트
+- 어휘가 바뀌면(추천 문구 생성기의 키워드 수정) 이전 아티팩트는 무시됩니다.
+- 워커는 카탈로그 버전이 아티팩트와 다르면 파일을 다시 확인해(mtime이 바뀐 경우만 읽음)
+  다른 프로세스(sync_catalog)가 새로 만든 아티팩트를 재시작 없이 사용합니다.
+
+사용법:
+    python manage.py build_review_keyword_index
+"""
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.utils import timezone
+
+from api.utils.catalog_version import get_catalog_version
+
+# 아티팩트 포맷 버전 (구조가 바뀌면 올려서 이전 파일을 무시)
+INDEX_FORMAT_VERSION = 1
+
+# 제품당 분석할 최신 리뷰 수
+REVIEWS_PER_PRODUCT = 20
+
+# 제품당 저장할 긍정 키워드 수
+TOP_POSITIVE = 3
+
+DEFAULT_INDEX_PATH = Path(__file__).parent.parent / 'scoring_logic' / 'review_keyword_index.json'
+
+
+def get_index_path() -> Path:
+    return Path(getattr(settings, 'REVIEW_KEYWORD_INDEX_PATH', DEFAULT_INDEX_PATH))
+
+
+def count_keyword_hits(review_texts: Iterable[str], keywords: Sequence[str]) -> List[int]:
+    """키워드별로 해당 키워드가 포함된 리뷰 수 (keywords 순서)"""
+    counts = [0] * len(keywords)
+    for review in review_texts:
+        review_lower = review.lower()
+        for idx, keyword in enumerate(keywords):
+            if keyword in review_lower:
+                counts[idx] += 1
+    return counts
+
+
+class ReviewKeywordHits:
+    """제품 하나의 리뷰 키워드 집계"""
+
+    __slots__ = ('keyword_counts', 'positive')
+
+    def __init__(self, keyword_counts: Dict[str, int], positive: List[Tuple[str, int]]):
+        self.keyword_counts = keyword_counts
+        self.positive = positive
+
+    def match(self, target_keywords: Iterable[str], limit: int = 3) -> List[Tuple[str, int]]:
+        """취향 키워드 중 리뷰에 많이 나온 순 (횟수 내림차순, 같으면 키워드 순)"""
+        counts = self.keyword_counts
+        matches = [(keyword, counts[keyword]) for keyword in set(target_keywords) if keyword in counts]
+        matches.sort(key=lambda x: (-x[1], x[0]))
+        return matches[:limit]
+
+    @classmethod
+    def from_reviews(
+        cls,
+        review_texts: List[str],
+        keywords: Sequence[str],
+        positive_words: Sequence[str],
+    ) -> 'ReviewKeywordHits':
+        """리뷰 텍스트에서 직접 집계 (인덱스가 없을 때)"""
+        keyword_counts = {
+            keyword: count
+            for keyword, count in zip(keywords, count_keyword_hits(review_texts, keywords))
+            if count
+        }
+        positive_counts = count_keyword_hits(review_texts, positive_words)
+        positive = sorted(
+            ((word, count) for word, count in zip(positive_words, positive_counts) if count),
+            key=lambda x: (-x[1], positive_words.index(x[0])),
+        )[:TOP_POSITIVE]
+        return cls(keyword_counts, positive)
+
+
+class ReviewKeywordIndex:
+    """리뷰 키워드 인덱스 (아티팩트 로드 + 제품별 조회)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._keywords: List[str] = []
+        self._positive_words: List[str] = []
+        self._products: Dict[int, Tuple[tuple, tuple]] = {}
+        self._loaded = False
+        self._catalog_version = None
+        self._mtime = None
+        self._checked_version = None
+        self._checked_at = 0.0
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    def needs_check(self) -> bool:
+        """
+        아티팩트를 다시 확인해야 하는지 여부
+
+        로드한 아티팩트의 카탈로그 버전이 현재 버전과 다르면(또는 아직 로드 전이면)
+        CATALOG_VERSION_CHECK_INTERVAL초마다 True를 반환합니다.
+        (sync_catalog는 버전을 올린 뒤 아티팩트를 만들므로 버전이 바뀐 직후 한 번만 확인하면 놓칠 수 있음)
+        """
+        version = get_catalog_version()
+        if self._loaded and self._catalog_version == version:
+            return False
+        now = time.monotonic()
+        if self._checked_version == version and now - self._checked_at < getattr(settings, 'CATALOG_VERSION_CHECK_INTERVAL', 5):
+            return False
+        self._checked_version = version
+        self._checked_at = now
+        return True
+
+    def load(self, keywords: Sequence[str], positive_words: Sequence[str], path: Path = None) -> bool:
+        """
+        아티팩트 로드
+
+        파일이 바뀌지 않았으면 다시 읽지 않습니다 (mtime 비교).
+        아티팩트의 어휘가 현재 어휘와 다르면 로드하지 않습니다 (호출자는 리뷰 직접 분석으로 폴백).
+        """
+        path = path or get_index_path()
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return self._loaded
+        if self._loaded and mtime == self._mtime and self._keywords == list(keywords) \
+                and self._positive_words == list(positive_words):
+            return True
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                artifact = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"[ReviewKeywordIndex] 아티팩트 로드 실패: {e}", flush=True)
+            return False
+
+        if artifact.get('format_version') != INDEX_FORMAT_VERSION:
+            return False
+        if artifact.get('keywords') != list(keywords) or artifact.get('positive_words') != list(positive_words):
+            print("[ReviewKeywordIndex] 키워드 어휘가 바뀌어 아티팩트를 사용하지 않습니다.", flush=True)
+            return False
+
+        # 평탄 리스트 → 튜플 (제품당 메모리 최소화)
+        products = {
+            int(pid): (tuple(entry.get('k', ())), tuple(entry.get('p', ())))
+            for pid, entry in artifact.get('products', {}).items()
+        }
+        with self._lock:
+            self._keywords = list(keywords)
+            self._positive_words = list(positive_words)
+            self._products = products
+            self._catalog_version = artifact.get('catalog_version')
+            self._mtime = mtime
+            self._loaded = True
+        print(
+            f"[ReviewKeywordIndex] 로드 완료: 제품 {len(products)}개 (카탈로그 v{self._catalog_version})",
+            flush=True
+        )
+        return True
+
+    def get(self, product_id: int) -> Optional[ReviewKeywordHits]:
+        """
+        제품 리뷰 키워드 집계 (리뷰가 없는 제품은 None)
+
+        인덱스가 로드되지 않았을 때는 호출하지 말고 is_loaded로 먼저 확인합니다.
+        """
+        entry = self._products.get(product_id)
+        if entry is None:
+            return None
+        flat_keywords, flat_positive = entry
+        keywords, positive_words = self._keywords, self._positive_words
+        keyword_counts = {
+            keywords[flat_keywords[i]]: flat_keywords[i + 1]
+            for i in range(0, len(flat_keywords), 2)
+        }
+        positive = [
+            (positive_words[flat_positive[i]], flat_positive[i + 1])
+            for i in range(0, len(flat_positive), 2)
+        ]
+        return ReviewKeywordHits(keyword_counts, positive)
+
+    def clear(self):
+        with self._lock:
+            self._products = {}
+            self._loaded = False
+            self._mtime = None
+            self._checked_version = None
+
+    def stats(self) -> Dict:
+        return {
+            'loaded': self._loaded,
+            'products': len(self._products),
+            'catalog_version': self._catalog_version,
+        }
+
+
+def build_review_keyword_index_artifact(path: Path = None) -> Dict:
+    """
+    전체 리뷰를 한 번 훑어 제품별 키워드 인덱스를 만들고 아티팩트로 저장
+
+    Returns:
+        저장된 아티팩트 (products 제외한 요약은 'stats' 키)
+    """
+    from api.models import ProductReview
+    from api.services.recommendation_reason_generator import reason_generator
+
+    started = time.time()
+    path = path or get_index_path()
+    keywords, positive_words = reason_generator.review_vocabulary()
+
+    products = {}
+    reviews_scanned = 0
+
+    def flush(product_id, texts):
+        if not texts:
+            return
+        keyword_counts = count_keyword_hits(texts, keywords)
+        flat_keywords = []
+        for idx, count in sorted(enumerate(keyword_counts), key=lambda x: (-x[1], x[0])):
+            if count:
+                flat_keywords.extend((idx, count))
+        positive_counts = count_keyword_hits(texts, positive_words)
+        flat_positive = []
+        for idx, count in sorted(enumerate(positive_counts), key=lambda x: (-x[1], x[0]))[:TOP_POSITIVE]:
+            if count:
+                flat_positive.extend((idx, count))
+        products[str(product_id)] = {'k': flat_keywords, 'p': flat_positive}
+
+    # 제품별 최신순으로 한 번만 순회 (제품당 REVIEWS_PER_PRODUCT개까지)
+    current_id, texts = None, []
+    rows = (
+        ProductReview.objects
+        .exclude(review_text='')
+        .order_by('product_id', '-created_at', '-id')
+        .values_list('product_id', 'review_text')
+        .iterator(chunk_size=5000)
+    )
+    for product_id, text in rows:
+        if product_id != current_id:
+            flush(current_id, texts)
+            current_id, texts = product_id, []
+        if len(texts) < REVIEWS_PER_PRODUCT:
+            texts.append(text)
+            reviews_scanned += 1
+    flush(current_id, texts)
+
+    artifact = {
+        'format_version': INDEX_FORMAT_VERSION,
+        'catalog_version': get_catalog_version(refresh=True),
+        'generated_at': timezone.now().isoformat(),
+        'reviews_per_product': REVIEWS_PER_PRODUCT,
+        'keywords': list(keywords),
+        'positive_words': list(positive_words),
+        'products': products,
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(artifact, f, ensure_ascii=False, separators=(',', ':'))
+    tmp_path.replace(path)
+
+    artifact['stats'] = {
+        'products': len(products),
+        'reviews': reviews_scanned,
+        'bytes': path.stat().st_size,
+        'elapsed': round(time.time() - started, 2),
+    }
+    print(f"[ReviewKeywordIndex] 아티팩트 저장: {path} {artifact['stats']}", flush=True)
+    return artifact
+
+
+# 싱글톤 인스턴스
+review_keyword_index = ReviewKeywordIndex()
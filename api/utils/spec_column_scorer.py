@@ -8,7 +8,9 @@ import json
 from typing import Dict, List, Optional, Tuple
 from collections import defaultdict
 from ..models import Product, ProductSpec
+from .catalog_version import get_catalog_version
 from .product_type_classifier import extract_product_type, group_products_by_type
+from .spec_schema import build_schema, get_schema_path, load_schema_artifact
 
 
 class SpecColumnScorer:
@@ -26,6 +28,17 @@ class SpecColumnScorer:
         
         # SPEC_KEY별 전체 등장 빈도
         self.spec_key_total_frequency = defaultdict(int)
+        
+        # 제품 종류별 스펙 보유 제품 수 / SPEC_KEY 중요도 (스키마 아티팩트 기준)
+        self.product_count_by_type = {}
+        self.spec_key_importance = {}
+        self.total_products = 0
+        
+        # 스키마 출처 ('artifact' | 'request' | None) 및 갱신 확인용 상태
+        self.schema_source = None
+        self.schema_catalog_version = None
+        self._schema_mtime = None
+        self._checked_version = None
     
     def analyze_spec_structure(self, products: List[Product]) -> Dict:
         """
@@ -35,67 +48,31 @@ class SpecColumnScorer:
         - VARIANT 칼럼 식별 (제품 종류별로 다름)
         - SPEC_KEY별 등장 빈도 계산
         
+        전체 카탈로그 기준 분석은 build_spec_schema 명령어로 미리 계산해 두고
+        load_schema_artifact()로 읽는 것을 권장합니다. (이 메서드는 아티팩트가 없을 때의 폴백)
+        
         Returns:
             분석 결과 딕셔너리
         """
         print("[SpecColumnScorer] 제품 스펙 구조 분석 시작...")
         
-        # 제품 종류별로 그룹화
-        products_by_type = group_products_by_type(products)
-        
-        # 제품 종류별 SPEC_KEY 수집
-        spec_keys_by_type = defaultdict(set)
-        all_spec_keys = set()
-        
-        total_products = 0
-        for product_type, type_products in products_by_type.items():
-            for product in type_products:
-                if not hasattr(product, 'spec') or not product.spec:
-                    continue
-                
-                try:
-                    spec_json = json.loads(product.spec.spec_json)
-                    if isinstance(spec_json, dict):
-                        spec_keys = set(spec_json.keys())
-                        spec_keys_by_type[product_type].update(spec_keys)
-                        all_spec_keys.update(spec_keys)
-                        
-                        # 등장 빈도 계산
-                        for key in spec_keys:
-                            self.spec_key_frequency[product_type][key] += 1
-                            self.spec_key_total_frequency[key] += 1
-                        
-                        total_products += 1
-                except (json.JSONDecodeError, AttributeError):
-                    continue
-        
-        # COMMON 칼럼 식별: 모든 제품 종류에서 100% 존재하는 칼럼
-        common_spec_keys = set(all_spec_keys)
-        for product_type, keys in spec_keys_by_type.items():
-            type_product_count = len([p for p in products_by_type[product_type] if hasattr(p, 'spec') and p.spec])
-            if type_product_count == 0:
+        records = []
+        for product in products:
+            if not hasattr(product, 'spec') or not product.spec:
                 continue
-            
-            # 해당 제품 종류에서 100% 존재하는 칼럼만
-            type_common_keys = set()
-            for key in keys:
-                frequency = self.spec_key_frequency[product_type][key]
-                if frequency == type_product_count:  # 100% 존재
-                    type_common_keys.add(key)
-            
-            # 모든 제품 종류에서 공통인 칼럼만 남김
-            common_spec_keys = common_spec_keys.intersection(type_common_keys)
-        
-        self.common_spec_keys = list(common_spec_keys)
+            try:
+                spec_json = json.loads(product.spec.spec_json)
+            except (json.JSONDecodeError, AttributeError):
+                continue
+            if isinstance(spec_json, dict):
+                records.append((extract_product_type(product) or '기타', set(spec_json.keys())))
         
-        # VARIANT 칼럼 식별: 제품 종류별로 다른 칼럼
-        for product_type, keys in spec_keys_by_type.items():
-            variant_keys = keys - common_spec_keys
-            self.variant_spec_keys_by_type[product_type].update(variant_keys)
+        self.apply_schema(build_schema(records))
+        self.schema_source = 'request'
         
         print(f"[SpecColumnScorer] 분석 완료:")
-        print(f"  - 총 제품 수: {total_products}")
-        print(f"  - 제품 종류 수: {len(products_by_type)}")
+        print(f"  - 총 제품 수: {self.total_products}")
+        print(f"  - 제품 종류 수: {len(self.product_count_by_type)}")
         print(f"  - COMMON 칼럼 수: {len(self.common_spec_keys)}")
         print(f"  - COMMON 칼럼: {self.common_spec_keys[:10]}...")
         
@@ -103,14 +80,79 @@ class SpecColumnScorer:
             print(f"  - {product_type} VARIANT 칼럼: {len(variant_keys)}개")
         
         return {
-            'common_spec_keys': list(common_spec_keys),
+            'common_spec_keys': list(self.common_spec_keys),
             'variant_spec_keys_by_type': {
                 k: list(v) for k, v in self.variant_spec_keys_by_type.items()
             },
-            'total_products': total_products,
+            'total_products': self.total_products,
             'spec_key_frequency': dict(self.spec_key_frequency)
         }
     
+    def apply_schema(self, schema: Dict):
+        """build_schema() 결과(또는 저장된 아티팩트)로 칼럼 정보 교체"""
+        self.common_spec_keys = list(schema.get('common_spec_keys', []))
+        self.variant_spec_keys_by_type = defaultdict(set)
+        self.spec_key_frequency = defaultdict(lambda: defaultdict(int))
+        self.spec_key_importance = {}
+        self.product_count_by_type = {}
+        
+        for product_type, info in schema.get('types', {}).items():
+            self.variant_spec_keys_by_type[product_type] = set(info.get('variant_keys', []))
+            self.spec_key_frequency[product_type].update(info.get('key_frequency', {}))
+            self.spec_key_importance[product_type] = dict(info.get('importance', {}))
+            self.product_count_by_type[product_type] = info.get('product_count', 0)
+        
+        self.spec_key_total_frequency = defaultdict(int, schema.get('spec_key_total_frequency', {}))
+        self.total_products = schema.get('total_products', 0)
+        self.schema_catalog_version = schema.get('catalog_version')
+    
+    def load_schema_artifact(self, force: bool = False) -> bool:
+        """
+        build_spec_schema 명령어가 저장한 전체 카탈로그 스키마 로드
+        
+        파일이 바뀌지 않았으면 다시 읽지 않습니다 (mtime 비교).
+        
+        Returns:
+            스키마가 적용되어 있으면 True
+        """
+        path = get_schema_path()
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return self.schema_source == 'artifact'
+        
+        if not force and self.schema_source == 'artifact' and mtime == self._schema_mtime:
+            return True
+        
+        artifact = load_schema_artifact(path)
+        if artifact is None:
+            return self.schema_source == 'artifact'
+        
+        self.apply_schema(artifact)
+        self.schema_source = 'artifact'
+        self._schema_mtime = mtime
+        print(
+            f"[SpecColumnScorer] 스키마 아티팩트 로드: 제품 {self.total_products}개, "
+            f"종류 {len(self.product_count_by_type)}개 (catalog_version={self.schema_catalog_version})",
+            flush=True
+        )
+        return True
+    
+    def ensure_schema(self, products: List[Product]):
+        """
+        스키마 준비
+        
+        카탈로그 버전이 바뀌면 아티팩트를 다시 확인하고, 아티팩트가 없을 때만 요청 제품으로 분석합니다.
+        """
+        version = get_catalog_version()
+        if self.schema_source is not None and self._checked_version == version:
+            return
+        self._checked_version = version
+        if self.load_schema_artifact():
+            return
+        if self.schema_source is None:
+            self.analyze_spec_structure(products)
+    
     def get_scoring_spec_keys(
         self,
         product_type: str,
@@ -195,8 +237,10 @@ class SpecColumnScorer:
     
     def _get_product_count_by_type(self, product_type: str) -> int:
         """제품 종류별 제품 수 반환"""
-        # 실제 구현에서는 DB에서 조회하거나 캐시 사용
-        # 여기서는 frequency 데이터 기반으로 추정
+        if product_type in self.product_count_by_type:
+            return self.product_count_by_type[product_type]
+        
+        # 스키마에 없으면 frequency 데이터 기반으로 추정
         max_count = 0
         for key, count in self.spec_key_frequency[product_type].items():
             max_count = max(max_count, count)
@@ -0,0 +1,215 @@
+"""
+카탈로그 전체 SPEC 스키마 분석 (오프라인 아티팩트)
+
+SpecColumnScorer가 사용하는 COMMON/VARIANT 칼럼과 제품 종류별 SPEC_KEY 빈도를
+전체 카탈로그 기준으로 미리 계산해 JSON 아티팩트로 저장합니다.
+워커는 기동 시 아티팩트를 읽기만 하므로 첫 요청에서 스펙 JSON을 디코딩하지 않습니다.
+
+재계산은 증분으로 동작합니다.
+- 제품 종류(extract_product_type)는 제품명만 보므로 매번 전체 제품에 대해 다시 계산
+- 스펙 키 목록은 ProductSpec.ingested_at이 이전 아티팩트 생성 시각 이후인 제품만 다시 디코딩
+
+사용법:
+    python manage.py build_spec_schema          # 증분 재계산
+    python manage.py build_spec_schema --full   # 전체 재계산
+"""
+import json
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.utils import timezone
+
+# 아티팩트 포맷 버전 (구조가 바뀌면 올려서 이전 파일을 무시)
+SCHEMA_FORMAT_VERSION = 1
+
+DEFAULT_SCHEMA_PATH = Path(__file__).parent.parent / 'scoring_logic' / 'spec_schema.json'
+
+
+def get_schema_path() -> Path:
+    return Path(getattr(settings, 'SPEC_SCHEMA_PATH', DEFAULT_SCHEMA_PATH))
+
+
+def build_schema(records: Iterable[Tuple[str, Optional[Set[str]]]]) -> Dict:
+    """
+    (제품 종류, 스펙 키 집합) 레코드로 스키마 계산
+
+    스펙이 없는 제품은 키 집합을 None으로 전달합니다 (제품 수에는 포함되지 않음).
+
+    - COMMON 칼럼: 모든 제품 종류에서 100% 존재하는 칼럼
+    - VARIANT 칼럼: 제품 종류별 나머지 칼럼
+    - importance: 해당 종류 내 등장 비율 × 종류 특이도 (적은 종류에만 있는 칼럼일수록 높음)
+    """
+    key_frequency: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    product_count: Dict[str, int] = defaultdict(int)
+    total_frequency: Dict[str, int] = defaultdict(int)
+    total_products = 0
+
+    for product_type, spec_keys in records:
+        if spec_keys is None:
+            continue
+        product_count[product_type] += 1
+        total_products += 1
+        for key in spec_keys:
+            key_frequency[product_type][key] += 1
+            total_frequency[key] += 1
+
+    common_keys: Optional[Set[str]] = None
+    for product_type, frequencies in key_frequency.items():
+        count = product_count[product_type]
+        type_common = {key for key, freq in frequencies.items() if freq == count}
+        common_keys = type_common if common_keys is None else common_keys & type_common
+    common_keys = common_keys or set()
+
+    types_with_key: Dict[str, int] = defaultdict(int)
+    for frequencies in key_frequency.values():
+        for key in frequencies:
+            types_with_key[key] += 1
+    num_types = len(key_frequency) or 1
+
+    types = {}
+    for product_type, frequencies in key_frequency.items():
+        count = product_count[product_type]
+        importance = {}
+        for key, freq in frequencies.items():
+            coverage = freq / count if count else 0.0
+            specificity = 1.0 - (types_with_key[key] - 1) / num_types
+            importance[key] = round(coverage * specificity, 4)
+        types[product_type] = {
+            'product_count': count,
+            'key_frequency': dict(sorted(frequencies.items())),
+            'variant_keys': sorted(set(frequencies) - common_keys),
+            'importance': dict(sorted(importance.items(), key=lambda x: (-x[1], x[0]))),
+        }
+
+    return {
+        'format_version': SCHEMA_FORMAT_VERSION,
+        'total_products': total_products,
+        'common_spec_keys': sorted(common_keys),
+        'spec_key_total_frequency': dict(sorted(total_frequency.items())),
+        'types': dict(sorted(types.items())),
+    }
+
+
+def _decode_spec_keys(spec_json: Optional[str]) -> Optional[List[str]]:
+    try:
+        spec = json.loads(spec_json or '')
+    except (json.JSONDecodeError, TypeError):
+        return None
+    return sorted(spec.keys()) if isinstance(spec, dict) else None
+
+
+def load_schema_artifact(path: Path = None) -> Optional[Dict]:
+    """저장된 아티팩트 로드 (없거나 포맷이 다르면 None)"""
+    path = path or get_schema_path()
+    if not path.exists():
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            artifact = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"[SpecSchema] 아티팩트 로드 실패: {e}", flush=True)
+        return None
+    if artifact.get('format_version') != SCHEMA_FORMAT_VERSION:
+        return None
+    return artifact
+
+
+def build_spec_schema_artifact(full: bool = False, path: Path = None) -> Dict:
+    """
+    전체 카탈로그 SPEC 스키마 계산 후 아티팩트로 저장
+
+    Args:
+        full: True면 이전 아티팩트를 무시하고 모든 스펙을 다시 디코딩
+
+    Returns:
+        저장된 아티팩트 (products 제외한 요약은 'stats' 키)
+    """
+    from api.models import Product, ProductSpec
+    from api.utils.catalog_version import get_catalog_version
+    from api.utils.product_type_classifier import extract_product_type
+
+    started = time.time()
+    path = path or get_schema_path()
+    previous = None if full else load_schema_artifact(path)
+    previous_products = (previous or {}).get('products', {})
+    since = None
+    if previous and previous.get('generated_at'):
+        since = datetime.fromisoformat(previous['generated_at'])
+
+    generated_at = timezone.now()
+
+    # 스펙 키: 바뀐 스펙만 디코딩
+    specs = ProductSpec.objects.all()
+    if since is not None:
+        specs = specs.filter(ingested_at__gte=since)
+    changed_keys = {
+        product_id: _decode_spec_keys(spec_json)
+        for product_id, spec_json in specs.values_list('product_id', 'spec_json').iterator(chunk_size=2000)
+    }
+    spec_product_ids = set(ProductSpec.objects.values_list('product_id', flat=True))
+
+    # extract_product_type이 읽는 칼럼까지 함께 조회 (지연 로딩으로 제품마다 쿼리가 나가지 않도록)
+    active_products = list(
+        Product.objects.filter(is_active=True).only('product_id', 'name', 'category', 'product_type')
+    )
+
+    # 이전 아티팩트에 없던 제품(재활성화 등)은 스펙이 오래됐어도 한 번에 디코딩
+    missing_ids = [
+        p.product_id for p in active_products
+        if p.product_id in spec_product_ids
+        and p.product_id not in changed_keys
+        and str(p.product_id) not in previous_products
+    ]
+    if missing_ids:
+        changed_keys.update(
+            (product_id, _decode_spec_keys(spec_json))
+            for product_id, spec_json in ProductSpec.objects.filter(
+                product_id__in=missing_ids
+            ).values_list('product_id', 'spec_json')
+        )
+
+    products = {}
+    for product in active_products:
+        pid = product.product_id
+        if pid not in spec_product_ids:
+            keys = None
+        elif pid in changed_keys:
+            keys = changed_keys[pid]
+        else:
+            keys = previous_products[str(pid)].get('keys')
+        products[str(pid)] = {
+            'type': extract_product_type(product) or '기타',
+            'keys': keys,
+        }
+
+    schema = build_schema(
+        (record['type'], set(record['keys']) if record['keys'] is not None else None)
+        for record in products.values()
+    )
+    artifact = dict(
+        schema,
+        catalog_version=get_catalog_version(refresh=True),
+        generated_at=generated_at.isoformat(),
+        products=products,
+    )
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(artifact, f, ensure_ascii=False)
+    tmp_path.replace(path)
+
+    artifact['stats'] = {
+        'mode': 'full' if previous is None else 'incremental',
+        'products': len(products),
+        'decoded_specs': len(changed_keys),
+        'types': len(schema['types']),
+        'common_spec_keys': len(schema['common_spec_keys']),
+        'elapsed': round(time.time() - started, 2),
+    }
+    print(f"[SpecSchema] 아티팩트 저장: {path} {artifact['stats']}", flush=True)
+    return artifact
@@ -5,7 +5,8 @@ Taste별 MAIN CATEGORY 선택 로직
 """
 from typing import List, Dict
 from api.utils.taste_classifier import taste_classifier
-from api.db.oracle_client import get_connection
+from api.utils.category_inventory import category_inventory
+from api.utils.category_selection_cache import category_selection_cache
 
 
 class TasteCategorySelector:
@@ -19,61 +20,15 @@ class TasteCategorySelector:
     @staticmethod
     def get_available_categories() -> List[str]:
         """
-        Oracle DB의 PRODUCT 테이블에서 실제 존재하는 MAIN_CATEGORY 목록 가져오기
-        Oracle DB 연결 실패 시 Django Product 모델에서 가져오기 (Fallback)
+        PRODUCT 테이블에서 판매중 제품이 있는 MAIN_CATEGORY 목록 가져오기
+        
+        카테고리 인벤토리(메모리 캐시)에서 조회하므로 요청마다 PRODUCT를 집계하지 않습니다.
+        인벤토리는 카탈로그 버전이 바뀌면 다시 적재되며, Oracle 연결 실패 시 Django Product로 집계합니다.
         
         Returns:
             활성 제품이 있는 카테고리 리스트 (제품 수 많은 순서)
         """
-        try:
-            with get_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT MAIN_CATEGORY, COUNT(*) as cnt
-                        FROM PRODUCT
-                        WHERE MAIN_CATEGORY IS NOT NULL
-                          AND STATUS = '판매중'
-                          AND PRICE > 0
-                          AND PRICE IS NOT NULL
-                        GROUP BY MAIN_CATEGORY
-                        ORDER BY cnt DESC
-                    """)
-                    results = cur.fetchall()
-                    return [row[0] for row in results]
-        except Exception as e:
-            # Oracle DB 연결 실패 시 Django Product 모델에서 가져오기
-            from api.models import Product
-            from api.utils.category_mapping import DJANGO_CATEGORY_TO_MAIN_CATEGORIES
-            from django.db.models import Count
-            
-            # Django Product에서 실제 존재하는 MAIN_CATEGORY 추출
-            categories = set()
-            products = Product.objects.filter(is_active=True, price__gt=0)
-            
-            for product in products:
-                if hasattr(product, 'spec') and product.spec and product.spec.spec_json:
-                    import json
-                    try:
-                        spec_data = json.loads(product.spec.spec_json)
-                        main_cat = spec_data.get('MAIN_CATEGORY', '').strip()
-                        if main_cat:
-                            categories.add(main_cat)
-                    except:
-                        pass
-                
-                # spec이 없으면 Django category를 MAIN_CATEGORY로 매핑
-                if not categories:
-                    django_cat = product.category
-                    main_cats = DJANGO_CATEGORY_TO_MAIN_CATEGORIES.get(django_cat, [])
-                    if main_cats:
-                        categories.add(main_cats[0])  # 첫 번째 MAIN_CATEGORY 사용
-            
-            # 기본 카테고리 목록 (fallback)
-            if not categories:
-                categories = {'TV', '냉장고', '에어컨', '세탁기', '청소기', '공기청정기'}
-            
-            # 제품 수 기준으로 정렬 (간단하게)
-            return sorted(list(categories))
+        return category_inventory.get_available_categories()
     
     @staticmethod
     def get_essential_categories() -> List[str]:
@@ -117,6 +72,20 @@ class TasteCategorySelector:
         
         Returns:
             선택된 MAIN CATEGORY 리스트 (점수 내림차순 정렬)
+        
+        결과는 taste_id가 아니라 카탈로그 버전 + num_categories + 온보딩 시그니처에만 의존하므로
+        category_selection_cache(LRU + 사전 계산 테이블)에서 먼저 조회합니다.
+        """
+        return category_selection_cache.get_or_compute(
+            onboarding_data,
+            num_categories,
+            lambda: TasteCategorySelector._select_categories_uncached(onboarding_data, num_categories),
+        )
+    
+    @staticmethod
+    def _select_categories_uncached(onboarding_data: Dict, num_categories: int = None) -> List[str]:
+        """
+        캐시 없이 카테고리 점수 계산 + 컷오프 분석으로 선택 (select_categories_for_taste 참고)
         """
         if not onboarding_data:
             onboarding_data = {}
@@ -1,12 +1,12 @@
-from django.http import JsonResponse, HttpResponse
+from django.http import JsonResponse, HttpResponse, StreamingHttpResponse
 from django.shortcuts import render
 from django.views.decorators.csrf import csrf_exempt
-from django.views.decorators.http import require_http_methods
+from django.views.decorators.http import require_http_methods, condition
 from django.utils import timezone
 from django.conf import settings
+from django.db import transaction
 import json
 import os
-import requests
 from pathlib import Path
 from .models import Product, OnboardingSession, Portfolio, ProductReview, Cart, Wishlist, ProductRecommendReason, ProductDemographics, Reservation, ProductSpec
 from .views_erd_helpers import (
@@ -17,13 +17,21 @@ from .rule_engine import build_profile, recommend_products
 from .services.recommendation_engine import recommendation_engine
 from .services.chatgpt_service import chatgpt_service
 from .services.onboarding_db_service import onboarding_db_service
+from .services.onboarding_write_buffer import onboarding_write_buffer
+from .services.outbox_service import outbox_service, EVENT_ONBOARDING_COMPLETED
 from .services.taste_calculation_service import taste_calculation_service
 from .services.portfolio_service import portfolio_service
 from .services.kakao_auth_service import kakao_auth_service
 from .services.kakao_message_service import kakao_message_service
 from .services.ai_recommendation_service import ai_recommendation_service
 from .services.product_comparison_service import product_comparison_service
+from .services.product_detail_service import product_detail_service
+from .services.review_summary_service import review_summary_service
+from .utils.product_search_index import product_search_index
+from .utils.http_client import http_client
+from .utils.llm_cache import llm_response_cache
 from .db.oracle_client import DatabaseDisabledError
+from .db.demographics_repository import demographics_repository
 
 
 def download_product_image(image_url: str, product_id: int) -> str:
@@ -65,12 +73,14 @@ def download_product_image(image_url: str, product_id: int) -> str:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
-        response = requests.get(image_url, headers=headers, timeout=10)
+        response = http_client.get(image_url, headers=headers)
         response.raise_for_status()
         
-        # 이미지 데이터 저장
-        with open(filepath, 'wb') as f:
+        # 이미지 데이터 저장 (임시 파일에 쓴 뒤 교체 - 동시 다운로드/중단 시 깨진 캐시 파일 방지)
+        tmp_path = filepath.with_name(f"{filename}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
             f.write(response.content)
+        os.replace(tmp_path, filepath)
         
         print(f"[download_product_image] ✅ 이미지 다운로드 완료: {filepath}", flush=True)
         return f'/static/images/products/{filename}'
@@ -1479,28 +1489,21 @@ def product_recommend_reason_view(request, product_id):
 def product_demographics_view(request, product_id):
     """GET /api/products/<product_id>/demographics/ - 제품 인구통계 조회"""
     try:
-        product = Product.objects.get(id=product_id)
+        product = Product.objects.select_related('demographics').get(product_id=product_id)
         
         # ProductDemographics가 있으면 반환
         if hasattr(product, 'demographics'):
             demographics = product.demographics
             
-            # 정규화 테이블에서 데이터 가져오기 시도
-            family_types = demographics.get_family_types_from_normalized()
-            house_sizes = demographics.get_house_sizes_from_normalized()
-            house_types = demographics.get_house_types_from_normalized()
-            
-            # 정규화 테이블에 데이터가 없으면 JSONField에서 가져오기
-            if not family_types:
-                family_types = demographics.family_types if isinstance(demographics.family_types, list) else []
-            if not house_sizes:
-                house_sizes = demographics.house_sizes if isinstance(demographics.house_sizes, list) else []
-            if not house_types:
-                house_types = demographics.house_types if isinstance(demographics.house_types, list) else []
+            # 정규화 테이블 3개를 한 번에 조회 (비어 있으면 JSONField 폴백)
+            resolved = demographics_repository.resolve_many([demographics])[demographics.product_id]
+            family_types = resolved['family_types']
+            house_sizes = resolved['house_sizes']
+            house_types = resolved['house_types']
             
             return JsonResponse({
                 'success': True,
-                'product_id': product.id,
+                'product_id': product.product_id,
                 'product_name': product.name,
                 'family_types': family_types,
                 'house_sizes': house_sizes,
@@ -1511,7 +1514,7 @@ def product_demographics_view(request, product_id):
         else:
             return JsonResponse({
                 'success': True,
-                'product_id': product.id,
+                'product_id': product.product_id,
                 'product_name': product.name,
                 'family_types': [],
                 'house_sizes': [],
@@ -1531,6 +1534,35 @@ def product_demographics_view(request, product_id):
         }, json_dumps_params={'ensure_ascii': False}, status=400)
 
 
+def _product_detail_etag(request, product_id):
+    return product_detail_service.get_etag(int(product_id))
+
+
+@require_http_methods(["GET"])
+@condition(etag_func=_product_detail_etag)
+def product_detail_view(request, product_id):
+    """
+    GET /api/products/<product_id>/detail/ - 제품 상세 통합 조회
+    
+    스펙, 리뷰(상위 3개 + 통계), 추천 이유, 인구통계, 이미지를 한 번에 반환합니다.
+    (제품 + 카탈로그 버전 단위 캐시, ETag / If-None-Match 지원)
+    """
+    detail = product_detail_service.get_detail(int(product_id))
+    if detail is None:
+        return JsonResponse({
+            'success': False,
+            'error': '제품을 찾을 수 없습니다.'
+        }, json_dumps_params={'ensure_ascii': False}, status=404)
+    
+    payload, _ = detail
+    response = JsonResponse(
+        dict(payload, success=True),
+        json_dumps_params={'ensure_ascii': False}
+    )
+    response['Cache-Control'] = 'no-cache'
+    return response
+
+
 @require_http_methods(["GET"])
 def product_image_by_name_view(request):
     """
@@ -2190,7 +2222,10 @@ def onboarding_step_view(request):
             print(f"    media = {media_value} (타입: {type(media_value).__name__})", flush=True)
             print(f"{'='*80}\n", flush=True)
             
-            onboarding_db_service.create_or_update_session(
+            # write-behind 모드: 단계별 저장은 로컬 버퍼에만 기록하고 완료 시 한 번에 Oracle 커밋
+            onboarding_writer = onboarding_write_buffer if onboarding_write_buffer.enabled else onboarding_db_service
+            
+            onboarding_writer.create_or_update_session(
                 session_id=session_id,
                 user_id=data.get('user_id'),
                 member_id=data.get('member_id'),
@@ -2218,7 +2253,7 @@ def onboarding_step_view(request):
             if step == 1:
                 # Step 1: vibe
                 if step_data.get('vibe'):
-                    onboarding_db_service.save_user_response(
+                    onboarding_writer.save_user_response(
                         session_id=session_id,
                         step_number=1,
                         question_type='vibe',
@@ -2228,7 +2263,7 @@ def onboarding_step_view(request):
             elif step == 2:
                 # Step 2: mate
                 if step_data.get('mate'):
-                    onboarding_db_service.save_user_response(
+                    onboarding_writer.save_user_response(
                         session_id=session_id,
                         step_number=2,
                         question_type='mate',
@@ -2236,7 +2271,7 @@ def onboarding_step_view(request):
                     )
                 # Step 2: pet
                 if step_data.get('pet'):
-                    onboarding_db_service.save_user_response(
+                    onboarding_writer.save_user_response(
                         session_id=session_id,
                         step_number=2,
                         question_type='pet',
@@ -2246,7 +2281,7 @@ def onboarding_step_view(request):
             elif step == 3:
                 # Step 3: housing_type
                 if step_data.get('housing_type'):
-                    onboarding_db_service.save_user_response(
+                    onboarding_writer.save_user_response(
                         session_id=session_id,
                         step_number=3,
                         question_type='housing_type',
@@ -2256,14 +2291,14 @@ def onboarding_step_view(request):
                 if step_data.get('main_space'):
                     main_spaces = step_data.get('main_space')
                     if isinstance(main_spaces, list):
-                        onboarding_db_service.save_multiple_responses(
+                        onboarding_writer.save_multiple_responses(
                             session_id=session_id,
                             step_number=3,
                             question_type='main_space',
                             answer_values=main_spaces
                         )
                     else:
-                        onboarding_db_service.save_user_response(
+                        onboarding_writer.save_user_response(
                             session_id=session_id,
                             step_number=3,
                             question_type='main_space',
@@ -2271,7 +2306,7 @@ def onboarding_step_view(request):
                         )
                 # Step 3: pyung (텍스트 입력)
                 if step_data.get('pyung'):
-                    onboarding_db_service.save_user_response(
+                    onboarding_writer.save_user_response(
                         session_id=session_id,
                         step_number=3,
                         question_type='pyung',
@@ -2282,7 +2317,7 @@ def onboarding_step_view(request):
             elif step == 4:
                 # Step 4: cooking
                 if step_data.get('cooking'):
-                    onboarding_db_service.save_user_response(
+                    onboarding_writer.save_user_response(
                         session_id=session_id,
                         step_number=4,
                         question_type='cooking',
@@ -2290,7 +2325,7 @@ def onboarding_step_view(request):
                     )
                 # Step 4: laundry
                 if step_data.get('laundry'):
-                    onboarding_db_service.save_user_response(
+                    onboarding_writer.save_user_response(
                         session_id=session_id,
                         step_number=4,
                         question_type='laundry',
@@ -2298,7 +2333,7 @@ def onboarding_step_view(request):
                     )
                 # Step 4: media
                 if step_data.get('media'):
-                    onboarding_db_service.save_user_response(
+                    onboarding_writer.save_user_response(
                         session_id=session_id,
                         step_number=4,
                         question_type='media',
@@ -2310,14 +2345,14 @@ def onboarding_step_view(request):
                 if step_data.get('priority'):
                     priorities = step_data.get('priority')
                     if isinstance(priorities, list):
-                        onboarding_db_service.save_multiple_responses(
+                        onboarding_writer.save_multiple_responses(
                             session_id=session_id,
                             step_number=5,
                             question_type='priority',
                             answer_values=priorities
                         )
                     else:
-                        onboarding_db_service.save_user_response(
+                        onboarding_writer.save_user_response(
                             session_id=session_id,
                             step_number=5,
                             question_type='priority',
@@ -2327,7 +2362,7 @@ def onboarding_step_view(request):
             elif step == 6:
                 # Step 6: budget
                 if step_data.get('budget'):
-                    onboarding_db_service.save_user_response(
+                    onboarding_writer.save_user_response(
                         session_id=session_id,
                         step_number=6,
                         question_type='budget',
@@ -2408,6 +2443,49 @@ def onboarding_step_view(request):
         }, json_dumps_params={'ensure_ascii': False}, status=400)
 
 
+def _as_list(value):
+    """JSON 문자열/단일 값/리스트를 리스트로 정규화"""
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except (json.JSONDecodeError, ValueError):
+            return [value] if value else []
+    if isinstance(value, list):
+        return value
+    return [value] if value else []
+
+
+def _onboarding_completed_fields(session, data, recommendations):
+    """온보딩 완료 시 Oracle ONBOARDING_SESSION에 반영할 필드 (아웃박스 이벤트 / 동기 저장 공용)"""
+    return {
+        'user_id': data.get('user_id', data.get('member_id')),
+        'member_id': data.get('member_id'),
+        'current_step': 6,
+        'status': 'COMPLETED',
+        'vibe': session.vibe,
+        'household_size': session.household_size,
+        'has_pet': session.has_pet,
+        'housing_type': session.housing_type,
+        'main_space': _as_list(session.main_space),
+        'pyung': session.pyung,
+        'cooking': session.cooking,
+        'laundry': session.laundry,
+        'media': session.media,
+        'priority': session.priority,
+        'priority_list': _as_list(session.priority_list),
+        'budget_level': session.budget_level,
+        # selected_categories는 data에서 직접 가져옴 (모델 필드 없음)
+        'selected_categories': _as_list(data.get('selected_categories', [])),
+        'recommended_products': [
+            r.get('product_id') or r.get('id')
+            for r in recommendations
+            if r.get('product_id') or r.get('id')
+        ],
+        'recommendation_result': session.recommendation_result if session.recommendation_result else {},
+        'taste_id': session.taste_id,
+    }
+
+
 @csrf_exempt
 @csrf_exempt
 @require_http_methods(["POST"])
@@ -2460,6 +2538,8 @@ def onboarding_complete_view(request):
             }, json_dumps_params={'ensure_ascii': False}, status=400)
         
         session_id = data.get('session_id')
+        # 아웃박스 모드: 완료 후 Oracle 저장을 로컬 이벤트로 기록하고 디스패처가 비동기로 반영
+        outbox_enabled = getattr(settings, 'OUTBOX_ENABLED', True)
         
         if not session_id:
             print("[Onboarding Complete] session_id 누락")
@@ -2491,7 +2571,6 @@ def onboarding_complete_view(request):
             main_space = data.get('main_space', [])
             if isinstance(main_space, str):
                 try:
-                    import json
                     main_space = json.loads(main_space)
                 except:
                     main_space = [main_space] if main_space else ['living']
@@ -2502,7 +2581,6 @@ def onboarding_complete_view(request):
             priority_list = data.get('priority_list', [])
             if isinstance(priority_list, str):
                 try:
-                    import json
                     priority_list = json.loads(priority_list)
                 except:
                     priority_list = [priority_list] if priority_list else []
@@ -2582,89 +2660,93 @@ def onboarding_complete_view(request):
                 # 실패해도 계속 진행
             
             # Oracle DB에도 저장 (기본 정보)
-            try:
-                print(f"[Onboarding Complete] Oracle DB 저장 시작 (기본 정보)...", flush=True)
-                print(f"[Oracle DB] session_id={session_id}, vibe={session.vibe}, household_size={session.household_size}", flush=True)
+            # 아웃박스 모드에서 버퍼를 쓰지 않으면 완료 이벤트에 같은 필드가 모두 들어가므로 여기서는 쓰지 않음
+            if outbox_enabled and not onboarding_write_buffer.enabled:
+                print(f"[Onboarding Complete] 기본 정보는 완료 이벤트로 Oracle에 반영 (아웃박스)", flush=True)
+            else:
+                try:
+                    print(f"[Onboarding Complete] Oracle DB 저장 시작 (기본 정보)...", flush=True)
+                    print(f"[Oracle DB] session_id={session_id}, vibe={session.vibe}, household_size={session.household_size}", flush=True)
                 
-                # main_space와 priority_list 처리
-                main_space_list = session.main_space
-                if isinstance(main_space_list, str):
-                    try:
-                        import json
-                        main_space_list = json.loads(main_space_list)
-                    except:
+                    # main_space와 priority_list 처리
+                    main_space_list = session.main_space
+                    if isinstance(main_space_list, str):
+                        try:
+                            main_space_list = json.loads(main_space_list)
+                        except:
+                            main_space_list = [main_space_list] if main_space_list else []
+                    elif not isinstance(main_space_list, list):
                         main_space_list = [main_space_list] if main_space_list else []
-                elif not isinstance(main_space_list, list):
-                    main_space_list = [main_space_list] if main_space_list else []
                 
-                priority_list_data = session.priority_list
-                if isinstance(priority_list_data, str):
-                    try:
-                        import json
-                        priority_list_data = json.loads(priority_list_data)
-                    except:
+                    priority_list_data = session.priority_list
+                    if isinstance(priority_list_data, str):
+                        try:
+                            priority_list_data = json.loads(priority_list_data)
+                        except:
+                            priority_list_data = [priority_list_data] if priority_list_data else []
+                    elif not isinstance(priority_list_data, list):
                         priority_list_data = [priority_list_data] if priority_list_data else []
-                elif not isinstance(priority_list_data, list):
-                    priority_list_data = [priority_list_data] if priority_list_data else []
                 
-                # selected_categories는 data에서 직접 가져옴 (모델 필드 없음)
-                selected_categories_list = data.get('selected_categories', [])
-                if not isinstance(selected_categories_list, list):
-                    selected_categories_list = [selected_categories_list] if selected_categories_list else []
+                    # selected_categories는 data에서 직접 가져옴 (모델 필드 없음)
+                    selected_categories_list = data.get('selected_categories', [])
+                    if not isinstance(selected_categories_list, list):
+                        selected_categories_list = [selected_categories_list] if selected_categories_list else []
                 
-                print(f"[Oracle DB] main_space={main_space_list}, priority_list={priority_list_data}, categories={selected_categories_list}", flush=True)
-                print(f"[Oracle DB] selected_categories 전달값: {selected_categories_list} (타입: {type(selected_categories_list).__name__}, 길이: {len(selected_categories_list)})", flush=True)
-                print(f"[Oracle DB] taste_id 전달값: {session.taste_id}", flush=True)
+                    print(f"[Oracle DB] main_space={main_space_list}, priority_list={priority_list_data}, categories={selected_categories_list}", flush=True)
+                    print(f"[Oracle DB] selected_categories 전달값: {selected_categories_list} (타입: {type(selected_categories_list).__name__}, 길이: {len(selected_categories_list)})", flush=True)
+                    print(f"[Oracle DB] taste_id 전달값: {session.taste_id}", flush=True)
                 
-                onboarding_db_service.create_or_update_session(
-                    session_id=session_id,
-                    user_id=data.get('user_id', data.get('member_id')),
-                    member_id=data.get('member_id'),
-                    current_step=6,
-                    status='COMPLETED',
-                    vibe=session.vibe,
-                    household_size=session.household_size,
-                    has_pet=session.has_pet,
-                    housing_type=session.housing_type,
-                    main_space=main_space_list,
-                    pyung=session.pyung,
-                    cooking=session.cooking,
-                    laundry=session.laundry,
-                    media=session.media,
-                    priority=session.priority,
-                    priority_list=priority_list_data,
-                    budget_level=session.budget_level,
-                    selected_categories=selected_categories_list,
-                    taste_id=session.taste_id,  # Taste Config 매칭 결과 저장
-                )
-                print(f"\n{'='*80}", flush=True)
-                print(f"[Onboarding Complete] ✅ Oracle DB 저장 성공 (기본 정보)", flush=True)
-                print(f"{'='*80}", flush=True)
-                print(f"  세션 ID: {session_id}", flush=True)
-                print(f"{'='*80}\n", flush=True)
-            except Exception as oracle_error:
-                error_type = type(oracle_error).__name__
-                error_message = str(oracle_error)
-                # Oracle 에러 코드 추출 (예: ORA-00904)
-                error_code = ""
-                if "ORA-" in error_message:
-                    import re
-                    match = re.search(r'ORA-\d+', error_message)
-                    if match:
-                        error_code = match.group()
+                    # write-behind 모드에서는 버퍼에만 기록 (추천 결과와 함께 아래에서 한 번에 flush)
+                    onboarding_writer = onboarding_write_buffer if onboarding_write_buffer.enabled else onboarding_db_service
+                    onboarding_writer.create_or_update_session(
+                        session_id=session_id,
+                        user_id=data.get('user_id', data.get('member_id')),
+                        member_id=data.get('member_id'),
+                        current_step=6,
+                        status='COMPLETED',
+                        vibe=session.vibe,
+                        household_size=session.household_size,
+                        has_pet=session.has_pet,
+                        housing_type=session.housing_type,
+                        main_space=main_space_list,
+                        pyung=session.pyung,
+                        cooking=session.cooking,
+                        laundry=session.laundry,
+                        media=session.media,
+                        priority=session.priority,
+                        priority_list=priority_list_data,
+                        budget_level=session.budget_level,
+                        selected_categories=selected_categories_list,
+                        taste_id=session.taste_id,  # Taste Config 매칭 결과 저장
+                    )
+                    print(f"\n{'='*80}", flush=True)
+                    print(f"[Onboarding Complete] ✅ Oracle DB 저장 성공 (기본 정보)", flush=True)
+                    print(f"{'='*80}", flush=True)
+                    print(f"  세션 ID: {session_id}", flush=True)
+                    print(f"{'='*80}\n", flush=True)
+                except Exception as oracle_error:
+                    error_type = type(oracle_error).__name__
+                    error_message = str(oracle_error)
+                    # Oracle 에러 코드 추출 (예: ORA-00904)
+                    error_code = ""
+                    if "ORA-" in error_message:
+                        import re
+                        match = re.search(r'ORA-\d+', error_message)
+                        if match:
+                            error_code = match.group()
                 
-                print(f"\n{'='*80}", flush=True)
-                print(f"[Onboarding Complete] ❌ Oracle DB 저장 실패 (기본 정보)", flush=True)
-                print(f"{'='*80}", flush=True)
-                print(f"  세션 ID: {session_id}", flush=True)
-                if error_code:
-                    print(f"  에러 코드: {error_code}", flush=True)
-                print(f"  에러 타입: {error_type}", flush=True)
-                print(f"  에러 메시지: {error_message}", flush=True)
-                print(f"{'='*80}\n", flush=True)
-                import traceback
-                traceback.print_exc()
-                # Oracle 저장 실패해도 계속 진행
+                    print(f"\n{'='*80}", flush=True)
+                    print(f"[Onboarding Complete] ❌ Oracle DB 저장 실패 (기본 정보)", flush=True)
+                    print(f"{'='*80}", flush=True)
+                    print(f"  세션 ID: {session_id}", flush=True)
+                    if error_code:
+                        print(f"  에러 코드: {error_code}", flush=True)
+                    print(f"  에러 타입: {error_type}", flush=True)
+                    print(f"  에러 메시지: {error_message}", flush=True)
+                    print(f"{'='*80}\n", flush=True)
+                    import traceback
+                    traceback.print_exc()
+                    # Oracle 저장 실패해도 계속 진행
             
         except Exception as e:
             print(f"[Onboarding Complete] 세션 저장 실패: {e}")
@@ -2790,135 +2872,87 @@ def onboarding_complete_view(request):
             result_with_data = result.copy()
             result_with_data['onboarding_data'] = onboarding_data
             session.recommendation_result = result_with_data
-            session.save()
-            
-            # ERD 기반 추천 제품 저장 (OnboardSessRecProducts)
-            try:
-                _save_recommended_products_to_erd(session, result['recommendations'])
-                print(f"[Onboarding Complete] 추천 제품 ERD 저장 완료")
-            except Exception as erd_error:
-                print(f"[Onboarding Complete] 추천 제품 ERD 저장 실패 (계속 진행): {erd_error}")
-            
-            print(f"[Success] {len(result['recommendations'])}개 제품 추천됨")
+            completed_fields = _onboarding_completed_fields(session, data, result['recommendations'])
             
-            # Oracle DB에 추천 결과 포함해서 최종 저장
-            try:
-                print(f"[Onboarding Complete] Oracle DB 최종 저장 시작 (추천 결과 포함)...")
-                print(f"[Oracle DB] 추천 제품 수: {len(session.recommended_products) if session.recommended_products else 0}")
-                
-                # main_space와 priority_list 처리
-                main_space_list = session.main_space
-                if isinstance(main_space_list, str):
-                    try:
-                        import json
-                        main_space_list = json.loads(main_space_list)
-                    except:
-                        main_space_list = [main_space_list] if main_space_list else []
-                elif not isinstance(main_space_list, list):
-                    main_space_list = [main_space_list] if main_space_list else []
-                
-                priority_list_data = session.priority_list
-                if isinstance(priority_list_data, str):
-                    try:
-                        import json
-                        priority_list_data = json.loads(priority_list_data)
-                    except:
-                        priority_list_data = [priority_list_data] if priority_list_data else []
-                elif not isinstance(priority_list_data, list):
-                    priority_list_data = [priority_list_data] if priority_list_data else []
-                
-                # selected_categories는 data에서 직접 가져옴 (모델 필드 없음)
-                selected_categories_list = data.get('selected_categories', [])
-                if not isinstance(selected_categories_list, list):
-                    selected_categories_list = [selected_categories_list] if selected_categories_list else []
-                
-                # recommended_products는 추천 결과에서 직접 추출 (모델 필드 없음)
-                recommended_products_list = []
-                if result.get('success') and result.get('recommendations'):
-                    recommended_products_list = [
-                        r.get('product_id') or r.get('id')
-                        for r in result['recommendations']
-                        if r.get('product_id') or r.get('id')
-                    ]
-                
-                print(f"[Oracle DB] 추천 제품 ID 목록: {recommended_products_list[:5]}..." if len(recommended_products_list) > 5 else f"[Oracle DB] 추천 제품 ID 목록: {recommended_products_list}")
-                print(f"[Oracle DB] recommended_products 전달값: {recommended_products_list[:10]} (타입: {type(recommended_products_list).__name__}, 길이: {len(recommended_products_list)})", flush=True)
-                print(f"[Oracle DB] taste_id 전달값: {session.taste_id}", flush=True)
+            # 세션/추천 제품 저장과 Oracle 반영 이벤트를 하나의 로컬 트랜잭션으로 기록 (아웃박스)
+            with transaction.atomic():
+                session.save()
                 
-                onboarding_db_service.create_or_update_session(
-                    session_id=session_id,
-                    user_id=data.get('user_id', data.get('member_id')),
-                    current_step=6,
-                    status='COMPLETED',
-                    vibe=session.vibe,
-                    household_size=session.household_size,
-                    has_pet=session.has_pet,
-                    housing_type=session.housing_type,
-                    main_space=main_space_list,
-                    pyung=session.pyung,
-                    cooking=session.cooking,
-                    laundry=session.laundry,
-                    media=session.media,
-                    priority=session.priority,
-                    priority_list=priority_list_data,
-                    budget_level=session.budget_level,
-                    selected_categories=selected_categories_list,
-                    recommended_products=recommended_products_list,
-                    recommendation_result=session.recommendation_result if session.recommendation_result else {},
-                    taste_id=session.taste_id,  # Taste Config 매칭 결과 저장
-                )
-                print(f"\n{'='*80}", flush=True)
-                print(f"[Onboarding Complete] ✅ Oracle DB 저장 성공 (추천 결과 포함)", flush=True)
-                print(f"{'='*80}", flush=True)
-                print(f"  세션 ID: {session_id}", flush=True)
-                print(f"{'='*80}\n", flush=True)
-            except Exception as oracle_error:
-                error_type = type(oracle_error).__name__
-                error_message = str(oracle_error)
-                # Oracle 에러 코드 추출 (예: ORA-00904)
-                error_code = ""
-                if "ORA-" in error_message:
-                    import re
-                    match = re.search(r'ORA-\d+', error_message)
-                    if match:
-                        error_code = match.group()
+                # ERD 기반 추천 제품 저장 (OnboardSessRecProducts)
+                try:
+                    with transaction.atomic():
+                        _save_recommended_products_to_erd(session, result['recommendations'])
+                    print(f"[Onboarding Complete] 추천 제품 ERD 저장 완료")
+                except Exception as erd_error:
+                    print(f"[Onboarding Complete] 추천 제품 ERD 저장 실패 (계속 진행): {erd_error}")
                 
-                print(f"\n{'='*80}", flush=True)
-                print(f"[Onboarding Complete] ❌ Oracle DB 저장 실패 (추천 결과 포함)", flush=True)
-                print(f"{'='*80}", flush=True)
-                print(f"  세션 ID: {session_id}", flush=True)
-                if error_code:
-                    print(f"  에러 코드: {error_code}", flush=True)
-                print(f"  에러 타입: {error_type}", flush=True)
-                print(f"  에러 메시지: {error_message}", flush=True)
-                print(f"{'='*80}\n", flush=True)
-                import traceback
-                traceback.print_exc()
-                # Oracle 저장 실패해도 계속 진행
+                if outbox_enabled:
+                    outbox_service.enqueue(EVENT_ONBOARDING_COMPLETED, session_id, completed_fields)
             
+            print(f"[Success] {len(result['recommendations'])}개 제품 추천됨")
             
+            # 아웃박스 미사용 시 Oracle DB에 추천 결과 포함해서 최종 저장 (응답 전 동기 저장)
+            if not outbox_enabled:
+                try:
+                    print(f"[Onboarding Complete] Oracle DB 최종 저장 시작 (추천 결과 포함)...")
+                    print(f"[Oracle DB] 추천 제품 수: {len(completed_fields['recommended_products'])}")
+                    print(f"[Oracle DB] taste_id 전달값: {session.taste_id}", flush=True)
+                    
+                    # write-behind 모드: 버퍼에 쌓인 단계별 응답과 함께 단일 트랜잭션으로 반영
+                    persist_session = onboarding_write_buffer.flush if onboarding_write_buffer.enabled else onboarding_db_service.create_or_update_session
+                    persist_session(session_id=session_id, **completed_fields)
+                    print(f"\n{'='*80}", flush=True)
+                    print(f"[Onboarding Complete] ✅ Oracle DB 저장 성공 (추천 결과 포함)", flush=True)
+                    print(f"{'='*80}", flush=True)
+                    print(f"  세션 ID: {session_id}", flush=True)
+                    print(f"{'='*80}\n", flush=True)
+                except Exception as oracle_error:
+                    error_type = type(oracle_error).__name__
+                    error_message = str(oracle_error)
+                    # Oracle 에러 코드 추출 (예: ORA-00904)
+                    error_code = ""
+                    if "ORA-" in error_message:
+                        import re
+                        match = re.search(r'ORA-\d+', error_message)
+                        if match:
+                            error_code = match.group()
+                    
+                    print(f"\n{'='*80}", flush=True)
+                    print(f"[Onboarding Complete] ❌ Oracle DB 저장 실패 (추천 결과 포함)", flush=True)
+                    print(f"{'='*80}", flush=True)
+                    print(f"  세션 ID: {session_id}", flush=True)
+                    if error_code:
+                        print(f"  에러 코드: {error_code}", flush=True)
+                    print(f"  에러 타입: {error_type}", flush=True)
+                    print(f"  에러 메시지: {error_message}", flush=True)
+                    print(f"{'='*80}\n", flush=True)
+                    import traceback
+                    traceback.print_exc()
+                    # Oracle 저장 실패해도 계속 진행
             
             # Taste 정보를 응답에 포함 (이미 위에서 계산됨)
             if taste_id:
                 result_with_data['taste_id'] = taste_id
             
-            # 응답에 포트폴리오 정보 포함
             response_data = {
                 'success': True,
                 'session_id': session_id,
                 'recommendations': result['recommendations'],
             }
             
-            if portfolio_id:
-                response_data['portfolio_id'] = portfolio_id
-                response_data['style_analysis'] = portfolio_result.get('style_analysis')
-                response_data['total_price'] = portfolio_result.get('total_price')
-                response_data['total_discount_price'] = portfolio_result.get('total_discount_price')
-            
             return JsonResponse(response_data, json_dumps_params={'ensure_ascii': False})
         else:
             print(f"[Error] {result.get('error', '알 수 없는 오류')}")
             
+            # 추천 실패 시에도 온보딩 데이터는 Oracle에 반영 (아웃박스 모드면 완료 이벤트로 기록)
+            if outbox_enabled:
+                outbox_service.enqueue(EVENT_ONBOARDING_COMPLETED, session_id, _onboarding_completed_fields(session, data, []))
+            elif onboarding_write_buffer.enabled:
+                try:
+                    onboarding_write_buffer.flush(session_id)
+                except Exception as flush_error:
+                    print(f"[Onboarding Complete] ❌ 온보딩 버퍼 flush 실패 (재시도 대기): {flush_error}", flush=True)
+            
             return JsonResponse({
                 'success': False,
                 'error': result.get('error', '추천 실패'),
@@ -3497,6 +3531,57 @@ def portfolio_estimate_view(request, portfolio_id):
         }, json_dumps_params={'ensure_ascii': False}, status=400)
 
 
+@csrf_exempt
+@require_http_methods(["POST"])
+def portfolio_optimize_view(request, portfolio_id):
+    """
+    예산 내 최적 패키지 조합
+
+    POST /api/portfolio/<portfolio_id>/optimize/
+    {
+        "budget": 5000000,
+        "top_n": 3,
+        "required_categories": ["TV", "냉장고"],
+        "category_constraints": {
+            "TV": {"min_price": 1000000, "max_price": 3000000}
+        }
+    }
+
+    required_categories / category_constraints의 카테고리는 추천 후보 순위의 MAIN_CATEGORY
+    ('TV', '냉장고', '세탁기' 등)입니다. Django category('KITCHEN' 등)는 후보와 매칭되지 않습니다.
+    """
+    try:
+        data = json.loads(request.body.decode('utf-8'))
+        budget = data.get('budget')
+        if budget is None:
+            return JsonResponse({
+                'success': False,
+                'error': 'budget은 필수입니다.'
+            }, json_dumps_params={'ensure_ascii': False}, status=400)
+
+        result = portfolio_service.optimize_package(
+            portfolio_id=portfolio_id,
+            budget=int(budget),
+            top_n=min(int(data.get('top_n', 3)), 10),
+            required_categories=data.get('required_categories'),
+            category_constraints=data.get('category_constraints')
+        )
+
+        if result.get('success'):
+            return JsonResponse(result, json_dumps_params={'ensure_ascii': False})
+        else:
+            return JsonResponse({
+                'success': False,
+                'error': result.get('error', '패키지 최적화 실패')
+            }, json_dumps_params={'ensure_ascii': False}, status=400)
+
+    except Exception as e:
+        return JsonResponse({
+            'success': False,
+            'error': str(e)
+        }, json_dumps_params={'ensure_ascii': False}, status=400)
+
+
 @csrf_exempt
 @require_http_methods(["POST"])
 def bestshop_consultation_view(request):
@@ -3732,12 +3817,18 @@ def ai_review_summary_view(request):
         reviews = data.get('reviews', [])
         product_name = data.get('product_name', '')
         
-        # product_id가 있으면 DB에서 리뷰 가져오기
+        # product_id가 있으면 미리 생성된 요약 사용 (없을 때만 실시간 생성 후 저장)
         if product_id and not reviews:
-            product = Product.objects.get(id=product_id)
-            product_name = product.name
-            review_objs = ProductReview.objects.filter(product=product)[:20]
-            reviews = [r.review_text for r in review_objs if r.review_text]
+            product = Product.objects.get(pk=product_id)
+            result = review_summary_service.get_summary(product)
+            if result is not None:
+                return JsonResponse({
+                    'success': True,
+                    'summary': result['summary'],
+                    'review_count': result['review_count'],
+                    'ai_generated': result['ai_generated'],
+                    'source': result['source'],
+                }, json_dumps_params={'ensure_ascii': False})
         
         if not reviews:
             return JsonResponse({
@@ -3767,6 +3858,47 @@ def ai_review_summary_view(request):
         }, json_dumps_params={'ensure_ascii': False}, status=400)
 
 
+def _wants_event_stream(request, data: dict) -> bool:
+    """SSE 스트리밍 응답 요청 여부 (Accept: text/event-stream 또는 "stream": true)"""
+    return bool(data.get('stream')) or 'text/event-stream' in request.META.get('HTTP_ACCEPT', '')
+
+
+def _sse_event(event: str, data) -> bytes:
+    """Server-Sent Events 한 건"""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n".encode('utf-8')
+
+
+def _sse_response(events) -> StreamingHttpResponse:
+    """
+    (이벤트 이름, 데이터) 제너레이터 → SSE 스트리밍 응답
+    
+    클라이언트가 연결을 끊으면 서버가 응답 이터레이터를 닫고, 그 GeneratorExit이
+    events 제너레이터(→ OpenAI 스트림)까지 전달되어 남은 생성이 중단됩니다.
+    처리 중 예외는 error 이벤트로 보낸 뒤 스트림을 끝냅니다.
+    """
+    def stream():
+        # 첫 바이트를 바로 보내 프록시/브라우저가 연결을 열어 두도록 함
+        yield b": stream-open\n\n"
+        try:
+            for event, data in events:
+                yield _sse_event(event, data)
+        except Exception as e:
+            print(f"[SSE] 스트리밍 오류: {e}", flush=True)
+            yield _sse_event('error', {
+                'success': False,
+                'message': '죄송해요, 일시적인 오류가 발생했어요. 다시 시도해주세요.',
+                'error': str(e),
+            })
+        finally:
+            events.close()
+    
+    response = StreamingHttpResponse(stream(), content_type='text/event-stream; charset=utf-8')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # nginx 응답 버퍼링 끄기
+    return response
+
+
 @csrf_exempt
 @require_http_methods(["POST"])
 def ai_chat_view(request):
@@ -3776,8 +3908,12 @@ def ai_chat_view(request):
     POST /api/ai/chat/
     {
         "message": "냉장고 추천해주세요",
-        "context": {"history": [...]}  # 선택
+        "context": {"history": [...]},  # 선택
+        "stream": true                  # 선택 (또는 Accept: text/event-stream)
     }
+    
+    스트리밍 모드는 SSE로 응답 텍스트 조각(event: token, {"text"})을 생성되는 대로 보내고
+    마지막에 event: done으로 일반 모드와 같은 형식의 결과를 보냅니다.
     """
     try:
         data = json.loads(request.body.decode('utf-8'))
@@ -3791,6 +3927,19 @@ def ai_chat_view(request):
                 'error': '메시지를 입력해주세요.'
             }, status=400)
         
+        if _wants_event_stream(request, data):
+            def events():
+                parts = []
+                for text in chatgpt_service.stream_chat_response(user_message, context):
+                    parts.append(text)
+                    yield 'token', {'text': text}
+                yield 'done', {
+                    'success': True,
+                    'response': ''.join(parts).strip(),
+                    'ai_generated': chatgpt_service.is_available()
+                }
+            return _sse_response(events())
+        
         response = chatgpt_service.chat_response(user_message, context)
         
         return JsonResponse({
@@ -3816,7 +3965,8 @@ def ai_status_view(request):
     return JsonResponse({
         'success': True,
         'chatgpt_available': chatgpt_service.is_available(),
-        'model': chatgpt_service.MODEL if chatgpt_service.is_available() else None
+        'model': chatgpt_service.MODEL if chatgpt_service.is_available() else None,
+        'llm_cache': llm_response_cache.stats()
     })
 
 
@@ -3998,8 +4148,12 @@ def ai_chat_recommend_view(request):
     POST /api/ai/chat-recommend/
     {
         "message": "냉장고 추천해줘",
-        "conversation_history": [...]  # 선택
+        "conversation_history": [...],  # 선택
+        "stream": true                  # 선택 (또는 Accept: text/event-stream)
     }
+    
+    스트리밍 모드 SSE 이벤트: status(추천 처리 시작) / token(일반 대화 텍스트 조각) /
+    done(일반 모드와 같은 형식의 최종 결과, 추천 목록 포함) / error
     """
     try:
         data = json.loads(request.body.decode('utf-8'))
@@ -4017,6 +4171,12 @@ def ai_chat_recommend_view(request):
         
         print(f"[AI 추천] 사용자 메시지: {user_message}")
         
+        if _wants_event_stream(request, data):
+            return _sse_response(ai_recommendation_service.stream_chat_recommendation(
+                user_message=user_message,
+                conversation_history=conversation_history
+            ))
+        
         result = ai_recommendation_service.chat_recommendation(
             user_message=user_message,
             conversation_history=conversation_history
@@ -4452,9 +4612,10 @@ def search_view(request):
     제품 검색 API
     
     GET /api/search/?q=검색어&category=TV&page=1&page_size=20
-    """
-    from django.db.models import Q
     
+    메모리 검색 인덱스(product_search_index)에서 제품명/모델명/설명/주요 스펙을
+    n-gram으로 매칭하고 BM25 점수 순으로 반환합니다. (DB 조회 없음)
+    """
     query = request.GET.get('q', '').strip()
     category = request.GET.get('category', None)
     page = int(request.GET.get('page', 1))
@@ -4466,42 +4627,14 @@ def search_view(request):
             'error': '검색어가 필요합니다.'
         }, json_dumps_params={'ensure_ascii': False}, status=400)
     
-    # 기본 쿼리셋
-    queryset = Product.objects.filter(is_active=True)
-    
-    # 검색 필터 (제품명, 모델명, 설명에서 검색)
-    queryset = queryset.filter(
-        Q(name__icontains=query) |
-        Q(model_number__icontains=query) |
-        Q(description__icontains=query)
+    search_result = product_search_index.search(
+        query,
+        category=category,
+        offset=(page - 1) * page_size,
+        limit=page_size,
     )
-    
-    # 카테고리 필터
-    if category:
-        queryset = queryset.filter(category=category)
-    
-    # 총 개수
-    total_count = queryset.count()
-    
-    # 페이지네이션
-    start = (page - 1) * page_size
-    end = start + page_size
-    queryset = queryset.order_by('-created_at')[start:end]
-    
-    results = []
-    for product in queryset:
-        results.append({
-            'id': product.id,
-            'name': product.name,
-            'model_number': product.model_number,
-            'category': product.category,
-            'category_display': product.get_category_display(),
-            'description': product.description,
-            'price': float(product.price),
-            'discount_price': float(product.discount_price) if product.discount_price else None,
-            'image_url': product.image_url,
-            'created_at': product.created_at.isoformat(),
-        })
+    total_count = search_result['total_count']
+    results = search_result['results']
     
     return JsonResponse({
         'success': True,
@@ -4511,10 +4644,28 @@ def search_view(request):
         'page': page,
         'page_size': page_size,
         'total_pages': (total_count + page_size - 1) // page_size,
+        'facets': search_result['facets'],
         'results': results
     }, json_dumps_params={'ensure_ascii': False})
 
 
+@require_http_methods(["GET"])
+def search_autocomplete_view(request):
+    """
+    검색어 자동완성 API
+    
+    GET /api/search/autocomplete/?q=오브제&limit=10
+    """
+    prefix = request.GET.get('q', '').strip()
+    limit = int(request.GET.get('limit', 10))
+    
+    return JsonResponse({
+        'success': True,
+        'query': prefix,
+        'suggestions': product_search_index.autocomplete(prefix, limit=limit),
+    }, json_dumps_params={'ensure_ascii': False})
+
+
 # ============================================================
 # 제품 비교 기능
 # ============================================================
@@ -8,6 +8,9 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django.shortcuts import get_object_or_404
+from django.db import transaction
+from django.db.models import DecimalField, F, Sum, Value
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from .models import (
     Member, CartNew, CartItem, Orders, OrderDetail, Payment,
@@ -174,30 +177,44 @@ class OrderViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        cart = get_object_or_404(CartNew, cart_id=cart_id)
-        
-        # 주문 생성
-        order = Orders.objects.create(
-            member=cart.member,
-            order_status='주문완료',
-            payment_status='결제대기'
-        )
-        
-        # 장바구니 항목을 주문 상세로 변환
-        total_amount = 0
-        for cart_item in cart.items.all():
-            OrderDetail.objects.create(
-                order=order,
-                product=cart_item.product,
-                quantity=cart_item.quantity
+        with transaction.atomic():
+            cart = get_object_or_404(
+                CartNew.objects.select_for_update().select_related('member'),
+                cart_id=cart_id
             )
-            total_amount += (cart_item.product.price or 0) * cart_item.quantity
-        
-        order.total_amount = total_amount
-        order.save()
+            cart_items = list(cart.items.select_related('product'))
+            
+            # 주문 총액은 DB 집계로 한 번에 계산 (가격 없는 제품은 0원)
+            amount_field = DecimalField(max_digits=12, decimal_places=0)
+            total_amount = cart.items.aggregate(
+                total=Coalesce(
+                    Sum(F('product__price') * F('quantity'), output_field=amount_field),
+                    Value(0, output_field=amount_field)
+                )
+            )['total']
+            
+            # 주문 생성
+            order = Orders.objects.create(
+                member=cart.member,
+                order_status='주문완료',
+                payment_status='결제대기',
+                total_amount=total_amount
+            )
+            
+            # 장바구니 항목을 주문 상세로 일괄 변환
+            OrderDetail.objects.bulk_create([
+                OrderDetail(
+                    order=order,
+                    product=cart_item.product,
+                    quantity=cart_item.quantity
+                )
+                for cart_item in cart_items
+            ])
+            
+            # 장바구니 비우기
+            cart.items.all().delete()
         
-        # 장바구니 비우기
-        cart.items.all().delete()
+        order = Orders.objects.prefetch_related('details__product').get(pk=order.pk)
         
         return Response({
             'success': True,
@@ -280,6 +280,129 @@ else:
     }
 
 
+# ============================================================
+# 캐시 설정
+# ============================================================
+# default: 프로세스 로컬 캐시
+# llm: LLM 응답 캐시 (요청 내용 해시 키, 파일 기반, TTL + 최대 항목 수) - api/utils/llm_cache.py
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'llm': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('LLM_CACHE_DIR', str(BASE_DIR / 'cache' / 'llm')),
+        'TIMEOUT': int(os.environ.get('LLM_CACHE_TTL', str(60 * 60 * 24 * 7))),
+        'OPTIONS': {'MAX_ENTRIES': int(os.environ.get('LLM_CACHE_MAX_ENTRIES', '20000'))},
+    },
+}
+
+# 온보딩 단계별 Oracle 저장을 완료 시점까지 모아서 한 번에 커밋 (write-behind)
+ONBOARDING_WRITE_BEHIND = os.environ.get('ONBOARDING_WRITE_BEHIND', 'true').lower() == 'true'
+# 버퍼 저장 위치 (세션별 저널 + pending 표시, 캐시와 달리 만료/정리되지 않음 - 워커 간 공유되는 경로여야 함)
+ONBOARDING_BUFFER_DIR = os.environ.get('ONBOARDING_BUFFER_DIR', str(BASE_DIR / 'data' / 'onboarding_buffer'))
+ONBOARDING_BUFFER_CLAIM_TIMEOUT = 60 * 10  # 중단된 flush의 선점을 넘겨받기까지 대기 시간 (초)
+ONBOARDING_BUFFER_RETENTION = 60 * 60 * 24 * 7  # flush_onboarding_buffer --purge-stale 시 방치된 미완료 세션 보관 시간 (초)
+
+# 온보딩 완료 후 Oracle 저장을 아웃박스 이벤트로 기록하고 비동기로 반영 (False면 응답 전 동기 저장)
+OUTBOX_ENABLED = os.environ.get('OUTBOX_ENABLED', 'true').lower() == 'true'
+# 웹 프로세스 안의 백그라운드 스레드로 디스패치 (False면 `python manage.py dispatch_outbox --loop` 워커 사용)
+OUTBOX_DISPATCH_IN_PROCESS = os.environ.get('OUTBOX_DISPATCH_IN_PROCESS', 'true').lower() == 'true'
+OUTBOX_BATCH_SIZE = int(os.environ.get('OUTBOX_BATCH_SIZE', '50'))
+OUTBOX_POLL_INTERVAL = float(os.environ.get('OUTBOX_POLL_INTERVAL', '5'))  # 대기 이벤트 폴링 주기 (초)
+OUTBOX_MAX_ATTEMPTS = int(os.environ.get('OUTBOX_MAX_ATTEMPTS', '8'))  # 초과 시 FAILED (dispatch_outbox --retry-failed로 복구)
+OUTBOX_RETRY_BASE_SECONDS = 5  # 재시도 간격 = base * 2^(시도-1) (지터 적용, 최대 OUTBOX_RETRY_MAX_SECONDS)
+OUTBOX_RETRY_MAX_SECONDS = 600
+OUTBOX_LEASE_SECONDS = 60  # 이벤트 점유 시간 (워커가 죽으면 이후 다른 워커가 다시 처리)
+
+# 카탈로그 버전 재확인 주기 (초) - 버전 키 캐시가 DB를 매 요청 조회하지 않도록
+CATALOG_VERSION_CHECK_INTERVAL = int(os.environ.get('CATALOG_VERSION_CHECK_INTERVAL', '5'))
+
+# 카테고리 인벤토리 최대 보관 시간 (초) - 카탈로그 버전이 바뀌지 않아도 이 시간이 지나면 다시 집계
+CATEGORY_INVENTORY_MAX_AGE = int(os.environ.get('CATEGORY_INVENTORY_MAX_AGE', '3600'))
+CATEGORY_INVENTORY_DEGRADED_MAX_AGE = int(os.environ.get('CATEGORY_INVENTORY_DEGRADED_MAX_AGE', '60'))  # Oracle 장애로 대체 집계한 결과 유지 시간 (초)
+
+# Taste별 카테고리 선택 결과 캐시 (프로세스 내 LRU 크기 / 사전 계산 테이블 경로)
+CATEGORY_SELECTION_CACHE_SIZE = int(os.environ.get('CATEGORY_SELECTION_CACHE_SIZE', '4096'))
+CATEGORY_SELECTION_PRECOMPUTED_PATH = os.environ.get(
+    'CATEGORY_SELECTION_PRECOMPUTED_PATH',
+    str(BASE_DIR / 'api' / 'scoring_logic' / 'category_selection_precomputed.json'),
+)
+
+# 전체 카탈로그 SPEC 스키마 아티팩트 경로 (build_spec_schema 명령어로 생성, 워커 기동 시 로드)
+SPEC_SCHEMA_PATH = os.environ.get(
+    'SPEC_SCHEMA_PATH',
+    str(BASE_DIR / 'api' / 'scoring_logic' / 'spec_schema.json'),
+)
+
+# 제품별 리뷰 키워드 인덱스 아티팩트 경로 (build_review_keyword_index 명령어로 생성, 워커 기동 시 로드)
+REVIEW_KEYWORD_INDEX_PATH = os.environ.get(
+    'REVIEW_KEYWORD_INDEX_PATH',
+    str(BASE_DIR / 'api' / 'scoring_logic' / 'review_keyword_index.json'),
+)
+
+# 제품 상세 통합 API 캐시 시간 (초) - 키에 카탈로그 버전이 포함되어 카탈로그 변경 시 자동 무효화
+PRODUCT_DETAIL_CACHE_TIMEOUT = int(os.environ.get('PRODUCT_DETAIL_CACHE_TIMEOUT', '600'))
+PRODUCT_DETAIL_DEGRADED_CACHE_TIMEOUT = int(os.environ.get('PRODUCT_DETAIL_DEGRADED_CACHE_TIMEOUT', '30'))  # Oracle 장애로 Django DB에서 조립한 결과 (초)
+
+# 추천 엔진 카테고리별 파이프라인 병렬 실행 (스레드 풀 크기 / 요청 단위 마감 시간, 그때까지 끝난 카테고리만 반환)
+# 스레드 풀은 프로세스 공유라 동시 요청이 많으면 대기가 길어지므로 기본은 순차 실행 (마감 시간 없음)
+RECOMMENDATION_PARALLEL = os.environ.get('RECOMMENDATION_PARALLEL', 'false').lower() == 'true'
+RECOMMENDATION_MAX_WORKERS = int(os.environ.get('RECOMMENDATION_MAX_WORKERS', '4'))
+RECOMMENDATION_DEADLINE_SECONDS = float(os.environ.get('RECOMMENDATION_DEADLINE_SECONDS', '10'))
+
+# Oracle 참조 테이블(TASTE_CONFIG, PRODUCT, PRODUCT_SPEC 등) 로컬 SQLite 복제본
+# sync_reference_replica 명령어로 동기화한 뒤 켜면 조회 경로가 Oracle 대신 복제본을 사용
+REFERENCE_REPLICA_ENABLED = os.environ.get('REFERENCE_REPLICA_ENABLED', 'false').lower() == 'true'
+REFERENCE_REPLICA_PATH = os.environ.get(
+    'REFERENCE_REPLICA_PATH',
+    str(BASE_DIR / 'replica' / 'reference.sqlite3'),
+)
+REFERENCE_REPLICA_SYNC_INTERVAL = int(os.environ.get('REFERENCE_REPLICA_SYNC_INTERVAL', '300'))  # --loop 동기화 주기 (초)
+# 마지막 동기화 성공 후 이 시간(초)이 지나면 복제본 대신 Oracle 조회 (동기화 루프 중단 대비, 0이면 제한 없음)
+REFERENCE_REPLICA_MAX_AGE = int(os.environ.get('REFERENCE_REPLICA_MAX_AGE', str(REFERENCE_REPLICA_SYNC_INTERVAL * 3)))
+REFERENCE_REPLICA_MMAP_SIZE = 256 * 1024 * 1024
+
+# 외부 HTTP 호출 공용 클라이언트 (카카오 API, 제품 이미지 다운로드) - api/utils/http_client.py
+HTTP_CONNECT_TIMEOUT = float(os.environ.get('HTTP_CONNECT_TIMEOUT', '3.05'))  # 연결 타임아웃 (초)
+HTTP_READ_TIMEOUT = float(os.environ.get('HTTP_READ_TIMEOUT', '10'))  # 응답 타임아웃 (초)
+HTTP_POOL_CONNECTIONS = 10  # 연결 풀을 유지할 호스트 수
+HTTP_POOL_MAXSIZE = int(os.environ.get('HTTP_POOL_MAXSIZE', '20'))  # 호스트당 keep-alive 연결 수
+HTTP_MAX_RETRIES = int(os.environ.get('HTTP_MAX_RETRIES', '2'))  # 멱등 요청 최대 재시도 횟수
+HTTP_RETRY_BACKOFF_BASE = 0.3  # 재시도 대기 = uniform(0, base * 2^시도) (최대 HTTP_RETRY_BACKOFF_MAX)
+HTTP_RETRY_BACKOFF_MAX = 5
+HTTP_CIRCUIT_FAILURE_THRESHOLD = int(os.environ.get('HTTP_CIRCUIT_FAILURE_THRESHOLD', '5'))  # 호스트별 연속 실패 시 서킷 열림
+HTTP_CIRCUIT_RESET_SECONDS = int(os.environ.get('HTTP_CIRCUIT_RESET_SECONDS', '30'))  # 서킷 열림 유지 시간 (초)
+
+# 자연어 추천 요청 로컬 의도 파서 (신뢰도가 임계값 이상이면 LLM 호출 없이 응답) - api/utils/intent_parser.py
+AI_INTENT_FAST_PATH = os.environ.get('AI_INTENT_FAST_PATH', 'true').lower() == 'true'
+AI_INTENT_CONFIDENCE_THRESHOLD = float(os.environ.get('AI_INTENT_CONFIDENCE_THRESHOLD', '0.8'))
+# 질의 로그 (benchmark_intent_parser 입력). 기본값은 기록 안 함.
+# 사용자 채팅 원문이 그대로 디스크에 남으므로(이름/연락처/주소 등 개인정보 포함 가능)
+# 측정이 필요할 때만 환경 변수로 경로를 지정하고, 파일 접근 권한과 보관 기간을 따로 관리하세요.
+AI_INTENT_QUERY_LOG = os.environ.get('AI_INTENT_QUERY_LOG', '')
+
+# 제품별 리뷰 요약 배치 (build_review_summaries) 동시 요청 수 / 분당 최대 요청 수
+REVIEW_SUMMARY_CONCURRENCY = int(os.environ.get('REVIEW_SUMMARY_CONCURRENCY', '4'))
+REVIEW_SUMMARY_RATE_PER_MINUTE = float(os.environ.get('REVIEW_SUMMARY_RATE_PER_MINUTE', '60'))
+
+# LLM 응답 캐시 (같은 모델/프롬프트/온도 구간 요청은 저장된 응답 재사용, 동시 요청은 한 번만 호출)
+LLM_CACHE_ENABLED = os.environ.get('LLM_CACHE_ENABLED', 'true').lower() == 'true'
+LLM_CACHE_ALIAS = 'llm'
+LLM_CACHE_TTL = CACHES['llm']['TIMEOUT']  # 응답 보관 시간 (초)
+LLM_CACHE_MAX_VALUE_BYTES = 32 * 1024  # 이보다 큰 응답은 저장하지 않음
+LLM_CACHE_SINGLE_FLIGHT_TIMEOUT = 60  # 같은 요청이 진행 중일 때 결과 대기 시간 (초)
+
+# Oracle 배열 DML 적재 (정규화 마이그레이션) - 커밋 단위 부모 레코드 수 / 재개용 체크포인트 파일
+BULK_LOAD_CHUNK_SIZE = int(os.environ.get('BULK_LOAD_CHUNK_SIZE', '500'))
+BULK_LOAD_CHECKPOINT_PATH = os.environ.get('BULK_LOAD_CHECKPOINT_PATH', str(BASE_DIR / 'logs' / 'bulk_load_checkpoints.json'))
+
+# Playbook 스코어링 컴포넌트별 점수 캐시 최대 항목 수 (컴포넌트마다 LRU)
+PLAYBOOK_SCORE_CACHE_SIZE = int(os.environ.get('PLAYBOOK_SCORE_CACHE_SIZE', '20000'))
+# ReviewScore 캐시 유지 시간 (초). 리뷰 적재는 카탈로그 버전을 올리지 않으므로 시간 단위로 다시 계산
+PLAYBOOK_REVIEW_SCORE_TTL = int(os.environ.get('PLAYBOOK_REVIEW_SCORE_TTL', '600'))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -4,19 +4,19 @@ from rest_framework.routers import DefaultRouter
 
 from api.views import (
     index_view, recommend, products, recommend_view, product_spec_view, product_image_by_name_view, product_reviews_view,
-    product_recommend_reason_view, product_demographics_view,
+    product_recommend_reason_view, product_demographics_view, product_detail_view,
     onboarding_page, onboarding_step2_page, onboarding_step3_page, onboarding_step4_page, onboarding_step5_page, onboarding_step6_page, onboarding_step7_page, main_page, onboarding_new_page, result_page,
     fake_lg_main_page, react_app_view, health_check_view, oracle_test_view,reservation_status_page, other_recommendations_page, mypage,
     onboarding_step_view, onboarding_complete_view, onboarding_session_view,
     portfolio_save_view, portfolio_detail_view, portfolio_list_view, portfolio_share_view,
     portfolio_refresh_view, portfolio_alternatives_view, portfolio_add_to_cart_view,
-    portfolio_edit_view, portfolio_estimate_view,
+    portfolio_edit_view, portfolio_estimate_view, portfolio_optimize_view,
     bestshop_consultation_view,
     ai_recommendation_reason_view, ai_style_message_view, ai_review_summary_view,
     ai_chat_view, ai_status_view, ai_natural_recommend_view, ai_chat_recommend_view, ai_product_compare_view,
     cart_add_view, cart_remove_view, cart_list_view,
     product_detail_page,
-    search_view, product_compare_view,
+    search_view, search_autocomplete_view, product_compare_view,
     wishlist_add_view, wishlist_remove_view, wishlist_list_view,
     reservation_list_view, reservation_detail_view, reservation_update_view, reservation_cancel_view,
     other_recommendations_page, mypage, reservation_status_page,
@@ -110,6 +110,7 @@ urlpatterns = [
     path('api/products/<int:product_id>/reviews/', product_reviews_view, name='product_reviews'),  # LGDX-40
     path('api/products/<int:product_id>/recommend-reason/', product_recommend_reason_view, name='product_recommend_reason'),
     path('api/products/<int:product_id>/demographics/', product_demographics_view, name='product_demographics'),
+    path('api/products/<int:product_id>/detail/', product_detail_view, name='product_detail_api'),
     path('api/products/image-by-name/', product_image_by_name_view, name='product_image_by_name'),
     path('api/onboarding/step/', onboarding_step_view, name='onboarding_step'),
     path('api/onboarding/complete/', onboarding_complete_view, name='onboarding_complete'),
@@ -125,6 +126,7 @@ urlpatterns = [
     path('api/portfolio/<str:portfolio_id>/add-to-cart/', portfolio_add_to_cart_view, name='portfolio_add_to_cart'),  # PRD: 2-3
     path('api/portfolio/<str:portfolio_id>/edit/', portfolio_edit_view, name='portfolio_edit'),  # ?�트?�리???�집
     path('api/portfolio/<str:portfolio_id>/estimate/', portfolio_estimate_view, name='portfolio_estimate'),  # ?�시�?견적 계산
+    path('api/portfolio/<str:portfolio_id>/optimize/', portfolio_optimize_view, name='portfolio_optimize'),
     
     # 베스?�샵 ?�담 ?�약 API
     path('api/bestshop/consultation/', bestshop_consultation_view, name='bestshop_consultation'),  # PRD: 2-5
@@ -142,6 +144,7 @@ urlpatterns = [
     
     # 검??API
     path('api/search/', search_view, name='search'),
+    path('api/search/autocomplete/', search_autocomplete_view, name='search_autocomplete'),
     
     # ?�품 비교 API
     path('api/products/compare/', product_compare_view, name='product_compare'),